@@ -0,0 +1,329 @@
+"""
+Benchmark: memoized phase pipeline vs rerunning every plan-mode phase
+
+Models the plan-mode notebooks as a PhasePipeline whose "model calls" sleep:
+phase1 (file analyses) -> phase2 (checkpoint outline) -> three independent
+phase3 shards (detailed planning per checkpoint group) -> phase4 (output
+formatting). Times:
+- rerun-all: every phase recomputed in order (what rerunning the notebooks
+  costs today)
+- cold: first PhasePipeline run (independent shards in parallel)
+- warm: nothing changed (every phase skipped)
+- prompt edit: one phase3 prompt changed (that shard and phase4 rerun)
+- revert: the edit undone (served from the cache)
+
+check_equivalence() asserts that memoized runs materialize the same interim
+files as a full rerun, that only phases downstream of a change rerun, that a
+missing store object forces a rerun, that failures block only their
+dependents and leave no stale artifacts, and that garbage collection fits
+the size bound without evicting current artifacts.
+
+Usage (from context/code):
+    python -m benchmarks.bench_phase_pipeline
+"""
+
+import contextlib
+import io
+import json
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from utils.interim_data_management import load_interim_data, save_interim_data
+from utils.phase_pipeline import (
+    Phase,
+    PhaseFailedError,
+    PhaseInputs,
+    PhasePipeline,
+)
+
+MODEL_CALL_SECONDS = 0.05
+SHARDS = ("phase3_a", "phase3_b", "phase3_c")
+
+
+class FakeModel:
+    """Counts calls; each call sleeps MODEL_CALL_SECONDS."""
+
+    def __init__(self, delay: float = MODEL_CALL_SECONDS):
+        self.delay = delay
+        self.calls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, phase: str, prompt: str) -> str:
+        with self._lock:
+            self.calls[phase] = self.calls.get(phase, 0) + 1
+        time.sleep(self.delay)
+        return f"{phase}: {len(prompt)} chars -> {prompt[-40:]}"
+
+
+def build_phases(
+    prompts_dir: Path, model: FakeModel, fail: str = ""
+) -> List[Phase]:
+    """The four plan-mode phases, with phase3 split into independent shards."""
+
+    def prompt(name: str) -> str:
+        return (prompts_dir / f"{name}.md").read_text()
+
+    def phase1(inputs: PhaseInputs) -> Dict[str, Any]:
+        files = {f"src/module_{n}.py": f"def f{n}(): ..." for n in range(3)}
+        analyses = [
+            {"file_path": path, "analysis": model("phase1", prompt("phase1") + body)}
+            for path, body in files.items()
+        ]
+        return {"files_dict": files, "file_analyses": analyses}
+
+    def phase2(inputs: PhaseInputs) -> Dict[str, Any]:
+        analyses = inputs.upstream["phase1"]["file_analyses"]
+        outline = model("phase2", prompt("phase2") + json.dumps(analyses))
+        return {"checkpoint_outline": {"outline": outline, "shards": list(SHARDS)}}
+
+    def shard(name: str):
+        def run(inputs: PhaseInputs) -> Dict[str, Any]:
+            if name == fail:
+                raise RuntimeError(f"{name} model call failed")
+            outline = inputs.upstream["phase2"]["checkpoint_outline"]
+            detail = model(name, prompt(name) + outline["outline"])
+            return {"detailed_plan": {"shard": name, "detail": detail}}
+
+        return run
+
+    def phase4(inputs: PhaseInputs) -> Dict[str, Any]:
+        details = [inputs.upstream[name]["detailed_plan"] for name in SHARDS]
+        text = model("phase4", prompt("phase4") + json.dumps(details))
+        return {"final_plan": {"details": details, "formatted": text}}
+
+    return [
+        Phase("phase1", phase1, prompt_files=[prompts_dir / "phase1.md"]),
+        Phase(
+            "phase2",
+            phase2,
+            requires=["phase1"],
+            prompt_files=[prompts_dir / "phase2.md"],
+        ),
+        *(
+            Phase(
+                name,
+                shard(name),
+                requires=["phase2"],
+                prompt_files=[prompts_dir / f"{name}.md"],
+                config_keys=["MODEL_NAME", "TEMPERATURE"],
+            )
+            for name in SHARDS
+        ),
+        Phase(
+            "phase4",
+            phase4,
+            requires=list(SHARDS),
+            prompt_files=[prompts_dir / "phase4.md"],
+        ),
+    ]
+
+
+def _workspace() -> Path:
+    root = Path(tempfile.mkdtemp(prefix="bench_phase_pipeline_"))
+    (root / "prompts").mkdir()
+    for name in ("phase1", "phase2", *SHARDS, "phase4"):
+        (root / "prompts" / f"{name}.md").write_text(f"<{name} prompt>\n")
+    (root / "interim_data").mkdir()
+    return root
+
+
+def _config(root: Path) -> Dict[str, Any]:
+    return {
+        "MODEL_NAME": "fake-model",
+        "TEMPERATURE": 0.5,
+        "INTERIM_DATA_DIR": root / "interim_data",
+    }
+
+
+def _pipeline(root: Path, model: FakeModel, **kwargs: Any) -> PhasePipeline:
+    fail = kwargs.pop("fail", "")
+    config = kwargs.pop("config", None) or _config(root)
+    phases = build_phases(root / "prompts", model, fail)
+    return PhasePipeline(phases, config=config, verbose=False, **kwargs)
+
+
+def rerun_all(root: Path, model: FakeModel) -> None:
+    """Every phase in order, saved with save_interim_data (no memoization)."""
+    config = _config(root)
+    interim = root / "rerun_all"
+    interim.mkdir(exist_ok=True)
+    upstream: Dict[str, Dict[str, Any]] = {}
+    for phase in _pipeline(root, model).phases.values():
+        inputs = PhaseInputs(
+            config, dict(phase.params), {r: upstream[r] for r in phase.requires}
+        )
+        produced = phase.run(inputs)
+        for filename, data in produced.items():
+            save_interim_data(interim, data, filename, phase.name)
+        upstream[phase.name] = {
+            f: load_interim_data(interim, f, phase.name) for f in produced
+        }
+
+
+def _interim_files(directory: Path) -> Dict[str, bytes]:
+    return {
+        str(p.relative_to(directory)): p.read_bytes()
+        for p in sorted(directory.glob("phase*/*.json"))
+    }
+
+
+def _statuses(results: Dict[str, Any]) -> Dict[str, str]:
+    return {name: result.status for name, result in results.items()}
+
+
+def check_equivalence() -> int:
+    """
+    Assert memoized runs produce the interim files of a full rerun.
+
+    Returns:
+        Number of pipeline runs checked
+    """
+    root = _workspace()
+    runs = 0
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):  # save/load prints
+            rerun_all(root, FakeModel(0))
+        expected = _interim_files(root / "rerun_all")
+        interim = root / "interim_data"
+
+        model = FakeModel(0)
+        results = _pipeline(root, model).run()
+        assert set(_statuses(results).values()) == {"ran"}
+        assert _interim_files(interim) == expected
+        runs += 1
+
+        # Unchanged inputs: nothing runs, files untouched
+        model.calls.clear()
+        results = _pipeline(root, model).run()
+        assert set(_statuses(results).values()) == {"cached"} and not model.calls
+        assert _interim_files(interim) == expected
+        runs += 1
+
+        # A shard prompt edit reruns that shard and what depends on it
+        prompt = root / "prompts" / "phase3_b.md"
+        prompt.write_text("<phase3_b prompt, revised>\n")
+        results = _pipeline(root, model).run()
+        ran = {name for name, status in _statuses(results).items() if status == "ran"}
+        assert ran == {"phase3_b", "phase4"}, ran
+        runs += 1
+
+        # Reverting is served from the cache
+        prompt.write_text("<phase3_b prompt>\n")
+        model.calls.clear()
+        results = _pipeline(root, model).run()
+        assert not model.calls and _interim_files(interim) == expected
+        runs += 1
+
+        # config_keys: a key the shards ignore reruns only phases using all keys
+        config = {**_config(root), "DEBUG": True}
+        results = _pipeline(root, model, config=config).run()
+        ran = {name for name, status in _statuses(results).items() if status == "ran"}
+        assert ran == {"phase1", "phase2", "phase4"}, ran
+        # phase1/phase2 outputs are identical, so phase3 inputs are too
+        assert all(results[name].status == "cached" for name in SHARDS)
+        runs += 1
+
+        # force reruns a phase; identical output lets downstream stay cached
+        results = _pipeline(root, model).run(force=["phase2"])
+        assert _statuses(results)["phase2"] == "ran"
+        assert all(results[name].status == "cached" for name in SHARDS)
+        runs += 1
+
+        # A missing store object forces a rerun of its phase
+        pipeline = _pipeline(root, model)
+        digest = results["phase4"].outputs["final_plan"]
+        pipeline._object_path(digest).unlink()
+        results = pipeline.run()
+        assert _statuses(results)["phase4"] == "ran"
+        assert _interim_files(interim) == expected
+        runs += 1
+
+        # A failing shard blocks phase4 only; the other shards still run
+        (root / "prompts" / "phase3_a.md").write_text("<phase3_a prompt v2>\n")
+        (root / "prompts" / "phase3_c.md").write_text("<phase3_c prompt v2>\n")
+        try:
+            _pipeline(root, model, fail="phase3_a").run()
+        except PhaseFailedError as exc:
+            statuses = _statuses(exc.results)
+        else:
+            raise AssertionError("failure not raised")
+        assert statuses["phase3_a"] == "failed" and statuses["phase4"] == "blocked"
+        assert statuses["phase3_c"] == "ran"
+        # ...and neither leaves the previous run's artifacts or manifest entry
+        stale = [
+            f for f in _interim_files(interim) if f.startswith(("phase3_a", "phase4"))
+        ]
+        assert not stale, stale
+        phases = _pipeline(root, model)._load_manifest()["phases"]
+        assert phases["phase3_a"]["status"] == "failed"
+        assert phases["phase4"]["status"] == "blocked"
+        assert not phases["phase4"]["outputs"]
+        runs += 1
+
+        # GC: the bound holds (current artifacts permitting), current survive
+        pipeline = _pipeline(root, model)
+        pipeline.run()
+        before = pipeline.store_size()
+        manifest = pipeline._load_manifest()
+        current = {
+            digest
+            for entry in manifest["phases"].values()
+            for digest in entry["outputs"].values()
+        }
+        current_size = sum(pipeline._object_path(d).stat().st_size for d in current)
+        assert before > current_size
+        pipeline.collect_garbage(current_size)
+        assert pipeline.store_size() == current_size
+        assert all(pipeline._has_object(d) for d in current)
+        results = pipeline.run()
+        assert set(_statuses(results).values()) == {"cached"}
+        runs += 1
+    finally:
+        shutil.rmtree(root)
+    return runs
+
+
+def timings() -> List[Dict[str, Any]]:
+    """Seconds and fake model calls per scenario."""
+    root = _workspace()
+    rows = []
+
+    def measure(name: str, fn) -> None:
+        model = FakeModel()
+        start = time.perf_counter()
+        fn(model)
+        rows.append(
+            {
+                "scenario": name,
+                "seconds": time.perf_counter() - start,
+                "model_calls": sum(model.calls.values()),
+            }
+        )
+
+    prompt = root / "prompts" / "phase3_b.md"
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            measure("rerun-all", lambda model: rerun_all(root, model))
+        measure("cold", lambda model: _pipeline(root, model).run())
+        measure("warm", lambda model: _pipeline(root, model).run())
+        prompt.write_text("<phase3_b prompt, revised>\n")
+        measure("prompt edit", lambda model: _pipeline(root, model).run())
+        prompt.write_text("<phase3_b prompt>\n")
+        measure("revert", lambda model: _pipeline(root, model).run())
+    finally:
+        shutil.rmtree(root)
+    return rows
+
+
+if __name__ == "__main__":
+    print(f"Equivalence: {check_equivalence()} pipeline runs checked")
+    print()
+    print(f"{'scenario':<12} {'seconds':>8} {'model calls':>12}")
+    for row in timings():
+        print(
+            f"{row['scenario']:<12} {row['seconds']:>8.3f} {row['model_calls']:>12}"
+        )
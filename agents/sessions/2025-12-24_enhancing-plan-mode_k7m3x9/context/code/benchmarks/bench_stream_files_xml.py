@@ -0,0 +1,186 @@
+"""
+Benchmark: streaming repository packer vs build_files_dict round trip
+
+Checks iter_files_from_stream / iter_files_xml against build_files_dict and
+format_files_dict_to_xml (randomized 'File:' streams split at every chunk
+size, plus a realistic dump), then packs a multi-hundred-MB synthetic tree
+three ways - each in its own process so peak memory is isolated:
+- build_files_dict + format_files_dict_to_xml over the whole dump
+- iter_files_from_stream over the dump file
+- iter_files_from_disk over the tree
+
+Usage (from context/code):
+    python -m benchmarks.bench_stream_files_xml [total_mb]
+"""
+
+import multiprocessing
+import random
+import re
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from utils.build_files_dict import build_files_dict
+from utils.format_files_dict_to_xml import format_files_dict_to_xml
+from utils.stream_files_xml import (
+    iter_files_from_disk,
+    iter_files_from_stream,
+    iter_files_xml,
+    write_files_xml,
+)
+
+# Fragments biased towards the delimiters the parser has to get right
+_PROPERTY_ALPHABET = ["File: ", "\n```", "```", "\n", "a", " ", "py", "x/y.py", "\t", "``"]
+
+_CODE_LINES = [
+    "def handler(request):",
+    "    return render(request, 'index.html', {'items': items})",
+    "import os",
+    "class Service:",
+    "    async def fetch(self, key: str) -> dict:",
+    "        # TODO: cache the result",
+    "export const Button = ({ label }) => <button>{label}</button>;",
+    "",
+]
+
+
+def check_equivalence(samples: int = 20_000, seed: int = 0) -> int:
+    """
+    Streaming parser/formatter match the reference functions.
+
+    Random streams are compared against the build_files_dict regex (as an
+    ordered list, since the dict collapses duplicate paths) for several
+    chunk sizes; a realistic dump is compared end to end as XML.
+
+    Returns:
+        Number of random streams checked
+    """
+    rng = random.Random(seed)
+    pattern = re.compile(r"File: (.*?)\n```.*?\n(.*?)```", re.DOTALL)
+    for _ in range(samples):
+        text = "".join(rng.choice(_PROPERTY_ALPHABET) for _ in range(rng.randint(0, 30)))
+        expected = [(p.strip(), c.strip()) for p, c in pattern.findall(text)]
+        for size in (1, 2, 3, 7, 1 << 20):
+            chunks = [text[i : i + size] for i in range(0, len(text), size)]
+            if list(iter_files_from_stream(chunks)) != expected:
+                raise AssertionError(f"Parse mismatch for {text!r} (chunk size {size})")
+        if dict(iter_files_from_stream(text)) != build_files_dict(text):
+            raise AssertionError(f"build_files_dict mismatch for {text!r}")
+
+    dump = "".join(
+        f"File: src/module_{n}.py\n```py\n{_synthetic_source(rng, 40)}\n```\n\n"
+        for n in range(200)
+    )
+    files_dict = build_files_dict(dump)
+    streamed = "".join(iter_files_xml(iter_files_from_stream(dump)))
+    if streamed != format_files_dict_to_xml(files_dict):
+        raise AssertionError("XML output differs from format_files_dict_to_xml")
+    return samples
+
+
+def _synthetic_source(rng: random.Random, lines: int) -> str:
+    return "\n".join(rng.choice(_CODE_LINES) for _ in range(lines))
+
+
+def write_tree(root: Path, total_mb: int, seed: int = 0) -> Path:
+    """
+    Write a synthetic source tree of about `total_mb` MB plus its 'File:' dump.
+
+    Returns:
+        Path of the dump file
+    """
+    rng = random.Random(seed)
+    blocks = [_synthetic_source(rng, rng.randint(20, 4000)) for _ in range(64)]
+    dump_path = root / "dump.txt"
+    written = 0
+    n = 0
+    with open(dump_path, "w", encoding="utf-8") as dump:
+        while written < total_mb * 1024 * 1024:
+            relative = f"pkg_{n % 50}/mod_{n}.py"
+            content = rng.choice(blocks)
+            path = root / "tree" / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+            dump.write(f"File: {relative}\n```py\n{content}\n```\n\n")
+            written += len(content)
+            n += 1
+    return dump_path
+
+
+def _pack_reference(dump_path: Path, out_path: Path) -> None:
+    text = dump_path.read_text(encoding="utf-8")
+    out_path.write_text(format_files_dict_to_xml(build_files_dict(text)), encoding="utf-8")
+
+
+def _pack_stream(dump_path: Path, out_path: Path) -> None:
+    with open(dump_path, encoding="utf-8") as src, open(out_path, "w", encoding="utf-8") as out:
+        write_files_xml(iter_files_from_stream(src), out)
+
+
+def _pack_disk(tree: Path, out_path: Path) -> None:
+    with open(out_path, "w", encoding="utf-8") as out:
+        write_files_xml(iter_files_from_disk(tree), out)
+
+
+def _measure(fn: Callable[..., None], args: tuple, queue: Any) -> None:
+    start = time.perf_counter()
+    fn(*args)
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((time.perf_counter() - start, peak_kb / 1024))
+
+
+def _run_isolated(fn: Callable[..., None], *args: Any) -> Dict[str, float]:
+    """Run fn in a fresh process; returns seconds and peak RSS (MB)."""
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=_measure, args=(fn, args, queue))
+    process.start()
+    seconds, peak_mb = queue.get()
+    process.join()
+    return {"seconds": seconds, "peak_rss_mb": peak_mb}
+
+
+def run(total_mb: int = 300, seed: int = 0) -> Dict[str, Any]:
+    """
+    Pack the same synthetic tree with each strategy.
+
+    Returns:
+        Dict with one row per strategy, plus whether outputs matched
+    """
+    rows: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        dump_path = write_tree(root, total_mb, seed)
+        outputs = {}
+        for name, fn, source in (
+            ("build_files_dict + format", _pack_reference, dump_path),
+            ("stream from dump", _pack_stream, dump_path),
+            ("stream from disk", _pack_disk, root / "tree"),
+        ):
+            out_path = root / f"{fn.__name__}.xml"
+            rows.append({"strategy": name, **_run_isolated(fn, source, out_path)})
+            outputs[name] = out_path
+
+        reference = outputs["build_files_dict + format"].read_bytes()
+        identical = outputs["stream from dump"].read_bytes() == reference
+        input_mb = dump_path.stat().st_size / 1024 / 1024
+
+    return {"input_mb": input_mb, "identical": identical, "rows": rows}
+
+
+if __name__ == "__main__":
+    checked = check_equivalence()
+    print(f"Equivalence check: {checked} random streams match the reference")
+
+    results = run(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
+    print(
+        f"Packed {results['input_mb']:.0f} MB dump "
+        f"(stream output identical to reference: {results['identical']})"
+    )
+    print()
+    print(f"{'strategy':<28} {'seconds':>8} {'peak RSS MB':>12}")
+    for row in results["rows"]:
+        print(f"{row['strategy']:<28} {row['seconds']:>8.1f} {row['peak_rss_mb']:>12.0f}")
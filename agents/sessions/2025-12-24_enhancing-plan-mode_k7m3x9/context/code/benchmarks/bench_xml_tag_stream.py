@@ -0,0 +1,119 @@
+"""
+Benchmark: streaming XML tag extractor vs the extract_xml_content regex
+
+Checks extract_xml_tags against the extract_xml_content regex on flat,
+well-formed LLM-style output (same tags, same stripped contents) and checks
+that results do not depend on how the input is chunked. Then times both on
+realistic output and on adversarial inputs that make the backreferencing
+regex go quadratic: many unclosed tags, distinct unclosed tag names and a
+long run of '<' with no '>'.
+
+Usage (from context/code):
+    python -m benchmarks.bench_xml_tag_stream
+"""
+
+import random
+import re
+import time
+from typing import Any, Callable, Dict, List
+
+from utils.xml_tag_stream import extract_xml_tags, iter_xml_tags
+
+# The pattern extract_xml_content runs over the whole file
+_REFERENCE_PATTERN = re.compile(r"<([^>]+)>([\s\S]*?)</\1>")
+
+_WORDS = "the file handler returns a list of items with < and > signs".split()
+
+# Stop growing an input once the regex takes longer than this
+_REGEX_TIME_LIMIT = 2.0
+
+
+def _reference(text: str) -> Dict[str, str]:
+    """extract_xml_content without the file I/O."""
+    return {name: content.strip() for name, content in _REFERENCE_PATTERN.findall(text)}
+
+
+def _llm_output(rng: random.Random, sections: int, words: int) -> str:
+    parts = []
+    for n in range(sections):
+        body = " ".join(rng.choice(_WORDS) for _ in range(words))
+        parts.append(f"Some preamble text.\n<section_{n}>\n{body}\n</section_{n}>\n")
+    return "".join(parts)
+
+
+def check_equivalence(samples: int = 500, seed: int = 0) -> int:
+    """
+    Flat documents give the regex's results; chunking never changes output.
+
+    Returns:
+        Number of documents checked
+    """
+    rng = random.Random(seed)
+    for _ in range(samples):
+        text = _llm_output(rng, rng.randint(0, 8), rng.randint(0, 50))
+        expected = {name: [content] for name, content in _reference(text).items()}
+        if extract_xml_tags(text) != expected:
+            raise AssertionError(f"Mismatch with extract_xml_content for {text!r}")
+
+        whole = list(iter_xml_tags(text))
+        for size in (1, 3, 64):
+            chunks = [text[i : i + size] for i in range(0, len(text), size)]
+            if list(iter_xml_tags(chunks)) != whole:
+                raise AssertionError(f"Chunk size {size} changed the result")
+    return samples
+
+
+def _adversarial_inputs(size: int) -> Dict[str, str]:
+    return {
+        "unclosed <t> tags": "<t>" * (size // 3),
+        "distinct unclosed tags": "".join(f"<t{n}>" for n in range(size // 6)),
+        "'<' without '>'": "<x" * (size // 2),
+    }
+
+
+def _time(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run(
+    sizes=(4_000, 16_000, 64_000, 256_000, 1_000_000), seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Time both extractors; the regex is skipped once it exceeds the limit.
+
+    Returns:
+        Dict with one row per (input kind, size)
+    """
+    rng = random.Random(seed)
+    rows: List[Dict[str, Any]] = []
+    regex_gave_up = set()
+    for size in sizes:
+        inputs = {"realistic LLM output": _llm_output(rng, size // 600, 100)}
+        inputs.update(_adversarial_inputs(size))
+        for kind, text in inputs.items():
+            regex_s = None
+            if kind not in regex_gave_up:
+                regex_s = _time(lambda: _reference(text))
+                if regex_s > _REGEX_TIME_LIMIT:
+                    regex_gave_up.add(kind)
+            rows.append(
+                {
+                    "input": kind,
+                    "chars": len(text),
+                    "regex_s": regex_s,
+                    "stream_s": _time(lambda: extract_xml_tags(text)),
+                }
+            )
+    return {"rows": rows}
+
+
+if __name__ == "__main__":
+    checked = check_equivalence()
+    print(f"Equivalence check: {checked} documents match extract_xml_content")
+    print()
+    print(f"{'input':<24} {'chars':>9} {'regex s':>10} {'stream s':>10}")
+    for row in sorted(run()["rows"], key=lambda r: (r["input"], r["chars"])):
+        regex = f"{row['regex_s']:.4f}" if row["regex_s"] is not None else "skipped"
+        print(f"{row['input']:<24} {row['chars']:>9} {regex:>10} {row['stream_s']:>10.4f}")
@@ -20,24 +20,31 @@ def save_interim_data(
     phase_dir.mkdir(exist_ok=True)
 
     filepath = phase_dir / f"{filename}.json"
+    json_str = serialize_interim_data(data)
+    with open(filepath, "w") as f:
+        f.write(json_str)
 
+    print(f"Saved {filename} to {filepath}")
+    return str(filepath)
+
+
+def serialize_interim_data(data: Any) -> str:
+    """Serialize data to the JSON text save_interim_data writes.
+
+    Args:
+        data: Data to serialize (dict, list, or Pydantic model)
+
+    Returns:
+        JSON text
+    """
     # Handle Pydantic models
     if hasattr(data, "model_dump_json"):
-        json_str = data.model_dump_json(indent=2)
-        with open(filepath, "w") as f:
-            f.write(json_str)
+        return data.model_dump_json(indent=2)
     # Handle lists of Pydantic models
-    elif isinstance(data, list) and data and hasattr(data[0], "model_dump"):
-        json_data = [item.model_dump() for item in data]
-        with open(filepath, "w") as f:
-            json.dump(json_data, f, indent=2)
+    if isinstance(data, list) and data and hasattr(data[0], "model_dump"):
+        return json.dumps([item.model_dump() for item in data], indent=2)
     # Handle regular data
-    else:
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
-
-    print(f"Saved {filename} to {filepath}")
-    return str(filepath)
+    return json.dumps(data, indent=2)
 
 
 def load_interim_data(interim_data_dir: Path, filename: str, phase_name: str) -> Any:
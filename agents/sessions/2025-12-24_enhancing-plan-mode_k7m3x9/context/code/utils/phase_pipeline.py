@@ -0,0 +1,461 @@
+import asyncio
+import hashlib
+import inspect
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from utils.interim_data_management import serialize_interim_data
+
+# Content-addressed store under INTERIM_DATA_DIR
+STORE_DIRNAME = "store"
+MANIFEST_FILENAME = "manifest.json"
+
+
+class PhaseInputs(NamedTuple):
+    """What a phase's run function receives."""
+
+    config: Dict[str, Any]
+    params: Dict[str, Any]
+    # Upstream phase name -> {artifact filename: data}, as load_interim_data
+    # would return it
+    upstream: Dict[str, Dict[str, Any]]
+
+
+@dataclass
+class Phase:
+    """One pipeline phase (e.g. a plan-mode notebook).
+
+    `run` takes PhaseInputs and returns {artifact filename: data}, where data
+    is anything save_interim_data accepts. It may be a coroutine function.
+    Everything that can change its outputs must be declared here: the
+    upstream phases, prompt files, config keys and params are hashed, and
+    `version` is bumped when the phase's code changes.
+    """
+
+    name: str
+    run: Callable[[PhaseInputs], Any]
+    requires: Sequence[str] = ()
+    prompt_files: Sequence[Union[str, Path]] = ()
+    params: Dict[str, Any] = field(default_factory=dict)
+    # get_config() keys the phase depends on (all keys if None)
+    config_keys: Optional[Sequence[str]] = None
+    version: str = "1"
+
+
+class PhaseResult(NamedTuple):
+    """Outcome of one phase in PhasePipeline.run()."""
+
+    name: str
+    status: str  # "ran", "cached", "failed" or "blocked"
+    input_hash: Optional[str]
+    outputs: Dict[str, str]  # artifact filename -> content digest
+    seconds: float
+    error: Optional[str] = None
+
+
+class PhaseFailedError(RuntimeError):
+    """Raised by PhasePipeline.run() when a phase raised."""
+
+    def __init__(self, results: Dict[str, PhaseResult]):
+        self.results = results
+        failed = [r for r in results.values() if r.status == "failed"]
+        super().__init__(
+            "; ".join(f"{r.name}: {r.error}" for r in failed) or "pipeline failed"
+        )
+
+
+class PhasePipeline:
+    """Memoized runner for phases that hand results over as interim data.
+
+    Each phase's input hash covers its name and version, its prompt files,
+    the config values and params it uses, and the content digests of its
+    upstream artifacts. If the manifest holds outputs for that hash and they
+    are still in the store, the phase is skipped. Otherwise it runs, and
+    phases whose upstream phases are done run in parallel threads.
+
+    Artifacts are stored once per content digest under
+    INTERIM_DATA_DIR/store/objects, and copied to
+    INTERIM_DATA_DIR/<phase>/<filename>.json so load_interim_data (and the
+    notebooks) read them as before. Earlier results stay cached until
+    collect_garbage() evicts the least recently used ones to fit max_bytes.
+    A phase that fails or is blocked is marked so in the manifest, and its
+    files under INTERIM_DATA_DIR/<phase> are removed instead of being left
+    over from an earlier run.
+    """
+
+    def __init__(
+        self,
+        phases: Iterable[Phase],
+        interim_data_dir: Optional[Path] = None,
+        config: Optional[Dict[str, Any]] = None,
+        max_workers: int = 4,
+        max_store_bytes: Optional[int] = None,
+        verbose: bool = True,
+    ):
+        """
+        Args:
+            phases: Pipeline phases; `requires` must name other phases
+            interim_data_dir: Defaults to config["INTERIM_DATA_DIR"]
+            config: Defaults to utils.config.get_config()
+            max_workers: Phases running at once
+            max_store_bytes: Run collect_garbage(max_store_bytes) after run()
+            verbose: Print one line per phase
+
+        Raises:
+            ValueError: On duplicate names, unknown requirements or a cycle
+        """
+        if config is None:
+            from utils.config import get_config
+
+            config = get_config()
+        self.config = config
+        self.interim_data_dir = Path(
+            interim_data_dir
+            if interim_data_dir is not None
+            else config["INTERIM_DATA_DIR"]
+        )
+        self.store_dir = self.interim_data_dir / STORE_DIRNAME
+        self.max_workers = max_workers
+        self.max_store_bytes = max_store_bytes
+        self.verbose = verbose
+
+        self.phases: Dict[str, Phase] = {}
+        for phase in phases:
+            if phase.name in self.phases:
+                raise ValueError(f"Duplicate phase: {phase.name}")
+            self.phases[phase.name] = phase
+        self.order = _topological_order(self.phases)
+
+    def run(
+        self, force: Iterable[str] = (), raise_on_error: bool = True
+    ) -> Dict[str, PhaseResult]:
+        """Run every phase whose inputs changed; skip the rest.
+
+        Args:
+            force: Phase names to rerun even if cached
+            raise_on_error: Raise PhaseFailedError once independent phases
+                have finished, if any phase raised
+
+        Returns:
+            Phase name -> PhaseResult, in pipeline order
+
+        Raises:
+            PhaseFailedError: If a phase raised and raise_on_error is set
+        """
+        force = set(force)
+        manifest = self._load_manifest()
+        results: Dict[str, PhaseResult] = {}
+        remaining = list(self.order)
+        running: Dict[Future, tuple] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while remaining or running:
+                for name in list(remaining):
+                    phase = self.phases[name]
+                    statuses = [
+                        results[r].status if r in results else None
+                        for r in phase.requires
+                    ]
+                    if None in statuses:
+                        continue  # an upstream phase is still pending
+                    remaining.remove(name)
+                    if any(s in ("failed", "blocked") for s in statuses):
+                        results[name] = PhaseResult(name, "blocked", None, {}, 0.0)
+                        self._fail(manifest, results[name])
+                        self._log(f"Blocked {name} (upstream phase failed)")
+                        continue
+
+                    upstream = {r: results[r].outputs for r in phase.requires}
+                    input_hash = self.input_hash(phase, upstream)
+                    cached = manifest["cache"].get(input_hash)
+                    if (
+                        name not in force
+                        and cached is not None
+                        and all(map(self._has_object, cached["outputs"].values()))
+                    ):
+                        cached["used_at"] = time.time()
+                        self._finish(manifest, name, input_hash, cached["outputs"])
+                        results[name] = PhaseResult(
+                            name, "cached", input_hash, cached["outputs"], 0.0
+                        )
+                        self._log(f"Skipped {name} (inputs unchanged)")
+                        continue
+
+                    inputs = PhaseInputs(
+                        config=self.config,
+                        params=dict(phase.params),
+                        upstream={
+                            r: {f: self._read_object(d) for f, d in outputs.items()}
+                            for r, outputs in upstream.items()
+                        },
+                    )
+                    future = pool.submit(self._execute, phase, inputs)
+                    running[future] = (name, input_hash)
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, input_hash = running.pop(future)
+                    try:
+                        outputs, seconds = future.result()
+                    except Exception as exc:
+                        results[name] = PhaseResult(
+                            name, "failed", input_hash, {}, 0.0,
+                            f"{type(exc).__name__}: {exc}",
+                        )
+                        self._fail(manifest, results[name])
+                        self._log(f"Failed {name}: {exc}")
+                        continue
+                    manifest["cache"][input_hash] = {
+                        "phase": name,
+                        "outputs": outputs,
+                        "used_at": time.time(),
+                    }
+                    self._finish(manifest, name, input_hash, outputs)
+                    results[name] = PhaseResult(
+                        name, "ran", input_hash, outputs, seconds
+                    )
+                    self._log(f"Ran {name} in {seconds:.1f}s")
+
+        if self.max_store_bytes is not None:
+            self.collect_garbage(self.max_store_bytes)
+        results = {name: results[name] for name in self.order}
+        if raise_on_error and any(r.status == "failed" for r in results.values()):
+            raise PhaseFailedError(results)
+        return results
+
+    def input_hash(self, phase: Phase, upstream: Dict[str, Dict[str, str]]) -> str:
+        """Hash of everything that determines a phase's outputs.
+
+        Args:
+            phase: The phase
+            upstream: Upstream phase name -> {artifact filename: digest}
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        keys = phase.config_keys if phase.config_keys is not None else self.config
+        prompts = {}
+        for prompt_file in phase.prompt_files:
+            with open(prompt_file, "rb") as f:
+                prompts[str(prompt_file)] = hashlib.sha256(f.read()).hexdigest()
+        key = {
+            "phase": phase.name,
+            "version": phase.version,
+            "prompts": prompts,
+            "config": {k: self.config.get(k) for k in sorted(keys)},
+            "params": phase.params,
+            "upstream": upstream,
+        }
+        text = json.dumps(key, sort_keys=True, default=str)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _execute(self, phase: Phase, inputs: PhaseInputs) -> tuple:
+        """Run one phase (in a worker thread) and store its artifacts."""
+        start = time.perf_counter()
+        if inspect.iscoroutinefunction(phase.run):
+            produced = asyncio.run(phase.run(inputs))
+        else:
+            produced = phase.run(inputs)
+        if not isinstance(produced, dict):
+            raise TypeError(
+                f"Phase {phase.name} must return a dict of artifacts, "
+                f"got {type(produced).__name__}"
+            )
+        outputs = {
+            filename: self._write_object(serialize_interim_data(data).encode("utf-8"))
+            for filename, data in produced.items()
+        }
+        return outputs, time.perf_counter() - start
+
+    def _finish(
+        self,
+        manifest: Dict[str, Any],
+        name: str,
+        input_hash: str,
+        outputs: Dict[str, str],
+    ) -> None:
+        """Record a phase's current outputs and materialize them."""
+        previous = manifest["phases"].get(name)
+        manifest["phases"][name] = {"input_hash": input_hash, "outputs": outputs}
+        self._save_manifest(manifest)
+        if previous is not None:
+            self._unmaterialize(name, set(previous["outputs"]) - set(outputs))
+        phase_dir = self.interim_data_dir / name
+        phase_dir.mkdir(parents=True, exist_ok=True)
+        for filename, digest in outputs.items():
+            data = self._object_path(digest).read_bytes()
+            target = phase_dir / f"{filename}.json"
+            if target.exists() and target.read_bytes() == data:
+                continue
+            _atomic_write(target, data)
+
+    def _fail(self, manifest: Dict[str, Any], result: PhaseResult) -> None:
+        """Mark a failed or blocked phase and remove its stale artifacts.
+
+        Its previous outputs no longer match its inputs, so they are deleted
+        from INTERIM_DATA_DIR/<phase> rather than left for the notebooks to
+        read. Cached results stay in the store for a later run.
+        """
+        previous = manifest["phases"].get(result.name)
+        manifest["phases"][result.name] = {
+            "input_hash": result.input_hash,
+            "outputs": {},
+            "status": result.status,
+            "error": result.error,
+        }
+        self._save_manifest(manifest)
+        if previous is not None:
+            self._unmaterialize(result.name, previous["outputs"])
+
+    def _unmaterialize(self, name: str, filenames: Iterable[str]) -> None:
+        """Delete materialized artifacts of a phase."""
+        for filename in filenames:
+            (self.interim_data_dir / name / f"{filename}.json").unlink(
+                missing_ok=True
+            )
+
+    # Content-addressed store
+
+    def _object_path(self, digest: str) -> Path:
+        return self.store_dir / "objects" / digest[:2] / f"{digest[2:]}.json"
+
+    def _has_object(self, digest: str) -> bool:
+        return self._object_path(digest).exists()
+
+    def _write_object(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(path, data)
+        return digest
+
+    def _read_object(self, digest: str) -> Any:
+        return json.loads(self._object_path(digest).read_bytes())
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        path = self.store_dir / MANIFEST_FILENAME
+        try:
+            manifest = json.loads(path.read_text())
+        except (OSError, ValueError):
+            manifest = {}
+        manifest.setdefault("phases", {})
+        manifest.setdefault("cache", {})
+        return manifest
+
+    def _save_manifest(self, manifest: Dict[str, Any]) -> None:
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        text = json.dumps(manifest, indent=2, sort_keys=True)
+        _atomic_write(self.store_dir / MANIFEST_FILENAME, text.encode("utf-8"))
+
+    def store_size(self) -> int:
+        """Total bytes of stored artifacts."""
+        objects = self.store_dir / "objects"
+        return sum(p.stat().st_size for p in objects.glob("*/*.json"))
+
+    def collect_garbage(self, max_bytes: int) -> int:
+        """Evict cached results, least recently used first, to fit max_bytes.
+
+        Artifacts of each phase's current result are never evicted, so the
+        store can stay above max_bytes if they alone exceed it. Objects no
+        cache entry references are always deleted.
+
+        Args:
+            max_bytes: Target total size of stored artifacts
+
+        Returns:
+            Number of bytes freed
+        """
+        manifest = self._load_manifest()
+        current = {
+            entry["input_hash"]
+            for entry in manifest["phases"].values()
+            if "error" not in entry
+        }
+        sizes = {}
+        for path in (self.store_dir / "objects").glob("*/*.json"):
+            sizes[path.parent.name + path.stem] = path.stat().st_size
+
+        # Cache entries referencing each digest, and bytes of referenced ones
+        refs: Dict[str, int] = {}
+        for entry in manifest["cache"].values():
+            for digest in entry["outputs"].values():
+                refs[digest] = refs.get(digest, 0) + 1
+        live_bytes = sum(sizes.get(digest, 0) for digest in refs)
+
+        evictable = sorted(
+            (h for h in manifest["cache"] if h not in current),
+            key=lambda h: manifest["cache"][h]["used_at"],
+        )
+        for input_hash in evictable:
+            if live_bytes <= max_bytes:
+                break
+            for digest in manifest["cache"].pop(input_hash)["outputs"].values():
+                refs[digest] -= 1
+                if not refs[digest]:
+                    del refs[digest]
+                    live_bytes -= sizes.get(digest, 0)
+
+        freed = 0
+        for digest, size in sizes.items():
+            if digest not in refs:
+                self._object_path(digest).unlink()
+                freed += size
+        self._save_manifest(manifest)
+        if freed:
+            self._log(f"Collected {freed} bytes from {self.store_dir}")
+        return freed
+
+    def _log(self, message: str) -> None:
+        if self.verbose:
+            print(message)
+
+
+def _topological_order(phases: Dict[str, Phase]) -> List[str]:
+    """Phase names with requirements first (definition order otherwise)."""
+    order: List[str] = []
+    visiting = set()
+
+    def visit(name: str, path: tuple) -> None:
+        if name in order:
+            return
+        if name in visiting:
+            raise ValueError(f"Phase cycle: {' -> '.join((*path, name))}")
+        if name not in phases:
+            raise ValueError(f"Unknown phase {name!r} required by {path[-1]}")
+        visiting.add(name)
+        for required in phases[name].requires:
+            visit(required, (*path, name))
+        visiting.discard(name)
+        order.append(name)
+
+    for name in phases:
+        visit(name, ())
+    return order
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write via a temp file + rename so readers never see a partial file."""
+    # Unique per thread: two phases may store the same object at once
+    tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
@@ -0,0 +1,163 @@
+import fnmatch
+import os
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+# Directories never worth packing into a prompt
+DEFAULT_EXCLUDE_DIRS = (".git", "node_modules", "__pycache__", ".venv", "venv")
+
+FILE_MARKER = "File: "
+FENCE_OPEN = "\n```"
+FENCE_CLOSE = "```"
+
+
+class _DelimitedReader:
+    """Reads a chunked text stream up to successive delimiters."""
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._buffer = ""
+        # Read position in _buffer (avoids re-slicing the chunk per match)
+        self._pos = 0
+
+    def read_until(self, delimiter: str, keep: bool = True) -> Optional[str]:
+        """Consume text up to and including `delimiter`.
+
+        Args:
+            delimiter: Text to stop at
+            keep: Return the consumed text (False discards it as it streams)
+
+        Returns:
+            The text before the delimiter ("" when keep is False),
+            or None if the stream ended first
+        """
+        parts = []
+        buffer, pos = self._buffer, self._pos
+        while True:
+            index = buffer.find(delimiter, pos)
+            if index >= 0:
+                if keep:
+                    parts.append(buffer[pos:index])
+                self._buffer, self._pos = buffer, index + len(delimiter)
+                return "".join(parts)
+
+            # Hold back a tail that could be the start of a split delimiter
+            cut = max(pos, len(buffer) - len(delimiter) + 1)
+            if keep:
+                parts.append(buffer[pos:cut])
+
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._buffer, self._pos = "", 0
+                return None
+            buffer, pos = buffer[cut:] + chunk, 0
+
+
+def _iter_chunks(
+    source: Union[str, IO[str], Iterable[str]], chunk_size: int
+) -> Iterator[str]:
+    """Normalize a string, text file or iterable of strings into chunks."""
+    if isinstance(source, str):
+        yield source
+    elif hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in source:
+            if chunk:
+                yield chunk
+
+
+def iter_files_from_stream(
+    source: Union[str, IO[str], Iterable[str]], chunk_size: int = 1 << 20
+) -> Iterator[Tuple[str, str]]:
+    """Yield (path, content) pairs from a 'File:' formatted stream.
+
+    Matches the same blocks as build_files_dict:
+    'File: /path/to/file.py\\n```py\\n[content]\\n```'
+    but reads the input incrementally, so memory is bounded by the largest
+    single file. Unlike the dict, a path that appears twice is yielded twice.
+
+    Args:
+        source: Formatted string, text file object, or iterable of text chunks
+        chunk_size: Characters per read when source is a file object
+
+    Yields:
+        (file path, content) with both stripped, in stream order
+    """
+    reader = _DelimitedReader(_iter_chunks(source, chunk_size))
+    while reader.read_until(FILE_MARKER, keep=False) is not None:
+        file_path = reader.read_until(FENCE_OPEN)
+        # Skip the rest of the fence line (language tag)
+        if file_path is None or reader.read_until("\n", keep=False) is None:
+            return
+        content = reader.read_until(FENCE_CLOSE)
+        if content is None:
+            return
+        yield file_path.strip(), content.strip()
+
+
+def iter_files_from_disk(
+    root: Union[str, Path],
+    include: Optional[Sequence[str]] = None,
+    exclude_dirs: Sequence[str] = DEFAULT_EXCLUDE_DIRS,
+    strip: bool = True,
+) -> Iterator[Tuple[str, str]]:
+    """Yield (relative path, content) for files under root, one at a time.
+
+    Args:
+        root: Directory to pack
+        include: Glob patterns matched against the relative path (all if None)
+        exclude_dirs: Directory names to skip entirely
+        strip: Strip content like build_files_dict does
+
+    Yields:
+        (POSIX-style path relative to root, file content), sorted by path
+    """
+    root = Path(root)
+    for dir_path, dir_names, file_names in os.walk(root):
+        dir_names[:] = sorted(d for d in dir_names if d not in exclude_dirs)
+        for file_name in sorted(file_names):
+            file_path = Path(dir_path) / file_name
+            relative = file_path.relative_to(root).as_posix()
+            if include and not any(fnmatch.fnmatch(relative, p) for p in include):
+                continue
+            content = file_path.read_text(encoding="utf-8", errors="replace")
+            yield relative, content.strip() if strip else content
+
+
+def iter_files_xml(files: Iterable[Tuple[str, str]]) -> Iterator[str]:
+    """Yield the <files> document of format_files_dict_to_xml in chunks.
+
+    Args:
+        files: (file path, content) pairs, e.g. files_dict.items()
+
+    Yields:
+        XML text chunks; joined, identical to format_files_dict_to_xml
+    """
+    yield "<files>\n"
+    for file_path, content in files:
+        yield f'  <file path="{file_path}">\n    <content>'
+        yield content
+        yield "</content>\n  </file>\n"
+    yield "</files>\n"
+
+
+def write_files_xml(files: Iterable[Tuple[str, str]], writer: IO[str]) -> int:
+    """Stream the <files> document to a writer.
+
+    Args:
+        files: (file path, content) pairs
+        writer: Text file object (anything with write())
+
+    Returns:
+        Number of characters written
+    """
+    written = 0
+    for chunk in iter_files_xml(files):
+        writer.write(chunk)
+        written += len(chunk)
+    return written
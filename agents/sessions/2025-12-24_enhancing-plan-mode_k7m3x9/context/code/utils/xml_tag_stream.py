@@ -0,0 +1,198 @@
+import re
+from bisect import bisect_right
+from functools import partial
+from typing import (
+    IO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+# A tag is '<' + up to MAX_TAG_LENGTH chars without '<', '>' or newline + '>'.
+# Anything longer is treated as plain text, which bounds the work per '<'.
+MAX_TAG_LENGTH = 256
+
+_TAG = re.compile(r"<([^<>\n]{1,%d})>" % MAX_TAG_LENGTH)
+_PARTIAL_TAG = re.compile(r"<[^<>\n]{0,%d}" % MAX_TAG_LENGTH)
+
+
+class XMLTag(NamedTuple):
+    """A closed tag: its name, raw inner text and enclosing tag names."""
+
+    name: str
+    content: str
+    parents: Tuple[str, ...]
+
+
+class XMLTagStream:
+    """Single-pass, incremental extractor for XML-like tags in LLM output.
+
+    Feed chunks as they arrive; each call returns the tags closed by that
+    chunk (innermost first). Tags are matched with a stack, so nested tags are
+    reported both on their own and as raw text inside their parent. A closing
+    tag with no matching open tag is ignored; open tags left inside a closed
+    parent, or still open at the end of the stream, are dropped.
+
+    Runs in time linear in the input plus the size of the reported contents.
+    Only text inside a still-open tag is retained between chunks.
+    """
+
+    def __init__(self, tags: Optional[Iterable[str]] = None):
+        """
+        Args:
+            tags: Tag names to report (all tags if None); nesting is still
+                tracked through unreported tags
+        """
+        self.tags = set(tags) if tags is not None else None
+
+        # Open tags: (name, absolute offset where its content starts)
+        self._stack: List[Tuple[str, int]] = []
+        self._open_counts: Dict[str, int] = {}
+
+        # Retained input: chunk start offsets and texts
+        self._part_starts: List[int] = []
+        self._parts: List[str] = []
+        self._consumed = 0
+
+        # Unfinished '<...' at the end of the previous chunk
+        self._pending = ""
+
+    def feed(self, chunk: str) -> List[XMLTag]:
+        """Process the next chunk of text.
+
+        Returns:
+            Tags closed within this chunk, in closing order
+        """
+        if not chunk:
+            return []
+        self._part_starts.append(self._consumed)
+        self._parts.append(chunk)
+
+        base = self._consumed - len(self._pending)
+        data = self._pending + chunk
+        self._consumed += len(chunk)
+
+        closed: List[XMLTag] = []
+        scan_end = 0
+        for match in _TAG.finditer(data):
+            self._token(
+                match.group(1), base + match.start(), base + match.end(), closed
+            )
+            scan_end = match.end()
+
+        # Carry a trailing '<...' that may complete in the next chunk
+        self._pending = ""
+        start = data.rfind("<", max(scan_end, len(data) - MAX_TAG_LENGTH - 1))
+        if start >= 0 and _PARTIAL_TAG.fullmatch(data, start):
+            self._pending = data[start:]
+
+        self._trim()
+        return closed
+
+    def close(self) -> None:
+        """Finish the stream; tags still open are dropped."""
+        self._stack.clear()
+        self._open_counts.clear()
+        self._pending = ""
+        self._trim()
+
+    @property
+    def depth(self) -> int:
+        """Number of currently open tags."""
+        return len(self._stack)
+
+    def _token(self, inner: str, start: int, end: int, closed: List[XMLTag]) -> None:
+        if inner[0] == "/":
+            self._close(inner[1:].strip(), start, closed)
+        elif inner[0] not in "!?" and inner[-1] != "/":
+            # Comments, declarations and self-closing tags open nothing
+            name = inner.strip()
+            if name:
+                self._stack.append((name, end))
+                self._open_counts[name] = self._open_counts.get(name, 0) + 1
+
+    def _close(self, name: str, start: int, closed: List[XMLTag]) -> None:
+        if not self._open_counts.get(name):
+            return
+        while True:
+            open_name, content_start = self._stack.pop()
+            self._open_counts[open_name] -= 1
+            if open_name == name:
+                break
+        if self.tags is None or name in self.tags:
+            parents = tuple(open_name for open_name, _ in self._stack)
+            closed.append(XMLTag(name, self._text(content_start, start), parents))
+
+    def _text(self, start: int, end: int) -> str:
+        """Retained input between two absolute offsets."""
+        index = bisect_right(self._part_starts, start) - 1
+        pieces = []
+        while index < len(self._parts) and self._part_starts[index] < end:
+            part_start = self._part_starts[index]
+            pieces.append(
+                self._parts[index][max(0, start - part_start) : end - part_start]
+            )
+            index += 1
+        return "".join(pieces)
+
+    def _trim(self) -> None:
+        """Drop chunks that no open tag (or pending '<') can still need."""
+        keep_from = self._stack[0][1] if self._stack else self._consumed
+        if self._pending:
+            keep_from = min(keep_from, self._consumed - len(self._pending))
+        drop = bisect_right(self._part_starts, keep_from) - 1
+        if self._parts and keep_from >= self._consumed:
+            drop = len(self._parts)
+        if drop > 0:
+            del self._part_starts[:drop]
+            del self._parts[:drop]
+
+
+def iter_xml_tags(
+    chunks: Union[str, IO[str], Iterable[str]],
+    tags: Optional[Iterable[str]] = None,
+    chunk_size: int = 1 << 16,
+) -> Iterator[XMLTag]:
+    """Yield tags from a string, text file or stream of chunks as they close.
+
+    Args:
+        chunks: Input text, text file object, or iterable of text chunks
+        tags: Tag names to report (all tags if None)
+        chunk_size: Characters per read when chunks is a file object
+    """
+    stream = XMLTagStream(tags)
+    if isinstance(chunks, str):
+        chunks = [chunks]
+    elif hasattr(chunks, "read"):
+        chunks = iter(partial(chunks.read, chunk_size), "")
+    for chunk in chunks:
+        yield from stream.feed(chunk)
+    stream.close()
+
+
+def extract_xml_tags(
+    chunks: Union[str, IO[str], Iterable[str]],
+    tags: Optional[Iterable[str]] = None,
+    nested: bool = True,
+) -> Dict[str, List[str]]:
+    """Collect tag contents, keeping every occurrence.
+
+    Args:
+        chunks: Input text, text file object, or iterable of text chunks
+        tags: Tag names to extract (all tags if None)
+        nested: Include tags nested inside other tags
+
+    Returns:
+        Dict with tag names as keys and lists of stripped contents, in
+        closing order
+    """
+    result: Dict[str, List[str]] = {}
+    for tag in iter_xml_tags(chunks, tags):
+        if nested or not tag.parents:
+            result.setdefault(tag.name, []).append(tag.content.strip())
+    return result
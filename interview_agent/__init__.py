@@ -0,0 +1,71 @@
+"""
+Interview Agent
+
+Lazy package namespace for short-lived workers:
+- `import agents.interview_agent` loads nothing but this file
+- Names listed in _EXPORTS import their module on first attribute access,
+  so formatters come without Pydantic and models load on first use
+- Submodule imports (agents.interview_agent.state_schema, ...) work as usual
+
+Usage:
+    from agents.interview_agent import format_minimal_context  # no Pydantic
+    from agents.interview_agent import InterviewState  # loads the schema
+"""
+
+from importlib import import_module
+from typing import Any, List
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    # Pure-string formatters (no Pydantic)
+    "format_interviewer_prompt": "user_prompt_formatter",
+    "format_response_analyzer_prompt": "user_prompt_formatter",
+    "format_transition_generator_prompt": "user_prompt_formatter",
+    "format_followup_generator_prompt": "user_prompt_formatter",
+    "format_minimal_context": "user_prompt_formatter",
+    # Tracing
+    "enable_tracing": "tracing",
+    "disable_tracing": "tracing",
+    "span": "tracing",
+    "traced": "tracing",
+    # State schema (Pydantic)
+    "Exchange": "state_schema",
+    "Insight": "state_schema",
+    "InsightBank": "state_schema",
+    "InterviewConfig": "state_schema",
+    "InterviewState": "state_schema",
+    "QuestionState": "state_schema",
+    "ResponseAnalysis": "state_schema",
+    "create_interview_state": "state_schema",
+    # Runtime
+    "RuntimeInterviewState": "runtime_models",
+    "create_runtime_state": "runtime_models",
+    "FakeLLMClient": "session_runtime",
+    "SessionManager": "session_runtime",
+    "run_turn": "session_runtime",
+    "StateJournal": "state_journal",
+    "Durability": "state_writer",
+    "GroupCommitWriter": "state_writer",
+    "TranscriptWriter": "transcript",
+    "recover_state": "transcript",
+    # Workflow sessions
+    "SessionCatalog": "session_catalog",
+    "CheckpointScheduler": "checkpoint_scheduler",
+    "FakeCheckpointExecutor": "checkpoint_scheduler",
+    "load_plan": "checkpoint_scheduler",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
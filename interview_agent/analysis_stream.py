@@ -0,0 +1,406 @@
+"""
+Streaming Response Analysis for Interview Agent
+
+Parses the response analyzer's ResponseAnalysis JSON while the model is
+still generating it, so the next question can start before the reply ends:
+- ResponseAnalysisStreamParser scans the top-level JSON object once,
+  validating each field against ResponseAnalysis as soon as its value closes
+- on_decision fires once objective_progress and recommendation are known
+  (stream_response_analysis asks for those two fields first; the default
+  analyzer prompt is unchanged)
+- close() returns the same ResponseAnalysis as model_validate_json would
+- StreamingTurnRunner is a TurnRunner that launches the follow-up on the
+  decision, and the transition once insights_extracted is known (so its
+  prompt still carries key_insight)
+
+Clients without stream() are handled by feeding the whole completion.
+"""
+
+import asyncio
+import json
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from pydantic import BaseModel, TypeAdapter
+
+from agents.interview_agent.session_runtime import (
+    COMPLETION_MESSAGE,
+    LLMClient,
+    TurnResult,
+    analyzer_prompt,
+    apply_analysis,
+    apply_follow_up,
+    apply_transition,
+    followup_prompt,
+    transition_prompt,
+    transition_reason_for,
+    wants_follow_up,
+)
+from agents.interview_agent.state_schema import (
+    InterviewState,
+    ResearchObjectiveStatus,
+    ResponseAnalysis,
+)
+
+DECISION_FIELDS = ("objective_progress", "recommendation")
+
+_FIELD_ADAPTERS: Dict[str, TypeAdapter] = {
+    name: TypeAdapter(field.annotation)
+    for name, field in ResponseAnalysis.model_fields.items()
+}
+
+# Next character that can end or escape a JSON string
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+# Scanner states (position inside the top-level object)
+_BEFORE_OBJECT = 0
+_EXPECT_KEY = 1
+_IN_KEY = 2
+_EXPECT_COLON = 3
+_EXPECT_VALUE = 4
+_IN_STRING_VALUE = 5
+_IN_COMPOSITE_VALUE = 6
+_IN_SCALAR_VALUE = 7
+_AFTER_VALUE = 8
+_DONE = 9
+
+_IN_TOKEN = (_IN_KEY, _IN_STRING_VALUE, _IN_COMPOSITE_VALUE, _IN_SCALAR_VALUE)
+
+
+class AnalysisStreamError(ValueError):
+    """Raised when a streamed reply does not hold a complete JSON object."""
+
+
+class AnalysisDecision(BaseModel):
+    """The part of a ResponseAnalysis that decides the next action."""
+
+    objective_progress: ResearchObjectiveStatus
+    recommendation: str
+
+
+# =============================================================================
+# PARSER
+# =============================================================================
+
+
+class ResponseAnalysisStreamParser:
+    """
+    Incremental parser for a ResponseAnalysis JSON reply.
+
+    Text before the first '{' (e.g. a ```json fence) and after the closing
+    '}' is ignored. Each top-level field is validated once its value is
+    complete, so a bad field raises pydantic's ValidationError as soon as it
+    arrives. Every character is scanned once; string bodies are skipped with
+    a regex search.
+
+    Usage:
+        parser = ResponseAnalysisStreamParser(on_decision=start_next_step)
+        async for chunk in client.stream(model, prompt):
+            parser.feed(chunk)
+        analysis = parser.close()
+    """
+
+    def __init__(
+        self,
+        on_decision: Optional[Callable[[AnalysisDecision], None]] = None,
+        on_field: Optional[Callable[[str, Any], None]] = None,
+    ):
+        """
+        Args:
+            on_decision: Called once, when both DECISION_FIELDS are known
+            on_field: Called with (name, validated value) for each field
+        """
+        self.on_decision = on_decision
+        self.on_field = on_field
+        self.fields: Dict[str, Any] = {}
+        self.decision: Optional[AnalysisDecision] = None
+
+        self._buffer = ""
+        self._pos = 0
+        self._state = _BEFORE_OBJECT
+        self._depth = 0
+        self._in_string = False
+        self._key = ""
+        self._token_start = 0
+
+    @property
+    def done(self) -> bool:
+        """True once the top-level object has closed."""
+        return self._state == _DONE
+
+    def feed(self, chunk: str) -> None:
+        """Scan the next chunk of the reply."""
+        if self._state == _DONE or not chunk:
+            return
+        self._buffer += chunk
+        self._scan()
+
+    def close(self) -> ResponseAnalysis:
+        """
+        Finish the stream and validate the whole analysis.
+
+        Raises:
+            AnalysisStreamError: The reply ended before the object closed
+            ValidationError: Required fields are missing
+        """
+        if self._state != _DONE:
+            raise AnalysisStreamError(
+                "Reply ended before the ResponseAnalysis object was complete"
+            )
+        return ResponseAnalysis.model_validate(self.fields)
+
+    def _scan(self) -> None:
+        buffer = self._buffer
+        end = len(buffer)
+        i = self._pos
+
+        if self._state == _BEFORE_OBJECT:
+            i = buffer.find("{", i)
+            if i < 0:
+                self._buffer, self._pos = "", 0
+                return
+            self._state = _EXPECT_KEY
+            self._depth = 1
+            i += 1
+
+        while i < end:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, i)
+                if match is None:
+                    i = end
+                    break
+                j = match.start()
+                if buffer[j] == "\\":
+                    if j + 1 >= end:
+                        # Escape split across chunks: rescan it next time
+                        i = j
+                        break
+                    i = j + 2
+                    continue
+                self._in_string = False
+                i = j + 1
+                if self._state == _IN_KEY:
+                    self._key = json.loads(buffer[self._token_start : i])
+                    self._state = _EXPECT_COLON
+                elif self._state == _IN_STRING_VALUE:
+                    self._complete(buffer[self._token_start : i])
+                continue
+
+            c = buffer[i]
+            state = self._state
+            if c == '"':
+                self._in_string = True
+                if state == _EXPECT_KEY:
+                    self._state, self._token_start = _IN_KEY, i
+                elif state == _EXPECT_VALUE:
+                    self._state, self._token_start = _IN_STRING_VALUE, i
+            elif c in "{[":
+                if state == _EXPECT_VALUE:
+                    self._state, self._token_start = _IN_COMPOSITE_VALUE, i
+                self._depth += 1
+            elif c in "}]":
+                self._depth -= 1
+                if self._depth == 1 and state == _IN_COMPOSITE_VALUE:
+                    self._complete(buffer[self._token_start : i + 1])
+                elif self._depth == 0:
+                    if state == _IN_SCALAR_VALUE:
+                        self._complete(buffer[self._token_start : i])
+                    self._state = _DONE
+                    i += 1
+                    break
+            elif self._depth == 1:
+                if c == ":" and state == _EXPECT_COLON:
+                    self._state = _EXPECT_VALUE
+                elif c == ",":
+                    if state == _IN_SCALAR_VALUE:
+                        self._complete(buffer[self._token_start : i])
+                    self._state = _EXPECT_KEY
+                elif state == _EXPECT_VALUE and not c.isspace():
+                    self._state, self._token_start = _IN_SCALAR_VALUE, i
+            i += 1
+
+        # Keep only the value (or key) still being read
+        keep_from = self._token_start if self._state in _IN_TOKEN else i
+        self._buffer = buffer[keep_from:]
+        self._pos = i - keep_from
+        self._token_start = 0
+
+    def _complete(self, raw: str) -> None:
+        """Validate one top-level value and fire callbacks."""
+        self._state = _AFTER_VALUE
+        key = self._key
+        adapter = _FIELD_ADAPTERS.get(key)
+        if adapter is None:
+            # Unknown fields are ignored, as in ResponseAnalysis itself
+            return
+        try:
+            value = json.loads(raw)
+        except ValueError as e:
+            raise AnalysisStreamError(f"Invalid JSON for field {key!r}: {e}") from e
+        value = adapter.validate_python(value)
+        self.fields[key] = value
+
+        if self.on_field is not None:
+            self.on_field(key, value)
+        if self.decision is None and all(f in self.fields for f in DECISION_FIELDS):
+            self.decision = AnalysisDecision(
+                objective_progress=self.fields["objective_progress"],
+                recommendation=self.fields["recommendation"],
+            )
+            if self.on_decision is not None:
+                self.on_decision(self.decision)
+
+
+def parse_response_analysis(
+    chunks: Iterable[str],
+    on_decision: Optional[Callable[[AnalysisDecision], None]] = None,
+) -> ResponseAnalysis:
+    """Feed an iterable of text chunks through a parser and close it."""
+    parser = ResponseAnalysisStreamParser(on_decision)
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
+
+
+async def stream_response_analysis(
+    state: InterviewState,
+    user_response: str,
+    client: LLMClient,
+    parser: ResponseAnalysisStreamParser,
+) -> ResponseAnalysis:
+    """
+    Run the response analyzer call, feeding the reply to `parser` as it
+    streams (or all at once when the client cannot stream).
+    """
+    model = state.config.analysis_model
+    prompt = analyzer_prompt(state, user_response, decision_fields_first=True)
+    stream = getattr(client, "stream", None)
+    if stream is None:
+        parser.feed(await client.complete(model, prompt))
+    else:
+        async for chunk in stream(model, prompt):
+            parser.feed(chunk)
+    return parser.close()
+
+
+# =============================================================================
+# TURN RUNNER
+# =============================================================================
+
+
+class StreamingMetrics(BaseModel):
+    """Counters for the streaming turn runner."""
+
+    turns: int = 0
+    # Turns whose next call started before the analysis reply finished
+    early_starts: int = 0
+    # Sum over early starts of (analysis end - next call start)
+    lead_seconds: float = 0.0
+
+    @property
+    def mean_lead_seconds(self) -> float:
+        """Average head start per early start."""
+        return self.lead_seconds / self.early_starts if self.early_starts else 0.0
+
+
+class StreamingTurnRunner:
+    """
+    TurnRunner that overlaps generation with the tail of the analysis reply.
+
+    Unlike SpeculativeTurnRunner it never launches a branch that might be
+    discarded: the next call starts only once the analysis has decided, and
+    its prompt is the one run_turn would build.
+
+    It pays off when model latency dominates. Parsing every chunk costs CPU,
+    so on a saturated event loop it gains nothing over run_turn and can be
+    slower (see bench_analysis_stream); run_turn remains the default.
+
+    Usage:
+        runner = StreamingTurnRunner()
+        manager = SessionManager(client, turn_runner=runner)
+    """
+
+    def __init__(self, metrics: Optional[StreamingMetrics] = None):
+        self.metrics = metrics or StreamingMetrics()
+
+    async def __call__(
+        self, state: InterviewState, user_response: str, client: LLMClient
+    ) -> TurnResult:
+        metrics = self.metrics
+        metrics.turns += 1
+        model = state.config.transition_model
+        next_call: Optional[asyncio.Task] = None
+        started_at = 0.0
+
+        def maybe_start(*_: Any) -> None:
+            nonlocal next_call, started_at
+            decision = parser.decision
+            if next_call is not None or decision is None:
+                return
+            if wants_follow_up(state, decision):
+                prompt = followup_prompt(state, user_response)
+            elif "insights_extracted" in parser.fields:
+                insights = parser.fields["insights_extracted"]
+                prompt = transition_prompt(
+                    state,
+                    user_response,
+                    transition_reason_for(decision),
+                    insights[0] if insights else None,
+                )
+                if prompt is None:
+                    return
+            else:
+                return
+            next_call = asyncio.create_task(client.complete(model, prompt))
+            started_at = time.perf_counter()
+
+        parser = ResponseAnalysisStreamParser(maybe_start, maybe_start)
+        try:
+            analysis = await stream_response_analysis(
+                state, user_response, client, parser
+            )
+        except BaseException:
+            if next_call is not None:
+                next_call.cancel()
+            raise
+        if next_call is not None:
+            metrics.early_starts += 1
+            metrics.lead_seconds += time.perf_counter() - started_at
+
+        # The decision only depends on fields run_turn also uses, so an early
+        # call is always the branch wants_follow_up picks. State is applied
+        # only once the next message exists.
+        if wants_follow_up(state, analysis):
+            text = await (
+                next_call
+                or client.complete(model, followup_prompt(state, user_response))
+            )
+            apply_analysis(state, user_response, analysis)
+            apply_follow_up(state, text)
+            action = "follow_up"
+        else:
+            if next_call is None:
+                insights = analysis.insights_extracted
+                prompt = transition_prompt(
+                    state,
+                    user_response,
+                    transition_reason_for(analysis),
+                    insights[0] if insights else None,
+                )
+                text = (
+                    await client.complete(model, prompt)
+                    if prompt
+                    else COMPLETION_MESSAGE
+                )
+            else:
+                text = await next_call
+            apply_analysis(state, user_response, analysis)
+            action = apply_transition(state, analysis, text)
+
+        return TurnResult(
+            session_id=state.session_id,
+            action=action,
+            assistant_message=text,
+            analysis=analysis,
+        )
@@ -0,0 +1,660 @@
+"""
+Columnar Analytics Export for Interview Sessions
+
+Flattens many InterviewState files into four column-oriented tables:
+- sessions:  one row per session
+- questions: one row per question (session_row links to sessions)
+- exchanges: one row per exchange (session_row, question_row)
+- insights:  one row per insight bank entry (session_row)
+
+Files are streamed one at a time straight from JSON (no Pydantic objects),
+so memory holds only the compact columns plus a single parsed file.
+Enum-like columns are dictionary-encoded (small int codes + categories)
+and numbers are packed into typed arrays. The aggregate helpers are not
+vectorized: each is a collections.Counter pass over one or two code arrays,
+which beats walking nested models but is still per-element Python hashing.
+For vectorized work convert with to_numpy() or to_arrow().
+
+Backends:
+- Built in: AnalyticsTables with stdlib array columns
+- pyarrow (optional): to_arrow() with DictionaryArray columns, and
+  export_parquet() writing row groups as files stream in
+- numpy (optional): to_numpy() record arrays with integer codes
+"""
+
+import json
+from array import array
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from agents.interview_agent.state_journal import JOURNAL_FILENAME, StateJournal
+from agents.interview_agent.state_loader import StateLoadError
+from agents.interview_agent.state_schema import (
+    InterviewStatus,
+    ResearchObjectiveStatus,
+)
+
+try:  # optional faster JSON backend
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Stored for missing integers (nullable int columns)
+NULL_INT = -(2**63)
+
+COMPLETED = InterviewStatus.COMPLETED.value
+
+SATISFIED_STATUSES = (
+    ResearchObjectiveStatus.SATISFIED.value,
+    ResearchObjectiveStatus.EXCEEDED.value,
+)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+# =============================================================================
+# COLUMNS
+# =============================================================================
+
+
+class DictColumn:
+    """Dictionary-encoded strings: int32 codes (-1 = null) + categories."""
+
+    __slots__ = ("codes", "categories", "_index")
+
+    def __init__(self) -> None:
+        self.codes = array("i")
+        self.categories: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def append(self, value: Optional[str]) -> None:
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+
+    def code(self, value: str) -> int:
+        """Code of a category (-2, matching nothing, if absent)."""
+        return self._index.get(value, -2)
+
+    def value_counts(self) -> Dict[Optional[str], int]:
+        """Occurrences per category (None for nulls), in category order."""
+        counts = Counter(self.codes)
+        result: Dict[Optional[str], int] = {
+            name: counts[code] for code, name in enumerate(self.categories)
+        }
+        if counts[-1]:
+            result[None] = counts[-1]
+        return result
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        code = self.codes[row]
+        return self.categories[code] if code >= 0 else None
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def clear(self) -> None:
+        """Drop rows, keeping categories (codes stay stable across batches)."""
+        del self.codes[:]
+
+
+class IntColumn:
+    """int64 values; NULL_INT marks nulls."""
+
+    __slots__ = ("values",)
+
+    def __init__(self) -> None:
+        self.values = array("q")
+
+    def append(self, value: Optional[int]) -> None:
+        self.values.append(NULL_INT if value is None else int(value))
+
+    def __getitem__(self, row: int) -> Optional[int]:
+        value = self.values[row]
+        return None if value == NULL_INT else value
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def clear(self) -> None:
+        del self.values[:]
+
+
+class FloatColumn:
+    """float64 values; NaN marks nulls."""
+
+    __slots__ = ("values",)
+
+    def __init__(self) -> None:
+        self.values = array("d")
+
+    def append(self, value: Optional[float]) -> None:
+        self.values.append(float("nan") if value is None else value)
+
+    def __getitem__(self, row: int) -> Optional[float]:
+        value = self.values[row]
+        return None if value != value else value
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def clear(self) -> None:
+        del self.values[:]
+
+
+class StrColumn:
+    """Plain (free-text) strings."""
+
+    __slots__ = ("values",)
+
+    def __init__(self) -> None:
+        self.values: List[Optional[str]] = []
+
+    def append(self, value: Optional[str]) -> None:
+        self.values.append(value)
+
+    def __getitem__(self, row: int) -> Optional[str]:
+        return self.values[row]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def clear(self) -> None:
+        del self.values[:]
+
+
+Column = Union[DictColumn, IntColumn, FloatColumn, StrColumn]
+
+# Table schemas: column name -> column type. Booleans are 0/1 IntColumns;
+# timestamps are IntColumns of wall-clock microseconds since 1970-01-01.
+SCHEMAS: Dict[str, Dict[str, type]] = {
+    "sessions": {
+        "session_id": StrColumn,
+        "title": DictColumn,
+        "status": DictColumn,
+        "created_at": IntColumn,
+        "completed_at": IntColumn,
+        "total_questions": IntColumn,
+        "completed_questions": IntColumn,
+        "total_exchanges": IntColumn,
+        "insight_count": IntColumn,
+        "termination_reason": DictColumn,
+    },
+    "questions": {
+        "session_row": IntColumn,
+        "question_id": DictColumn,
+        "order": IntColumn,
+        "status": DictColumn,
+        "objective_status": DictColumn,
+        "transition_reason": DictColumn,
+        "follow_up_count": IntColumn,
+        "max_follow_ups": IntColumn,
+        "exchange_count": IntColumn,
+        "started_at": IntColumn,
+        "completed_at": IntColumn,
+    },
+    "exchanges": {
+        "session_row": IntColumn,
+        "question_row": IntColumn,
+        "exchange_id": StrColumn,
+        "is_follow_up": IntColumn,
+        "follow_up_reason": DictColumn,
+        "has_response": IntColumn,
+        "response_chars": IntColumn,
+        "objective_progress": DictColumn,
+        "recommendation": DictColumn,
+        "confidence": FloatColumn,
+        "insights_extracted": IntColumn,
+    },
+    "insights": {
+        "session_row": IntColumn,
+        "insight_id": StrColumn,
+        "source_question_id": DictColumn,
+        "category": DictColumn,
+        "importance": DictColumn,
+        "content_chars": IntColumn,
+    },
+}
+
+# Free-text columns added with include_text=True
+TEXT_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "exchanges": ("question_text", "user_response"),
+    "insights": ("content",),
+}
+
+
+class Table:
+    """Named columns of equal length."""
+
+    def __init__(self, name: str, include_text: bool = False):
+        self.name = name
+        self.columns: Dict[str, Column] = {
+            column: column_type() for column, column_type in SCHEMAS[name].items()
+        }
+        if include_text:
+            for column in TEXT_COLUMNS.get(name, ()):
+                self.columns[column] = StrColumn()
+
+    def __getitem__(self, column: str) -> Column:
+        return self.columns[column]
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values())))
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """One row as a dict (decoded values)."""
+        return {name: column[index] for name, column in self.columns.items()}
+
+    def clear(self) -> None:
+        for column in self.columns.values():
+            column.clear()
+
+
+class AnalyticsTables:
+    """The four export tables plus per-file load errors."""
+
+    def __init__(self, include_text: bool = False):
+        self.sessions = Table("sessions", include_text)
+        self.questions = Table("questions", include_text)
+        self.exchanges = Table("exchanges", include_text)
+        self.insights = Table("insights", include_text)
+        self.errors: List[StateLoadError] = []
+        # Rows already flushed (export_parquet); keeps row links global
+        self._row_offsets = {"sessions": 0, "questions": 0}
+
+    @property
+    def tables(self) -> Dict[str, Table]:
+        return {
+            "sessions": self.sessions,
+            "questions": self.questions,
+            "exchanges": self.exchanges,
+            "insights": self.insights,
+        }
+
+    def add_state(self, data: Dict[str, Any]) -> None:
+        """Append one state (InterviewState JSON, as a dict) to the tables."""
+        sessions, questions = self.sessions, self.questions
+        exchanges, insights = self.exchanges, self.insights
+        text = "content" in insights.columns
+
+        session_row = self._row_offsets["sessions"] + len(sessions)
+        bank = data.get("insight_bank") or {}
+        bank_insights = bank.get("insights") or []
+
+        s = sessions.columns
+        s["session_id"].append(data.get("session_id"))
+        s["title"].append(data.get("title"))
+        s["status"].append(data.get("status"))
+        s["created_at"].append(_timestamp(data.get("created_at")))
+        s["completed_at"].append(_timestamp(data.get("completed_at")))
+        s["total_questions"].append(data.get("total_questions"))
+        s["completed_questions"].append(data.get("completed_questions"))
+        s["total_exchanges"].append(data.get("total_exchanges"))
+        s["insight_count"].append(len(bank_insights))
+        s["termination_reason"].append(data.get("termination_reason"))
+
+        q = questions.columns
+        e = exchanges.columns
+        for question in data.get("questions") or ():
+            question_row = self._row_offsets["questions"] + len(questions)
+            question_exchanges = question.get("exchanges") or ()
+            q["session_row"].append(session_row)
+            q["question_id"].append(question.get("id"))
+            q["order"].append(question.get("order"))
+            q["status"].append(question.get("status"))
+            q["objective_status"].append(question.get("objective_status"))
+            q["transition_reason"].append(question.get("transition_reason"))
+            q["follow_up_count"].append(question.get("follow_up_count"))
+            q["max_follow_ups"].append(question.get("max_follow_ups"))
+            q["exchange_count"].append(len(question_exchanges))
+            q["started_at"].append(_timestamp(question.get("started_at")))
+            q["completed_at"].append(_timestamp(question.get("completed_at")))
+
+            for exchange in question_exchanges:
+                response = exchange.get("user_response")
+                analysis = exchange.get("response_analysis") or {}
+                e["session_row"].append(session_row)
+                e["question_row"].append(question_row)
+                e["exchange_id"].append(exchange.get("id"))
+                e["is_follow_up"].append(1 if exchange.get("is_follow_up") else 0)
+                e["follow_up_reason"].append(exchange.get("follow_up_reason"))
+                e["has_response"].append(0 if response is None else 1)
+                e["response_chars"].append(len(response) if response else 0)
+                e["objective_progress"].append(analysis.get("objective_progress"))
+                e["recommendation"].append(analysis.get("recommendation"))
+                e["confidence"].append(analysis.get("confidence"))
+                e["insights_extracted"].append(
+                    len(analysis.get("insights_extracted") or ())
+                )
+                if text:
+                    e["question_text"].append(exchange.get("question_text"))
+                    e["user_response"].append(response)
+
+        i = insights.columns
+        for insight in bank_insights:
+            content = insight.get("content") or ""
+            i["session_row"].append(session_row)
+            i["insight_id"].append(insight.get("id"))
+            i["source_question_id"].append(insight.get("source_question_id"))
+            i["category"].append(insight.get("category"))
+            i["importance"].append(insight.get("importance"))
+            i["content_chars"].append(len(content))
+            if text:
+                i["content"].append(content)
+
+    def clear_rows(self) -> None:
+        """Drop buffered rows (after a flush), keeping dictionaries and links."""
+        self._row_offsets["sessions"] += len(self.sessions)
+        self._row_offsets["questions"] += len(self.questions)
+        for table in self.tables.values():
+            table.clear()
+
+    # -------------------------------------------------------------------------
+    # Optional backends
+    # -------------------------------------------------------------------------
+
+    def to_arrow(self) -> Dict[str, Any]:
+        """pyarrow Tables keyed by table name (dictionary-encoded enums)."""
+        return {name: _arrow_table(table) for name, table in self.tables.items()}
+
+    def to_numpy(self) -> Dict[str, Tuple[Any, Dict[str, List[str]]]]:
+        """
+        NumPy record arrays keyed by table name.
+
+        Returns:
+            {name: (recarray, {dict column: categories})}; dictionary columns
+            hold int32 codes (-1 = null), free text is stored as objects
+        """
+        try:
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("numpy is required for to_numpy: uv add numpy") from e
+
+        result = {}
+        for name, table in self.tables.items():
+            arrays, names, categories = [], [], {}
+            for column_name, column in table.columns.items():
+                names.append(column_name)
+                if isinstance(column, DictColumn):
+                    arrays.append(np.frombuffer(column.codes, dtype=np.int32))
+                    categories[column_name] = list(column.categories)
+                elif isinstance(column, StrColumn):
+                    arrays.append(np.array(column.values, dtype=object))
+                elif isinstance(column, IntColumn):
+                    arrays.append(np.frombuffer(column.values, dtype=np.int64))
+                else:
+                    arrays.append(np.frombuffer(column.values, dtype=np.float64))
+            result[name] = (np.rec.fromarrays(arrays, names=names), categories)
+        return result
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+
+def iter_state_dicts(
+    paths: Iterable[Path], errors: Optional[List[StateLoadError]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield each state file as parsed JSON, one file in memory at a time.
+
+    Journaled sessions are replayed through StateJournal. Unreadable files
+    are appended to `errors` (when given) and skipped.
+    """
+    for path in paths:
+        path = Path(path)
+        try:
+            if (path.parent / JOURNAL_FILENAME).exists():
+                journal = StateJournal(path.parent, fsync=False)
+                try:
+                    yield journal.load().model_dump(mode="json")
+                finally:
+                    journal.close()
+                continue
+            data = _json_loads(path.read_bytes())
+            if not isinstance(data, dict):
+                raise ValueError("State file does not hold a JSON object")
+        except Exception as exc:  # reported per file
+            if errors is not None:
+                errors.append(
+                    StateLoadError(
+                        path=str(path),
+                        error_type=type(exc).__name__,
+                        message=str(exc),
+                    )
+                )
+            continue
+        yield data
+
+
+def export_tables(
+    paths: Iterable[Path],
+    completed_only: bool = True,
+    include_text: bool = False,
+) -> AnalyticsTables:
+    """
+    Stream state files into in-memory columnar tables.
+
+    Args:
+        paths: state.json files (e.g. from state_loader.discover_state_files)
+        completed_only: Skip sessions whose status is not "completed"
+        include_text: Also keep question / response / insight text
+
+    Returns:
+        AnalyticsTables (per-file errors in .errors)
+    """
+    tables = AnalyticsTables(include_text)
+    for data in iter_state_dicts(paths, tables.errors):
+        if completed_only and data.get("status") != COMPLETED:
+            continue
+        tables.add_state(data)
+    return tables
+
+
+def export_parquet(
+    paths: Iterable[Path],
+    out_dir: Path,
+    completed_only: bool = True,
+    include_text: bool = False,
+    batch_sessions: int = 1000,
+) -> AnalyticsTables:
+    """
+    Stream state files into <out_dir>/<table>.parquet (requires pyarrow).
+
+    Rows are flushed as one row group per `batch_sessions` sessions, so
+    memory stays bounded by a batch regardless of the number of files.
+
+    Returns:
+        The (emptied) AnalyticsTables, for its errors and dictionaries
+    """
+    pa, pq = _require_pyarrow()
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    tables = AnalyticsTables(include_text)
+    writers: Dict[str, Any] = {}
+
+    def flush() -> None:
+        for name, table in tables.tables.items():
+            arrow_table = _arrow_table(table)
+            writer = writers.get(name)
+            if writer is None:
+                writer = writers[name] = pq.ParquetWriter(
+                    str(out_dir / f"{name}.parquet"), _arrow_schema(table)
+                )
+            writer.write_table(arrow_table)
+        tables.clear_rows()
+
+    try:
+        for data in iter_state_dicts(paths, tables.errors):
+            if completed_only and data.get("status") != COMPLETED:
+                continue
+            tables.add_state(data)
+            if len(tables.sessions) >= batch_sessions:
+                flush()
+        flush()
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return tables
+
+
+# =============================================================================
+# AGGREGATES (Counter over code / value arrays; no numpy or pyarrow needed)
+# =============================================================================
+
+
+def objective_satisfaction_rate(
+    tables: AnalyticsTables, by_question: bool = False
+) -> Union[float, Dict[str, float]]:
+    """
+    Share of questions whose objective ended satisfied or exceeded.
+
+    Args:
+        by_question: Return {question_id: rate} instead of one overall rate
+    """
+    status = tables.questions["objective_status"]
+    satisfied = {status.code(value) for value in SATISFIED_STATUSES}
+    if not by_question:
+        counts = Counter(status.codes)
+        total = len(status)
+        return sum(counts[code] for code in satisfied) / total if total else 0.0
+
+    question_ids = tables.questions["question_id"]
+    pairs = Counter(zip(question_ids.codes, status.codes))
+    totals: Counter = Counter()
+    hits: Counter = Counter()
+    for (question_code, status_code), count in pairs.items():
+        totals[question_code] += count
+        if status_code in satisfied:
+            hits[question_code] += count
+    return {
+        question_ids.categories[code]: hits[code] / total
+        for code, total in totals.items()
+        if code >= 0
+    }
+
+
+def follow_up_stats(tables: AnalyticsTables) -> Dict[str, Any]:
+    """Mean / max follow-ups per question and the follow-up count histogram."""
+    values = tables.questions["follow_up_count"].values
+    histogram = Counter(values)
+    histogram.pop(NULL_INT, None)
+    total = sum(histogram.values())
+    return {
+        "questions": total,
+        "mean": sum(value * count for value, count in histogram.items()) / total
+        if total
+        else 0.0,
+        "max": max(histogram) if histogram else 0,
+        "histogram": dict(sorted(histogram.items())),
+    }
+
+
+def transition_reason_counts(tables: AnalyticsTables) -> Dict[Optional[str], int]:
+    """Questions per TransitionReason value (None: never transitioned)."""
+    return tables.questions["transition_reason"].value_counts()
+
+
+def insight_category_counts(
+    tables: AnalyticsTables, by_importance: bool = False
+) -> Dict[Any, int]:
+    """
+    Insights per category (None: uncategorized).
+
+    Args:
+        by_importance: Count (category, importance) pairs instead
+    """
+    category = tables.insights["category"]
+    if not by_importance:
+        return category.value_counts()
+    importance = tables.insights["importance"]
+    return {
+        (category.categories[c] if c >= 0 else None, importance.categories[i]): n
+        for (c, i), n in Counter(zip(category.codes, importance.codes)).items()
+    }
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+
+def _timestamp(value: Optional[str]) -> Optional[int]:
+    """ISO timestamp -> wall-clock microseconds since 1970-01-01."""
+    if not value:
+        return None
+    moment = datetime.fromisoformat(value)
+    delta = moment.replace(tzinfo=None) - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for Arrow / Parquet export: uv add pyarrow"
+        ) from e
+    return pa, pq
+
+
+def _arrow_schema(table: Table):
+    pa, _ = _require_pyarrow()
+    fields = []
+    for name, column in table.columns.items():
+        if isinstance(column, DictColumn):
+            field_type = pa.dictionary(pa.int32(), pa.string())
+        elif isinstance(column, IntColumn):
+            field_type = pa.int64()
+        elif isinstance(column, FloatColumn):
+            field_type = pa.float64()
+        else:
+            field_type = pa.string()
+        fields.append(pa.field(name, field_type))
+    return pa.schema(fields)
+
+
+def _arrow_table(table: Table):
+    pa, _ = _require_pyarrow()
+    arrays = []
+    for column in table.columns.values():
+        if isinstance(column, DictColumn):
+            codes = pa.array(
+                column.codes, type=pa.int32(), mask=_null_mask(column.codes, -1)
+            )
+            arrays.append(
+                pa.DictionaryArray.from_arrays(
+                    codes, pa.array(column.categories, type=pa.string())
+                )
+            )
+        elif isinstance(column, IntColumn):
+            arrays.append(
+                pa.array(
+                    column.values,
+                    type=pa.int64(),
+                    mask=_null_mask(column.values, NULL_INT),
+                )
+            )
+        elif isinstance(column, FloatColumn):
+            # from_pandas: NaN becomes null
+            arrays.append(
+                pa.array(column.values, type=pa.float64(), from_pandas=True)
+            )
+        else:
+            arrays.append(pa.array(column.values, type=pa.string()))
+    return pa.Table.from_arrays(arrays, schema=_arrow_schema(table))
+
+
+def _null_mask(values: array, null: int):
+    pa, _ = _require_pyarrow()
+    return pa.array([value == null for value in values], type=pa.bool_())
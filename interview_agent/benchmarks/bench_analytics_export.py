@@ -0,0 +1,239 @@
+"""
+Benchmark: analytics export + code-counting aggregates vs per-object loops
+
+Writes thousands of completed synthetic sessions, then answers the usual
+analytics questions (objective satisfaction rate overall and per question,
+follow-up stats, TransitionReason distribution, insight categories) two ways:
+- today: InterviewState.model_validate_json per file, then walking the
+  nested questions / exchanges / insights lists
+- export_tables once (streamed, no Pydantic), then the aggregate helpers,
+  which count dictionary codes with collections.Counter (not vectorized)
+
+Reports load/export time, query time over already-loaded data, and peak
+traced memory for holding every session as models vs as columns.
+check_equivalence() asserts both paths give identical answers.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_analytics_export
+"""
+
+import random
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from agents.interview_agent.analytics_export import (
+    SATISFIED_STATUSES,
+    AnalyticsTables,
+    export_tables,
+    follow_up_stats,
+    insight_category_counts,
+    objective_satisfaction_rate,
+    transition_reason_counts,
+)
+from agents.interview_agent.benchmarks.synthetic import build_synthetic_state
+from agents.interview_agent.state_loader import discover_state_files
+from agents.interview_agent.state_schema import (
+    InterviewState,
+    ResearchObjectiveStatus,
+    TransitionReason,
+)
+
+
+def write_completed_sessions(root: Path, sessions: int, seed: int = 0) -> None:
+    """Write `sessions` completed interviews with varied outcomes."""
+    rng = random.Random(seed)
+    templates = [
+        build_synthetic_state(questions=8, seed=rng.randrange(1 << 30))
+        for _ in range(8)
+    ]
+    reasons = list(TransitionReason)
+    objectives = list(ResearchObjectiveStatus)
+    for n in range(sessions):
+        state = templates[n % len(templates)]
+        state.session_id = f"session-{n:05d}"
+        for question in state.questions:
+            question.transition_reason = rng.choice(reasons)
+            question.objective_status = rng.choice(objectives)
+            question.follow_up_count = rng.randint(0, question.max_follow_ups)
+        session_dir = root / state.session_id
+        session_dir.mkdir(parents=True, exist_ok=True)
+        (session_dir / "state.json").write_text(
+            state.model_dump_json(indent=2), encoding="utf-8"
+        )
+
+
+# =============================================================================
+# PER-OBJECT REFERENCE
+# =============================================================================
+
+
+def load_models(paths: List[Path]) -> List[InterviewState]:
+    """Today's path: validate every file into InterviewState."""
+    states = []
+    for path in paths:
+        state = InterviewState.model_validate_json(path.read_bytes())
+        if state.status.value == "completed":
+            states.append(state)
+    return states
+
+
+def loop_aggregates(states: List[InterviewState]) -> Dict[str, Any]:
+    """The aggregate helpers' answers, computed by walking the models."""
+    questions = satisfied = 0
+    per_question: Dict[str, List[int]] = {}
+    follow_ups: Counter = Counter()
+    reasons: Counter = Counter()
+    categories: Counter = Counter()
+    for state in states:
+        for question in state.questions:
+            questions += 1
+            hit = question.objective_status.value in SATISFIED_STATUSES
+            satisfied += hit
+            counts = per_question.setdefault(question.id, [0, 0])
+            counts[0] += hit
+            counts[1] += 1
+            follow_ups[question.follow_up_count] += 1
+            reason = question.transition_reason
+            reasons[reason.value if reason else None] += 1
+        for insight in state.insight_bank.insights:
+            categories[insight.category] += 1
+    total = sum(follow_ups.values())
+    return {
+        "satisfaction": satisfied / questions if questions else 0.0,
+        "satisfaction_by_question": {q: h / n for q, (h, n) in per_question.items()},
+        "follow_up_mean": sum(v * c for v, c in follow_ups.items()) / total,
+        "follow_up_histogram": dict(sorted(follow_ups.items())),
+        "transition_reasons": dict(reasons),
+        "insight_categories": dict(categories),
+    }
+
+
+def code_count_aggregates(tables: AnalyticsTables) -> Dict[str, Any]:
+    """Same answers by counting codes in the exported tables."""
+    stats = follow_up_stats(tables)
+    return {
+        "satisfaction": objective_satisfaction_rate(tables),
+        "satisfaction_by_question": objective_satisfaction_rate(tables, True),
+        "follow_up_mean": stats["mean"],
+        "follow_up_histogram": stats["histogram"],
+        "transition_reasons": transition_reason_counts(tables),
+        "insight_categories": insight_category_counts(tables),
+    }
+
+
+def _normalize(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop zero counts and key order so both paths compare equal."""
+    normalized = {}
+    for key, value in result.items():
+        if isinstance(value, dict):
+            value = {k: v for k, v in value.items() if v}
+        normalized[key] = value
+    return normalized
+
+
+def check_equivalence(sessions: int = 200) -> int:
+    """
+    Assert code-count aggregates equal the per-object loop, and the tables hold
+    one row per question / exchange / insight.
+
+    Returns:
+        Number of sessions compared
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_completed_sessions(root, sessions)
+        (root / "broken").mkdir()
+        (root / "broken" / "state.json").write_text("{not json", encoding="utf-8")
+        paths = discover_state_files([root])
+
+        states = load_models([p for p in paths if p.parent.name != "broken"])
+        tables = export_tables(paths)
+
+    assert len(tables.errors) == 1 and len(tables.sessions) == len(states)
+    expected = _normalize(loop_aggregates(states))
+    assert _normalize(code_count_aggregates(tables)) == expected
+    assert len(tables.questions) == sum(len(s.questions) for s in states)
+    assert len(tables.exchanges) == sum(
+        len(q.exchanges) for s in states for q in s.questions
+    )
+    assert len(tables.insights) == sum(len(s.insight_bank.insights) for s in states)
+    first = tables.questions.row(0)
+    question = states[0].questions[0]
+    assert first["question_id"] == question.id
+    assert first["objective_status"] == question.objective_status.value
+    return len(states)
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+
+def _timed(fn: Callable[[], Any], repeat: int = 1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def _peak_bytes(fn: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(sessions: int = 2000, seed: int = 0) -> Dict[str, Any]:
+    """
+    Time loading and querying with both approaches.
+
+    Returns:
+        Dict with seconds per phase and peak traced memory
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_completed_sessions(root, sessions, seed)
+        paths = discover_state_files([root])
+
+        states, load_s = _timed(lambda: load_models(paths))
+        tables, export_s = _timed(lambda: export_tables(paths))
+        _, loop_query_s = _timed(lambda: loop_aggregates(states), repeat=5)
+        _, count_query_s = _timed(lambda: code_count_aggregates(tables), repeat=5)
+
+        del states, tables
+        models_peak = _peak_bytes(lambda: load_models(paths))
+        columns_peak = _peak_bytes(lambda: export_tables(paths))
+
+    return {
+        "sessions": sessions,
+        "load_models_s": load_s,
+        "export_tables_s": export_s,
+        "loop_query_s": loop_query_s,
+        "count_query_s": count_query_s,
+        "models_peak_mb": models_peak / 1e6,
+        "columns_peak_mb": columns_peak / 1e6,
+    }
+
+
+if __name__ == "__main__":
+    print(f"Equivalence: {check_equivalence()} sessions, identical aggregates")
+    print()
+    r = run()
+    print(f"{r['sessions']} completed sessions")
+    print()
+    print(f"{'phase':<30} {'per-object':>11} {'export':>10} {'speedup':>8}")
+    for label, loop_value, export_value in (
+        ("load / export (s)", r["load_models_s"], r["export_tables_s"]),
+        ("all aggregates (ms)", r["loop_query_s"] * 1e3, r["count_query_s"] * 1e3),
+        ("peak traced memory (MB)", r["models_peak_mb"], r["columns_peak_mb"]),
+    ):
+        print(
+            f"{label:<30} {loop_value:>11.2f} {export_value:>10.2f} "
+            f"{loop_value / export_value:>7.1f}x"
+        )
@@ -0,0 +1,334 @@
+"""
+Benchmark: parallel checkpoint scheduling vs sequential build mode
+
+Runs plans through CheckpointScheduler with FakeCheckpointExecutor sleeping
+a fixed time per checkpoint:
+- sequential: max_parallel=1 (one checkpoint at a time, as build mode does)
+- parallel: no cap
+
+Plans: the real agents/sessions plan.json files (when present) and synthetic
+shapes (wide fan-out, layered random DAG, a chain). Reports makespan,
+critical path and achieved parallelism; with enough width the parallel
+makespan approaches the critical path instead of the summed work.
+
+check_equivalence() asserts that no checkpoint starts before its
+prerequisites finished, every status is written back to plan.json (other
+fields untouched), cycles / unknown / duplicate ids are rejected, failures
+block only their dependents, max_parallel holds, reruns skip completed
+checkpoints and a cancelled run leaves plan.json pending.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_checkpoint_scheduler
+"""
+
+import asyncio
+import json
+import random
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from agents.interview_agent.checkpoint_scheduler import (
+    CheckpointScheduler,
+    FakeCheckpointExecutor,
+    PlanCycleError,
+    PlanError,
+    ScheduleReport,
+    build_graph,
+    load_plan,
+)
+from agents.interview_agent.state_loader import WORKFLOW_SESSIONS_DIR
+
+STEP_SECONDS = 0.02  # fake duration of one checkpoint
+
+
+# =============================================================================
+# PLANS
+# =============================================================================
+
+
+def _checkpoints(prerequisites: List[List[int]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": n + 1,
+            "title": f"Checkpoint {n + 1}",
+            "goal": "synthetic",
+            "prerequisites": before,
+            "status": "pending",
+        }
+        for n, before in enumerate(prerequisites)
+    ]
+
+
+def fan_out(width: int) -> List[Dict[str, Any]]:
+    """1 setup checkpoint -> `width` independent ones -> 1 integration."""
+    middle = [[1] for _ in range(width)]
+    return _checkpoints([[], *middle, list(range(2, width + 2))])
+
+
+def layered(layers: int, width: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Random DAG: each checkpoint depends on 1-3 of the previous layer."""
+    rng = random.Random(seed)
+    prerequisites: List[List[int]] = []
+    previous: List[int] = []
+    for _ in range(layers):
+        layer = []
+        for _ in range(width):
+            before = rng.sample(previous, min(len(previous), rng.randint(1, 3)))
+            prerequisites.append(sorted(before))
+            layer.append(len(prerequisites))
+        previous = layer
+    return _checkpoints(prerequisites)
+
+
+def chain(length: int) -> List[Dict[str, Any]]:
+    return _checkpoints([[n] if n else [] for n in range(length)])
+
+
+def real_plans() -> List[Tuple[str, List[Dict[str, Any]]]]:
+    """(session name, checkpoints with statuses reset) for each real plan."""
+    plans = []
+    for path in sorted(WORKFLOW_SESSIONS_DIR.glob("*/plan.json")):
+        checkpoints = json.loads(path.read_text(encoding="utf-8"))["checkpoints"]
+        for checkpoint in checkpoints:
+            checkpoint["status"] = "pending"
+        plans.append((path.parent.name, checkpoints))
+    return plans
+
+
+def _write_plan(path: Path, checkpoints: List[Dict[str, Any]]) -> Dict[str, Any]:
+    document = {
+        "$schema": "Plan schema for session checkpoint-based planning",
+        "session_id": path.parent.name,
+        "updated_at": "2026-01-01T00:00:00Z",
+        "status": "finalized",
+        "checkpoints": checkpoints,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    return document
+
+
+def _run(path: Path, executor: FakeCheckpointExecutor, **kwargs: Any) -> ScheduleReport:
+    scheduler = CheckpointScheduler(load_plan(path), executor, fsync=False, **kwargs)
+    return asyncio.run(scheduler.run())
+
+
+# =============================================================================
+# EQUIVALENCE
+# =============================================================================
+
+
+class _LoggingExecutor(FakeCheckpointExecutor):
+    """Records ("start" | "end", id) events in one sequence."""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.events: List[Tuple[str, str]] = []
+
+    async def run(self, checkpoint: Any) -> None:
+        self.events.append(("start", checkpoint.id))
+        try:
+            await super().run(checkpoint)
+        finally:
+            self.events.append(("end", checkpoint.id))
+
+
+def _check_plan(path: Path, checkpoints: List[Dict[str, Any]], **kwargs: Any) -> None:
+    """Run one plan; assert ordering, write-back and report invariants."""
+    original = _write_plan(path, checkpoints)
+    rng = random.Random(len(checkpoints))
+    durations = {str(c["id"]): rng.uniform(0, 0.004) for c in checkpoints}
+    executor = _LoggingExecutor(durations)
+    report = _run(path, executor, **kwargs)
+
+    position = {event: n for n, event in enumerate(executor.events)}
+    for checkpoint in checkpoints:
+        start = position[("start", str(checkpoint["id"]))]
+        for prerequisite in checkpoint["prerequisites"]:
+            assert position[("end", str(prerequisite))] < start
+    assert sorted(report.completed) == sorted(str(c["id"]) for c in checkpoints)
+    assert not report.failed and not report.blocked
+
+    written = json.loads(path.read_text(encoding="utf-8"))
+    assert [c["status"] for c in written["checkpoints"]] == ["completed"] * len(
+        checkpoints
+    )
+    for key in ("$schema", "session_id", "status"):
+        assert written[key] == original[key]
+    for before, after in zip(original["checkpoints"], written["checkpoints"]):
+        assert {**before, "status": "completed"} == after
+
+    graph = build_graph(checkpoints)
+    length, critical = graph.critical_path(report.durations)
+    assert (length, critical) == (
+        report.critical_path_seconds,
+        report.critical_path,
+    )
+    assert report.work_seconds + 1e-9 >= report.critical_path_seconds
+    if kwargs.get("max_parallel"):
+        assert executor.max_active <= kwargs["max_parallel"]
+
+    # A rerun skips everything
+    rerun = FakeCheckpointExecutor()
+    report = _run(path, rerun)
+    assert not rerun.started and len(report.skipped) == len(checkpoints)
+
+
+def _check_errors() -> int:
+    checks = 0
+    cases = {
+        "self": [[1]],
+        "three": [[3], [1], [2]],
+        "tail": [[], [1], [4], [3, 2]],
+    }
+    for name, prerequisites in cases.items():
+        try:
+            build_graph(_checkpoints(prerequisites))
+        except PlanCycleError as exc:
+            cycle = exc.cycle
+            assert cycle[0] == cycle[-1], (name, cycle)
+            for before, after in zip(cycle, cycle[1:]):
+                raw = prerequisites[int(after) - 1]
+                assert int(before) in raw, (name, cycle)
+            checks += 1
+        else:
+            raise AssertionError(f"cycle not detected: {name}")
+    for bad in (
+        [{"id": 1, "prerequisites": [2]}],
+        [{"id": 1}, {"id": 1}],
+        [{"title": "no id"}],
+        [{"id": 1, "prerequisites": "1"}],
+    ):
+        try:
+            build_graph(bad)
+        except PlanCycleError:
+            raise AssertionError(bad)
+        except PlanError:
+            checks += 1
+        else:
+            raise AssertionError(f"accepted {bad}")
+    return checks
+
+
+def _check_failure_and_resume(root: Path) -> int:
+    # 1 -> {2, 3}; 2 -> 4; 3 -> 5; 4 -> 6. Failing 2 blocks 4 and 6 only
+    path = root / "failure" / "plan.json"
+    _write_plan(path, _checkpoints([[], [1], [1], [2], [3], [4]]))
+    report = _run(path, FakeCheckpointExecutor(fail={"2"}))
+    assert list(report.failed) == ["2"]
+    assert report.completed == ["1", "3", "5"]
+    assert report.blocked == ["4", "6"]
+    statuses = [c["status"] for c in json.loads(path.read_text())["checkpoints"]]
+    assert statuses == [
+        "completed", "failed", "completed", "pending", "completed", "pending"
+    ]
+
+    # The rerun retries the failed checkpoint and finishes its dependents
+    executor = FakeCheckpointExecutor()
+    report = _run(path, executor)
+    assert executor.started == ["2", "4", "6"]
+    assert report.skipped == ["1", "3", "5"]
+
+    # Cancelling mid-run writes in-progress checkpoints back as pending
+    path = root / "cancel" / "plan.json"
+    _write_plan(path, fan_out(4))
+
+    async def cancel_midway() -> None:
+        scheduler = CheckpointScheduler(
+            load_plan(path), FakeCheckpointExecutor(default_duration=0.05), fsync=False
+        )
+        task = asyncio.ensure_future(scheduler.run())
+        await asyncio.sleep(0.07)  # setup done, the fan-out running
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(cancel_midway())
+    statuses = [c["status"] for c in json.loads(path.read_text())["checkpoints"]]
+    assert statuses == ["completed", *["pending"] * 5], statuses
+    return 3
+
+
+def check_equivalence() -> int:
+    """
+    Assert scheduling invariants on real and synthetic plans.
+
+    Returns:
+        Number of plans and error cases checked
+    """
+    checked = _check_errors()
+    root = Path(tempfile.mkdtemp(prefix="bench_checkpoint_scheduler_"))
+    try:
+        plans = [
+            *real_plans(),
+            ("fan_out", fan_out(12)),
+            ("layered", layered(5, 6)),
+            ("chain", chain(6)),
+        ]
+        for name, checkpoints in plans:
+            for max_parallel in (None, 1, 3):
+                _check_plan(
+                    root / f"{name}-{max_parallel}" / "plan.json",
+                    checkpoints,
+                    max_parallel=max_parallel,
+                )
+                checked += 1
+        checked += _check_failure_and_resume(root)
+    finally:
+        shutil.rmtree(root)
+    return checked
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+
+def makespans() -> List[Dict[str, Any]]:
+    """Sequential vs parallel makespan per plan (STEP_SECONDS per checkpoint)."""
+    plans = [
+        *real_plans(),
+        ("fan_out(16)", fan_out(16)),
+        ("layered(4x8)", layered(4, 8)),
+        ("chain(8)", chain(8)),
+    ]
+    rows = []
+    root = Path(tempfile.mkdtemp(prefix="bench_checkpoint_scheduler_"))
+    try:
+        for name, checkpoints in plans:
+            path = root / "plan.json"
+            row: Dict[str, Any] = {"plan": name, "checkpoints": len(checkpoints)}
+            for mode, max_parallel in (("sequential", 1), ("parallel", None)):
+                _write_plan(path, checkpoints)
+                report = _run(
+                    path,
+                    FakeCheckpointExecutor(default_duration=STEP_SECONDS),
+                    max_parallel=max_parallel,
+                )
+                row[f"{mode}_s"] = report.makespan_seconds
+                row[f"{mode}_parallelism"] = report.parallelism
+            row["critical_path"] = len(build_graph(checkpoints).critical_path()[1])
+            rows.append(row)
+    finally:
+        shutil.rmtree(root)
+    return rows
+
+
+if __name__ == "__main__":
+    print(f"Equivalence: {check_equivalence()} plans and cases checked")
+    print()
+    print(
+        f"{'plan':<40} {'n':>3} {'crit':>4} {'sequential':>11} "
+        f"{'parallel':>9} {'parallelism':>11} {'speedup':>8}"
+    )
+    for row in makespans():
+        print(
+            f"{row['plan'][:40]:<40} {row['checkpoints']:>3} {row['critical_path']:>4} "
+            f"{row['sequential_s'] * 1e3:>9.0f}ms {row['parallel_s'] * 1e3:>7.0f}ms "
+            f"{row['parallel_parallelism']:>11.1f} "
+            f"{row['sequential_s'] / row['parallel_s']:>7.1f}x"
+        )
@@ -0,0 +1,120 @@
+"""
+Benchmark: ConversationHistory vs plain List[Dict[str, str]]
+
+Grows a conversation history to several lengths and reports traced Python
+heap usage plus the cost of the per-turn window read done by
+format_conversation_history. The bounded container should stay flat in
+memory while producing identical prompt sections.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_conversation_history
+"""
+
+import random
+import tempfile
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Dict, List
+
+from agents.interview_agent.benchmarks.synthetic import synthetic_text
+from agents.interview_agent.conversation_history import ConversationHistory
+from agents.interview_agent.user_prompt_formatter import format_conversation_history
+
+
+def _traced(build) -> Any:
+    """Run `build` and return (result, bytes still allocated)."""
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def run(
+    lengths: List[int] = (500, 5_000, 50_000),
+    window: int = 50,
+    max_entries: int = 10,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Run the benchmark.
+
+    Args:
+        lengths: History lengths to measure
+        window: ConversationHistory in-memory window
+        max_entries: Prompt window passed to format_conversation_history
+        seed: RNG seed
+
+    Returns:
+        Dict with one row per history length
+    """
+    rng = random.Random(seed)
+    messages = [synthetic_text(rng, 40) for _ in range(200)]
+    rows = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for length in lengths:
+            roles = ("assistant", "user")
+
+            def build_plain():
+                history = []
+                for n in range(length):
+                    history.append(
+                        {
+                            "role": roles[n % 2],
+                            "content": messages[n % len(messages)][:],
+                            "timestamp": datetime.now().isoformat(),
+                        }
+                    )
+                return history
+
+            def build_bounded():
+                history = ConversationHistory(
+                    window=window, spill_path=Path(tmp) / f"{length}.segment"
+                )
+                for n in range(length):
+                    history.record(roles[n % 2], messages[n % len(messages)][:])
+                return history
+
+            plain, plain_bytes = _traced(build_plain)
+            bounded, bounded_bytes = _traced(build_bounded)
+
+            start = perf_counter_ns()
+            expected = format_conversation_history(plain, max_entries)
+            plain_ns = perf_counter_ns() - start
+
+            start = perf_counter_ns()
+            actual = format_conversation_history(bounded, max_entries)
+            bounded_ns = perf_counter_ns() - start
+
+            if actual.count("<message") != expected.count("<message"):
+                raise AssertionError("Bounded history window differs in size")
+            bounded.close()
+
+            rows.append(
+                {
+                    "entries": length,
+                    "plain_kib": plain_bytes / 1024,
+                    "bounded_kib": bounded_bytes / 1024,
+                    "plain_window_us": plain_ns / 1000,
+                    "bounded_window_us": bounded_ns / 1000,
+                }
+            )
+
+    return {"window": window, "rows": rows}
+
+
+if __name__ == "__main__":
+    results = run()
+    print(f"In-memory window: {results['window']} entries")
+    print(
+        f"{'entries':>8} {'list (KiB)':>11} {'bounded (KiB)':>14} "
+        f"{'list window (us)':>17} {'bounded window (us)':>20}"
+    )
+    for row in results["rows"]:
+        print(
+            f"{row['entries']:>8} {row['plain_kib']:>11.1f} {row['bounded_kib']:>14.1f} "
+            f"{row['plain_window_us']:>17.1f} {row['bounded_window_us']:>20.1f}"
+        )
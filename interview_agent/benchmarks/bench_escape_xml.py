@@ -0,0 +1,122 @@
+"""
+Benchmark: _escape_xml variants
+
+Checks the table-driven _escape_xml (and its memoized variant) against the
+original chained str.replace implementation on randomized inputs, then
+times all three over realistic transcript text.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_escape_xml
+"""
+
+import random
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List
+
+from agents.interview_agent.benchmarks.synthetic import synthetic_text
+from agents.interview_agent.user_prompt_formatter import (
+    _escape_xml,
+    _escape_xml_cached,
+)
+
+# Alphabet biased towards the characters that interact during escaping
+_PROPERTY_ALPHABET = "&<>\"'amp;lgtquos#x1 \t\né中\U0001f600"
+
+
+def _escape_xml_reference(text: str) -> str:
+    """The original five-step chained replace implementation."""
+    if not text:
+        return ""
+    return (
+        text.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("'", "&apos;")
+    )
+
+
+def check_equivalence(samples: int = 20_000, seed: int = 0) -> int:
+    """
+    Property check: both variants match the reference on random strings.
+
+    Also asserts clean strings are returned without a copy.
+
+    Returns:
+        Number of samples checked
+    """
+    rng = random.Random(seed)
+    for _ in range(samples):
+        text = "".join(
+            rng.choice(_PROPERTY_ALPHABET) for _ in range(rng.randint(0, 40))
+        )
+        expected = _escape_xml_reference(text)
+        if _escape_xml(text) != expected or _escape_xml_cached(text) != expected:
+            raise AssertionError(f"Escape mismatch for {text!r}")
+
+    clean = synthetic_text(rng, 50, special_rate=0.0).replace("'", "")
+    clean = clean.replace("&", "and")
+    if _escape_xml(clean) is not clean:
+        raise AssertionError("Clean string was copied")
+
+    if _escape_xml(None) != "" or _escape_xml("") != "":
+        raise AssertionError("Empty input must escape to an empty string")
+    return samples
+
+
+def _time(fn: Callable[[str], str], texts: List[str], rounds: int) -> float:
+    """Mean nanoseconds per call."""
+    start = perf_counter_ns()
+    for _ in range(rounds):
+        for text in texts:
+            fn(text)
+    return (perf_counter_ns() - start) / (rounds * len(texts))
+
+
+def run(rounds: int = 200, seed: int = 0) -> Dict[str, Any]:
+    """
+    Time reference vs table-driven vs memoized escaping.
+
+    Text mixes mirror a prompt build: short static fields repeated every
+    turn, user responses of varying length, and mostly-clean insights.
+
+    Returns:
+        Dict with one row per text mix (mean ns per call)
+    """
+    rng = random.Random(seed)
+    mixes = {
+        "static fields (repeat)": [synthetic_text(rng, 15, 0.02)] * 50,
+        "insights (mostly clean)": [synthetic_text(rng, 10, 0.01) for _ in range(200)],
+        "responses (60 words)": [synthetic_text(rng, 60, 0.05) for _ in range(200)],
+        "responses (2k words)": [synthetic_text(rng, 2000, 0.05) for _ in range(20)],
+    }
+
+    rows = []
+    for name, texts in mixes.items():
+        rows.append(
+            {
+                "mix": name,
+                "reference_ns": _time(_escape_xml_reference, texts, rounds),
+                "table_ns": _time(_escape_xml, texts, rounds),
+                # Memoization only pays off for text repeated across turns
+                "cached_ns": (
+                    _time(_escape_xml_cached, texts, rounds)
+                    if name.endswith("(repeat)")
+                    else None
+                ),
+            }
+        )
+    return {"rows": rows}
+
+
+if __name__ == "__main__":
+    checked = check_equivalence()
+    print(f"Property check: {checked} random strings match the reference")
+    print()
+    print(f"{'text mix':<26} {'reference':>10} {'table':>10} {'cached':>10}  (ns/call)")
+    for row in run()["rows"]:
+        cached = f"{row['cached_ns']:.0f}" if row["cached_ns"] is not None else "-"
+        print(
+            f"{row['mix']:<26} {row['reference_ns']:>10.0f} "
+            f"{row['table_ns']:>10.0f} {cached:>10}"
+        )
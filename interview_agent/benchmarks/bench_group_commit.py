@@ -0,0 +1,292 @@
+"""
+Benchmark: group-commit state.json writes vs per-exchange writes
+
+Many sessions save state.json after every exchange:
+- naive: atomic_write_text() with fsync per save (temp file + fsync +
+  rename + directory fsync), run in worker threads
+- GroupCommitWriter at each Durability level (coalescing, one barrier or
+  two per batch)
+
+Reports saves/sec, files written and barriers per run.
+
+check_equivalence() runs crash-consistency checks on FaultyFileSystem, an
+in-memory filesystem shim that crashes after N operations (optionally
+tearing the write in progress) and models power loss as an arbitrary subset
+of the operations since the last barrier surviving:
+- after a process crash, every state.json holds at least the last version
+  whose save() completed
+- after a power loss, BATCH and FULL never leave a torn or empty
+  state.json, and FULL keeps every completed save
+- the shim does catch NONE tearing files, so the checks are not vacuous
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_group_commit
+"""
+
+import asyncio
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from agents.interview_agent.benchmarks.synthetic import (
+    synthetic_questions,
+    synthetic_text,
+)
+from agents.interview_agent.state_journal import SNAPSHOT_FILENAME, atomic_write_text
+from agents.interview_agent.state_schema import InterviewState, create_interview_state
+from agents.interview_agent.state_writer import (
+    Durability,
+    FileSystem,
+    GroupCommitWriter,
+)
+
+
+class SimulatedCrash(OSError):
+    """Raised by FaultyFileSystem once its crash point is reached."""
+
+
+class FaultyFileSystem(FileSystem):
+    """
+    In-memory FileSystem that crashes after `crash_after` operations.
+
+    `files` is what a process sees (the page cache); `durable` is what the
+    last barrier guaranteed. Operations since then are kept in order so a
+    power loss can replay any subset of them.
+    """
+
+    def __init__(self, crash_after: Optional[int] = None, torn: bool = False):
+        self.crash_after = crash_after
+        self.torn = torn
+        self.operations = 0
+        self.crashed = False
+        self.files: Dict[Path, bytes] = {}
+        self.durable: Dict[Path, bytes] = {}
+        self.pending: List[tuple] = []
+
+    def _step(self) -> None:
+        if self.crashed:
+            raise SimulatedCrash("filesystem crashed")
+        self.operations += 1
+        if self.crash_after is not None and self.operations >= self.crash_after:
+            self.crashed = True
+
+    def makedirs(self, path: Path) -> None:
+        pass  # directories are implicit
+
+    def write(self, path: Path, data: bytes) -> None:
+        self._step()
+        if self.crashed and self.torn:
+            data = data[: len(data) // 2]
+        self.files[path] = data
+        self.pending.append(("write", path, data))
+        if self.crashed:
+            raise SimulatedCrash(f"crashed writing {path.name}")
+
+    def replace(self, src: Path, dst: Path) -> None:
+        self._step()
+        if self.crashed:
+            raise SimulatedCrash(f"crashed renaming {src.name}")
+        self.files[dst] = self.files.pop(src)
+        self.pending.append(("replace", src, dst))
+
+    def barrier(self, root: Path, paths: List[Path]) -> None:
+        self._step()
+        if self.crashed:
+            raise SimulatedCrash("crashed in barrier")
+        self.durable = dict(self.files)
+        self.pending = []
+
+    def after_power_loss(self, rng: random.Random) -> Dict[Path, bytes]:
+        """Files after a power loss: durable ones + a random subset of the rest."""
+        files = dict(self.durable)
+        for op in self.pending:
+            if rng.random() < 0.5:
+                continue
+            if op[0] == "write":
+                files[op[1]] = op[2]
+            elif op[1] in files:
+                files[op[2]] = files.pop(op[1])
+            else:  # rename survived, its temp file's data did not
+                files[op[2]] = b""
+        return files
+
+
+# =============================================================================
+# EQUIVALENCE
+# =============================================================================
+
+
+def _sessions(count: int, seed: int = 0) -> List[InterviewState]:
+    rng = random.Random(seed)
+    return [
+        create_interview_state(
+            title=f"Session {n}",
+            context=synthetic_text(rng, 20),
+            questions=synthetic_questions(rng, 3),
+        )
+        for n in range(count)
+    ]
+
+
+def _versions(files: Dict[Path, bytes]) -> Dict[str, Optional[int]]:
+    """session_id -> total_exchanges in its state.json (None if torn)."""
+    versions = {}
+    for path, data in files.items():
+        if path.name != SNAPSHOT_FILENAME:
+            continue
+        try:
+            state = InterviewState.model_validate_json(data)
+        except ValueError:
+            versions[path.parent.name] = None
+        else:
+            versions[state.session_id] = state.total_exchanges
+    return versions
+
+
+async def _crash_run(
+    durability: Durability, fs: FaultyFileSystem, sessions: int, saves: int
+) -> Dict[str, int]:
+    """Save `saves` versions per session; returns the last completed versions."""
+    writer = GroupCommitWriter(Path("/sessions"), durability, window=0.0005, fs=fs)
+    completed: Dict[str, int] = {}
+
+    async def drive(state: InterviewState) -> None:
+        for n in range(saves):
+            state.record_exchange("user", f"answer {n}")
+            version = state.total_exchanges
+            try:
+                await writer.save(state)
+            except SimulatedCrash:
+                return
+            completed[state.session_id] = version
+
+    await asyncio.gather(*(drive(state) for state in _sessions(sessions)))
+    await writer.close()
+    return completed
+
+
+def check_equivalence() -> int:
+    """
+    Crash-consistency checks on FaultyFileSystem.
+
+    Returns:
+        Number of crash scenarios checked
+    """
+    scenarios = 0
+    torn_without_barrier = 0
+    for durability in Durability:
+        for crash_after in range(1, 40, 3):
+            for torn in (False, True):
+                fs = FaultyFileSystem(crash_after, torn)
+                completed = asyncio.run(_crash_run(durability, fs, 4, 6))
+                scenarios += 1
+
+                # Process crash: the OS kept every operation
+                on_disk = _versions(fs.files)
+                for session_id, version in completed.items():
+                    assert on_disk[session_id] is not None
+                    assert on_disk[session_id] >= version, (durability, crash_after)
+
+                # Power loss: any subset of un-barriered operations survives
+                for seed in range(20):
+                    after = _versions(fs.after_power_loss(random.Random(seed)))
+                    torn_files = [s for s, v in after.items() if v is None]
+                    if durability == Durability.NONE:
+                        torn_without_barrier += len(torn_files)
+                        continue
+                    assert not torn_files, (durability, crash_after, seed)
+                    if durability == Durability.FULL:
+                        for session_id, version in completed.items():
+                            assert after[session_id] >= version
+
+    assert torn_without_barrier, "shim never exposed a torn file under NONE"
+
+    # No faults: the final files match the final states
+    fs = FaultyFileSystem()
+    completed = asyncio.run(_crash_run(Durability.BATCH, fs, 8, 10))
+    assert _versions(fs.files) == completed
+    return scenarios + 1
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+
+async def _drive_naive(
+    root: Path, states: List[InterviewState], exchanges: int
+) -> None:
+    async def drive(state: InterviewState) -> None:
+        path = root / state.session_id / SNAPSHOT_FILENAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        for n in range(exchanges):
+            state.record_exchange("user", f"answer {n}")
+            text = state.model_dump_json(indent=2)
+            await asyncio.to_thread(atomic_write_text, path, text, True)
+
+    await asyncio.gather(*(drive(state) for state in states))
+
+
+async def _drive_group(
+    writer: GroupCommitWriter,
+    states: List[InterviewState],
+    exchanges: int,
+    wait: bool = True,
+) -> None:
+    async def drive(state: InterviewState) -> None:
+        for n in range(exchanges):
+            state.record_exchange("user", f"answer {n}")
+            await writer.save(state, wait=wait)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(drive(state) for state in states))
+    await writer.close()
+
+
+def throughput(sessions: int = 200, exchanges: int = 10) -> List[Dict[str, Any]]:
+    """
+    saves/sec for naive writes and each durability level.
+
+    The last row saves without waiting (wait=False), so repeated saves of a
+    session within one window coalesce.
+    """
+    rows = []
+    saves = sessions * exchanges
+    for mode in ("naive", *Durability, "no-wait"):
+        root = Path(tempfile.mkdtemp(prefix="bench_group_commit_"))
+        try:
+            states = _sessions(sessions)
+            start = time.perf_counter()
+            if mode == "naive":
+                asyncio.run(_drive_naive(root, states, exchanges))
+                stats = {"writes": saves, "barriers": saves * 2}
+            else:
+                wait = mode != "no-wait"
+                writer = GroupCommitWriter(root, mode if wait else Durability.BATCH)
+                asyncio.run(_drive_group(writer, states, exchanges, wait))
+                stats = {
+                    "writes": writer.stats.writes,
+                    "barriers": writer.stats.barriers,
+                }
+            elapsed = time.perf_counter() - start
+        finally:
+            shutil.rmtree(root)
+        name = f"group/{mode.value}" if isinstance(mode, Durability) else mode
+        rows.append({"mode": name, "saves_per_sec": saves / elapsed, **stats})
+    return rows
+
+
+if __name__ == "__main__":
+    print(f"Crash consistency: {check_equivalence()} scenarios passed")
+    print()
+    rows = throughput()
+    print(f"{'mode':<14} {'saves/sec':>10} {'files written':>14} {'fsyncs':>8}")
+    for row in rows:
+        speedup = row["saves_per_sec"] / rows[0]["saves_per_sec"]
+        print(
+            f"{row['mode']:<14} {row['saves_per_sec']:>10.0f} "
+            f"{row['writes']:>14} {row['barriers']:>8} {speedup:>6.1f}x"
+        )
@@ -0,0 +1,179 @@
+"""
+Benchmark: cold-start import cost
+
+Runs `python -X importtime -c "import <module>"` in fresh interpreters for
+the package's entry points and reports the cumulative import time of each
+(best of several runs) and whether Pydantic was loaded. The string
+formatters must import without Pydantic; state_schema shows what loading
+the models costs.
+
+run() returns rows in the benchmark suite's results format, and suite.py
+records them as `import:<target>@cold_start` cases (`import:package` for
+the package itself), so cold-start regressions are gated like any other
+case.
+
+check_equivalence() asserts, in a fresh interpreter, that the formatters and
+the lazy package exports load without Pydantic and format prompts exactly
+as the eagerly imported modules do.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_import_time
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, Optional, Tuple
+
+from agents.interview_agent.benchmarks.synthetic import build_synthetic_state
+from agents.interview_agent.user_prompt_formatter import (
+    format_interviewer_prompt,
+    format_minimal_context,
+)
+
+PACKAGE = "agents.interview_agent"
+
+# Entry points timed on cold start (submodule names; "" is the package)
+IMPORT_TARGETS = (
+    "",
+    "user_prompt_formatter",
+    "tracing",
+    "state_schema",
+    "state_journal",
+    "session_runtime",
+)
+
+# Entry points that must import without Pydantic
+PYDANTIC_FREE = ("", "user_prompt_formatter", "tracing")
+
+
+def _module_path(target: str) -> str:
+    return f"{PACKAGE}.{target}" if target else PACKAGE
+
+
+def _run_python(
+    code: str, importtime: bool = False, stdin: str = ""
+) -> Tuple[str, str]:
+    """Run code in a fresh interpreter on this process's sys.path."""
+    args = [sys.executable]
+    if importtime:
+        args += ["-X", "importtime"]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    done = subprocess.run(
+        args + ["-c", code],
+        input=stdin,
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return done.stdout, done.stderr
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """`-X importtime` output -> {module: cumulative microseconds}."""
+    cumulative: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            cumulative[fields[2].strip()] = int(fields[1])
+    return cumulative
+
+
+def measure_import(target: str, repeat: int = 5) -> Dict[str, Any]:
+    """
+    Time one cold import.
+
+    Args:
+        target: Submodule name from IMPORT_TARGETS ("" for the package)
+        repeat: Fresh interpreters to start
+
+    Returns:
+        {"best_us", "median_us", "loops", "pydantic"} (suite results format
+        plus whether Pydantic was imported)
+    """
+    module = _module_path(target)
+    samples = []
+    pydantic = False
+    for _ in range(repeat):
+        _, stderr = _run_python(f"import {module}", importtime=True)
+        cumulative = parse_importtime(stderr)
+        samples.append(cumulative[module])
+        pydantic = "pydantic" in cumulative
+    return {
+        "best_us": min(samples),
+        "median_us": statistics.median(samples),
+        "loops": 1,
+        "pydantic": pydantic,
+    }
+
+
+def run(repeat: int = 5, match: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Cold-start rows keyed like suite results: `import:<target>@cold_start`."""
+    results = {}
+    for target in IMPORT_TARGETS:
+        name = f"import:{target or 'package'}@cold_start"
+        if match and match not in name:
+            continue
+        row = measure_import(target, repeat)
+        del row["pydantic"]
+        results[name] = row
+    return results
+
+
+# =============================================================================
+# EQUIVALENCE
+# =============================================================================
+
+_LAZY_CHECK = f"""
+import json, sys
+from {PACKAGE} import format_interviewer_prompt, format_minimal_context
+args = json.loads(sys.stdin.read())
+minimal = format_minimal_context(*args["minimal"])
+assert "pydantic" not in sys.modules, "formatters imported pydantic"
+from {PACKAGE} import InterviewState
+state = InterviewState.model_validate_json(args["state"])
+print(json.dumps([format_interviewer_prompt(state), minimal]))
+"""
+
+
+def check_equivalence() -> int:
+    """
+    Assert the lazy import paths avoid Pydantic and format identical prompts.
+
+    Returns:
+        Number of entry points checked
+    """
+    for target in PYDANTIC_FREE:
+        module = _module_path(target)
+        stdout, _ = _run_python(
+            f"import sys, {module}; print('pydantic' in sys.modules)"
+        )
+        assert stdout.strip() == "False", f"{module} imports pydantic"
+
+    state = build_synthetic_state(questions=5, seed=3, complete=False)
+    minimal_args = ["What <matters> most?", "Find & rank priorities", "Cost."]
+    stdout, _ = _run_python(
+        _LAZY_CHECK,
+        stdin=json.dumps({"state": state.model_dump_json(), "minimal": minimal_args}),
+    )
+    interviewer, minimal = json.loads(stdout)
+    assert interviewer == format_interviewer_prompt(state)
+    assert minimal == format_minimal_context(*minimal_args)
+    return len(PYDANTIC_FREE) + 1
+
+
+if __name__ == "__main__":
+    print(f"Equivalence: {check_equivalence()} entry points load without Pydantic")
+    print()
+    print(f"{'module':<44} {'best ms':>8} {'median ms':>10} {'pydantic':>9}")
+    for target in IMPORT_TARGETS:
+        row = measure_import(target)
+        print(
+            f"{_module_path(target):<44} {row['best_us'] / 1000:>8.1f} "
+            f"{row['median_us'] / 1000:>10.1f} {'yes' if row['pydantic'] else 'no':>9}"
+        )
@@ -0,0 +1,141 @@
+"""
+Benchmark: indexed InsightBank queries
+
+Checks the indexed InsightBank queries (get_high_importance, get_by_id,
+top_insights) against the original linear scans, including after a JSON
+round-trip, then times both across bank sizes.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_insight_bank
+"""
+
+import random
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List, Optional
+
+from agents.interview_agent.benchmarks.synthetic import synthetic_text
+from agents.interview_agent.state_schema import Insight, InsightBank
+
+
+def _high_reference(bank: InsightBank) -> List[Insight]:
+    """The original list-comprehension get_high_importance."""
+    return [i for i in bank.insights if i.importance in ("high", "critical")]
+
+
+def _top_reference(bank: InsightBank, limit: int) -> List[Insight]:
+    """The original formatter selection: (high + other)[:limit]."""
+    high = [i for i in bank.insights if i.importance in ("high", "critical")]
+    other = [i for i in bank.insights if i.importance not in ("high", "critical")]
+    return (high + other)[:limit]
+
+
+def _by_id_reference(bank: InsightBank, insight_id: str) -> Optional[Insight]:
+    """Linear lookup by id."""
+    return next((i for i in bank.insights if i.id == insight_id), None)
+
+
+def build_bank(size: int, seed: int = 0, high_rate: float = 0.4) -> InsightBank:
+    """Bank of `size` insights; `high_rate` of them are high/critical."""
+    rng = random.Random(seed)
+    bank = InsightBank()
+    for n in range(size):
+        importance = (
+            rng.choice(("high", "critical"))
+            if rng.random() < high_rate
+            else rng.choice(("low", "medium"))
+        )
+        bank.add_insight(
+            synthetic_text(rng, 8),
+            source_question_id=f"q{n % 10}",
+            source_exchange_id=f"e{n}",
+            category=rng.choice(("pain", "goal", None)),
+            importance=importance,
+        )
+    return bank
+
+
+def check_equivalence(sizes=(0, 1, 5, 33, 200), seed: int = 0) -> int:
+    """
+    Indexed queries match the reference scans, also after a JSON round-trip
+    and after the insights list is replaced.
+
+    Returns:
+        Number of (bank, limit) cases checked
+    """
+    checked = 0
+    for size in sizes:
+        for high_rate in (0.0, 0.1, 0.5, 1.0):
+            bank = build_bank(size, seed, high_rate)
+            restored = InsightBank.model_validate_json(bank.model_dump_json())
+            if restored.by_category != bank.by_category:
+                raise AssertionError("by_category changed across a round-trip")
+            replaced = build_bank(size, seed, high_rate)
+            replaced.insights = list(reversed(replaced.insights))
+
+            for candidate in (bank, restored, replaced):
+                ids = [i.id for i in _high_reference(candidate)]
+                if [i.id for i in candidate.get_high_importance()] != ids:
+                    raise AssertionError(f"get_high_importance mismatch (size {size})")
+                for limit in (0, 1, 10, 32, 33, 1000):
+                    expected = [i.id for i in _top_reference(candidate, limit)]
+                    actual = [i.id for i in candidate.top_insights(limit)]
+                    if actual != expected:
+                        raise AssertionError(
+                            f"top_insights({limit}) mismatch (size {size})"
+                        )
+                    checked += 1
+                for insight in candidate.insights[:20]:
+                    if candidate.get_by_id(insight.id) is not insight:
+                        raise AssertionError("get_by_id mismatch")
+    return checked
+
+
+def _time(fn: Callable[[], Any], rounds: int) -> float:
+    """Mean microseconds per call."""
+    start = perf_counter_ns()
+    for _ in range(rounds):
+        fn()
+    return (perf_counter_ns() - start) / rounds / 1000
+
+
+def run(sizes=(100, 1_000, 10_000, 100_000), seed: int = 0) -> Dict[str, Any]:
+    """
+    Time reference scans vs indexed queries.
+
+    Returns:
+        Dict with one row per bank size (mean us per call)
+    """
+    rows = []
+    for size in sizes:
+        bank = build_bank(size, seed)
+        rounds = max(5, 200_000 // size)
+        probe = bank.insights[size // 2].id
+        rows.append(
+            {
+                "size": size,
+                "top10_reference_us": _time(lambda: _top_reference(bank, 10), rounds),
+                "top10_indexed_us": _time(lambda: bank.top_insights(10), rounds),
+                "high_reference_us": _time(lambda: _high_reference(bank), rounds),
+                "high_indexed_us": _time(bank.get_high_importance, rounds),
+                "by_id_reference_us": _time(lambda: _by_id_reference(bank, probe), rounds),
+                "by_id_indexed_us": _time(lambda: bank.get_by_id(probe), rounds),
+            }
+        )
+    return {"rows": rows}
+
+
+if __name__ == "__main__":
+    checked = check_equivalence()
+    print(f"Equivalence check: {checked} cases match the reference scans")
+    print()
+    print(
+        f"{'insights':>9} {'top10 ref':>10} {'top10 idx':>10} "
+        f"{'high ref':>10} {'high idx':>10} {'id ref':>10} {'id idx':>10}  (us/call)"
+    )
+    for row in run()["rows"]:
+        print(
+            f"{row['size']:>9} {row['top10_reference_us']:>10.1f} "
+            f"{row['top10_indexed_us']:>10.2f} {row['high_reference_us']:>10.1f} "
+            f"{row['high_indexed_us']:>10.1f} {row['by_id_reference_us']:>10.1f} "
+            f"{row['by_id_indexed_us']:>10.2f}"
+        )
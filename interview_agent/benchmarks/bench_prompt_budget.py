@@ -0,0 +1,93 @@
+"""
+Benchmark: format_budgeted_prompt vs format_interviewer_prompt
+
+Builds mid-interview states with increasingly long user responses and
+compares prompt size (estimated tokens) and assembly time for the current
+formatter and the budgeted assembly at several budgets. Verifies that an
+unconstrained budget reproduces the current formatter exactly.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_prompt_budget
+"""
+
+from collections import Counter
+from time import perf_counter_ns
+from typing import Any, Dict, List
+
+from agents.interview_agent.benchmarks.synthetic import build_synthetic_state
+from agents.interview_agent.prompt_budget import estimate_tokens, format_budgeted_prompt
+from agents.interview_agent.user_prompt_formatter import format_interviewer_prompt
+
+
+def _mean_ns(fn, rounds: int) -> float:
+    start = perf_counter_ns()
+    for _ in range(rounds):
+        fn()
+    return (perf_counter_ns() - start) / rounds
+
+
+def run(
+    response_words: List[int] = (60, 600, 3000),
+    budgets: List[int] = (4000, 2000, 1000),
+    rounds: int = 50,
+) -> Dict[str, Any]:
+    """
+    Run the benchmark.
+
+    Args:
+        response_words: Approximate user response lengths to simulate
+        budgets: Token budgets to assemble against
+        rounds: Timing repetitions per measurement
+
+    Returns:
+        Dict with one row per (response length, budget)
+    """
+    rows = []
+    for words in response_words:
+        state = build_synthetic_state(
+            questions=12,
+            exchanges_per_question=4,
+            response_words=words,
+            complete=False,
+        )
+        user_message = state.conversation_history[-1]["content"]
+
+        full = format_interviewer_prompt(state, user_message)
+        unbounded = format_budgeted_prompt(state, 10**9, user_message)
+        if unbounded.prompt != full or unbounded.trimmed:
+            raise AssertionError("Unconstrained budget must match the formatter")
+        full_ns = _mean_ns(lambda: format_interviewer_prompt(state, user_message), rounds)
+
+        for budget in budgets:
+            result = format_budgeted_prompt(state, budget, user_message)
+            budget_ns = _mean_ns(
+                lambda: format_budgeted_prompt(state, budget, user_message), rounds
+            )
+            by_section = Counter(item.section for item in result.trimmed)
+            rows.append(
+                {
+                    "response_words": words,
+                    "budget": budget,
+                    "full_tokens": estimate_tokens(full),
+                    "budgeted_tokens": result.token_count,
+                    "fits": result.fits,
+                    "trimmed": dict(by_section),
+                    "full_us": full_ns / 1000,
+                    "budgeted_us": budget_ns / 1000,
+                }
+            )
+    return {"rows": rows}
+
+
+if __name__ == "__main__":
+    print(
+        f"{'words':>6} {'budget':>7} {'full tok':>9} {'budgeted tok':>13} {'fits':>5} "
+        f"{'full (us)':>10} {'budgeted (us)':>14}  trimmed"
+    )
+    for row in run()["rows"]:
+        trimmed = ", ".join(f"{k}={v}" for k, v in row["trimmed"].items()) or "-"
+        print(
+            f"{row['response_words']:>6} {row['budget']:>7} {row['full_tokens']:>9} "
+            f"{row['budgeted_tokens']:>13} {str(row['fits']):>5} "
+            f"{row['full_us']:>10.1f} {row['budgeted_us']:>14.1f}  {trimmed}"
+        )
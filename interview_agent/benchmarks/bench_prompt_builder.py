@@ -0,0 +1,135 @@
+"""
+Benchmark: InterviewPromptBuilder vs format_interviewer_prompt
+
+Simulates a growing interview and times one prompt build per turn with each
+approach. The full formatter's per-turn cost grows with the insight bank;
+the incremental builder should stay flat. Every prompt is checked for
+byte-identical output; check_equivalence() also covers other history
+windows, including max_history=0.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_prompt_builder
+"""
+
+import random
+from time import perf_counter_ns
+from typing import Any, Dict, List
+
+from agents.interview_agent.benchmarks.synthetic import (
+    iter_interview_turns,
+    synthetic_questions,
+    synthetic_text,
+)
+from agents.interview_agent.prompt_builder import InterviewPromptBuilder
+from agents.interview_agent.state_schema import create_interview_state
+from agents.interview_agent.user_prompt_formatter import format_interviewer_prompt
+
+
+def check_equivalence(
+    max_histories: List[int] = (0, 1, 3, 10, 1000), seed: int = 0
+) -> int:
+    """
+    Assert the builder matches format_interviewer_prompt on every turn for
+    each history window.
+
+    Returns:
+        Number of prompts compared
+    """
+    compared = 0
+    for max_history in max_histories:
+        rng = random.Random(seed)
+        state = create_interview_state(
+            title="Prompt Builder Equivalence",
+            context=synthetic_text(rng, 40),
+            questions=synthetic_questions(rng, 6),
+        )
+        builder = InterviewPromptBuilder(state, max_history=max_history)
+        for state in iter_interview_turns(state, insights_per_exchange=3, seed=seed):
+            user_message = state.conversation_history[-1]["content"]
+            expected = format_interviewer_prompt(state, user_message, max_history)
+            assert builder.build(user_message) == expected, (max_history, compared)
+            compared += 1
+    return compared
+
+
+def run(
+    questions: int = 60,
+    exchanges_per_question: int = 4,
+    insights_per_exchange: int = 3,
+    buckets: int = 6,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Run the benchmark.
+
+    Args:
+        questions: Number of questions in the simulated interview
+        exchanges_per_question: Initial question + follow-ups per question
+        insights_per_exchange: Insights added to the bank per response
+        buckets: Number of turn ranges to average over
+        seed: RNG seed
+
+    Returns:
+        Dict with per-bucket mean microseconds for both approaches
+    """
+    rng = random.Random(seed)
+    state = create_interview_state(
+        title="Prompt Builder Benchmark",
+        context=synthetic_text(rng, 40),
+        questions=synthetic_questions(rng, questions),
+    )
+    builder = InterviewPromptBuilder(state)
+
+    full_ns: List[int] = []
+    incremental_ns: List[int] = []
+
+    for state in iter_interview_turns(
+        state,
+        exchanges_per_question=exchanges_per_question,
+        insights_per_exchange=insights_per_exchange,
+        seed=seed,
+    ):
+        user_message = state.conversation_history[-1]["content"]
+
+        start = perf_counter_ns()
+        expected = format_interviewer_prompt(state, user_message)
+        full_ns.append(perf_counter_ns() - start)
+
+        start = perf_counter_ns()
+        actual = builder.build(user_message)
+        incremental_ns.append(perf_counter_ns() - start)
+
+        if actual != expected:
+            raise AssertionError(
+                f"Builder output diverged at turn {len(full_ns)} "
+                f"(question {state.current_question_index + 1})"
+            )
+
+    size = max(1, len(full_ns) // buckets)
+    rows = []
+    for start in range(0, len(full_ns), size):
+        full = full_ns[start : start + size]
+        incremental = incremental_ns[start : start + size]
+        rows.append(
+            {
+                "turns": f"{start + 1}-{start + len(full)}",
+                "insights": (start + len(full)) * insights_per_exchange,
+                "full_us": sum(full) / len(full) / 1000,
+                "incremental_us": sum(incremental) / len(incremental) / 1000,
+            }
+        )
+
+    return {"turns": len(full_ns), "rows": rows}
+
+
+if __name__ == "__main__":
+    print(f"Equivalence: {check_equivalence()} prompts byte-identical")
+    results = run()
+    print(f"Turns simulated: {results['turns']} (all outputs byte-identical)")
+    print()
+    print(f"{'turns':>10} {'insights':>9} {'full (us)':>11} {'builder (us)':>13}")
+    for row in results["rows"]:
+        print(
+            f"{row['turns']:>10} {row['insights']:>9} "
+            f"{row['full_us']:>11.1f} {row['incremental_us']:>13.1f}"
+        )
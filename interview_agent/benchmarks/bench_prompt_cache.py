@@ -0,0 +1,248 @@
+"""
+Benchmark: content-addressed prompt cache
+
+Drives interviews through SessionManager with and without CachingLLMClient:
+- panel: many sessions on one question set, answers drawn from a small pool
+  of scripted responses (identical prompts recur across sessions)
+- replay: the same sessions run again by a second "worker" whose memory
+  level is empty, so every hit comes from the shared SQLite store
+
+Reports model calls, hit rates, coalesced in-flight misses and wall time,
+plus per-lookup cost of each cache level. check_equivalence() asserts
+cached runs produce the same transcripts as uncached ones, exercises
+LRU / TTL eviction on a deterministic clock, and checks that concurrent
+streams of one prompt share a single upstream stream and that SQLite I/O
+stays off the event loop thread.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_prompt_cache
+"""
+
+import asyncio
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from agents.interview_agent.benchmarks.synthetic import (
+    synthetic_questions,
+    synthetic_text,
+)
+from agents.interview_agent.prompt_cache import (
+    CachingLLMClient,
+    PromptCache,
+    SQLitePromptStore,
+)
+from agents.interview_agent.session_runtime import FakeLLMClient, SessionManager
+from agents.interview_agent.state_schema import InterviewConfig, create_interview_state
+
+
+async def drive_panel(
+    client: Any,
+    sessions: int,
+    questions: int,
+    answer_pool: int,
+    seed: int = 0,
+    runtime_models: bool = False,
+) -> List[List[str]]:
+    """
+    Run `sessions` interviews on one question set to completion.
+
+    Args:
+        runtime_models: Host sessions as slotted runtime objects
+
+    Returns:
+        Assistant messages per session, in session order
+    """
+    rng = random.Random(seed)
+    question_set = synthetic_questions(rng, questions)
+    answers = [synthetic_text(rng, 40) for _ in range(answer_pool)]
+
+    manager = SessionManager(client, runtime_models=runtime_models)
+    config = InterviewConfig()
+    for _ in range(sessions):
+        manager.add_session(
+            create_interview_state(
+                title="Panel",
+                context="Panel study",
+                questions=question_set,
+                config=config,
+            )
+        )
+
+    async def drive(session_id: str, session_rng: random.Random) -> List[str]:
+        messages = [await manager.start_session(session_id)]
+        while True:
+            answer = session_rng.choice(answers)
+            result = await manager.submit_turn(session_id, answer)
+            messages.append(result.assistant_message)
+            if result.action == "complete":
+                return messages
+
+    return await asyncio.gather(
+        *(
+            drive(sid, random.Random(seed * 1000003 + n))
+            for n, sid in enumerate(manager.session_ids)
+        )
+    )
+
+
+def run_panel(
+    cache: Optional[PromptCache],
+    sessions: int = 200,
+    questions: int = 5,
+    answer_pool: int = 3,
+    latency: float = 0.02,
+) -> Dict[str, Any]:
+    """One panel run; cache=None runs against the model directly."""
+    fake = FakeLLMClient(latency=latency, follow_ups_per_question=1)
+    client = fake if cache is None else CachingLLMClient(fake, cache)
+    start = time.perf_counter()
+    transcripts = asyncio.run(drive_panel(client, sessions, questions, answer_pool))
+    return {
+        "elapsed_s": time.perf_counter() - start,
+        "model_calls": sum(fake.calls.values()),
+        "transcripts": transcripts,
+        "stats": cache.stats.model_copy() if cache is not None else None,
+    }
+
+
+def lookup_costs(entries: int = 2000, prompt_chars: int = 4000) -> Dict[str, float]:
+    """Microseconds per lookup: memory hit, SQLite hit, miss."""
+    rng = random.Random(0)
+    prompts = [synthetic_text(rng, prompt_chars // 6) for _ in range(entries)]
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLitePromptStore(Path(tmp) / "cache.db")
+        cache = PromptCache(store=store)
+        for prompt in prompts:
+            cache.put("gpt-4o", prompt, prompt[:200])
+
+        def timed(fn) -> float:
+            start = time.perf_counter()
+            for prompt in prompts:
+                fn(prompt)
+            return (time.perf_counter() - start) / len(prompts) * 1e6
+
+        memory = timed(lambda p: cache.get("gpt-4o", p))
+        cold = PromptCache(store=store)
+        disk = timed(lambda p: cold.get("gpt-4o", p))
+        miss = timed(lambda p: cache.get("gemini-2.0-flash", p))
+        store.close()
+    return {"memory_hit_us": memory, "disk_hit_us": disk, "miss_us": miss}
+
+
+async def _concurrent_streams(
+    client: CachingLLMClient, prompt: str, readers: int
+) -> List[List[str]]:
+    async def read() -> List[str]:
+        return [chunk async for chunk in client.stream("gpt-4o", prompt)]
+
+    return await asyncio.gather(*(read() for _ in range(readers)))
+
+
+class _ThreadRecordingStore(SQLitePromptStore):
+    """SQLitePromptStore that records which threads ran its get / put."""
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.threads: set = set()
+
+    def get(self, key: str):
+        self.threads.add(threading.get_ident())
+        return super().get(key)
+
+    def put(self, key: str, model: str, response: str, created_at: float) -> None:
+        self.threads.add(threading.get_ident())
+        super().put(key, model, response, created_at)
+
+
+def check_equivalence() -> int:
+    """
+    Assert cached runs match uncached ones, and LRU / TTL / shared-store
+    behaviour on a deterministic clock.
+
+    Returns:
+        Number of transcripts compared
+    """
+    baseline = run_panel(None, sessions=40, latency=0.0)["transcripts"]
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLitePromptStore(Path(tmp) / "cache.db")
+        first = run_panel(PromptCache(store=store), sessions=40, latency=0.0)
+        replay = run_panel(PromptCache(store=store), sessions=40, latency=0.0)
+        assert first["transcripts"] == baseline
+        assert replay["transcripts"] == baseline
+        assert replay["model_calls"] == 0 and replay["stats"].misses == 0
+
+        cache = PromptCache(
+            max_entries=2, ttl_seconds=10, store=store, deterministic=True
+        )
+        store.clear()
+        cache.put("m", "a", "A")
+        cache.put("m", "b", "B")
+        assert cache.get("m", "a") == "A"  # a is now most recent
+        cache.put("m", "c", "C")  # evicts b from memory
+        assert len(cache) == 2 and cache.stats.evictions == 1
+        assert cache.get("m", "b") == "B" and cache.stats.disk_hits == 1
+        assert cache.get("x", "a") is None  # model is part of the key
+        cache.clock.advance(10)
+        assert cache.get("m", "a") is None and cache.stats.expirations == 1
+        assert len(store) == 2  # expired entry deleted from disk too
+
+        sized = PromptCache(max_chars=5, deterministic=True)
+        sized.put("m", "a", "xxx")
+        sized.put("m", "b", "yyy")
+        assert sized.get("m", "a") is None and sized.get("m", "b") == "yyy"
+        store.close()
+
+        # Concurrent streams of one prompt share one upstream stream, and
+        # SQLite calls run in worker threads, not on the event loop
+        recording = _ThreadRecordingStore(Path(tmp) / "streams.db")
+        fake = FakeLLMClient(latency=0.01, stream_chunk_chars=8)
+        client = CachingLLMClient(fake, PromptCache(store=recording))
+        prompt = synthetic_text(random.Random(1), 80)
+        streams = asyncio.run(_concurrent_streams(client, prompt, readers=4))
+        assert fake.calls == {"gpt-4o": 1} and client.cache.stats.coalesced == 3
+        assert len(streams[0]) > 1 and all(s == streams[0] for s in streams)
+        assert asyncio.run(_concurrent_streams(client, prompt, readers=1)) == [
+            ["".join(streams[0])]
+        ]
+        assert fake.calls == {"gpt-4o": 1} and not client._streams
+        assert recording.threads and threading.get_ident() not in recording.threads
+        recording.close()
+    return 3 * len(baseline)
+
+
+if __name__ == "__main__":
+    compared = check_equivalence()
+    print(f"Equivalence: {compared} transcripts identical with and without cache")
+    print()
+
+    print(
+        f"{'run':<24} {'seconds':>8} {'model calls':>12} {'hit rate':>9} "
+        f"{'disk hits':>10} {'coalesced':>10}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLitePromptStore(Path(tmp) / "cache.db")
+        runs = [
+            ("uncached", run_panel(None)),
+            ("panel (cached)", run_panel(PromptCache(store=store))),
+            ("replay (other worker)", run_panel(PromptCache(store=store))),
+        ]
+        store.close()
+    for name, r in runs:
+        stats = r["stats"]
+        hit_rate = f"{stats.hit_rate:.0%}" if stats else "-"
+        disk_hits = stats.disk_hits if stats else "-"
+        coalesced = stats.coalesced if stats else "-"
+        print(
+            f"{name:<24} {r['elapsed_s']:>8.2f} {r['model_calls']:>12} "
+            f"{hit_rate:>9} {disk_hits:>10} {coalesced:>10}"
+        )
+
+    print()
+    costs = lookup_costs()
+    print(f"Memory hit: {costs['memory_hit_us']:.1f} us")
+    print(f"SQLite hit: {costs['disk_hit_us']:.1f} us")
+    print(f"Miss:       {costs['miss_us']:.1f} us")
@@ -0,0 +1,298 @@
+"""
+Benchmark: slotted runtime models vs Pydantic models on the live path
+
+Drives interviews through the real turn functions (start_interview,
+apply_analysis, apply_follow_up, apply_transition) with scripted analyses,
+once on InterviewState and once on RuntimeInterviewState:
+- per-turn mutation cost (add_exchange, record_response, add_insight,
+  record_exchange, advance_to_next_question, ...)
+- memory for 1,000 sessions paused mid-interview
+- boundary cost: to_model() + model_dump_json() vs model_dump_json(), and
+  converting one exchange for a journal record
+
+check_equivalence() asserts both representations end in the same state
+(ids and timestamps canonicalized), conversion round trips are lossless,
+format_budgeted_prompt clips both alike, SessionManager(runtime_models=True)
+yields identical transcripts and refuses journal-bound states.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_runtime_models
+"""
+
+import asyncio
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from agents.interview_agent.benchmarks.bench_prompt_cache import drive_panel
+from agents.interview_agent.benchmarks.synthetic import (
+    build_synthetic_state,
+    synthetic_questions,
+    synthetic_text,
+)
+from agents.interview_agent.prompt_budget import format_budgeted_prompt
+from agents.interview_agent.runtime_models import (
+    create_runtime_state,
+    to_model,
+    to_runtime,
+)
+from agents.interview_agent.session_runtime import (
+    FakeLLMClient,
+    SessionManager,
+    apply_analysis,
+    apply_follow_up,
+    apply_transition,
+    start_interview,
+)
+from agents.interview_agent.state_journal import StateJournal
+from agents.interview_agent.state_schema import (
+    InterviewState,
+    ResearchObjectiveStatus,
+    ResponseAnalysis,
+    create_interview_state,
+)
+
+Factory = Callable[..., Any]
+
+
+def _analyses(insights: int) -> Dict[str, ResponseAnalysis]:
+    """Scripted analyses, validated once and shared like parsed LLM replies."""
+    return {
+        recommendation: ResponseAnalysis(
+            objective_progress=ResearchObjectiveStatus.PARTIAL,
+            insights_extracted=[f"insight {n}" for n in range(insights)],
+            recommendation=recommendation,
+            recommendation_reason="scripted",
+        )
+        for recommendation in ("follow_up", "transition")
+    }
+
+
+def drive_session(
+    state: Any,
+    responses: List[str],
+    analyses: Dict[str, ResponseAnalysis],
+    follow_ups: int = 2,
+    stop_after: int = 0,
+) -> int:
+    """
+    Run scripted turns on `state` (either representation).
+
+    Args:
+        stop_after: Stop after this many turns (0 = run to completion)
+
+    Returns:
+        Number of turns applied
+    """
+    start_interview(state)
+    turns = 0
+    while not state.is_complete():
+        question = state.get_current_question()
+        key = "follow_up" if question.follow_up_count < follow_ups else "transition"
+        response = responses[turns % len(responses)]
+        if apply_analysis(state, response, analyses[key]):
+            apply_follow_up(state, "Could you say more about that?")
+        else:
+            apply_transition(state, analyses[key], "Thanks - next question.")
+        turns += 1
+        if turns == stop_after:
+            break
+    return turns
+
+
+def _new_state(factory: Factory, questions: List[dict]) -> Any:
+    return factory(title="Runtime Models", context="Benchmark", questions=questions)
+
+
+# =============================================================================
+# EQUIVALENCE
+# =============================================================================
+
+
+def _canonical(value: Any, ids: Dict[str, str]) -> Any:
+    """Rename ids to first-seen ordinals and blank timestamps, recursively."""
+    if isinstance(value, dict):
+        out = {}
+        for key, item in value.items():
+            if key in ("timestamp", "created_at", "updated_at") or key.endswith(
+                ("_at", "_timestamp")
+            ):
+                out[key] = item is not None
+            elif key == "id" or key.endswith("_id"):
+                out[key] = ids.setdefault(item, f"id{len(ids)}") if item else item
+            else:
+                out[key] = _canonical(item, ids)
+        return out
+    if isinstance(value, list):
+        return [_canonical(item, ids) for item in value]
+    if isinstance(value, datetime):
+        return True
+    if isinstance(value, str) and value in ids:
+        return ids[value]
+    return value
+
+
+def check_equivalence() -> int:
+    """
+    Assert runtime and Pydantic paths produce the same state, conversions are
+    lossless, and SessionManager transcripts match.
+
+    Returns:
+        Number of states compared
+    """
+    rng = random.Random(0)
+    questions = synthetic_questions(rng, 6)
+    responses = [synthetic_text(rng, 40) for _ in range(10)]
+    analyses = _analyses(insights=2)
+    compared = 0
+
+    for stop_after in (0, 1, 5, 11):
+        model = _new_state(create_interview_state, questions)
+        runtime = _new_state(create_runtime_state, questions)
+        drive_session(model, responses, analyses, stop_after=stop_after)
+        drive_session(runtime, responses, analyses, stop_after=stop_after)
+        converted = to_model(runtime)
+        assert _canonical(converted.model_dump(), {}) == _canonical(
+            model.model_dump(), {}
+        ), stop_after
+        assert to_model(to_runtime(converted)).model_dump() == converted.model_dump()
+        compared += 1
+
+    for scale in (1, 5, 20):
+        state = build_synthetic_state(questions=scale, seed=scale, complete=False)
+        round_trip = to_model(to_runtime(state))
+        assert round_trip.model_dump_json() == state.model_dump_json()
+        validated = InterviewState.model_validate_json(round_trip.model_dump_json())
+        assert validated.model_dump() == state.model_dump()
+        compared += 1
+
+    # Budgeted prompts clip long responses the same way on both
+    state = build_synthetic_state(questions=4, response_words=600, complete=False)
+    runtime = to_runtime(state)
+    for budget in (10**9, 2000, 500):
+        expected = format_budgeted_prompt(state, budget)
+        result = format_budgeted_prompt(runtime, budget)
+        assert result.prompt == expected.prompt and result.trimmed == expected.trimmed
+    assert any(
+        item.section == "question_exchanges" and item.action == "truncated"
+        for item in expected.trimmed
+    )
+    compared += 1
+
+    # A journal only tracks the Pydantic state, so hosting it as runtime
+    # objects would silently stop persisting turns
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = StateJournal(Path(tmp), fsync=False)
+        journal.create(_new_state(create_interview_state, questions))
+        manager = SessionManager(FakeLLMClient(), runtime_models=True)
+        try:
+            manager.add_session(journal.state)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("journal-bound state hosted as runtime models")
+        journal.close()
+
+    baseline = asyncio.run(drive_panel(FakeLLMClient(latency=0.0), 8, 4, 3))
+    runtime_panel = asyncio.run(
+        drive_panel(FakeLLMClient(latency=0.0), 8, 4, 3, runtime_models=True)
+    )
+    assert runtime_panel == baseline
+    return compared + len(baseline)
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+
+def mutation_cost(
+    factory: Factory, sessions: int = 300, questions: int = 8, insights: int = 2
+) -> Dict[str, float]:
+    """Microseconds per turn driving `sessions` interviews to completion."""
+    rng = random.Random(0)
+    question_set = synthetic_questions(rng, questions)
+    responses = [synthetic_text(rng, 40) for _ in range(20)]
+    analyses = _analyses(insights)
+    states = [_new_state(factory, question_set) for _ in range(sessions)]
+
+    start = time.perf_counter()
+    turns = sum(drive_session(state, responses, analyses) for state in states)
+    elapsed = time.perf_counter() - start
+    return {"turns": turns, "us_per_turn": elapsed / turns * 1e6}
+
+
+def session_memory(
+    factory: Factory, sessions: int = 1000, questions: int = 8, insights: int = 2
+) -> float:
+    """Traced MB held by `sessions` sessions paused halfway through."""
+    rng = random.Random(0)
+    question_set = synthetic_questions(rng, questions)
+    responses = [synthetic_text(rng, 40) for _ in range(20)]
+    analyses = _analyses(insights)
+    halfway = questions * 3 // 2
+
+    tracemalloc.start()
+    try:
+        states = [_new_state(factory, question_set) for _ in range(sessions)]
+        for state in states:
+            drive_session(state, responses, analyses, stop_after=halfway)
+        return tracemalloc.get_traced_memory()[0] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def boundary_cost(repeat: int = 200) -> Dict[str, float]:
+    """Microseconds to produce state.json from either representation."""
+    state = build_synthetic_state(questions=10, complete=False)
+    runtime = to_runtime(state)
+
+    def timed(fn: Callable[[], Any]) -> float:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        return (time.perf_counter() - start) / repeat * 1e6
+
+    exchange = runtime.get_current_question().exchanges[-1]
+    return {
+        "model_dump_json_us": timed(state.model_dump_json),
+        "to_model_dump_json_us": timed(lambda: to_model(runtime).model_dump_json()),
+        "to_runtime_us": timed(lambda: to_runtime(state)),
+        "exchange_record_us": timed(
+            lambda: exchange.to_model().model_dump(mode="json", exclude_none=True)
+        ),
+    }
+
+
+if __name__ == "__main__":
+    print(f"Equivalence: {check_equivalence()} states / transcripts identical")
+    print()
+
+    rows = []
+    for name, factory in (
+        ("pydantic", create_interview_state),
+        ("runtime", create_runtime_state),
+    ):
+        cost = mutation_cost(factory)
+        rows.append((name, cost["us_per_turn"], session_memory(factory)))
+    print(f"{'models':<10} {'us / turn':>10} {'MB / 1000 sessions':>19}")
+    for name, per_turn, memory in rows:
+        print(f"{name:<10} {per_turn:>10.1f} {memory:>19.1f}")
+    print(
+        f"{'speedup':<10} {rows[0][1] / rows[1][1]:>9.1f}x "
+        f"{rows[0][2] / rows[1][2]:>18.1f}x"
+    )
+
+    print()
+    boundary = boundary_cost()
+    for label, key in (
+        ("state.json from InterviewState", "model_dump_json_us"),
+        ("state.json via to_model()", "to_model_dump_json_us"),
+        ("to_runtime() at session load", "to_runtime_us"),
+        ("Journal exchange record", "exchange_record_us"),
+    ):
+        print(f"{label + ':':<33}{boundary[key]:.0f} us")
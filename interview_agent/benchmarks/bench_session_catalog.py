@@ -0,0 +1,437 @@
+"""
+Benchmark: SessionCatalog refresh vs scanning every session's JSON files
+
+Builds a synthetic sessions tree shaped like agents/sessions (state.json,
+plan.json with ~30 KB of checkpoints, dev-notes.json) and measures:
+- Full scan: glob + parse every file, then filter in Python (what
+  answering "which sessions are in build?" costs without an index)
+- Cold refresh: SessionCatalog.refresh() into an empty database
+- Warm refresh: nothing changed / 1% touched (same content) / 1% edited
+- Query: one catalog query after a warm refresh
+
+check_equivalence() compares every catalog query with the full scan on the
+real agents/sessions tree (when present) and on a synthetic tree through
+edits, touches, corrupt files, deleted files and deleted sessions, and
+after reopening a persisted database.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_session_catalog
+"""
+
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from agents.interview_agent.benchmarks.synthetic import synthetic_text
+from agents.interview_agent.session_catalog import (
+    SESSION_FILES,
+    CheckpointRecord,
+    DevNoteRecord,
+    SessionCatalog,
+    SessionRecord,
+)
+from agents.interview_agent.state_loader import WORKFLOW_SESSIONS_DIR
+
+PHASES = ("spec", "plan", "build")
+PHASE_STATUSES = ("not_started", "in_progress", "finalized", "completed")
+NOTE_CATEGORIES = ("decision", "discovery", "deviation", "issue")
+
+
+# =============================================================================
+# SYNTHETIC SESSIONS
+# =============================================================================
+
+
+def _write_json(path: Path, document: Dict[str, Any]) -> None:
+    path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+
+
+def write_session(root: Path, n: int, rng: random.Random, revision: int = 0) -> str:
+    """Write one synthetic session directory; returns its session id."""
+    session_id = f"2026-01-{n % 28 + 1:02d}_session-{n:05d}_{n * 7919 % 65536:04x}"
+    directory = root / session_id
+    directory.mkdir(parents=True, exist_ok=True)
+    current = rng.randrange(len(PHASES) + 1)
+    phases = {
+        phase: {
+            "status": (
+                "finalized" if i < current
+                else "in_progress" if i == current
+                else "not_started"
+            ),
+            "started_at": "2026-01-01T10:00:00Z" if i <= current else None,
+        }
+        for i, phase in enumerate(PHASES)
+    }
+    checkpoints = rng.randrange(3, 8)
+    completed = list(range(1, rng.randrange(checkpoints + 1) + 1))
+    _write_json(
+        directory / "state.json",
+        {
+            "session_id": session_id,
+            "topic": f"Synthetic session {n} (revision {revision})",
+            "description": synthetic_text(rng, 40),
+            "granularity": rng.choice(("coarse", "fine")),
+            "current_phase": (*PHASES, "complete")[current],
+            "parent_session": None,
+            "prior_session": None,
+            "created_at": "2026-01-01T10:00:00Z",
+            "updated_at": f"2026-01-02T10:00:{revision % 60:02d}Z",
+            "phases": phases,
+            "goals": [synthetic_text(rng, 12) for _ in range(4)],
+            "open_questions": [],
+            "key_decisions": [synthetic_text(rng, 20) for _ in range(3)],
+            "plan_state": {
+                "status": "in_progress" if current == 2 else "not_started",
+                "checkpoints_completed": completed,
+                "current_checkpoint": len(completed) + 1,
+            },
+        },
+    )
+    if current >= 1:
+        _write_json(
+            directory / "plan.json",
+            {
+                "session_id": session_id,
+                "status": phases["plan"]["status"],
+                "checkpoints": [
+                    {
+                        "id": c,
+                        "title": f"Checkpoint {c}",
+                        "goal": synthetic_text(rng, 30),
+                        "prerequisites": list(range(1, c))[-rng.randrange(3):],
+                        "status": "completed" if c in completed else "pending",
+                        "file_context": synthetic_text(rng, 200),
+                        "testing_strategy": synthetic_text(rng, 80),
+                        "tranches": [synthetic_text(rng, 60) for _ in range(3)],
+                    }
+                    for c in range(1, checkpoints + 1)
+                ],
+            },
+        )
+    if current >= 2:
+        _write_json(
+            directory / "dev-notes.json",
+            {
+                "session_id": session_id,
+                "notes": [
+                    {
+                        "id": f"DN-{i:03d}",
+                        "timestamp": "2026-01-03T10:00:00Z",
+                        "scope": {"type": "checkpoint", "ref": rng.randrange(1, 5)},
+                        "category": rng.choice(NOTE_CATEGORIES),
+                        "content": synthetic_text(rng, 40),
+                    }
+                    for i in range(rng.randrange(6))
+                ],
+            },
+        )
+    return session_id
+
+
+def build_tree(root: Path, sessions: int, seed: int = 0) -> List[str]:
+    """Synthetic sessions tree; prior_session links every tenth session."""
+    rng = random.Random(seed)
+    session_ids = [write_session(root, n, rng) for n in range(sessions)]
+    for n in range(10, sessions, 10):
+        path = root / session_ids[n] / "state.json"
+        state = json.loads(path.read_text())
+        state["prior_session"] = session_ids[n - 10]
+        state["parent_session"] = session_ids[0] if n % 20 == 0 else None
+        _write_json(path, state)
+    return session_ids
+
+
+# =============================================================================
+# FULL SCAN (reference)
+# =============================================================================
+
+
+def full_scan(root: Path) -> Dict[str, Dict[str, Any]]:
+    """session id -> {kind: parsed document} for every readable JSON file."""
+    sessions: Dict[str, Dict[str, Any]] = {}
+    for filename, kind in SESSION_FILES.items():
+        for path in sorted(root.glob(f"*/{filename}")):
+            if path.parent.name.startswith("."):
+                continue
+            try:
+                document = json.loads(path.read_bytes())
+            except ValueError:
+                continue
+            if isinstance(document, dict):
+                sessions.setdefault(path.parent.name, {})[kind] = document
+    return sessions
+
+
+def _opt(value: Any) -> Any:
+    return None if value is None else str(value)
+
+
+def scan_sessions(scan: Dict[str, Dict[str, Any]]) -> List[SessionRecord]:
+    records = []
+    for session_id, files in sorted(scan.items()):
+        state = files.get("state")
+        if state is None:
+            continue
+        fields = {
+            key: _opt(state.get(key))
+            for key in SessionRecord.model_fields
+            if key not in ("session_id", "build_status")
+        }
+        build_status = (state.get("plan_state") or {}).get("status")
+        records.append(
+            SessionRecord(session_id=session_id, build_status=build_status, **fields)
+        )
+    return records
+
+
+def scan_phases(scan: Dict[str, Dict[str, Any]], session_id: str) -> Dict[str, Any]:
+    phases = (scan.get(session_id, {}).get("state") or {}).get("phases") or {}
+    return {phase: info.get("status") for phase, info in phases.items()}
+
+
+def scan_checkpoints(scan: Dict[str, Dict[str, Any]]) -> List[CheckpointRecord]:
+    records = []
+    for session_id, files in sorted(scan.items()):
+        plan_state = (files.get("state") or {}).get("plan_state") or {}
+        completed = {str(c) for c in plan_state.get("checkpoints_completed") or ()}
+        for checkpoint in (files.get("plan") or {}).get("checkpoints") or ():
+            checkpoint_id = str(checkpoint["id"])
+            records.append(
+                CheckpointRecord(
+                    session_id=session_id,
+                    checkpoint_id=checkpoint_id,
+                    title=checkpoint.get("title"),
+                    status=checkpoint.get("status"),
+                    prerequisites=[str(p) for p in checkpoint["prerequisites"]],
+                    completed=checkpoint_id in completed,
+                )
+            )
+    return records
+
+
+def scan_dev_notes(scan: Dict[str, Dict[str, Any]]) -> List[DevNoteRecord]:
+    records = []
+    for session_id, files in sorted(scan.items()):
+        for note in (files.get("dev_notes") or {}).get("notes") or ():
+            scope = note.get("scope") or {}
+            records.append(
+                DevNoteRecord(
+                    session_id=session_id,
+                    note_id=note.get("id"),
+                    category=note.get("category"),
+                    scope_type=scope.get("type"),
+                    scope_ref=_opt(scope.get("ref")),
+                    timestamp=note.get("timestamp"),
+                )
+            )
+    return records
+
+
+# =============================================================================
+# EQUIVALENCE
+# =============================================================================
+
+
+def _compare(catalog: SessionCatalog) -> int:
+    """Assert every catalog query matches the full scan; returns queries run."""
+    scan = full_scan(catalog.root)
+    sessions = scan_sessions(scan)
+    checkpoints = scan_checkpoints(scan)
+    notes = scan_dev_notes(scan)
+    checks = [
+        (catalog.sessions(), sessions),
+        (catalog.checkpoints(), checkpoints),
+        (catalog.dev_notes(), notes),
+    ]
+    for phase in (*PHASES, "complete"):
+        checks.append(
+            (
+                catalog.sessions(current_phase=phase),
+                [s for s in sessions if s.current_phase == phase],
+            )
+        )
+        for status in PHASE_STATUSES:
+            checks.append(
+                (
+                    catalog.sessions(phase=phase, phase_status=status),
+                    [
+                        s for s in sessions
+                        if scan_phases(scan, s.session_id).get(phase) == status
+                    ],
+                )
+            )
+    for record in sessions:
+        checks.append(
+            (
+                catalog.children(record.session_id),
+                [
+                    s for s in sessions
+                    if record.session_id in (s.parent_session, s.prior_session)
+                ],
+            )
+        )
+        checks.append(
+            (
+                catalog.phase_statuses(record.session_id),
+                scan_phases(scan, record.session_id),
+            )
+        )
+    for status in ("completed", "pending"):
+        checks.append(
+            (
+                catalog.checkpoints(status=status),
+                [c for c in checkpoints if c.status == status],
+            )
+        )
+    checks.append(
+        (
+            catalog.checkpoints(completed=False),
+            [c for c in checkpoints if not c.completed],
+        )
+    )
+    for category in NOTE_CATEGORIES:
+        checks.append(
+            (
+                catalog.dev_notes(category=category),
+                [n for n in notes if n.category == category],
+            )
+        )
+    categories: Dict[str, int] = {}
+    for note in notes:
+        categories[note.category] = categories.get(note.category, 0) + 1
+    checks.append((catalog.note_categories(), dict(sorted(categories.items()))))
+
+    for n, (got, expected) in enumerate(checks):
+        assert got == expected, (n, got[:3], expected[:3])
+    return len(checks)
+
+
+def check_equivalence() -> int:
+    """
+    Assert catalog queries match a full scan across refreshes.
+
+    Returns:
+        Number of query results compared
+    """
+    compared = 0
+    if WORKFLOW_SESSIONS_DIR.is_dir():
+        with SessionCatalog(WORKFLOW_SESSIONS_DIR, ":memory:") as catalog:
+            catalog.refresh()
+            compared += _compare(catalog)
+
+    root = Path(tempfile.mkdtemp(prefix="bench_session_catalog_"))
+    try:
+        tree = root / "sessions"
+        session_ids = build_tree(tree, 60)
+        db_path = root / "catalog.sqlite"
+        rng = random.Random(1)
+        with SessionCatalog(tree, db_path) as catalog:
+            stats = catalog.refresh()
+            assert stats.reparsed == stats.files and not stats.errors
+            compared += _compare(catalog)
+
+            # Edit a few sessions, touch others without changing content
+            for n in (3, 17, 42):
+                write_session(tree, n, rng, revision=1)
+            for n in (5, 6):
+                path = tree / session_ids[n] / "state.json"
+                stat = path.stat()
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            stats = catalog.refresh()
+            assert stats.touched == 2 and stats.reparsed >= 3, stats
+            compared += _compare(catalog)
+
+            # Corrupt a plan, delete dev notes, delete a whole session, add one
+            (tree / session_ids[20] / "plan.json").write_text("{ torn")
+            for path in tree.glob("*/dev-notes.json"):
+                path.unlink()
+                break
+            shutil.rmtree(tree / session_ids[30])
+            write_session(tree, 999, rng)
+            stats = catalog.refresh()
+            assert list(stats.errors) == [str(tree / session_ids[20] / "plan.json")]
+            assert catalog.errors() == stats.errors
+            compared += _compare(catalog)
+
+            stats = catalog.refresh()
+            assert stats.unchanged == stats.files, stats
+
+        # A persisted database resumes incrementally
+        write_session(tree, 7, rng, revision=2)
+        with SessionCatalog(tree, db_path) as catalog:
+            stats = catalog.refresh()
+            assert stats.reparsed >= 1 and stats.reparsed < 4, stats
+            compared += _compare(catalog)
+    finally:
+        shutil.rmtree(root)
+    return compared
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+
+def _timed(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1e3
+
+
+def refresh_cost(sessions: int = 2000, changed: float = 0.01) -> Dict[str, Any]:
+    """Milliseconds for a full scan and for cold / warm catalog refreshes."""
+    root = Path(tempfile.mkdtemp(prefix="bench_session_catalog_"))
+    try:
+        tree = root / "sessions"
+        session_ids = build_tree(tree, sessions)
+        size = sum(path.stat().st_size for path in tree.glob("*/*.json"))
+        rng = random.Random(2)
+        sample = max(1, int(sessions * changed))
+
+        def scan_query() -> List[SessionRecord]:
+            found = scan_sessions(full_scan(tree))
+            return [s for s in found if s.current_phase == "build"]
+
+        results = {"sessions": sessions, "tree_mb": size / 2**20}
+        results["full_scan_ms"] = _timed(scan_query)
+        with SessionCatalog(tree, root / "catalog.sqlite") as catalog:
+            results["cold_refresh_ms"] = _timed(catalog.refresh)
+            results["warm_refresh_ms"] = _timed(catalog.refresh)
+
+            for session_id in rng.sample(session_ids, sample):
+                path = tree / session_id / "state.json"
+                os.utime(path, ns=(path.stat().st_atime_ns, time.time_ns()))
+            results["touched_refresh_ms"] = _timed(catalog.refresh)
+
+            for n in rng.sample(range(sessions), sample):
+                write_session(tree, n, rng, revision=1)
+            results["edited_refresh_ms"] = _timed(catalog.refresh)
+            results["query_ms"] = _timed(
+                lambda: catalog.sessions(current_phase="build")
+            )
+            results["changed"] = sample
+    finally:
+        shutil.rmtree(root)
+    return results
+
+
+if __name__ == "__main__":
+    print(f"Equivalence: {check_equivalence()} query results identical")
+    print()
+    cost = refresh_cost()
+    print(
+        f"{cost['sessions']} sessions ({cost['tree_mb']:.0f} MB of JSON), "
+        f"{cost['changed']} changed per warm run:"
+    )
+    print(f"  full scan + filter:        {cost['full_scan_ms']:8.1f} ms")
+    print(f"  cold refresh:              {cost['cold_refresh_ms']:8.1f} ms")
+    print(f"  warm refresh (no changes): {cost['warm_refresh_ms']:8.1f} ms")
+    print(f"  warm refresh (touched):    {cost['touched_refresh_ms']:8.1f} ms")
+    print(f"  warm refresh (edited):     {cost['edited_refresh_ms']:8.1f} ms")
+    print(f"  catalog query:             {cost['query_ms']:8.2f} ms")
@@ -0,0 +1,201 @@
+"""
+Load Test: SessionManager against FakeLLMClient
+
+Hosts many concurrent interviews, drives every session to completion with
+synthetic responses and reports throughput (turns/sec) and end-to-end turn
+latency percentiles. check_failed_turns() asserts that, for every turn
+runner, a failed generation call leaves the session untouched and a retry
+applies the turn exactly once.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_session_runtime
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from agents.interview_agent.benchmarks.synthetic import (
+    synthetic_questions,
+    synthetic_text,
+)
+from agents.interview_agent.analysis_stream import StreamingTurnRunner
+from agents.interview_agent.session_runtime import (
+    FakeLLMClient,
+    SessionManager,
+    TurnRunner,
+    run_turn,
+    start_interview,
+)
+from agents.interview_agent.speculative_turn import SpeculativeTurnRunner
+from agents.interview_agent.state_schema import InterviewConfig, create_interview_state
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+async def load_test(
+    sessions: int = 200,
+    questions: int = 5,
+    latency: float = 0.01,
+    model_limits: Optional[Dict[str, int]] = None,
+    max_pending_turns: int = 128,
+    turn_runner: TurnRunner = run_turn,
+    insights_per_analysis: int = 1,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Drive `sessions` interviews to completion concurrently.
+
+    Args:
+        sessions: Number of concurrent interviews
+        questions: Questions per interview
+        latency: Fake model latency per call (seconds)
+        model_limits: Per-model concurrency limits
+        max_pending_turns: SessionManager backpressure limit
+        turn_runner: Turn implementation to exercise
+        insights_per_analysis: Insights in each fake analysis reply
+        seed: RNG seed
+
+    Returns:
+        Dict with throughput and latency percentiles
+    """
+    rng = random.Random(seed)
+    client = FakeLLMClient(
+        latency=latency,
+        follow_ups_per_question=1,
+        insights_per_analysis=insights_per_analysis,
+    )
+    manager = SessionManager(
+        client,
+        model_limits=model_limits,
+        max_pending_turns=max_pending_turns,
+        turn_runner=turn_runner,
+    )
+
+    config = InterviewConfig()
+    for _ in range(sessions):
+        manager.add_session(
+            create_interview_state(
+                title="Load Test",
+                context=synthetic_text(rng, 20),
+                questions=synthetic_questions(rng, questions),
+                config=config,
+            )
+        )
+
+    latencies: List[float] = []
+
+    async def drive(session_id: str) -> int:
+        await manager.start_session(session_id)
+        turns = 0
+        while True:
+            result = await manager.submit_turn(session_id, synthetic_text(rng, 40))
+            latencies.append(result.latency_seconds)
+            turns += 1
+            if result.action == "complete":
+                return turns
+
+    start = time.perf_counter()
+    turns = await asyncio.gather(*(drive(sid) for sid in manager.session_ids))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "sessions": sessions,
+        "turns": sum(turns),
+        "model_calls": dict(client.calls),
+        "elapsed_s": elapsed,
+        "turns_per_sec": sum(turns) / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+class _ModelCallFailed(RuntimeError):
+    pass
+
+
+class _FlakyClient(FakeLLMClient):
+    """FakeLLMClient whose generation calls raise while `fail` is set."""
+
+    fail = False
+
+    async def complete(self, model: str, prompt: str) -> str:
+        if self.fail and model == InterviewConfig().transition_model:
+            raise _ModelCallFailed(model)
+        return await super().complete(model, prompt)
+
+
+async def _check_failed_turns(turn_runner: TurnRunner, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    client = _FlakyClient(follow_ups_per_question=1, insights_per_analysis=2)
+    state = create_interview_state(
+        title="Retry Check",
+        context=synthetic_text(rng, 20),
+        questions=synthetic_questions(rng, 2),
+    )
+    start_interview(state)
+
+    # A follow-up turn, then a transition turn on the same question
+    for action in ("follow_up", "transition"):
+        response = synthetic_text(rng, 40)
+        before = state.model_dump()
+        client.fail = True
+        try:
+            await turn_runner(state, response, client)
+        except _ModelCallFailed:
+            pass
+        else:
+            raise AssertionError("generation failure was not raised")
+        assert state.model_dump() == before, "failed turn changed the state"
+
+        client.fail = False
+        result = await turn_runner(state, response, client)
+        assert result.action == action, result.action
+        contents = [entry["content"] for entry in state.conversation_history]
+        assert contents.count(response) == 1
+
+    assert len(state.insight_bank.insights) == 4
+    assert len(state.questions[0].cumulative_insights) == 4
+
+
+def check_failed_turns() -> int:
+    """
+    Assert a failed generation call is retryable for every turn runner.
+
+    Returns:
+        Number of turn runners checked
+    """
+    runners = [run_turn, SpeculativeTurnRunner(), StreamingTurnRunner()]
+    for runner in runners:
+        asyncio.run(_check_failed_turns(runner))
+    return len(runners)
+
+
+def run(**kwargs: Any) -> Dict[str, Any]:
+    """Synchronous wrapper around load_test."""
+    return asyncio.run(load_test(**kwargs))
+
+
+if __name__ == "__main__":
+    print(f"Failed-turn retry: {check_failed_turns()} turn runners checked")
+    print()
+    scenarios = [
+        ("default (16)", {}),
+        ("8 per model", {"model_limits": {"gpt-4o": 8, "gemini-2.0-flash": 8}}),
+        ("32 per model", {"model_limits": {"gpt-4o": 32, "gemini-2.0-flash": 32}}),
+    ]
+    print(f"{'scenario':<14} {'turns':>6} {'turns/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, kwargs in scenarios:
+        result = run(**kwargs)
+        print(
+            f"{name:<14} {result['turns']:>6} {result['turns_per_sec']:>9.1f} "
+            f"{result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f}"
+        )
@@ -0,0 +1,93 @@
+"""
+Benchmark: binary snapshot codec vs JSON
+
+Encodes realistic 50-exchange interviews (10 questions x 5 exchanges, with
+insights and conversation history) as pretty JSON, compact JSON and binary
+snapshots (uncompressed, zlib, lzma), checks every binary form round-trips
+to the same JSON, and reports size plus encode / decode time.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_snapshot_codec
+"""
+
+from time import perf_counter_ns
+from typing import Any, Callable, Dict
+
+from agents.interview_agent.benchmarks.synthetic import build_synthetic_state
+from agents.interview_agent.snapshot_codec import decode_snapshot, encode_snapshot
+from agents.interview_agent.state_schema import InterviewState
+
+
+def _time(fn: Callable[[], Any], rounds: int) -> float:
+    """Mean microseconds per call."""
+    start = perf_counter_ns()
+    for _ in range(rounds):
+        fn()
+    return (perf_counter_ns() - start) / rounds / 1000
+
+
+def run(
+    questions: int = 10,
+    exchanges_per_question: int = 5,
+    rounds: int = 100,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Compare formats on one synthetic interview.
+
+    Returns:
+        Dict with one row per format (bytes, encode / decode us)
+    """
+    state = build_synthetic_state(
+        questions=questions, exchanges_per_question=exchanges_per_question, seed=seed
+    )
+    expected = state.model_dump_json()
+
+    formats = {
+        "json (indent=2)": (
+            lambda: state.model_dump_json(indent=2).encode(),
+            InterviewState.model_validate_json,
+        ),
+        "json (compact)": (
+            lambda: state.model_dump_json().encode(),
+            InterviewState.model_validate_json,
+        ),
+        "binary": (lambda: encode_snapshot(state), decode_snapshot),
+        "binary + zlib": (lambda: encode_snapshot(state, "zlib"), decode_snapshot),
+        "binary + lzma": (lambda: encode_snapshot(state, "lzma"), decode_snapshot),
+    }
+
+    rows = []
+    for name, (encode, decode) in formats.items():
+        data = encode()
+        if decode(data).model_dump_json() != expected:
+            raise AssertionError(f"{name} does not round-trip")
+        rows.append(
+            {
+                "format": name,
+                "bytes": len(data),
+                "encode_us": _time(encode, rounds),
+                "decode_us": _time(lambda: decode(data), rounds),
+            }
+        )
+    return {
+        "exchanges": sum(len(q.exchanges) for q in state.questions),
+        "insights": len(state.insight_bank.insights),
+        "rows": rows,
+    }
+
+
+if __name__ == "__main__":
+    results = run()
+    print(
+        f"{results['exchanges']} exchanges, {results['insights']} insights "
+        "(all formats round-trip to identical JSON)"
+    )
+    print()
+    baseline = results["rows"][0]["bytes"]
+    print(f"{'format':<18} {'bytes':>8} {'ratio':>7} {'encode us':>10} {'decode us':>10}")
+    for row in results["rows"]:
+        print(
+            f"{row['format']:<18} {row['bytes']:>8} {row['bytes'] / baseline:>6.0%} "
+            f"{row['encode_us']:>10.0f} {row['decode_us']:>10.0f}"
+        )
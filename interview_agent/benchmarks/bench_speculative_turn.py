@@ -0,0 +1,72 @@
+"""
+Benchmark: speculative vs sequential turn pipeline
+
+Runs the SessionManager load test with run_turn and with
+SpeculativeTurnRunner against the same fake model latency, then reports
+turn latency, throughput and the speculation metrics (wasted calls versus
+latency saved).
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_speculative_turn
+"""
+
+from typing import Any, Dict
+
+from agents.interview_agent.benchmarks.bench_session_runtime import run as load_test
+from agents.interview_agent.session_runtime import run_turn
+from agents.interview_agent.speculative_turn import SpeculativeTurnRunner
+
+
+def run(
+    sessions: int = 100,
+    questions: int = 5,
+    latency: float = 0.02,
+) -> Dict[str, Any]:
+    """
+    Run both pipelines.
+
+    Args:
+        sessions: Concurrent interviews
+        questions: Questions per interview
+        latency: Fake model latency per call (seconds)
+
+    Returns:
+        Dict with sequential / speculative load-test results and metrics
+    """
+    # Generous model limits so the comparison measures pipeline latency,
+    # not queueing on the per-model semaphores
+    limits = {"gpt-4o": 1024, "gemini-2.0-flash": 1024}
+    common = dict(
+        sessions=sessions, questions=questions, latency=latency, model_limits=limits
+    )
+
+    sequential = load_test(turn_runner=run_turn, **common)
+    runner = SpeculativeTurnRunner()
+    speculative = load_test(turn_runner=runner, **common)
+
+    return {
+        "sequential": sequential,
+        "speculative": speculative,
+        "metrics": runner.metrics,
+    }
+
+
+if __name__ == "__main__":
+    results = run()
+    print(f"{'pipeline':<12} {'turns':>6} {'turns/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'model calls':>12}")
+    for name in ("sequential", "speculative"):
+        r = results[name]
+        print(
+            f"{name:<12} {r['turns']:>6} {r['turns_per_sec']:>9.1f} "
+            f"{r['p50_ms']:>8.1f} {r['p99_ms']:>8.1f} {sum(r['model_calls'].values()):>12}"
+        )
+
+    m = results["metrics"]
+    print()
+    print(f"Branches launched:        {m.branches_launched}")
+    print(f"Branches committed:       {m.branches_committed}")
+    print(f"Branches cancelled:       {m.branches_cancelled} ({m.wasted_call_ratio:.0%} of launched)")
+    print(f"  already completed:      {m.branches_wasted_completed}")
+    print(f"Follow-ups skipped (max): {m.follow_ups_skipped_at_limit}")
+    print(f"Transitions reissued:     {m.transitions_reissued}")
+    print(f"Mean latency saved/turn:  {m.mean_latency_saved_seconds * 1000:.1f} ms")
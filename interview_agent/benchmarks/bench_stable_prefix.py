@@ -0,0 +1,178 @@
+"""
+Benchmark: stable-prefix prompt layout vs default layout
+
+Simulates an interview and builds the interviewer prompt for every turn in
+both layouts, then measures how much of each prompt a provider prefix cache
+could reuse from the previous turn:
+- breakpoint: the part before CACHE_BREAKPOINT, reused when identical to the
+  previous turn's (explicit cache_control-style breakpoints)
+- automatic: the common prefix with the previous prompt, rounded down to
+  whole cache blocks (automatic prefix caching)
+
+Cost is reported in input-token units with cached tokens billed at
+CACHED_TOKEN_PRICE; uncached tokens per turn are the latency proxy (prefill
+work the provider cannot skip). Token counts use estimate_tokens.
+
+check_equivalence() asserts both layouts carry exactly the same content.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_stable_prefix
+"""
+
+import random
+import re
+from collections import Counter
+from os.path import commonprefix
+from typing import Any, Dict, List, Optional
+
+from agents.interview_agent.benchmarks.synthetic import (
+    iter_interview_turns,
+    synthetic_questions,
+    synthetic_text,
+)
+from agents.interview_agent.prompt_budget import estimate_tokens
+from agents.interview_agent.state_schema import InterviewState, create_interview_state
+from agents.interview_agent.user_prompt_formatter import (
+    CACHE_BREAKPOINT,
+    LAYOUT_DEFAULT,
+    LAYOUT_STABLE_PREFIX,
+    format_interviewer_prompt,
+    split_cache_breakpoint,
+)
+
+# Relative price of a cache-read input token
+CACHED_TOKEN_PRICE = 0.1
+
+# Automatic prefix caches reuse whole blocks of this many tokens
+CACHE_BLOCK_TOKENS = 128
+
+# Section wrappers and status lines that move between layouts
+_WRAPPER = re.compile(r"^</?(interview|current_question|status)>$")
+_INTERVIEW_STATUS = re.compile(r"^<interview_status>(.*)</interview_status>$")
+
+
+def _interview(questions: int, seed: int) -> InterviewState:
+    rng = random.Random(seed)
+    return create_interview_state(
+        title="Stable Prefix Benchmark",
+        context=synthetic_text(rng, 120),
+        questions=synthetic_questions(rng, questions),
+    )
+
+
+def _content_lines(prompt: str) -> Counter:
+    """Prompt lines minus layout-only wrappers, as a multiset."""
+    lines = Counter()
+    for line in prompt.replace(CACHE_BREAKPOINT, "").splitlines():
+        line = _INTERVIEW_STATUS.sub(r"<status>\1</status>", line.strip())
+        if line and not _WRAPPER.match(line):
+            lines[line] += 1
+    return lines
+
+
+def check_equivalence(questions: int = 8, seed: int = 0) -> int:
+    """
+    Assert both layouts hold the same content lines on every turn, and the
+    stable layout always carries exactly one breakpoint.
+
+    Returns:
+        Number of turns checked
+    """
+    turns = 0
+    for state in iter_interview_turns(_interview(questions, seed), seed=seed):
+        for user_message in (None, state.conversation_history[-1]["content"]):
+            default = format_interviewer_prompt(state, user_message)
+            stable = format_interviewer_prompt(
+                state, user_message, layout=LAYOUT_STABLE_PREFIX
+            )
+            assert stable.count(CACHE_BREAKPOINT) == 1
+            assert _content_lines(default) == _content_lines(stable), turns
+        turns += 1
+    assert _content_lines(format_interviewer_prompt(state)) == _content_lines(
+        format_interviewer_prompt(state, layout=LAYOUT_STABLE_PREFIX)
+    )
+    return turns
+
+
+def run(
+    questions: int = 10,
+    exchanges_per_question: int = 4,
+    insights_per_exchange: int = 2,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Measure cacheable prefixes per turn for both layouts.
+
+    Returns:
+        Dict with per-layout totals and the per-turn stable prefix lengths
+    """
+    results: Dict[str, Any] = {}
+    for layout in (LAYOUT_DEFAULT, LAYOUT_STABLE_PREFIX):
+        previous: Optional[str] = None
+        previous_prefix: Optional[str] = None
+        totals = Counter()
+        prefix_chars: List[int] = []
+
+        for state in iter_interview_turns(
+            _interview(questions, seed),
+            exchanges_per_question=exchanges_per_question,
+            insights_per_exchange=insights_per_exchange,
+            seed=seed,
+        ):
+            prompt = format_interviewer_prompt(
+                state, state.conversation_history[-1]["content"], layout=layout
+            )
+            tokens = estimate_tokens(prompt)
+            prefix, _ = split_cache_breakpoint(prompt)
+            prefix_chars.append(len(prefix))
+
+            breakpoint_cached = (
+                estimate_tokens(prefix) if prefix and prefix == previous_prefix else 0
+            )
+            shared = commonprefix([previous, prompt]) if previous else ""
+            automatic_cached = (
+                estimate_tokens(shared) // CACHE_BLOCK_TOKENS * CACHE_BLOCK_TOKENS
+            )
+
+            totals["turns"] += 1
+            totals["tokens"] += tokens
+            totals["breakpoint_cached"] += breakpoint_cached
+            totals["automatic_cached"] += automatic_cached
+            previous, previous_prefix = prompt, prefix
+
+        results[layout] = {"totals": totals, "prefix_chars": prefix_chars}
+    return results
+
+
+def _cost(tokens: int, cached: int) -> float:
+    return tokens - cached + cached * CACHED_TOKEN_PRICE
+
+
+if __name__ == "__main__":
+    print(f"Equivalence: {check_equivalence()} turns carry identical content")
+    print()
+
+    results = run()
+    baseline = results[LAYOUT_DEFAULT]["totals"]["tokens"]
+    header = (
+        f"{'layout':<14} {'mode':<11} {'cached':>7} {'uncached tok/turn':>18} "
+        f"{'relative cost':>14}"
+    )
+    print(header)
+    for layout, result in results.items():
+        totals = result["totals"]
+        for mode in ("breakpoint", "automatic"):
+            cached = totals[f"{mode}_cached"]
+            print(
+                f"{layout:<14} {mode:<11} {cached / totals['tokens']:>7.0%} "
+                f"{(totals['tokens'] - cached) / totals['turns']:>18.0f} "
+                f"{_cost(totals['tokens'], cached) / baseline:>14.0%}"
+            )
+
+    prefix_chars = results[LAYOUT_STABLE_PREFIX]["prefix_chars"]
+    print()
+    mean = sum(prefix_chars) / len(prefix_chars)
+    print(
+        f"Stable prefix per turn: min {min(prefix_chars)}, "
+        f"max {max(prefix_chars)}, mean {mean:.0f} chars"
+    )
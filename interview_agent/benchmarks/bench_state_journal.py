@@ -0,0 +1,165 @@
+"""
+Benchmark: StateJournal appends vs full state.json rewrites
+
+Runs a simulated interview and times two ways of saving after each turn:
+rewriting the whole model, and atomic_update() on a state bound to a
+StateJournal (the auto_save_after_each_exchange path, which journals only
+what changed). Reports per-turn save cost as history grows. Also verifies
+that replay reproduces the final state, including updated_at, and that a
+torn tail record is recovered from.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_state_journal
+"""
+
+import random
+import tempfile
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Dict, List
+
+from agents.interview_agent.benchmarks.synthetic import (
+    synthetic_questions,
+    synthetic_text,
+)
+from agents.interview_agent.state_journal import StateJournal, atomic_write_text
+from agents.interview_agent.state_schema import (
+    FollowUpReason,
+    InterviewStatus,
+    QuestionStatus,
+    ResearchObjectiveStatus,
+    ResponseAnalysis,
+    create_interview_state,
+)
+
+
+def run(
+    questions: int = 40,
+    exchanges_per_question: int = 4,
+    fsync: bool = True,
+    buckets: int = 5,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """
+    Run the benchmark.
+
+    Args:
+        questions: Number of questions in the simulated interview
+        exchanges_per_question: Initial question + follow-ups per question
+        fsync: Whether saves fsync (both strategies use the same setting)
+        buckets: Number of turn ranges to average over
+        seed: RNG seed
+
+    Returns:
+        Dict with per-bucket save microseconds for both strategies (the journal
+        mean includes amortized snapshot compaction; p50 is the plain sync)
+    """
+    rng = random.Random(seed)
+    state = create_interview_state(
+        title="Journal Benchmark",
+        context=synthetic_text(rng, 40),
+        questions=synthetic_questions(rng, questions),
+    )
+    state.status = InterviewStatus.IN_PROGRESS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        full_path = Path(tmp) / "full" / "state.json"
+        full_path.parent.mkdir()
+        journal = StateJournal(Path(tmp) / "journal", fsync=fsync)
+        journal.create(state)
+
+        full_ns: List[int] = []
+        journal_ns: List[int] = []
+
+        while not state.is_complete():
+            question = state.get_current_question()
+            question.status = QuestionStatus.ACTIVE
+
+            for n in range(exchanges_per_question):
+                exchange = question.add_exchange(
+                    synthetic_text(rng, 15),
+                    is_follow_up=n > 0,
+                    follow_up_reason=FollowUpReason.PROBE_DEEPER if n else None,
+                )
+                state.record_exchange("assistant", exchange.question_text)
+
+                response = synthetic_text(rng, 60)
+                question.record_response(
+                    response,
+                    ResponseAnalysis(
+                        objective_progress=ResearchObjectiveStatus.PARTIAL,
+                        insights_extracted=[synthetic_text(rng, 10)],
+                        recommendation="follow_up",
+                        recommendation_reason=synthetic_text(rng, 10),
+                    ),
+                )
+                state.record_exchange("user", response)
+                state.insight_bank.add_insight(
+                    synthetic_text(rng, 10), question.id, exchange.id, "pain_point"
+                )
+                start = perf_counter_ns()
+                state.atomic_update()
+                journal_ns.append(perf_counter_ns() - start)
+
+                # Baseline: one full rewrite per turn
+                start = perf_counter_ns()
+                atomic_write_text(full_path, state.model_dump_json(indent=2), fsync)
+                full_ns.append(perf_counter_ns() - start)
+
+            question.status = QuestionStatus.SATISFIED
+            state.advance_to_next_question()
+            state.atomic_update()
+
+        state.status = InterviewStatus.COMPLETED
+        state.atomic_update()
+        journal.close()
+
+        # Replay must reproduce the live state exactly
+        recovered = StateJournal(Path(tmp) / "journal").load()
+        if recovered.model_dump() != state.model_dump():
+            raise AssertionError("Journal replay diverged from live state")
+
+        # Copies are not journaled; only the bound state is
+        copy = recovered.model_copy(deep=True)
+        copy.record_exchange("user", "edited copy")
+        copy.atomic_update()
+        reloaded = StateJournal(Path(tmp) / "journal").load()
+        if reloaded.model_dump() != state.model_dump():
+            raise AssertionError("A copy of the bound state was journaled")
+
+        # A torn final record must be dropped, not fail the load
+        journal_path = Path(tmp) / "journal" / "journal.jsonl"
+        with open(journal_path, "ab") as f:
+            f.write(b'0badc0de {"op":"hist')
+        StateJournal(Path(tmp) / "journal").load()
+
+    size = max(1, len(full_ns) // buckets)
+    rows = []
+    for start in range(0, len(full_ns), size):
+        full = full_ns[start : start + size]
+        appended = journal_ns[start : start + size]
+        rows.append(
+            {
+                "turns": f"{start + 1}-{start + len(full)}",
+                "full_us": sum(full) / len(full) / 1000,
+                "journal_us": sum(appended) / len(appended) / 1000,
+                "journal_p50_us": sorted(appended)[len(appended) // 2] / 1000,
+            }
+        )
+    return {"turns": len(full_ns), "fsync": fsync, "rows": rows}
+
+
+if __name__ == "__main__":
+    for fsync in (False, True):
+        results = run(fsync=fsync)
+        print(f"Turns: {results['turns']}  fsync={fsync}  (replay verified)")
+        print(
+            f"{'turns':>10} {'full rewrite (us)':>18} "
+            f"{'journal mean (us)':>18} {'journal p50 (us)':>17}"
+        )
+        for row in results["rows"]:
+            print(
+                f"{row['turns']:>10} {row['full_us']:>18.1f} "
+                f"{row['journal_us']:>18.1f} {row['journal_p50_us']:>17.1f}"
+            )
+        print()
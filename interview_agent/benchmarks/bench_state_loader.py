@@ -0,0 +1,113 @@
+"""
+Benchmark: bulk state loader vs one-file-at-a-time loading
+
+Writes thousands of synthetic interview sessions (a few deliberately
+corrupt), then times the current path - json.load followed by
+InterviewState(**data) per file, as format_from_dict and load_interim_data
+do - against load_states in-process and with a process pool.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_state_loader
+"""
+
+import json
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from agents.interview_agent.benchmarks.synthetic import build_synthetic_state
+from agents.interview_agent.state_loader import (
+    discover_state_files,
+    load_states,
+)
+from agents.interview_agent.state_schema import InterviewState
+
+
+def write_sessions(root: Path, sessions: int, corrupt: int = 3, seed: int = 0) -> None:
+    """Write `sessions` state.json files under root; `corrupt` are invalid."""
+    rng = random.Random(seed)
+    templates = [
+        build_synthetic_state(questions=8, seed=rng.randrange(1 << 30), complete=False)
+        for _ in range(8)
+    ]
+    for n in range(sessions):
+        state = templates[n % len(templates)]
+        state.session_id = f"session-{n:05d}"
+        session_dir = root / state.session_id
+        session_dir.mkdir(parents=True, exist_ok=True)
+        text = state.model_dump_json(indent=2)
+        if n < corrupt:
+            # Truncated write / missing required field
+            text = text[: len(text) // 2] if n % 2 else text.replace('"title"', '"_title"')
+        (session_dir / "state.json").write_text(text, encoding="utf-8")
+
+
+def load_sequential(paths: List[Path]) -> Dict[str, Any]:
+    """The current path: json.load + full validation from a dict, per file."""
+    states, errors = {}, 0
+    for path in paths:
+        try:
+            with open(path, "r") as f:
+                states[str(path)] = InterviewState(**json.load(f))
+        except Exception:
+            errors += 1
+    return {"states": len(states), "errors": errors}
+
+
+def run(sessions: int = 2000, workers: int = 0, seed: int = 0) -> Dict[str, Any]:
+    """
+    Time each loading strategy over the same session directory.
+
+    Args:
+        sessions: Synthetic sessions to write
+        workers: Pool size for the parallel run (0: CPU count)
+        seed: RNG seed
+
+    Returns:
+        Dict with one row per strategy
+    """
+    workers = workers or os.cpu_count() or 1
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "interview_sessions"
+        write_sessions(root, sessions, seed=seed)
+        paths = discover_state_files([root])
+
+        def timed(name: str, fn) -> None:
+            start = time.perf_counter()
+            outcome = fn()
+            rows.append(
+                {
+                    "strategy": name,
+                    "seconds": time.perf_counter() - start,
+                    "loaded": outcome["states"],
+                    "errors": outcome["errors"],
+                }
+            )
+
+        def bulk(**kwargs) -> Dict[str, Any]:
+            result = load_states(paths, **kwargs)
+            return {"states": len(result.states), "errors": len(result.errors)}
+
+        timed("sequential json.load + validate", lambda: load_sequential(paths))
+        timed("load_states (in-process)", lambda: bulk(workers=1))
+        if workers > 1:
+            timed(f"load_states ({workers} processes)", lambda: bulk(workers=workers))
+
+    return {"sessions": sessions, "workers": workers, "rows": rows}
+
+
+if __name__ == "__main__":
+    results = run()
+    print(f"{results['sessions']} sessions, {results['workers']} CPU(s)")
+    print()
+    print(f"{'strategy':<34} {'seconds':>8} {'speedup':>8} {'loaded':>7} {'errors':>7}")
+    baseline = results["rows"][0]["seconds"]
+    for row in results["rows"]:
+        print(
+            f"{row['strategy']:<34} {row['seconds']:>8.2f} "
+            f"{baseline / row['seconds']:>7.1f}x {row['loaded']:>7} {row['errors']:>7}"
+        )
@@ -0,0 +1,284 @@
+"""
+Benchmark: tracing overhead
+
+Measures what the instrumentation in formatters, state methods, the journal
+and the session runtime costs in three modes:
+- disabled: the default (span() is a shared no-op, traced() calls through)
+- histogram: HistogramAggregator only
+- histogram + jsonl: HistogramAggregator and JsonlExporter
+
+Reports per-call overhead of a traced function, an in-process interview loop
+(state mutations + interviewer prompt per turn) and the SessionManager load
+test. check_equivalence() asserts tracing never changes outputs and that
+every turn's spans carry the Exchange.id being answered.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_tracing
+"""
+
+import asyncio
+import functools
+import inspect
+import random
+import re
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from agents.interview_agent.benchmarks.bench_session_runtime import load_test
+from agents.interview_agent.benchmarks.synthetic import (
+    iter_interview_turns,
+    synthetic_questions,
+    synthetic_text,
+)
+from agents.interview_agent.session_runtime import FakeLLMClient, SessionManager
+from agents.interview_agent.state_schema import InterviewState, create_interview_state
+from agents.interview_agent.tracing import (
+    HistogramAggregator,
+    JsonlExporter,
+    disable_tracing,
+    enable_tracing,
+    read_spans,
+    span,
+    spans_for_exchange,
+    traced,
+)
+from agents.interview_agent.user_prompt_formatter import format_interviewer_prompt
+
+MODES = ("disabled", "histogram", "histogram + jsonl")
+
+# Session / exchange / insight ids are random; masked before comparing prompts
+_UUID = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+
+def _interview(questions: int, seed: int) -> InterviewState:
+    rng = random.Random(seed)
+    return create_interview_state(
+        title="Tracing Benchmark",
+        context=synthetic_text(rng, 60),
+        questions=synthetic_questions(rng, questions),
+    )
+
+
+def _with_mode(mode: str, directory: Path, fn: Callable[[], Any]):
+    """Run fn with tracing configured for `mode`; returns (result, aggregator)."""
+    aggregator = HistogramAggregator()
+    if mode == "histogram":
+        enable_tracing(aggregator)
+    elif mode == "histogram + jsonl":
+        enable_tracing(aggregator, JsonlExporter(directory / "spans.jsonl"))
+    try:
+        return fn(), aggregator
+    finally:
+        # Closes the exporter, writing out any spans still buffered
+        disable_tracing()
+
+
+def interview_prompts(questions: int = 6, seed: int = 0) -> List[str]:
+    """Drive one interview in-process, building the interviewer prompt per turn."""
+    return [
+        _UUID.sub(
+            "<id>",
+            format_interviewer_prompt(state, state.conversation_history[-1]["content"]),
+        )
+        for state in iter_interview_turns(_interview(questions, seed), seed=seed)
+    ]
+
+
+async def drive_sessions(
+    sessions: int, questions: int, seed: int = 0
+) -> List[InterviewState]:
+    """Run sessions to completion through SessionManager (no model latency)."""
+    rng = random.Random(seed)
+    manager = SessionManager(FakeLLMClient(latency=0.0, follow_ups_per_question=1))
+    for _ in range(sessions):
+        manager.add_session(_interview(questions, rng.randrange(1 << 30)))
+
+    async def drive(session_id: str) -> None:
+        await manager.start_session(session_id)
+        while True:
+            result = await manager.submit_turn(session_id, synthetic_text(rng, 30))
+            if result.action == "complete":
+                return
+
+    await asyncio.gather(*(drive(sid) for sid in manager.session_ids))
+    return [manager.get_session(sid) for sid in manager.session_ids]
+
+
+def check_equivalence() -> int:
+    """
+    Assert prompts are identical in every mode, that disable_tracing() writes
+    out spans still buffered in a JsonlExporter, and that JSONL spans can be
+    joined to Exchange.id: each turn span names an answered exchange and its
+    model calls share that exchange_id and trace. Also asserts traced() spots
+    coroutine functions behind partial() and @wraps.
+
+    Returns:
+        Number of turns traced
+    """
+    baseline = interview_prompts()
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for mode in MODES[1:]:
+            prompts, aggregator = _with_mode(mode, directory, interview_prompts)
+            assert prompts == baseline, mode
+            assert aggregator.histograms["format_interviewer_prompt"].count == len(
+                baseline
+            )
+
+        (directory / "spans.jsonl").unlink()
+        enable_tracing(JsonlExporter(directory / "spans.jsonl", buffer_spans=256))
+        for i in range(3):
+            with span("bench.buffered", index=i):
+                pass
+        disable_tracing()
+        assert len(read_spans(directory / "spans.jsonl")) == 3
+
+        (directory / "spans.jsonl").unlink()
+        states, _ = _with_mode(
+            "histogram + jsonl",
+            directory,
+            lambda: asyncio.run(drive_sessions(sessions=5, questions=3)),
+        )
+        spans = read_spans(directory / "spans.jsonl")
+
+    answered = {
+        exchange.id: state.session_id
+        for state in states
+        for question in state.questions
+        for exchange in question.exchanges
+        if exchange.user_response is not None
+    }
+    turns = [s for s in spans if s["name"] == "turn"]
+    assert len(turns) == len(answered)
+    by_trace: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for s in spans:
+        by_trace[s["trace_id"]].append(s)
+    for turn in turns:
+        attributes = turn["attributes"]
+        assert answered[attributes["exchange_id"]] == attributes["session_id"]
+        related = spans_for_exchange(spans, attributes["exchange_id"])
+        assert related == by_trace[turn["trace_id"]]
+        names = {s["name"] for s in related}
+        assert {"model.call", "QuestionState.record_response"} <= names, names
+
+    # Coroutine functions behind partial() or a @wraps decorator get the
+    # async wrapper, so their span covers the await
+    async def answer(value: int = 1) -> int:
+        return value
+
+    @functools.wraps(answer)
+    def wrapped():
+        return answer()
+
+    for fn in (functools.partial(answer, 1), wrapped):
+        decorated = traced("bench.async")(fn)
+        assert inspect.iscoroutinefunction(decorated), fn
+        assert asyncio.run(decorated()) == 1
+    return len(turns)
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+
+def call_overhead(calls: int = 200_000) -> Dict[str, float]:
+    """Nanoseconds per call: plain function vs traced (disabled / enabled)."""
+
+    def plain(x: int) -> int:
+        return x
+
+    decorated = traced("bench.noop")(plain)
+
+    def timed(fn: Callable[[int], int]) -> float:
+        start = time.perf_counter_ns()
+        for i in range(calls):
+            fn(i)
+        return (time.perf_counter_ns() - start) / calls
+
+    results = {"plain_ns": timed(plain), "disabled_ns": timed(decorated)}
+    enable_tracing(HistogramAggregator())
+    try:
+        results["histogram_ns"] = timed(decorated)
+    finally:
+        disable_tracing()
+    return results
+
+
+def _best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best: Optional[float] = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best or 0.0
+
+
+def run(repeat: int = 5) -> Dict[str, Any]:
+    """
+    Time the interview loop and load test in every mode.
+
+    Returns:
+        Dict of mode -> seconds per workload, plus the last histogram summary
+    """
+    results: Dict[str, Any] = {}
+    summary: Dict[str, Any] = {}
+    # Warm-up so the first (disabled) mode is not charged for cold caches
+    interview_prompts(questions=40)
+    asyncio.run(load_test(sessions=200, latency=0.0))
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        for mode in MODES:
+            loop_s, _ = _with_mode(
+                mode,
+                directory,
+                lambda: _best_of(lambda: interview_prompts(questions=40), repeat),
+            )
+            load, aggregator = _with_mode(
+                mode,
+                directory,
+                lambda: asyncio.run(load_test(sessions=200, latency=0.0)),
+            )
+            results[mode] = {
+                "interview_loop_s": loop_s,
+                "load_test_s": load["elapsed_s"],
+            }
+            if aggregator.histograms:
+                summary = aggregator.summary()
+    results["summary"] = summary
+    return results
+
+
+if __name__ == "__main__":
+    print(f"Equivalence: {check_equivalence()} turns traced, outputs identical")
+    print()
+
+    overhead = call_overhead()
+    print(
+        f"Per call: plain {overhead['plain_ns']:.0f} ns, "
+        f"traced+disabled {overhead['disabled_ns']:.0f} ns, "
+        f"traced+histogram {overhead['histogram_ns']:.0f} ns"
+    )
+    print()
+
+    r = run()
+    base = r["disabled"]
+    print(f"{'mode':<20} {'interview loop s':>17} {'load test s':>12}")
+    for mode in MODES:
+        cells = []
+        for key in ("interview_loop_s", "load_test_s"):
+            overhead = r[mode][key] / base[key] - 1
+            cells.append(f"{r[mode][key]:.3f} ({overhead:+.0%})")
+        print(f"{mode:<20} {cells[0]:>17} {cells[1]:>12}")
+
+    print()
+    print(f"{'span':<40} {'count':>7} {'mean us':>9} {'p50 us':>8} {'p99 us':>8}")
+    for name, s in list(r["summary"].items())[:12]:
+        print(
+            f"{name:<40} {s['count']:>7} {s['mean_us']:>9.1f} "
+            f"{s['p50_us']:>8.0f} {s['p99_us']:>8.0f}"
+        )
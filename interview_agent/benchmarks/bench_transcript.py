@@ -0,0 +1,254 @@
+"""
+Benchmark: incremental transcript.md rendering and state recovery
+
+Drives a 50-question, 500-exchange synthetic interview and measures:
+- Rendering: TranscriptWriter.sync() after every turn vs re-rendering the
+  whole transcript each turn (what rewriting the file wholesale costs)
+- Recovery: recover_state() from the finished transcript, next to loading
+  the same state from state.json
+
+check_equivalence() asserts the recovered state equals the live one after
+every turn (Pydantic and runtime models, transition messages, multi-line
+text, a mid-interview resume) and that a torn tail is dropped on resume.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.bench_transcript
+"""
+
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from agents.interview_agent.benchmarks.bench_runtime_models import _analyses
+from agents.interview_agent.benchmarks.synthetic import (
+    iter_interview_turns,
+    synthetic_questions,
+    synthetic_text,
+)
+from agents.interview_agent.runtime_models import create_runtime_state, to_model
+from agents.interview_agent.session_runtime import (
+    apply_analysis,
+    apply_follow_up,
+    apply_transition,
+    start_interview,
+)
+from agents.interview_agent.state_schema import (
+    InterviewState,
+    create_interview_state,
+)
+from agents.interview_agent.transcript import (
+    TRANSCRIPT_FILENAME,
+    TranscriptWriter,
+    parse_transcript,
+    recover_state,
+)
+
+QUESTIONS = 50
+EXCHANGES_PER_QUESTION = 10
+
+
+def _as_model(state: Any) -> InterviewState:
+    return state if isinstance(state, InterviewState) else to_model(state)
+
+
+# =============================================================================
+# EQUIVALENCE
+# =============================================================================
+
+
+def _check_session(factory: Callable[..., Any], session_dir: Path) -> int:
+    """
+    Drive one session through the turn functions, recovering after each turn.
+
+    Returns:
+        Number of turns checked
+    """
+    rng = random.Random(1)
+    state = factory(
+        title="Equivalence <check>",
+        context="line one\nline two -->",
+        questions=synthetic_questions(rng, 5),
+    )
+    responses = [synthetic_text(rng, 30) + "\n\nsecond paragraph" for _ in range(4)]
+    analyses = _analyses(insights=2)
+
+    writer = TranscriptWriter(session_dir)
+    writer.open(state)
+    start_interview(state)
+    writer.sync(state)
+    turns = 0
+    while not state.is_complete():
+        question = state.get_current_question()
+        key = "follow_up" if question.follow_up_count < 1 else "transition"
+        if apply_analysis(state, responses[turns % len(responses)], analyses[key]):
+            apply_follow_up(state, "Could you say more?\n(take your time)")
+        else:
+            message = "Thanks -> on to the next one." if turns % 3 else None
+            apply_transition(state, analyses[key], message)
+        writer.sync(state)
+        turns += 1
+
+        if turns == 4:  # resume mid-interview on the same file
+            writer.close()
+            writer = TranscriptWriter(session_dir)
+            writer.open(state)
+        expected = _as_model(state).model_dump()
+        assert recover_state(session_dir).model_dump() == expected, turns
+    writer.close()
+
+    # A torn tail is dropped on parse and re-rendered on resume
+    path = session_dir / TRANSCRIPT_FILENAME
+    text = path.read_bytes()
+    for cut in (len(text) - 3, len(text) * 2 // 3):
+        path.write_bytes(text[:cut])
+        assert parse_transcript(path)[1] <= cut
+        with TranscriptWriter(session_dir) as resumed:
+            resumed.open(state)
+        assert recover_state(session_dir).model_dump() == expected
+    return turns
+
+
+def check_equivalence() -> int:
+    """
+    Assert transcripts recover the exact state they were rendered from.
+
+    Returns:
+        Number of recoveries checked
+    """
+    checked = 0
+    root = Path(tempfile.mkdtemp(prefix="bench_transcript_"))
+    try:
+        for factory in (create_interview_state, create_runtime_state):
+            checked += _check_session(factory, root / factory.__name__)
+
+        # Synthetic sessions: categories, importance levels, follow-up reasons
+        state = _new_state(questions=6)
+        writer = TranscriptWriter(root / "synthetic")
+        writer.open(state)
+        for _ in iter_interview_turns(state, on_turn=writer.sync):
+            recovered = recover_state(writer.session_dir)
+            assert recovered.model_dump() == state.model_dump()
+            checked += 1
+        writer.sync(state)
+        writer.close()
+        assert recover_state(writer.session_dir).model_dump() == state.model_dump()
+    finally:
+        shutil.rmtree(root)
+    return checked + 1
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+
+def _new_state(questions: int = QUESTIONS) -> InterviewState:
+    rng = random.Random(0)
+    return create_interview_state(
+        title="Transcript Benchmark",
+        context=synthetic_text(rng, 40),
+        questions=synthetic_questions(rng, questions),
+    )
+
+
+def render_cost(rewrite_every: int = 10) -> Dict[str, float]:
+    """
+    Rendering cost over a 50-question, 500-exchange interview.
+
+    Incremental: one sync() per turn. Rewrite: the full transcript rendered
+    into a fresh file, sampled every `rewrite_every` turns and scaled up.
+    """
+    root = Path(tempfile.mkdtemp(prefix="bench_transcript_"))
+    try:
+        state = _new_state()
+        writer = TranscriptWriter(root / "incremental")
+        writer.open(state)
+        sync_seconds = 0.0
+        rewrite_seconds = 0.0
+        turns = 0
+        for _ in iter_interview_turns(
+            state, exchanges_per_question=EXCHANGES_PER_QUESTION
+        ):
+            start = time.perf_counter()
+            writer.sync(state)
+            sync_seconds += time.perf_counter() - start
+            turns += 1
+            if turns % rewrite_every == 0:
+                rewrite_dir = root / f"rewrite{turns}"
+                start = time.perf_counter()
+                with TranscriptWriter(rewrite_dir) as full:
+                    full.open(state)
+                rewrite_seconds += time.perf_counter() - start
+                shutil.rmtree(rewrite_dir)
+        writer.sync(state)
+        writer.close()
+        size = writer.path.stat().st_size
+    finally:
+        shutil.rmtree(root)
+    return {
+        "turns": turns,
+        "transcript_kb": size / 1024,
+        "sync_us_per_turn": sync_seconds / turns * 1e6,
+        "rewrite_us_per_turn": rewrite_seconds / (turns // rewrite_every) * 1e6,
+    }
+
+
+def recovery_cost(repeat: int = 20) -> Dict[str, float]:
+    """Milliseconds to recover the 500-exchange session (best of `repeat`)."""
+    root = Path(tempfile.mkdtemp(prefix="bench_transcript_"))
+    try:
+        state = _new_state()
+        writer = TranscriptWriter(root)
+        writer.open(state)
+        for _ in iter_interview_turns(
+            state,
+            exchanges_per_question=EXCHANGES_PER_QUESTION,
+            on_turn=writer.sync,
+        ):
+            pass
+        writer.sync(state)
+        writer.close()
+        state_json = state.model_dump_json()
+        assert recover_state(root).model_dump() == state.model_dump()
+
+        def best(fn: Callable[[], Any]) -> float:
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn()
+                timings.append(time.perf_counter() - start)
+            return min(timings) * 1e3
+
+        return {
+            "exchanges": sum(len(q.exchanges) for q in state.questions),
+            "parse_ms": best(lambda: parse_transcript(writer.path)),
+            "recover_ms": best(lambda: recover_state(root)),
+            "state_json_ms": best(
+                lambda: InterviewState.model_validate_json(state_json)
+            ),
+        }
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    print(f"Equivalence: {check_equivalence()} recoveries identical")
+    print()
+
+    render = render_cost()
+    print(
+        f"Rendering ({render['turns']} turns, {render['transcript_kb']:.0f} KB "
+        f"transcript):"
+    )
+    print(f"  incremental sync():      {render['sync_us_per_turn']:8.0f} us / turn")
+    print(f"  full re-render:          {render['rewrite_us_per_turn']:8.0f} us / turn")
+    print()
+
+    recovery = recovery_cost()
+    print(f"Recovery ({QUESTIONS} questions, {recovery['exchanges']} exchanges):")
+    print(f"  parse_transcript():      {recovery['parse_ms']:8.1f} ms")
+    print(f"  recover_state():         {recovery['recover_ms']:8.1f} ms")
+    print(f"  state.json (reference):  {recovery['state_json_ms']:8.1f} ms")
@@ -0,0 +1,588 @@
+"""
+Benchmark Suite with Regression Gating
+
+Times the interview_agent hot paths on synthetic InterviewState objects at
+several scales and compares runs against stored JSON baselines:
+- Prompt formatting: format_interviewer_prompt, its section formatters and
+  the sub-prompt formatters (analyzer, follow-up, transition, minimal)
+- _escape_xml over every user response
+- create_interview_state, model_dump_json / model_validate_json round trips
+- InsightBank: add_insight, top_insights, get_high_importance, get_by_id
+- Cold-start imports of the package entry points (`cold_start` scale, timed
+  in fresh interpreters by bench_import_time)
+
+Everything runs offline and deterministically (seeded synthetic data).
+Each case reports the best and median time per call over several samples;
+comparisons use the best time, which is the least noisy.
+
+Usage:
+    python -m agents.interview_agent.benchmarks.suite run [--save out.json]
+    python -m agents.interview_agent.benchmarks.suite save-baseline
+    python -m agents.interview_agent.benchmarks.suite compare base.json new.json
+    python -m agents.interview_agent.benchmarks.suite check [--threshold 0.25]
+
+`check` runs the suite and compares it to the baseline (default: one file per
+machine under benchmarks/baselines/); it exits 1 when any case is slower
+than the baseline by more than the threshold, or when a baseline case that
+the run's --scale / --match selection covers is missing (a renamed or
+deleted case must be re-baselined, not silently dropped from gating).
+Baselines are per machine and not committed, so on a machine without one
+`check` skips (exit 0) with a message instead of failing.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from agents.interview_agent.benchmarks import bench_import_time
+from agents.interview_agent.benchmarks.synthetic import (
+    build_synthetic_state,
+    synthetic_questions,
+    synthetic_text,
+)
+from agents.interview_agent.state_schema import (
+    InsightBank,
+    InterviewState,
+    create_interview_state,
+)
+from agents.interview_agent.user_prompt_formatter import (
+    _escape_xml,
+    format_conversation_history,
+    format_current_question,
+    format_followup_generator_prompt,
+    format_insight_summary,
+    format_interview_context,
+    format_interviewer_prompt,
+    format_minimal_context,
+    format_progress,
+    format_question_exchanges,
+    format_response_analyzer_prompt,
+    format_task_instruction,
+    format_transition_generator_prompt,
+)
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+# Allowed slowdown (fraction of baseline) before a case counts as a regression
+DEFAULT_THRESHOLD = 0.25
+
+# Changes smaller than this are timer noise for sub-microsecond cases
+MIN_DELTA_US = 0.5
+
+# Each timing sample runs at least this long (loops are auto-scaled)
+MIN_SAMPLE_SECONDS = 0.02
+
+RESULTS_VERSION = 1
+
+
+class Scale(BaseModel):
+    """Size of the synthetic interview a case runs against."""
+
+    questions: int
+    exchanges_per_question: int
+    insights_per_exchange: int
+    history_entries: int = 0  # extra conversation history beyond the exchanges
+
+
+SCALES: Dict[str, Scale] = {
+    "small": Scale(questions=5, exchanges_per_question=2, insights_per_exchange=1),
+    "medium": Scale(questions=10, exchanges_per_question=3, insights_per_exchange=2),
+    "large": Scale(
+        questions=25,
+        exchanges_per_question=5,
+        insights_per_exchange=3,
+        history_entries=200,
+    ),
+    "long_history": Scale(
+        questions=10,
+        exchanges_per_question=3,
+        insights_per_exchange=2,
+        history_entries=2000,
+    ),
+}
+
+# Pseudo-scale for import:<target> cases, timed in fresh interpreters
+COLD_START = "cold_start"
+
+
+def build_scale_state(scale: Scale, seed: int = 0) -> InterviewState:
+    """Synthetic interview stopped mid-way (a question is active) at `scale`."""
+    state = build_synthetic_state(
+        questions=scale.questions,
+        exchanges_per_question=scale.exchanges_per_question,
+        insights_per_exchange=scale.insights_per_exchange,
+        seed=seed,
+        complete=False,
+    )
+    rng = random.Random(seed + 1)
+    for n in range(scale.history_entries):
+        state.record_exchange(
+            "user" if n % 2 else "assistant", synthetic_text(rng, 30)
+        )
+    return state
+
+
+# =============================================================================
+# CASES
+# =============================================================================
+
+# A case takes the scale's state and returns the zero-argument callable to time
+Case = Callable[[InterviewState], Callable[[], Any]]
+
+
+def _interviewer_prompt(state: InterviewState) -> Callable[[], Any]:
+    message = state.conversation_history[-1]["content"]
+    return lambda: format_interviewer_prompt(state, message)
+
+
+def _analyzer_prompt(state: InterviewState) -> Callable[[], Any]:
+    question = state.get_current_question()
+    exchange = question.exchanges[-1]
+    response = exchange.user_response or ""
+    return lambda: format_response_analyzer_prompt(
+        research_objective=question.research_objective,
+        question_asked=exchange.question_text,
+        user_response=response,
+        exchange_history=question.exchanges,
+        follow_up_count=question.follow_up_count,
+        max_follow_ups=question.max_follow_ups,
+    )
+
+
+def _followup_prompt(state: InterviewState) -> Callable[[], Any]:
+    question = state.get_current_question()
+    previous = [e.question_text for e in question.exchanges if e.is_follow_up]
+    response = question.exchanges[-1].user_response or ""
+    return lambda: format_followup_generator_prompt(
+        research_objective=question.research_objective,
+        user_response=response,
+        follow_up_reason="probe_deeper",
+        objective_gaps=["frequency", "workarounds"],
+        previous_follow_ups=previous,
+    )
+
+
+def _transition_prompt(state: InterviewState) -> Callable[[], Any]:
+    question = state.get_current_question()
+    response = question.exchanges[-1].user_response or ""
+    next_question = state.questions[-1].base_question_text
+    insight = state.insight_bank.insights[-1].content
+    return lambda: format_transition_generator_prompt(
+        response, "objective_satisfied", next_question, insight
+    )
+
+
+def _minimal_context(state: InterviewState) -> Callable[[], Any]:
+    question = state.get_current_question()
+    response = question.exchanges[-1].user_response
+    return lambda: format_minimal_context(
+        question.base_question_text, question.research_objective, response
+    )
+
+
+def _escape_responses(state: InterviewState) -> Callable[[], Any]:
+    texts = [
+        exchange.user_response
+        for question in state.questions
+        for exchange in question.exchanges
+        if exchange.user_response
+    ]
+    return lambda: [_escape_xml(text) for text in texts]
+
+
+def _create_state(state: InterviewState) -> Callable[[], Any]:
+    questions = synthetic_questions(random.Random(0), len(state.questions))
+    return lambda: create_interview_state(
+        title=state.title, context=state.context, questions=questions
+    )
+
+
+def _dump_json(state: InterviewState) -> Callable[[], Any]:
+    return state.model_dump_json
+
+
+def _validate_json(state: InterviewState) -> Callable[[], Any]:
+    data = state.model_dump_json()
+    return lambda: InterviewState.model_validate_json(data)
+
+
+def _round_trip(state: InterviewState) -> Callable[[], Any]:
+    return lambda: InterviewState.model_validate_json(state.model_dump_json())
+
+
+def _add_insights(state: InterviewState) -> Callable[[], Any]:
+    source = state.insight_bank.insights
+
+    def add_all() -> InsightBank:
+        bank = InsightBank()
+        for insight in source:
+            bank.add_insight(
+                insight.content,
+                insight.source_question_id,
+                insight.source_exchange_id,
+                insight.category,
+                insight.importance,
+            )
+        return bank
+
+    return add_all
+
+
+def _insight_queries(state: InterviewState) -> Callable[[], Any]:
+    bank = state.insight_bank
+    ids = [insight.id for insight in bank.insights]
+
+    def query() -> int:
+        found = len(bank.top_insights(10)) + len(bank.get_high_importance())
+        for insight_id in ids:
+            found += bank.get_by_id(insight_id) is not None
+        return found
+
+    return query
+
+
+CASES: Dict[str, Case] = {
+    "format_interviewer_prompt": _interviewer_prompt,
+    "format_interview_context": lambda s: lambda: format_interview_context(s),
+    "format_current_question": lambda s: lambda: format_current_question(s),
+    "format_question_exchanges": lambda s: lambda: format_question_exchanges(s),
+    "format_insight_summary": lambda s: lambda: format_insight_summary(
+        s.insight_bank
+    ),
+    "format_conversation_history": lambda s: lambda: format_conversation_history(
+        s.conversation_history
+    ),
+    "format_progress": lambda s: lambda: format_progress(s),
+    "format_task_instruction": lambda s: lambda: format_task_instruction(s, "ok"),
+    "format_response_analyzer_prompt": _analyzer_prompt,
+    "format_followup_generator_prompt": _followup_prompt,
+    "format_transition_generator_prompt": _transition_prompt,
+    "format_minimal_context": _minimal_context,
+    "escape_xml_responses": _escape_responses,
+    "create_interview_state": _create_state,
+    "model_dump_json": _dump_json,
+    "model_validate_json": _validate_json,
+    "json_round_trip": _round_trip,
+    "insight_bank_add": _add_insights,
+    "insight_bank_queries": _insight_queries,
+}
+
+
+# =============================================================================
+# RUNNING
+# =============================================================================
+
+
+def time_case(fn: Callable[[], Any], samples: int = 5) -> Dict[str, float]:
+    """
+    Time `fn` like timeit: auto-scale loops per sample, then take `samples`
+    with the garbage collector paused.
+
+    Returns:
+        Dict with best / median microseconds per call and loops per sample
+    """
+    fn()  # warm caches
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _time_samples(fn, samples)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _time_samples(fn: Callable[[], Any], samples: int) -> Dict[str, float]:
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SAMPLE_SECONDS:
+            break
+        loops *= 2 if elapsed * 10 > MIN_SAMPLE_SECONDS else 10
+
+    per_call = [elapsed / loops]
+    for _ in range(samples - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        per_call.append((time.perf_counter() - start) / loops)
+    return {
+        "best_us": min(per_call) * 1e6,
+        "median_us": statistics.median(per_call) * 1e6,
+        "loops": loops,
+    }
+
+
+def run_suite(
+    scales: Optional[List[str]] = None,
+    match: Optional[str] = None,
+    samples: int = 5,
+) -> Dict[str, Any]:
+    """
+    Run every case at every scale.
+
+    Args:
+        scales: Scale names to run (default: all of SCALES plus COLD_START)
+        match: Only run cases whose name contains this substring
+        samples: Timing samples per case
+
+    Returns:
+        Results document: {"version", "meta", "results": {"case@scale": {...}}}
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    for scale_name in scales or [*SCALES, COLD_START]:
+        if scale_name == COLD_START:
+            results.update(bench_import_time.run(match=match))
+            continue
+        state = build_scale_state(SCALES[scale_name])
+        for case_name, case in CASES.items():
+            if match and match not in case_name:
+                continue
+            results[f"{case_name}@{scale_name}"] = time_case(case(state), samples)
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.node(),
+            "samples": samples,
+        },
+        "results": results,
+    }
+
+
+def confirm_regressions(
+    results: Dict[str, Any],
+    report: Dict[str, List[Dict[str, Any]]],
+    samples: int = 5,
+) -> None:
+    """
+    Re-time regressed cases once and keep the better timing in `results`.
+
+    A single noisy sample should not fail the gate; a real slowdown shows up
+    again on the second run.
+    """
+    states: Dict[str, InterviewState] = {}
+    for row in report["regressions"]:
+        case_name, scale_name = row["case"].rsplit("@", 1)
+        if scale_name == COLD_START:
+            retry = bench_import_time.run(match=row["case"])[row["case"]]
+        else:
+            if scale_name not in states:
+                states[scale_name] = build_scale_state(SCALES[scale_name])
+            retry = time_case(CASES[case_name](states[scale_name]), samples)
+        timing = results["results"][row["case"]]
+        if retry["best_us"] < timing["best_us"]:
+            results["results"][row["case"]] = retry
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    scales: Optional[List[str]] = None,
+    match: Optional[str] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Compare two results documents case by case (best time per call).
+
+    A case regresses when it is more than `threshold` slower and at least
+    MIN_DELTA_US slower in absolute terms.
+
+    Args:
+        scales: Scales the current run covered (default: all)
+        match: --match filter of the current run; baseline cases outside
+            the run's selection are not reported as missing
+
+    Returns:
+        Dict with "regressions", "improvements", "unchanged" rows
+        (case, baseline_us, current_us, ratio) and "missing" / "new" case names
+    """
+    base = baseline["results"]
+    new = current["results"]
+    report: Dict[str, List[Any]] = {
+        "regressions": [],
+        "improvements": [],
+        "unchanged": [],
+        "missing": sorted(
+            case
+            for case in set(base) - set(new)
+            if _selected(case, scales, match)
+        ),
+        "new": sorted(set(new) - set(base)),
+    }
+    for case in sorted(set(base) & set(new)):
+        before = base[case]["best_us"]
+        after = new[case]["best_us"]
+        ratio = after / before if before else 1.0
+        row = {"case": case, "baseline_us": before, "current_us": after, "ratio": ratio}
+        if abs(after - before) < MIN_DELTA_US:
+            report["unchanged"].append(row)
+        elif ratio > 1 + threshold:
+            report["regressions"].append(row)
+        elif ratio < 1 / (1 + threshold):
+            report["improvements"].append(row)
+        else:
+            report["unchanged"].append(row)
+    return report
+
+
+def failed(report: Dict[str, List[Any]]) -> bool:
+    """Whether a comparison should fail the check (regressed or missing cases)."""
+    return bool(report["regressions"] or report["missing"])
+
+
+def _selected(case: str, scales: Optional[List[str]], match: Optional[str]) -> bool:
+    """Whether run_suite(scales, match) would have run `case` ("name@scale")."""
+    name, _, scale = case.rpartition("@")
+    if scales and scale not in scales:
+        return False
+    # Cold-start rows are matched on their full name (bench_import_time.run)
+    return not match or match in (case if scale == COLD_START else name)
+
+
+def default_baseline_path() -> Path:
+    """Baselines are machine specific: one file per host name."""
+    return BASELINE_DIR / f"{platform.node() or 'default'}.json"
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != RESULTS_VERSION:
+        raise ValueError(f"Unsupported benchmark results version in {path}")
+    return data
+
+
+def save_results(results: Dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True), encoding="utf-8")
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    print(f"{'case':<50} {'best us':>10} {'median us':>10}")
+    for case, timing in results["results"].items():
+        print(f"{case:<50} {timing['best_us']:>10.1f} {timing['median_us']:>10.1f}")
+
+
+def print_report(report: Dict[str, List[Any]], threshold: float) -> None:
+    print(f"{'case':<50} {'baseline us':>12} {'current us':>11} {'change':>8}")
+    for kind in ("regressions", "improvements", "unchanged"):
+        for row in report[kind]:
+            marker = {"regressions": " !", "improvements": " +"}.get(kind, "")
+            print(
+                f"{row['case']:<50} {row['baseline_us']:>12.1f} "
+                f"{row['current_us']:>11.1f} {row['ratio'] - 1:>+8.0%}{marker}"
+            )
+    if report["new"]:
+        names = report["new"]
+        shown = ", ".join(names[:5]) + (", ..." if len(names) > 5 else "")
+        print(f"New cases ({len(names)}): {shown}")
+    for name in report["missing"]:
+        print(f"MISSING: {name} is in the baseline but did not run")
+    if report["missing"]:
+        print(
+            f"{len(report['missing'])} baseline cases missing; if they were "
+            "renamed or removed on purpose, run save-baseline again"
+        )
+    print()
+    print(
+        f"{len(report['regressions'])} regressions, "
+        f"{len(report['missing'])} missing, "
+        f"{len(report['improvements'])} improvements "
+        f"(threshold {threshold:.0%})"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m agents.interview_agent.benchmarks.suite",
+        description="Offline benchmark suite for interview_agent hot paths.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_run_options(command: argparse.ArgumentParser) -> None:
+        command.add_argument(
+            "--scale", action="append", choices=[*SCALES, COLD_START], help="repeatable"
+        )
+        command.add_argument("--match", help="only cases containing this text")
+        command.add_argument("--samples", type=int, default=5)
+
+    run_cmd = commands.add_parser("run", help="run the suite")
+    add_run_options(run_cmd)
+    run_cmd.add_argument("--save", type=Path, help="write results JSON here")
+
+    save_cmd = commands.add_parser("save-baseline", help="run and store a baseline")
+    add_run_options(save_cmd)
+    save_cmd.add_argument("--baseline", type=Path, default=None)
+
+    compare_cmd = commands.add_parser("compare", help="compare two results files")
+    compare_cmd.add_argument("baseline", type=Path)
+    compare_cmd.add_argument("current", type=Path)
+    compare_cmd.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    check_cmd = commands.add_parser("check", help="run and compare to the baseline")
+    add_run_options(check_cmd)
+    check_cmd.add_argument("--baseline", type=Path, default=None)
+    check_cmd.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        baseline = load_results(args.baseline)
+        report = compare(baseline, load_results(args.current), args.threshold)
+        print_report(report, args.threshold)
+        return 1 if failed(report) else 0
+
+    baseline_path = None
+    if args.command != "run":
+        baseline_path = args.baseline or default_baseline_path()
+    if args.command == "check" and not baseline_path.exists():
+        print(
+            f"Skipping check: no baseline at {baseline_path} "
+            "(run save-baseline on this machine to enable it)"
+        )
+        return 0
+
+    results = run_suite(args.scale, args.match, args.samples)
+
+    if args.command == "run":
+        print_results(results)
+        if args.save:
+            save_results(results, args.save)
+        return 0
+
+    if args.command == "save-baseline":
+        save_results(results, baseline_path)
+        print(f"Saved {len(results['results'])} cases to {baseline_path}")
+        return 0
+
+    baseline = load_results(baseline_path)
+    selection = (args.scale, args.match)
+    report = compare(baseline, results, args.threshold, *selection)
+    if report["regressions"]:
+        confirm_regressions(results, report, args.samples)
+        report = compare(baseline, results, args.threshold, *selection)
+    print_report(report, args.threshold)
+    return 1 if failed(report) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
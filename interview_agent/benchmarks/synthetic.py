@@ -0,0 +1,181 @@
+"""
+Synthetic Interview Generator
+
+Builds realistic InterviewState objects offline for benchmarks:
+- Deterministic (seeded) so runs are comparable
+- Drives the real state machine methods (add_exchange, record_response, ...)
+- Text includes occasional XML special characters like real transcripts
+"""
+
+import random
+from typing import Callable, Iterator, List, Optional
+
+from agents.interview_agent.state_schema import (
+    FollowUpReason,
+    InterviewState,
+    InterviewStatus,
+    QuestionStatus,
+    ResearchObjectiveStatus,
+    ResponseAnalysis,
+    create_interview_state,
+)
+
+# =============================================================================
+# TEXT GENERATION
+# =============================================================================
+
+_WORDS = (
+    "honestly the dashboard was overwhelming at first because there were so many "
+    "options and I didn't know where to start but after a week it clicked and now "
+    "I use the reports every morning with my team we export them to spreadsheets "
+    "which is slow sometimes the onboarding emails helped a little though I mostly "
+    "figured it out by myself support was friendly & quick when I asked"
+).split()
+
+_SPECIALS = ("<b>", "&", '"quoted"', "it's", "a > b", "x < y")
+
+_CATEGORIES = ("motivation", "pain_point", "preference", "behavior", None)
+_IMPORTANCE = ("low", "medium", "medium", "high", "critical")
+
+
+def synthetic_text(rng: random.Random, words: int, special_rate: float = 0.05) -> str:
+    """Generate a sentence of roughly `words` words with occasional XML specials."""
+    out = []
+    for _ in range(words):
+        if rng.random() < special_rate:
+            out.append(rng.choice(_SPECIALS))
+        else:
+            out.append(rng.choice(_WORDS))
+    return " ".join(out)
+
+
+def synthetic_questions(rng: random.Random, count: int) -> List[dict]:
+    """Generate a question set in the create_interview_state input format."""
+    return [
+        {
+            "id": f"q{n}",
+            "order": n,
+            "base_question_text": synthetic_text(rng, 18),
+            "research_objective": synthetic_text(rng, 12),
+        }
+        for n in range(1, count + 1)
+    ]
+
+
+# =============================================================================
+# INTERVIEW SIMULATION
+# =============================================================================
+
+
+def iter_interview_turns(
+    state: InterviewState,
+    exchanges_per_question: int = 3,
+    insights_per_exchange: int = 2,
+    response_words: int = 60,
+    seed: int = 0,
+    on_turn: Optional[Callable[[InterviewState], None]] = None,
+) -> Iterator[InterviewState]:
+    """
+    Drive `state` through a full interview, yielding after every answered turn.
+
+    Each turn asks a question (initial or follow-up), records the response and
+    analysis, adds insights to the bank and appends both sides to the
+    conversation history - the same mutations a live session performs.
+    """
+    rng = random.Random(seed)
+    state.status = InterviewStatus.IN_PROGRESS
+
+    while not state.is_complete():
+        question = state.get_current_question()
+        question.status = QuestionStatus.ACTIVE
+
+        for n in range(exchanges_per_question):
+            is_follow_up = n > 0
+            asked = question.base_question_text if n == 0 else synthetic_text(rng, 15)
+            exchange = question.add_exchange(
+                asked,
+                is_follow_up=is_follow_up,
+                follow_up_reason=FollowUpReason.PROBE_DEEPER if is_follow_up else None,
+            )
+            state.record_exchange("assistant", asked)
+
+            response = synthetic_text(rng, response_words)
+            last = n == exchanges_per_question - 1
+            analysis = ResponseAnalysis(
+                objective_progress=(
+                    ResearchObjectiveStatus.SATISFIED
+                    if last
+                    else ResearchObjectiveStatus.PARTIAL
+                ),
+                insights_extracted=[
+                    synthetic_text(rng, 10) for _ in range(insights_per_exchange)
+                ],
+                recommendation="transition" if last else "follow_up",
+                recommendation_reason=synthetic_text(rng, 12),
+            )
+            question.record_response(response, analysis)
+            state.record_exchange("user", response)
+
+            for content in analysis.insights_extracted:
+                state.insight_bank.add_insight(
+                    content=content,
+                    source_question_id=question.id,
+                    source_exchange_id=exchange.id,
+                    category=rng.choice(_CATEGORIES),
+                    importance=rng.choice(_IMPORTANCE),
+                )
+
+            if on_turn:
+                on_turn(state)
+            yield state
+
+        question.status = QuestionStatus.SATISFIED
+        state.advance_to_next_question()
+
+    state.status = InterviewStatus.COMPLETED
+
+
+def build_synthetic_state(
+    questions: int = 10,
+    exchanges_per_question: int = 3,
+    insights_per_exchange: int = 2,
+    response_words: int = 60,
+    seed: int = 0,
+    complete: bool = True,
+) -> InterviewState:
+    """
+    Build an InterviewState at a given scale.
+
+    Args:
+        questions: Number of questions in the interview
+        exchanges_per_question: Initial question + follow-ups per question
+        insights_per_exchange: Insights extracted from every response
+        response_words: Approximate length of each user response
+        seed: RNG seed for reproducible text
+        complete: If False, stop halfway so a current question is still active
+
+    Returns:
+        Populated InterviewState
+    """
+    rng = random.Random(seed)
+    state = create_interview_state(
+        title="Synthetic Research Interview",
+        context=synthetic_text(rng, 40),
+        questions=synthetic_questions(rng, questions),
+    )
+
+    stop_after = (questions * exchanges_per_question) // 2
+    for turn, _ in enumerate(
+        iter_interview_turns(
+            state,
+            exchanges_per_question=exchanges_per_question,
+            insights_per_exchange=insights_per_exchange,
+            response_words=response_words,
+            seed=seed,
+        ),
+        start=1,
+    ):
+        if not complete and turn >= stop_after:
+            break
+
+    return state
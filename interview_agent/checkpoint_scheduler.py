@@ -0,0 +1,449 @@
+"""
+Checkpoint Scheduler: Run plan.json Checkpoints as a Prerequisite DAG
+
+Build mode walks checkpoints one at a time. The scheduler starts every
+checkpoint whose prerequisites are completed:
+- load_plan() reads plan.json into a PlanGraph; duplicate ids, unknown
+  prerequisites and cycles raise PlanError / PlanCycleError
+- CheckpointScheduler runs ready checkpoints concurrently through a pluggable
+  async CheckpointExecutor (FakeCheckpointExecutor for tests), optionally
+  capped at max_parallel
+- Status changes are written back to plan.json atomically (temp file +
+  rename); every other field is kept, re-serialized with 2-space indent
+- ScheduleReport gives makespan, summed work, the critical path and the
+  achieved parallelism
+
+Already-completed checkpoints are skipped, so a rerun resumes a plan. A
+failed checkpoint blocks its dependents; independent branches keep running.
+"""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Tuple
+
+from pydantic import BaseModel
+
+from agents.interview_agent.state_journal import atomic_write_text
+from agents.interview_agent.tracing import span
+
+
+class PlanError(ValueError):
+    """Raised when plan.json does not describe a valid checkpoint DAG."""
+
+
+class PlanCycleError(PlanError):
+    """Raised when checkpoint prerequisites form a cycle."""
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__(f"prerequisite cycle: {' -> '.join(cycle)}")
+
+
+class CheckpointStatus(str, Enum):
+    """plan.json checkpoint status values the scheduler writes."""
+
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+# Statuses treated as done when a plan is loaded
+DONE_STATUSES = frozenset({"completed", "complete"})
+
+
+# =============================================================================
+# PLAN GRAPH
+# =============================================================================
+
+
+@dataclass(slots=True)
+class Checkpoint:
+    """One plan.json checkpoint; ids are normalized to strings."""
+
+    id: str
+    title: str
+    prerequisites: Tuple[str, ...]
+    status: str
+    index: int  # position in plan.json "checkpoints"
+    data: Dict[str, Any]  # the raw checkpoint object (goal, tranches, ...)
+
+    @property
+    def done(self) -> bool:
+        return self.status in DONE_STATUSES
+
+
+@dataclass(slots=True)
+class PlanGraph:
+    """Checkpoints of one plan in plan order, with their dependents."""
+
+    checkpoints: Dict[str, Checkpoint]
+    dependents: Dict[str, List[str]]
+    order: List[str]  # a topological order (plan order among ready ones)
+    document: Dict[str, Any] = field(default_factory=dict)
+    path: Optional[Path] = None
+
+    def critical_path(
+        self, durations: Optional[Dict[str, float]] = None
+    ) -> Tuple[float, List[str]]:
+        """
+        Longest prerequisite chain.
+
+        Args:
+            durations: Seconds per checkpoint id (default: 1 each, giving
+                the chain length in checkpoints; missing ids count 0)
+
+        Returns:
+            (length, checkpoint ids along the path)
+        """
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for checkpoint_id in self.order:
+            before = max(
+                self.checkpoints[checkpoint_id].prerequisites,
+                key=lambda p: finish[p],
+                default=None,
+            )
+            cost = 1.0 if durations is None else durations.get(checkpoint_id, 0.0)
+            finish[checkpoint_id] = cost + (finish[before] if before else 0.0)
+            previous[checkpoint_id] = before
+        if not finish:
+            return 0.0, []
+        end: Optional[str] = max(self.order, key=lambda c: finish[c])
+        length = finish[end]
+        path = []
+        while end is not None:
+            path.append(end)
+            end = previous[end]
+        return length, path[::-1]
+
+
+def build_graph(
+    checkpoints: Iterable[Dict[str, Any]],
+    document: Optional[Dict[str, Any]] = None,
+    path: Optional[Path] = None,
+) -> PlanGraph:
+    """
+    Build the prerequisite DAG of plan.json checkpoint objects.
+
+    Raises:
+        PlanError: On a malformed checkpoint, duplicate id or unknown prerequisite
+        PlanCycleError: If prerequisites form a cycle
+    """
+    nodes: Dict[str, Checkpoint] = {}
+    for index, raw in enumerate(checkpoints):
+        if not isinstance(raw, dict) or "id" not in raw:
+            raise PlanError(f"checkpoint #{index} has no id")
+        checkpoint_id = str(raw["id"])
+        if checkpoint_id in nodes:
+            raise PlanError(f"duplicate checkpoint id {checkpoint_id}")
+        prerequisites = raw.get("prerequisites") or []
+        if not isinstance(prerequisites, list):
+            raise PlanError(f"checkpoint {checkpoint_id}: prerequisites must be a list")
+        nodes[checkpoint_id] = Checkpoint(
+            id=checkpoint_id,
+            title=str(raw.get("title", "")),
+            prerequisites=tuple(dict.fromkeys(str(p) for p in prerequisites)),
+            status=str(raw.get("status") or CheckpointStatus.PENDING.value),
+            index=index,
+            data=raw,
+        )
+
+    dependents: Dict[str, List[str]] = {checkpoint_id: [] for checkpoint_id in nodes}
+    for checkpoint in nodes.values():
+        for prerequisite in checkpoint.prerequisites:
+            if prerequisite not in nodes:
+                raise PlanError(
+                    f"checkpoint {checkpoint.id}: unknown prerequisite {prerequisite}"
+                )
+            dependents[prerequisite].append(checkpoint.id)
+
+    # Kahn's algorithm, taking ready checkpoints in plan order
+    waiting = {c.id: len(c.prerequisites) for c in nodes.values()}
+    ready = [checkpoint_id for checkpoint_id, n in waiting.items() if n == 0]
+    order: List[str] = []
+    while ready:
+        checkpoint_id = ready.pop(0)
+        order.append(checkpoint_id)
+        for dependent in dependents[checkpoint_id]:
+            waiting[dependent] -= 1
+            if waiting[dependent] == 0:
+                ready.append(dependent)
+        ready.sort(key=lambda c: nodes[c].index)
+    if len(order) < len(nodes):
+        raise PlanCycleError(_find_cycle(nodes, set(order)))
+
+    return PlanGraph(nodes, dependents, order, document or {}, path)
+
+
+def _find_cycle(nodes: Dict[str, Checkpoint], acyclic: set) -> List[str]:
+    """A cycle among the checkpoints Kahn's algorithm could not order."""
+    # Every unordered checkpoint has an unordered prerequisite, so walking
+    # prerequisites from any of them must revisit one
+    current = next(c for c in nodes if c not in acyclic)
+    seen: Dict[str, int] = {}
+    walk: List[str] = []
+    while current not in seen:
+        seen[current] = len(walk)
+        walk.append(current)
+        current = next(p for p in nodes[current].prerequisites if p not in acyclic)
+    cycle = walk[seen[current]:]
+    return [*cycle[::-1], cycle[-1]]  # prerequisite -> dependent order
+
+
+def load_plan(path: Path) -> PlanGraph:
+    """
+    Read plan.json into a PlanGraph.
+
+    Raises:
+        PlanError: If the file is not a valid plan (see build_graph)
+        OSError: If the file cannot be read
+    """
+    path = Path(path)
+    try:
+        document = json.loads(path.read_text(encoding="utf-8"))
+    except ValueError as exc:
+        raise PlanError(f"{path}: {exc}") from exc
+    if not isinstance(document, dict) or not isinstance(
+        document.get("checkpoints"), list
+    ):
+        raise PlanError(f"{path}: expected an object with a checkpoints list")
+    return build_graph(document["checkpoints"], document, path)
+
+
+# =============================================================================
+# EXECUTORS
+# =============================================================================
+
+
+class CheckpointExecutor(Protocol):
+    """Runs one checkpoint's work; raising marks the checkpoint failed."""
+
+    async def run(self, checkpoint: Checkpoint) -> None:
+        ...
+
+
+class FakeCheckpointExecutor:
+    """
+    Deterministic offline executor.
+
+    Sleeps a configured time per checkpoint and fails the listed ids;
+    records start/finish order and peak concurrency for assertions.
+    """
+
+    def __init__(
+        self,
+        durations: Optional[Dict[str, float]] = None,
+        default_duration: float = 0.0,
+        fail: Iterable[str] = (),
+    ):
+        """
+        Args:
+            durations: Seconds per checkpoint id
+            default_duration: Seconds for ids not in `durations`
+            fail: Checkpoint ids whose run raises RuntimeError
+        """
+        self.durations = durations or {}
+        self.default_duration = default_duration
+        self.fail = set(fail)
+        self.started: List[str] = []
+        self.finished: List[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def run(self, checkpoint: Checkpoint) -> None:
+        self.started.append(checkpoint.id)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(
+                self.durations.get(checkpoint.id, self.default_duration)
+            )
+            if checkpoint.id in self.fail:
+                raise RuntimeError(f"checkpoint {checkpoint.id} failed")
+        finally:
+            self.active -= 1
+            self.finished.append(checkpoint.id)
+
+
+# =============================================================================
+# SCHEDULER
+# =============================================================================
+
+
+class ScheduleReport(BaseModel):
+    """Outcome of one CheckpointScheduler.run()."""
+
+    completed: List[str] = []  # in completion order
+    failed: Dict[str, str] = {}  # checkpoint id -> error
+    blocked: List[str] = []  # not started: a prerequisite failed
+    skipped: List[str] = []  # already completed in plan.json
+    durations: Dict[str, float] = {}  # seconds per executed checkpoint
+    makespan_seconds: float = 0.0
+    work_seconds: float = 0.0  # summed checkpoint durations
+    critical_path: List[str] = []
+    critical_path_seconds: float = 0.0
+    parallelism: float = 0.0  # work_seconds / makespan_seconds
+    max_concurrency: int = 0
+    plan_writes: int = 0
+
+
+class CheckpointScheduler:
+    """
+    Runs a plan's checkpoints as soon as their prerequisites complete.
+
+        plan = load_plan(session_dir / "plan.json")
+        report = await CheckpointScheduler(plan, executor).run()
+
+    Status updates are written back to plan.path (if set) once per
+    scheduling step, so a batch of checkpoints that start or finish together
+    costs one write.
+    """
+
+    def __init__(
+        self,
+        plan: PlanGraph,
+        executor: CheckpointExecutor,
+        max_parallel: Optional[int] = None,
+        fsync: bool = True,
+    ):
+        """
+        Args:
+            plan: Loaded plan (load_plan / build_graph)
+            executor: Runs each checkpoint
+            max_parallel: Max concurrently running checkpoints (None: no cap;
+                1 reproduces sequential build mode)
+            fsync: fsync plan.json writes
+        """
+        if max_parallel is not None and max_parallel < 1:
+            raise ValueError("max_parallel must be at least 1")
+        self.plan = plan
+        self.executor = executor
+        self.max_parallel = max_parallel
+        self.fsync = fsync
+
+    async def run(self) -> ScheduleReport:
+        """
+        Run every checkpoint not yet completed.
+
+        If run() is cancelled, running checkpoints are cancelled and written
+        back as pending.
+        """
+        plan = self.plan
+        report = ScheduleReport()
+        report.skipped = [c for c in plan.order if plan.checkpoints[c].done]
+        waiting = {
+            checkpoint.id: sum(
+                not plan.checkpoints[p].done for p in checkpoint.prerequisites
+            )
+            for checkpoint in plan.checkpoints.values()
+            if not checkpoint.done
+        }
+        ready = [c for c in plan.order if waiting.get(c) == 0]
+        running: Dict[asyncio.Task, Checkpoint] = {}
+        start = time.perf_counter()
+
+        try:
+            while True:
+                started = False
+                while ready and (
+                    self.max_parallel is None or len(running) < self.max_parallel
+                ):
+                    checkpoint = plan.checkpoints[ready.pop(0)]
+                    self._set_status(checkpoint, CheckpointStatus.IN_PROGRESS)
+                    task = asyncio.ensure_future(self._execute(checkpoint, report))
+                    running[task] = checkpoint
+                    started = True
+                report.max_concurrency = max(report.max_concurrency, len(running))
+                if started:
+                    self._write(report)
+                if not running:
+                    break
+
+                finished, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                newly_ready = []
+                # Checkpoints finishing together are handled in plan order
+                for task in sorted(finished, key=lambda t: running[t].index):
+                    checkpoint = running.pop(task)
+                    error = task.exception()
+                    if error is not None:
+                        self._set_status(checkpoint, CheckpointStatus.FAILED)
+                        report.failed[checkpoint.id] = (
+                            f"{type(error).__name__}: {error}"
+                        )
+                        continue
+                    self._set_status(checkpoint, CheckpointStatus.COMPLETED)
+                    report.completed.append(checkpoint.id)
+                    for dependent in plan.dependents[checkpoint.id]:
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0:
+                            newly_ready.append(dependent)
+                ready = sorted(
+                    [*ready, *newly_ready], key=lambda c: plan.checkpoints[c].index
+                )
+                self._write(report)
+        finally:
+            if running:  # cancelled or the executor raised BaseException
+                for task in running:
+                    task.cancel()
+                await asyncio.gather(*running, return_exceptions=True)
+                for checkpoint in running.values():
+                    self._set_status(checkpoint, CheckpointStatus.PENDING)
+                self._write(report)
+
+        report.makespan_seconds = time.perf_counter() - start
+        report.blocked = [
+            c
+            for c in plan.order
+            if c in waiting
+            and c not in report.failed
+            and plan.checkpoints[c].status == CheckpointStatus.PENDING.value
+        ]
+        report.work_seconds = sum(report.durations.values())
+        report.critical_path_seconds, report.critical_path = plan.critical_path(
+            report.durations
+        )
+        if report.makespan_seconds > 0:
+            report.parallelism = report.work_seconds / report.makespan_seconds
+        return report
+
+    async def _execute(self, checkpoint: Checkpoint, report: ScheduleReport) -> None:
+        start = time.perf_counter()
+        try:
+            with span("checkpoint.run", checkpoint=checkpoint.id):
+                await self.executor.run(checkpoint)
+        finally:
+            report.durations[checkpoint.id] = time.perf_counter() - start
+
+    def _set_status(self, checkpoint: Checkpoint, status: CheckpointStatus) -> None:
+        checkpoint.status = status.value
+        checkpoint.data["status"] = status.value
+
+    def _write(self, report: ScheduleReport) -> None:
+        """Write plan.json with the current statuses (no-op without a path)."""
+        if self.plan.path is None:
+            return
+        document = self.plan.document
+        if "updated_at" in document:
+            document["updated_at"] = datetime.now(timezone.utc).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            )
+        text = json.dumps(document, indent=2, ensure_ascii=False) + "\n"
+        atomic_write_text(self.plan.path, text, self.fsync)
+        report.plan_writes += 1
+
+
+async def run_plan(
+    path: Path,
+    executor: CheckpointExecutor,
+    max_parallel: Optional[int] = None,
+) -> ScheduleReport:
+    """load_plan(path) and run it with a CheckpointScheduler."""
+    return await CheckpointScheduler(load_plan(path), executor, max_parallel).run()
@@ -0,0 +1,340 @@
+"""
+Bounded Conversation History for Interview Agent
+
+Drop-in container for InterviewState.conversation_history:
+- Fixed-size in-memory window of compact slotted entries
+- Role strings interned, timestamps stored as integer microseconds
+- Older entries spill to an append-only segment file, paged back on demand;
+  the file is opened per batch write or read, so no descriptor stays open
+- Reads and serializes as the plain List[Dict[str, str]] state.json shape
+"""
+
+import json
+import os
+import sys
+import tempfile
+import weakref
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from agents.interview_agent.state_schema import InterviewState
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# One segment offset is kept in memory per this many spilled entries
+_INDEX_STRIDE = 64
+
+
+# =============================================================================
+# HISTORY ENTRY
+# =============================================================================
+
+
+@dataclass(slots=True)
+class HistoryEntry:
+    """One conversation_history message in compact form."""
+
+    role: str
+    content: str
+    timestamp_us: Optional[int] = None
+    # Original timestamp string when it cannot round-trip through timestamp_us
+    timestamp_raw: Optional[str] = None
+    # Any keys beyond role/content/timestamp, kept for lossless round-trips
+    extra: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, entry: Dict[str, Any]) -> "HistoryEntry":
+        """Compact a state.json history dict."""
+        timestamp_us, timestamp_raw = _encode_timestamp(entry.get("timestamp"))
+        extra = {
+            key: value
+            for key, value in entry.items()
+            if key not in ("role", "content", "timestamp")
+        }
+        return cls(
+            role=sys.intern(entry.get("role", "user")),
+            content=entry.get("content", ""),
+            timestamp_us=timestamp_us,
+            timestamp_raw=timestamp_raw,
+            extra=extra or None,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Expand back into the state.json history dict."""
+        entry: Dict[str, Any] = {"role": self.role, "content": self.content}
+        if self.timestamp_raw is not None:
+            entry["timestamp"] = self.timestamp_raw
+        elif self.timestamp_us is not None:
+            entry["timestamp"] = (
+                _EPOCH + self.timestamp_us * _MICROSECOND
+            ).isoformat()
+        if self.extra:
+            entry.update(self.extra)
+        return entry
+
+
+# =============================================================================
+# CONVERSATION HISTORY
+# =============================================================================
+
+
+class ConversationHistory:
+    """
+    Ring buffer of recent history entries backed by an on-disk segment.
+
+    Supports the list operations the rest of the agent uses on
+    conversation_history: append(dict), len(), iteration, integer indexing
+    and slicing (both return dicts). Indexing an entry older than the window
+    reads it back from the segment file.
+
+    Spilled entries are written in batches of _INDEX_STRIDE (or before a
+    read). A deep copy (copy.deepcopy, model_copy(deep=True)) gets its own
+    anonymous segment; a shallow copy shares the container, as with a list.
+    """
+
+    def __init__(self, window: int = 50, spill_path: Optional[Path] = None):
+        """
+        Args:
+            window: Number of most recent entries kept in memory
+            spill_path: Segment file for older entries (anonymous temp file if None)
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self.spill_path = Path(spill_path) if spill_path else None
+
+        self._recent: deque = deque()
+        self._spilled = 0
+        # Byte offset of every _INDEX_STRIDE-th spilled entry (sparse index)
+        self._offsets = array("Q")
+        # Segment file (created on first flush), its size including pending
+        # bytes, and spilled lines not yet written
+        self._path: Optional[Path] = None
+        self._size = 0
+        self._pending: List[bytes] = []
+        self._flushed = False
+        self._remove_temp_segment = None
+
+    @classmethod
+    def from_list(
+        cls,
+        entries: List[Dict[str, Any]],
+        window: int = 50,
+        spill_path: Optional[Path] = None,
+    ) -> "ConversationHistory":
+        """Build a bounded history from a plain state.json list."""
+        history = cls(window=window, spill_path=spill_path)
+        for entry in entries:
+            history.append(entry)
+        return history
+
+    # ==========================================================================
+    # Mutation
+    # ==========================================================================
+
+    def append(self, entry: Union[Dict[str, Any], HistoryEntry]) -> None:
+        """Append an entry, spilling the oldest in-memory one if full."""
+        if not isinstance(entry, HistoryEntry):
+            entry = HistoryEntry.from_dict(entry)
+        if len(self._recent) >= self.window:
+            self._spill(self._recent.popleft())
+        self._recent.append(entry)
+
+    def record(
+        self, role: str, content: str, timestamp: Optional[datetime] = None
+    ) -> None:
+        """Append without building an intermediate dict."""
+        timestamp = timestamp or datetime.now()
+        timestamp_us, timestamp_raw = _encode_datetime(timestamp)
+        self.append(
+            HistoryEntry(
+                role=sys.intern(role),
+                content=content,
+                timestamp_us=timestamp_us,
+                timestamp_raw=timestamp_raw,
+            )
+        )
+
+    def close(self) -> None:
+        """
+        Flush spilled entries to spill_path, or delete the anonymous segment.
+
+        Spilled entries cannot be read back from a closed anonymous segment.
+        """
+        if self._remove_temp_segment is not None:
+            self._pending.clear()
+            self._remove_temp_segment()
+        else:
+            self._flush()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ConversationHistory":
+        # Appends to a shared segment would corrupt both copies' offsets
+        return ConversationHistory.from_list(list(self), self.window)
+
+    # ==========================================================================
+    # Sequence Protocol
+    # ==========================================================================
+
+    def __len__(self) -> int:
+        return self._spilled + len(self._recent)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self._entry(i).to_dict() for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("conversation history index out of range")
+        return self._entry(index).to_dict()
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if self._spilled:
+            self._flush()
+            with open(self._path, "rb") as segment:
+                for start in range(0, self._spilled, _INDEX_STRIDE):
+                    # Re-seek per block so appends between yields cannot move us
+                    self._flush()
+                    segment.seek(self._offsets[start // _INDEX_STRIDE])
+                    lines = [
+                        segment.readline()
+                        for _ in range(min(_INDEX_STRIDE, self._spilled - start))
+                    ]
+                    for line in lines:
+                        yield json.loads(line)
+        for entry in list(self._recent):
+            yield entry.to_dict()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, ConversationHistory)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def tail(self, count: int) -> List[Dict[str, Any]]:
+        """Return the last `count` entries as dicts."""
+        return self[-count:] if count > 0 else []
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Full history in the state.json shape (pages spilled entries in)."""
+        return list(self)
+
+    # ==========================================================================
+    # Segment File
+    # ==========================================================================
+
+    def _entry(self, index: int) -> HistoryEntry:
+        """Entry at a non-negative index, reading from disk if spilled."""
+        if index >= self._spilled:
+            return self._recent[index - self._spilled]
+
+        self._flush()
+        with open(self._path, "rb") as segment:
+            segment.seek(self._offsets[index // _INDEX_STRIDE])
+            for _ in range(index % _INDEX_STRIDE):
+                segment.readline()
+            line = segment.readline()
+        return HistoryEntry.from_dict(json.loads(line))
+
+    def _spill(self, entry: HistoryEntry) -> None:
+        """Queue an entry for the segment file, writing full batches."""
+        if self._spilled % _INDEX_STRIDE == 0:
+            self._offsets.append(self._size)
+        line = (
+            json.dumps(entry.to_dict(), separators=(",", ":")).encode("utf-8")
+            + b"\n"
+        )
+        self._pending.append(line)
+        self._size += len(line)
+        self._spilled += 1
+        if len(self._pending) >= _INDEX_STRIDE:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write pending spilled entries (the first write truncates the file)."""
+        if not self._pending:
+            return
+        if self._path is None:
+            if self.spill_path:
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                self._path = self.spill_path
+            else:
+                fd, name = tempfile.mkstemp(suffix=".segment")
+                os.close(fd)
+                self._path = Path(name)
+                self._remove_temp_segment = weakref.finalize(self, _unlink, name)
+        with open(self._path, "ab" if self._flushed else "wb") as segment:
+            segment.write(b"".join(self._pending))
+        self._pending.clear()
+        self._flushed = True
+
+
+# =============================================================================
+# CONVENIENCE FUNCTIONS
+# =============================================================================
+
+
+def bind_bounded_history(
+    state: InterviewState,
+    window: int = 50,
+    spill_path: Optional[Path] = None,
+) -> ConversationHistory:
+    """
+    Replace a state's conversation_history with a bounded container.
+
+    record_exchange() keeps working unchanged, and model_dump() still
+    produces the plain list shape.
+
+    Args:
+        state: State to convert (e.g. right after loading state.json)
+        window: In-memory window size
+        spill_path: Segment file, e.g. {session_dir}/history.segment
+
+    Returns:
+        The bound ConversationHistory
+    """
+    history = state.conversation_history
+    if not isinstance(history, ConversationHistory):
+        history = ConversationHistory.from_list(history, window, spill_path)
+        state.conversation_history = history
+    return history
+
+
+# =============================================================================
+# UTILITY FUNCTIONS
+# =============================================================================
+
+
+def _unlink(path: str) -> None:
+    """Delete an anonymous segment file (garbage collection or close())."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _encode_timestamp(value: Any) -> Tuple[Optional[int], Optional[str]]:
+    """ISO string -> (microseconds, raw string if it would not round-trip)."""
+    if value is None:
+        return None, None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None, value
+    timestamp_us, timestamp_raw = _encode_datetime(parsed)
+    if timestamp_raw is not None or parsed.isoformat() != value:
+        return timestamp_us, value
+    return timestamp_us, None
+
+
+def _encode_datetime(value: datetime) -> Tuple[Optional[int], Optional[str]]:
+    """Naive datetime -> microseconds; aware datetimes keep their ISO string."""
+    if value.tzinfo is not None:
+        return None, value.isoformat()
+    return (value - _EPOCH) // _MICROSECOND, None
@@ -0,0 +1,10 @@
+"""
+Insight Importance Levels
+
+Shared by state_schema (insight selection) and the prompt formatters
+(high-importance markers). Has no dependencies, so user_prompt_formatter can
+import it at module level and still load without Pydantic.
+"""
+
+# Importance values treated as high priority in selection and prompts
+HIGH_IMPORTANCE = ("high", "critical")
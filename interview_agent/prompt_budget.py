@@ -0,0 +1,364 @@
+"""
+Token-Budgeted Prompt Assembly for Interview Agent
+
+Budget-aware variant of format_interviewer_prompt:
+- Pluggable offline token counter (character estimate by default)
+- Sections and items are ranked; the lowest priority content is trimmed first
+- Reports every dropped or truncated item
+- Identical to format_interviewer_prompt whenever the prompt already fits
+
+Priority (highest first): interview context / current question / progress /
+task (never trimmed) > latest user message > current-question exchanges >
+high/critical insights > other insights > conversation history.
+"""
+
+import dataclasses
+import math
+from functools import partial
+from typing import Any, Callable, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from agents.interview_agent.importance import HIGH_IMPORTANCE
+from agents.interview_agent.state_schema import (
+    Exchange,
+    Insight,
+    InterviewState,
+)
+from agents.interview_agent.user_prompt_formatter import (
+    _format_exchange,
+    _format_history_message,
+    _format_insight,
+    _join_lines,
+    _select_insights,
+    format_current_question,
+    format_interview_context,
+    format_progress,
+    format_task_instruction,
+    format_user_message,
+)
+
+TokenCounter = Callable[[str], int]
+
+# Older exchange responses are clipped to this many characters before dropping
+EXCHANGE_CLIP_CHARS = 280
+
+_CLIP_MARKER = " [...truncated]"
+
+
+# =============================================================================
+# TOKEN COUNTERS
+# =============================================================================
+
+
+def estimate_tokens(text: str) -> int:
+    """Offline estimate: ~4 characters per token for English prose."""
+    return math.ceil(len(text) / 4)
+
+
+def chars_per_token_counter(chars_per_token: float) -> TokenCounter:
+    """Build an estimator with a custom characters-per-token ratio."""
+    return lambda text: math.ceil(len(text) / chars_per_token)
+
+
+def tiktoken_counter(encoding_name: str = "cl100k_base") -> TokenCounter:
+    """
+    Exact counter backed by tiktoken (optional dependency).
+
+    The encoding must already be cached locally to stay offline.
+    """
+    try:
+        import tiktoken
+    except ImportError as e:
+        raise ImportError(
+            "tiktoken is required for tiktoken_counter: uv add tiktoken"
+        ) from e
+    encoding = tiktoken.get_encoding(encoding_name)
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+# =============================================================================
+# RESULT MODELS
+# =============================================================================
+
+
+class TrimmedItem(BaseModel):
+    """One item removed or shortened to meet the budget."""
+
+    section: str  # "conversation_history", "insights", "question_exchanges", ...
+    item: str  # e.g. "message 12", "insight <id>", "exchange 2"
+    action: str  # "dropped" or "truncated"
+    tokens_saved: int
+
+
+class BudgetedPrompt(BaseModel):
+    """Assembled prompt plus a report of what was trimmed."""
+
+    prompt: str
+    token_count: int
+    token_budget: int
+    fits: bool
+    trimmed: List[TrimmedItem] = Field(default_factory=list)
+
+
+# =============================================================================
+# MAIN FORMATTER
+# =============================================================================
+
+
+def format_budgeted_prompt(
+    state: InterviewState,
+    token_budget: int,
+    user_message: Optional[str] = None,
+    max_history: int = 10,
+    max_insights: int = 10,
+    count_tokens: TokenCounter = estimate_tokens,
+) -> BudgetedPrompt:
+    """
+    Assemble the interviewer prompt within a token budget.
+
+    Args:
+        state: The current InterviewState
+        token_budget: Maximum prompt tokens according to `count_tokens`
+        user_message: The user's latest response (None on first turn)
+        max_history: Maximum conversation history entries considered
+        max_insights: Maximum insights considered
+        count_tokens: Token counter (see estimate_tokens, tiktoken_counter)
+
+    Returns:
+        BudgetedPrompt; `fits` is False if even the untrimmable sections
+        exceed the budget
+    """
+    parts = _PromptParts(state, user_message, max_history, max_insights)
+    prompt = parts.render()
+    tokens = count_tokens(prompt)
+    trimmed: List[TrimmedItem] = []
+
+    for section, item, action, trim in parts.trim_steps(count_tokens):
+        if tokens <= token_budget:
+            break
+        if not trim(tokens - token_budget):
+            continue
+        prompt = parts.render()
+        new_tokens = count_tokens(prompt)
+        trimmed.append(
+            TrimmedItem(
+                section=section,
+                item=item,
+                action=action,
+                tokens_saved=tokens - new_tokens,
+            )
+        )
+        tokens = new_tokens
+
+    return BudgetedPrompt(
+        prompt=prompt,
+        token_count=tokens,
+        token_budget=token_budget,
+        fits=tokens <= token_budget,
+        trimmed=trimmed,
+    )
+
+
+# =============================================================================
+# PROMPT PARTS
+# =============================================================================
+
+
+class _PromptParts:
+    """Trimmable working copy of every prompt section."""
+
+    def __init__(
+        self,
+        state: InterviewState,
+        user_message: Optional[str],
+        max_history: int,
+        max_insights: int,
+    ):
+        self.context = format_interview_context(state)
+        self.current_question = format_current_question(state)
+        self.progress = format_progress(state)
+        self.task = format_task_instruction(state, user_message)
+        self.user_message = user_message
+
+        question = state.get_current_question()
+        exchanges = question.exchanges if question else []
+        self.exchanges: List[Tuple[int, Exchange, str]] = [
+            (i + 1, exchange, _format_exchange(i + 1, exchange))
+            for i, exchange in enumerate(exchanges)
+        ]
+
+        insights = state.insight_bank.insights
+        self.insight_total = len(insights)
+        self.max_insights = max_insights
+        self.insights_capped = len(insights) > max_insights
+        self.insights_trimmed = False
+        selected = _select_insights(state.insight_bank, max_insights) if insights else []
+        self.insights: List[Tuple[Insight, str]] = [
+            (insight, _format_insight(insight)) for insight in selected
+        ]
+
+        history = state.conversation_history
+        self.history_total = len(history)
+        self.max_history = max_history
+        self.history_trimmed = False
+        # Same window as format_conversation_history's history[-max_entries:]
+        indices = range(len(history))
+        if len(history) > max_history:
+            indices = indices[-max_history:]
+        self.history: List[Tuple[int, str]] = [
+            (index, _format_history_message(history[index])) for index in indices
+        ]
+
+    # ==========================================================================
+    # Rendering
+    # ==========================================================================
+
+    def render(self) -> str:
+        """Assemble sections in format_interviewer_prompt order."""
+        prompt = self.context + self.current_question
+
+        if self.exchanges:
+            fragments = [fragment for _, _, fragment in self.exchanges]
+            prompt += f"<question_exchanges>\n{_join_lines(fragments)}\n</question_exchanges>\n\n"
+
+        if self.insights:
+            header = f"\t<total_insights>{self.insight_total}</total_insights>"
+            if self.insights_trimmed:
+                header += f"\n\t<showing>Top {len(self.insights)} (trimmed to fit token budget)</showing>"
+            elif self.insights_capped:
+                header += f"\n\t<showing>Most recent {self.max_insights} (prioritizing high importance)</showing>"
+            lines = [line for _, line in self.insights]
+            prompt += f"<accumulated_insights>\n{header}\n{_join_lines(lines)}\n</accumulated_insights>\n\n"
+
+        if self.history:
+            window_note = ""
+            if self.history_trimmed:
+                window_note = f"\t<!-- Showing last {len(self.history)} of {self.history_total} messages (trimmed to fit token budget) -->\n"
+            elif self.history_total > self.max_history:
+                window_note = f"\t<!-- Showing last {self.max_history} of {self.history_total} messages -->\n"
+            lines = [line for _, line in self.history]
+            prompt += f"<conversation_history>\n{window_note}{_join_lines(lines)}\n</conversation_history>\n\n"
+
+        if self.user_message:
+            prompt += format_user_message(self.user_message)
+
+        return prompt + self.progress + self.task
+
+    # ==========================================================================
+    # Trimming
+    # ==========================================================================
+
+    def trim_steps(self, count_tokens: TokenCounter):
+        """
+        Yield (section, item, action, trim) from lowest priority upwards.
+
+        `trim(excess_tokens)` applies the step and returns False if it was a
+        no-op (e.g. a response already shorter than the clip length).
+        """
+        # 1. Conversation history, oldest first
+        for index, _ in list(self.history):
+            yield (
+                "conversation_history",
+                f"message {index + 1}",
+                "dropped",
+                partial(self._drop_history, index),
+            )
+
+        # 2. Other insights, then 3. high/critical insights (lowest ranked first)
+        ranked = list(reversed(self.insights))
+        ranked.sort(key=lambda entry: entry[0].importance in HIGH_IMPORTANCE)
+        for insight, _ in ranked:
+            yield (
+                "insights",
+                f"insight {insight.id}",
+                "dropped",
+                partial(self._drop_insight, insight),
+            )
+
+        # 4. Clip long exchange responses, then 5. drop older exchanges
+        # (the latest exchange is clipped but never dropped)
+        nums = [num for num, _, _ in self.exchanges]
+        for num in nums:
+            yield (
+                "question_exchanges",
+                f"exchange {num}",
+                "truncated",
+                partial(self._clip_exchange, num),
+            )
+        for num in nums[:-1]:
+            yield (
+                "question_exchanges",
+                f"exchange {num}",
+                "dropped",
+                partial(self._drop_exchange, num),
+            )
+
+        # 6. Clip the latest user message to whatever room is left
+        if self.user_message:
+            yield (
+                "latest_user_message",
+                "user message",
+                "truncated",
+                partial(self._clip_user_message, count_tokens),
+            )
+
+    def _drop_history(self, index: int, excess: int) -> bool:
+        self.history = [entry for entry in self.history if entry[0] != index]
+        self.history_trimmed = True
+        return True
+
+    def _drop_insight(self, insight: Insight, excess: int) -> bool:
+        self.insights = [entry for entry in self.insights if entry[0] is not insight]
+        self.insights_trimmed = True
+        return True
+
+    def _clip_exchange(self, num: int, excess: int) -> bool:
+        for position, (n, exchange, _) in enumerate(self.exchanges):
+            if n != num:
+                continue
+            response = exchange.user_response or ""
+            if len(response) <= EXCHANGE_CLIP_CHARS:
+                return False
+            clipped = _with_response(exchange, _clip(response, EXCHANGE_CLIP_CHARS))
+            self.exchanges[position] = (n, clipped, _format_exchange(n, clipped))
+            return True
+        return False
+
+    def _drop_exchange(self, num: int, excess: int) -> bool:
+        self.exchanges = [entry for entry in self.exchanges if entry[0] != num]
+        return True
+
+    def _clip_user_message(self, count_tokens: TokenCounter, excess: int) -> bool:
+        """Binary-search the longest prefix that removes `excess` tokens."""
+        message = self.user_message
+        target = count_tokens(message) - excess
+        low, high = 0, len(message)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if count_tokens(_clip(message, mid)) <= target:
+                low = mid
+            else:
+                high = mid - 1
+        self.user_message = _clip(message, low)
+        return self.user_message != message
+
+
+# =============================================================================
+# UTILITY FUNCTIONS
+# =============================================================================
+
+
+def _with_response(exchange: Any, response: str) -> Any:
+    """Copy of an Exchange or runtime_models.RuntimeExchange with a new response."""
+    if dataclasses.is_dataclass(exchange):
+        return dataclasses.replace(exchange, user_response=response)
+    return exchange.model_copy(update={"user_response": response})
+
+
+def _clip(text: str, max_chars: int) -> str:
+    """Keep the first `max_chars` characters and mark the cut."""
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars].rstrip() + _CLIP_MARKER
+
@@ -0,0 +1,301 @@
+"""
+Incremental Prompt Builder for Interview Agent
+
+Stateful alternative to format_interviewer_prompt for long-running sessions:
+- Bound to a single InterviewState
+- Caches each section's rendered fragment between turns
+- State machine proxies invalidate only the sections they touch
+- Output is byte-identical to format_interviewer_prompt
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from agents.interview_agent.state_schema import (
+    Exchange,
+    FollowUpReason,
+    InterviewState,
+    QuestionState,
+    ResponseAnalysis,
+)
+from agents.interview_agent.user_prompt_formatter import (
+    _conversation_history_section,
+    _format_exchange,
+    _format_history_message,
+    _format_insight,
+    _history_window,
+    _insight_summary_section,
+    _join_lines,
+    format_current_question,
+    format_interview_context,
+    format_progress,
+    format_task_instruction,
+    format_user_message,
+)
+
+# Section names, in prompt order
+INTERVIEW_CONTEXT = "interview_context"
+CURRENT_QUESTION = "current_question"
+QUESTION_EXCHANGES = "question_exchanges"
+INSIGHT_SUMMARY = "insight_summary"
+CONVERSATION_HISTORY = "conversation_history"
+
+CACHED_SECTIONS = (
+    INTERVIEW_CONTEXT,
+    CURRENT_QUESTION,
+    QUESTION_EXCHANGES,
+    INSIGHT_SUMMARY,
+    CONVERSATION_HISTORY,
+)
+
+
+# =============================================================================
+# PROMPT BUILDER
+# =============================================================================
+
+
+class InterviewPromptBuilder:
+    """
+    Incremental interviewer prompt builder bound to one InterviewState.
+
+    Route mutations through the proxy methods (add_exchange, record_response,
+    record_exchange, advance_to_next_question) so only the affected sections
+    are re-rendered. Each section also carries a cheap key (counts, statuses,
+    object identity) so appends made directly on the state are still picked
+    up; call invalidate() after any other in-place edit.
+    """
+
+    def __init__(
+        self,
+        state: InterviewState,
+        max_history: int = 10,
+        max_insights: int = 10,
+    ):
+        """
+        Args:
+            state: The InterviewState to build prompts for
+            max_history: Maximum conversation history entries to include
+            max_insights: Insight summary limit (format_interviewer_prompt uses 10)
+        """
+        self.state = state
+        self.max_history = max_history
+        self.max_insights = max_insights
+
+        self._fragments: Dict[str, str] = {}
+        self._keys: Dict[str, Tuple[Any, ...]] = {}
+        self._dirty = set(CACHED_SECTIONS)
+
+        # Item-level caches
+        self._exchange_cache: List[Tuple[Any, Any, str]] = []
+        self._history_cache: Dict[int, str] = {}
+        self._insight_lines: Dict[str, str] = {}
+
+    # ==========================================================================
+    # State Machine Proxies
+    # ==========================================================================
+
+    def add_exchange(
+        self,
+        question_text: str,
+        is_follow_up: bool = False,
+        follow_up_reason: Optional[FollowUpReason] = None,
+    ) -> Optional[Exchange]:
+        """Add an exchange to the current question."""
+        question = self.state.get_current_question()
+        if not question:
+            return None
+        exchange = question.add_exchange(question_text, is_follow_up, follow_up_reason)
+        self._dirty.update((CURRENT_QUESTION, QUESTION_EXCHANGES))
+        return exchange
+
+    def record_response(self, response: str, analysis: ResponseAnalysis) -> None:
+        """Record the user response and analysis on the current question."""
+        question = self.state.get_current_question()
+        if not question:
+            return
+        question.record_response(response, analysis)
+        if self._exchange_cache:
+            self._exchange_cache.pop()
+        self._dirty.update((CURRENT_QUESTION, QUESTION_EXCHANGES))
+
+    def record_exchange(self, role: str, content: str) -> None:
+        """Append to the conversation history."""
+        self.state.record_exchange(role, content)
+        self._dirty.add(CONVERSATION_HISTORY)
+
+    def advance_to_next_question(self) -> Optional[QuestionState]:
+        """Move to the next question."""
+        question = self.state.advance_to_next_question()
+        self._exchange_cache = []
+        self._dirty.update((CURRENT_QUESTION, QUESTION_EXCHANGES))
+        return question
+
+    def invalidate(self, *sections: str) -> None:
+        """
+        Drop cached fragments so they are re-rendered on the next build.
+
+        Args:
+            sections: Section names to invalidate (all sections if omitted)
+        """
+        sections = sections or CACHED_SECTIONS
+        for section in sections:
+            self._dirty.add(section)
+            if section == QUESTION_EXCHANGES:
+                self._exchange_cache = []
+            elif section == CONVERSATION_HISTORY:
+                self._history_cache = {}
+            elif section == INSIGHT_SUMMARY:
+                self._insight_lines = {}
+
+    # ==========================================================================
+    # Build
+    # ==========================================================================
+
+    def build(self, user_message: Optional[str] = None) -> str:
+        """
+        Assemble the interviewer prompt.
+
+        Args:
+            user_message: The user's latest response (None on first turn)
+
+        Returns:
+            Formatted XML string, identical to format_interviewer_prompt
+        """
+        state = self.state
+        question = state.get_current_question()
+
+        prompt = self._section(
+            INTERVIEW_CONTEXT,
+            (state.session_id, state.title, state.status, state.context),
+            format_interview_context,
+        )
+        prompt += self._section(
+            CURRENT_QUESTION,
+            self._question_key(question),
+            format_current_question,
+        )
+        prompt += self._section(
+            QUESTION_EXCHANGES,
+            (
+                state.current_question_index,
+                id(question),
+                len(question.exchanges) if question else 0,
+            ),
+            self._render_question_exchanges,
+        )
+        prompt += self._section(
+            INSIGHT_SUMMARY,
+            (len(state.insight_bank.insights), self.max_insights),
+            self._render_insight_summary,
+        )
+        prompt += self._section(
+            CONVERSATION_HISTORY,
+            (len(state.conversation_history), self.max_history),
+            self._render_conversation_history,
+        )
+
+        if user_message:
+            prompt += format_user_message(user_message)
+
+        # Progress counters and task instruction are O(1) - always fresh
+        prompt += format_progress(state)
+        prompt += format_task_instruction(state, user_message)
+
+        return prompt
+
+    # ==========================================================================
+    # Section Cache
+    # ==========================================================================
+
+    def _section(self, name: str, key: Tuple[Any, ...], render) -> str:
+        """Return the cached fragment for `name`, re-rendering if stale."""
+        if name in self._dirty or self._keys.get(name) != key:
+            self._fragments[name] = render(self.state)
+            self._keys[name] = key
+            self._dirty.discard(name)
+        return self._fragments[name]
+
+    def _question_key(self, question: Optional[QuestionState]) -> Tuple[Any, ...]:
+        """Cheap key covering every field rendered in <current_question>."""
+        if not question:
+            return (None,)
+        return (
+            id(question),
+            self.state.total_questions,
+            question.status,
+            question.objective_status,
+            question.follow_up_count,
+            question.max_follow_ups,
+        )
+
+    def _render_question_exchanges(self, state: InterviewState) -> str:
+        """Render exchanges, reusing fragments whose response is unchanged."""
+        question = state.get_current_question()
+        if not question or not question.exchanges:
+            self._exchange_cache = []
+            return ""
+
+        cache = self._exchange_cache
+        del cache[len(question.exchanges) :]
+        for i, exchange in enumerate(question.exchanges):
+            if i < len(cache):
+                response, analysis, _ = cache[i]
+                if (
+                    response is exchange.user_response
+                    and analysis is exchange.response_analysis
+                ):
+                    continue
+                del cache[i:]
+            cache.append(
+                (
+                    exchange.user_response,
+                    exchange.response_analysis,
+                    _format_exchange(i + 1, exchange),
+                )
+            )
+
+        exchanges = [fragment for _, _, fragment in cache]
+        return f"<question_exchanges>\n{_join_lines(exchanges)}\n</question_exchanges>\n\n"
+
+    def _render_insight_summary(self, state: InterviewState) -> str:
+        """Render the insight summary from the bank's top-k view."""
+        insights = state.insight_bank.insights
+        if not insights:
+            return ""
+
+        max_insights = self.max_insights
+        selected = state.insight_bank.top_insights(max_insights)
+
+        if not selected:
+            return ""
+
+        lines = self._insight_lines
+        insight_lines = []
+        for insight in selected:
+            line = lines.get(insight.id)
+            if line is None:
+                line = lines[insight.id] = _format_insight(insight)
+            insight_lines.append(line)
+
+        return _insight_summary_section(insight_lines, len(insights), max_insights)
+
+    def _render_conversation_history(self, state: InterviewState) -> str:
+        """Render the history window, reusing already formatted messages."""
+        history = state.conversation_history
+        if not history:
+            self._history_cache = {}
+            return ""
+
+        total = len(history)
+        cache = self._history_cache
+        window: Dict[int, str] = {}
+        for index in _history_window(total, self.max_history):
+            line = cache.get(index)
+            if line is None:
+                line = _format_history_message(history[index])
+            window[index] = line
+        self._history_cache = window
+
+        return _conversation_history_section(
+            list(window.values()), total, self.max_history
+        )
+
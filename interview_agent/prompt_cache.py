@@ -0,0 +1,502 @@
+"""
+Content-Addressed Prompt Cache for Interview Agent
+
+The sub-prompt formatters are pure functions of their inputs, so a model
+reply can be reused whenever the same model sees the same formatted prompt
+again (retries, replays, panel interviews sharing a question set):
+- Keys are a SHA-256 of the model name plus the formatted prompt
+- Level 1: in-process LRU bounded by entry count and total characters,
+  with TTL expiry
+- Level 2 (optional): SQLite store shared between worker processes
+- Hit / miss / eviction counters
+- Deterministic mode: a manual clock instead of wall time, for tests
+
+CachingLLMClient wraps any LLMClient (put it outside the
+ConcurrencyLimitedClient so hits never wait for a model slot). Its SQLite
+reads and writes run in worker threads, so a slow disk never blocks the
+event loop, and concurrent misses on one prompt share a single model call
+or stream:
+
+    cache = PromptCache(store=SQLitePromptStore(Path("prompt_cache.db")))
+    manager = SessionManager(CachingLLMClient(client, cache))
+"""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from pydantic import BaseModel
+
+from agents.interview_agent.session_runtime import LLMClient
+
+# Bump to invalidate every stored entry (e.g. after a prompt format change)
+CACHE_KEY_VERSION = "1"
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_MAX_CHARS = 32 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 24 * 3600.0
+
+
+def cache_key(model: str, prompt: str) -> str:
+    """Content address of a (model, formatted prompt) pair."""
+    digest = hashlib.sha256()
+    for part in (CACHE_KEY_VERSION, model, prompt):
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ManualClock:
+    """Clock that only moves when told to (deterministic mode)."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class PromptCacheStats(BaseModel):
+    """Counters for one PromptCache."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    # Entries dropped from memory to respect max_entries / max_chars
+    evictions: int = 0
+    # Entries found but older than the TTL
+    expirations: int = 0
+    # Misses served by an identical call already in flight (CachingLLMClient)
+    coalesced: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        """Hits per lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+# =============================================================================
+# DISK STORE
+# =============================================================================
+
+
+class SQLitePromptStore:
+    """
+    Second-level cache in a SQLite file.
+
+    WAL mode lets several worker processes read while one writes; each
+    process opens its own store on the same path. Within a process the
+    connection may be used from any thread (one statement at a time).
+    """
+
+    def __init__(self, path: Path, timeout: float = 30.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=timeout, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS prompt_cache ("
+            " key TEXT PRIMARY KEY,"
+            " model TEXT NOT NULL,"
+            " response TEXT NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """Return (response, created_at) or None."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT response, created_at FROM prompt_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+    def put(self, key: str, model: str, response: str, created_at: float) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO prompt_cache VALUES (?, ?, ?, ?)",
+                (key, model, response, created_at),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM prompt_cache WHERE key = ?", (key,))
+
+    def prune(self, older_than: float) -> int:
+        """Delete entries created before `older_than`; returns the count."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM prompt_cache WHERE created_at < ?", (older_than,)
+            )
+        return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM prompt_cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM prompt_cache"
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# =============================================================================
+# TWO-LEVEL CACHE
+# =============================================================================
+
+
+class PromptCache:
+    """
+    In-process LRU in front of an optional SQLitePromptStore.
+
+    Entries expire ttl_seconds after they were first stored, on both levels.
+    get_key_async() / put_async() do the same work as get_key() / put() with
+    the SQLite calls moved to a worker thread (for use on an event loop).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_chars: int = DEFAULT_MAX_CHARS,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+        store: Optional[SQLitePromptStore] = None,
+        clock: Optional[Callable[[], float]] = None,
+        deterministic: bool = False,
+    ):
+        """
+        Args:
+            max_entries: Memory level entry limit
+            max_chars: Memory level limit on total cached response characters
+            ttl_seconds: Entry lifetime (None: never expire)
+            store: Optional shared second level
+            clock: Time source in seconds (default: time.time)
+            deterministic: Use a ManualClock starting at 0 (see .clock)
+        """
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self.ttl_seconds = ttl_seconds
+        self.store = store
+        self.clock = clock or (ManualClock() if deterministic else time.time)
+        self.stats = PromptCacheStats()
+
+        # key -> (response, created_at), least recently used first
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._chars = 0
+
+    def get(self, model: str, prompt: str) -> Optional[str]:
+        """Cached response for (model, prompt), or None."""
+        return self.get_key(cache_key(model, prompt))
+
+    def put(self, model: str, prompt: str, response: str) -> None:
+        """Store the response for (model, prompt) on both levels."""
+        key, now = self._put_memory(model, prompt, response)
+        if self.store is not None:
+            self.store.put(key, model, response, now)
+
+    async def put_async(self, model: str, prompt: str, response: str) -> None:
+        """put(), with the SQLite write run in a worker thread."""
+        key, now = self._put_memory(model, prompt, response)
+        if self.store is not None:
+            await asyncio.to_thread(self.store.put, key, model, response, now)
+
+    def get_key(self, key: str) -> Optional[str]:
+        """Cached response for a precomputed cache_key, or None."""
+        now = self.clock()
+        response, expired = self._get_memory(key, now)
+        # Another process may have stored a fresher reply
+        if response is None and self.store is not None:
+            response, stale = self._from_row(key, self.store.get(key), now)
+            if stale:
+                self.store.delete(key)
+            expired = expired or stale
+        return self._counted(response, expired)
+
+    async def get_key_async(self, key: str) -> Optional[str]:
+        """get_key(), with the SQLite lookup run in a worker thread."""
+        now = self.clock()
+        response, expired = self._get_memory(key, now)
+        if response is None and self.store is not None:
+            row = await asyncio.to_thread(self.store.get, key)
+            response, stale = self._from_row(key, row, now)
+            if stale:
+                await asyncio.to_thread(self.store.delete, key)
+            expired = expired or stale
+        return self._counted(response, expired)
+
+    def clear(self) -> None:
+        """Drop every entry on both levels (counters are kept)."""
+        self._entries.clear()
+        self._chars = 0
+        if self.store is not None:
+            self.store.clear()
+
+    def __len__(self) -> int:
+        """Entries held in memory."""
+        return len(self._entries)
+
+    def _put_memory(
+        self, model: str, prompt: str, response: str
+    ) -> Tuple[str, float]:
+        """Store on the memory level; returns (key, created_at) for the store."""
+        key = cache_key(model, prompt)
+        now = self.clock()
+        self._remember(key, response, now)
+        self.stats.writes += 1
+        return key, now
+
+    def _get_memory(self, key: str, now: float) -> Tuple[Optional[str], bool]:
+        """(response or None, whether an expired entry was dropped)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None, False
+        if self._expired(entry[1], now):
+            self._forget(key)
+            return None, True
+        self._entries.move_to_end(key)
+        self.stats.memory_hits += 1
+        return entry[0], False
+
+    def _from_row(
+        self, key: str, row: Optional[Tuple[str, float]], now: float
+    ) -> Tuple[Optional[str], bool]:
+        """(response or None, whether the stored row has expired)."""
+        if row is None:
+            return None, False
+        response, created_at = row
+        if self._expired(created_at, now):
+            return None, True
+        self._remember(key, response, created_at)
+        self.stats.disk_hits += 1
+        return response, False
+
+    def _counted(self, response: Optional[str], expired: bool) -> Optional[str]:
+        if response is None:
+            self.stats.expirations += expired
+            self.stats.misses += 1
+        return response
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at >= self.ttl_seconds
+
+    def _remember(self, key: str, response: str, created_at: float) -> None:
+        if key in self._entries:
+            self._forget(key)
+        if len(response) > self.max_chars:
+            return
+        self._entries[key] = (response, created_at)
+        self._chars += len(response)
+        while len(self._entries) > self.max_entries or self._chars > self.max_chars:
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self._chars -= len(evicted)
+            self.stats.evictions += 1
+
+    def _forget(self, key: str) -> None:
+        response, _ = self._entries.pop(key)
+        self._chars -= len(response)
+
+
+# =============================================================================
+# CLIENT WRAPPER
+# =============================================================================
+
+
+class CachingLLMClient:
+    """
+    LLMClient that answers repeated (model, prompt) pairs from a PromptCache.
+
+    Concurrent misses on the same key share one model call, and concurrent
+    streams of the same key share one upstream stream (a later caller first
+    gets the chunks received so far). complete() and stream() calls do not
+    coalesce with each other. Only replies that complete are stored; a
+    failed call leaves the cache untouched, and the shared call or stream is
+    cancelled once every caller waiting on it is.
+    """
+
+    def __init__(
+        self,
+        client: LLMClient,
+        cache: Optional[PromptCache] = None,
+        models: Optional[Collection[str]] = None,
+    ):
+        """
+        Args:
+            client: Wrapped client
+            cache: Cache to use (default: a fresh in-memory PromptCache)
+            models: Only cache calls to these models (None: all models)
+        """
+        self.client = client
+        self.cache = cache if cache is not None else PromptCache()
+        self.models = set(models) if models is not None else None
+
+        # key -> [shared call, number of callers waiting on it]
+        self._in_flight: Dict[str, List[Any]] = {}
+        self._streams: Dict[str, _SharedStream] = {}
+
+    async def complete(self, model: str, prompt: str) -> str:
+        if self.models is not None and model not in self.models:
+            return await self.client.complete(model, prompt)
+        key = cache_key(model, prompt)
+        cached = await self.cache.get_key_async(key)
+        if cached is not None:
+            return cached
+
+        entry = self._in_flight.get(key)
+        if entry is None:
+            call = asyncio.ensure_future(self._call(key, model, prompt))
+            entry = self._in_flight[key] = [call, 0]
+        else:
+            self.cache.stats.coalesced += 1
+
+        call = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(call)
+        except asyncio.CancelledError:
+            if not call.done() and entry[1] == 1:
+                call.cancel()
+            raise
+        finally:
+            entry[1] -= 1
+
+    async def _call(self, key: str, model: str, prompt: str) -> str:
+        """The shared model call for `key`; a completed reply is stored."""
+        try:
+            response = await self.client.complete(model, prompt)
+            await self.cache.put_async(model, prompt, response)
+            return response
+        finally:
+            self._in_flight.pop(key, None)
+
+    async def stream(self, model: str, prompt: str) -> AsyncIterator[str]:
+        """Stream from the wrapped client; a hit is yielded as one chunk."""
+        if self.models is not None and model not in self.models:
+            async for chunk in self._upstream(model, prompt):
+                yield chunk
+            return
+        key = cache_key(model, prompt)
+        cached = await self.cache.get_key_async(key)
+        if cached is not None:
+            yield cached
+            return
+
+        shared = self._streams.get(key)
+        if shared is None:
+            shared = self._streams[key] = _SharedStream(
+                self._stored(model, prompt), partial(self._stream_closed, key)
+            )
+        else:
+            self.cache.stats.coalesced += 1
+        async for chunk in shared.read():
+            yield chunk
+
+    async def _stored(self, model: str, prompt: str) -> AsyncIterator[str]:
+        """Upstream chunks; the joined reply is stored once the stream ends."""
+        chunks = []
+        async for chunk in self._upstream(model, prompt):
+            chunks.append(chunk)
+            yield chunk
+        await self.cache.put_async(model, prompt, "".join(chunks))
+
+    async def _upstream(self, model: str, prompt: str) -> AsyncIterator[str]:
+        stream = getattr(self.client, "stream", None)
+        if stream is None:
+            yield await self.client.complete(model, prompt)
+        else:
+            async for chunk in stream(model, prompt):
+                yield chunk
+
+    def _stream_closed(self, key: str, shared: "_SharedStream") -> None:
+        if self._streams.get(key) is shared:
+            del self._streams[key]
+
+
+class _SharedStream:
+    """One upstream stream fanned out to every caller reading it."""
+
+    def __init__(
+        self,
+        source: AsyncIterator[str],
+        on_close: Callable[["_SharedStream"], None],
+    ):
+        """
+        Args:
+            source: Upstream chunks (consumed by a background task)
+            on_close: Called once no new reader should join (finished,
+                failed, or abandoned by its last reader)
+        """
+        self.chunks: List[str] = []
+        self.readers = 0
+        self._on_close = on_close
+        self._done = False
+        self._error: Optional[Exception] = None
+        self._changed = asyncio.Event()
+        self._task = asyncio.ensure_future(self._pump(source))
+
+    async def read(self) -> AsyncIterator[str]:
+        """Every chunk from the start, then live ones until the stream ends."""
+        self.readers += 1
+        position = 0
+        try:
+            while True:
+                if position < len(self.chunks):
+                    position += 1
+                    yield self.chunks[position - 1]
+                elif self._done:
+                    if self._error is not None:
+                        raise self._error
+                    return
+                else:
+                    await self._changed.wait()
+        finally:
+            self.readers -= 1
+            if not self.readers and not self._done:
+                self._on_close(self)
+                self._task.cancel()
+
+    async def _pump(self, source: AsyncIterator[str]) -> None:
+        try:
+            async for chunk in source:
+                self.chunks.append(chunk)
+                self._notify()
+        except Exception as exc:  # re-raised in every reader
+            self._error = exc
+        finally:
+            self._done = True
+            self._on_close(self)
+            self._notify()
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = asyncio.Event()
@@ -0,0 +1,459 @@
+"""
+Slim Runtime Models for Live Sessions
+
+Slotted dataclass mirrors of the hot-path state objects:
+- RuntimeExchange, RuntimeQuestion, RuntimeInsight, RuntimeInsightBank,
+  RuntimeInterviewState
+- Same attribute names and state machine methods as the Pydantic schema, so
+  formatters and session_runtime turn functions work on either
+- No validation on construction; ids from a per-process RNG formatted as
+  uuid4 strings
+- to_runtime() / to_model() convert losslessly at persistence and API
+  boundaries (to_model builds with model_construct, skipping re-validation)
+- Each runtime object also has from_model() / to_model(), so a boundary
+  can convert only the objects it needs, e.g. exchange.to_model()
+
+ResponseAnalysis and InterviewConfig stay Pydantic models: the analysis is
+validated once when parsed from the LLM reply and is shared, not copied.
+"""
+
+import os
+import random
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from agents.interview_agent.state_schema import (
+    Exchange,
+    FollowUpReason,
+    Insight,
+    InsightBank,
+    InsightIndex,
+    InterviewConfig,
+    InterviewState,
+    InterviewStatus,
+    QuestionState,
+    QuestionStatus,
+    ResearchObjectiveStatus,
+    ResponseAnalysis,
+    TransitionReason,
+)
+from agents.interview_agent.tracing import traced
+
+# =============================================================================
+# IDS
+# =============================================================================
+
+_id_rng = random.Random(os.urandom(16))
+
+# uuid4 layout: version nibble 4, variant bits 10
+_UUID4_CLEAR = ~((0xF000 << 64) | (0xC << 60))
+_UUID4_SET = (0x4000 << 64) | (0x8 << 60)
+
+
+def new_id() -> str:
+    """Random uuid4-format id (not for secrets; ~2.5x cheaper than uuid4())."""
+    h = "%032x" % (_id_rng.getrandbits(128) & _UUID4_CLEAR | _UUID4_SET)
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _reseed_ids() -> None:
+    _id_rng.seed(os.urandom(16))
+
+
+# Forked workers must not repeat the parent's id sequence
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_ids)
+
+
+# =============================================================================
+# RUNTIME OBJECTS
+# =============================================================================
+
+
+@dataclass(slots=True)
+class RuntimeExchange:
+    """Runtime mirror of Exchange."""
+
+    question_text: str
+    is_follow_up: bool = False
+    follow_up_reason: Optional[FollowUpReason] = None
+    user_response: Optional[str] = None
+    response_timestamp: Optional[datetime] = None
+    response_analysis: Optional[ResponseAnalysis] = None
+    id: str = field(default_factory=new_id)
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    @classmethod
+    def from_model(cls, exchange: Exchange) -> "RuntimeExchange":
+        return cls(
+            question_text=exchange.question_text,
+            is_follow_up=exchange.is_follow_up,
+            follow_up_reason=exchange.follow_up_reason,
+            user_response=exchange.user_response,
+            response_timestamp=exchange.response_timestamp,
+            response_analysis=exchange.response_analysis,
+            id=exchange.id,
+            timestamp=exchange.timestamp,
+        )
+
+    def to_model(self) -> Exchange:
+        return Exchange.model_construct(
+            id=self.id,
+            timestamp=self.timestamp,
+            question_text=self.question_text,
+            is_follow_up=self.is_follow_up,
+            follow_up_reason=self.follow_up_reason,
+            user_response=self.user_response,
+            response_timestamp=self.response_timestamp,
+            response_analysis=self.response_analysis,
+        )
+
+
+@dataclass(slots=True)
+class RuntimeQuestion:
+    """Runtime mirror of QuestionState."""
+
+    id: str
+    order: int
+    base_question_text: str
+    research_objective: str
+    status: QuestionStatus = QuestionStatus.PENDING
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    objective_status: ResearchObjectiveStatus = ResearchObjectiveStatus.NOT_STARTED
+    exchanges: List[RuntimeExchange] = field(default_factory=list)
+    transition_reason: Optional[TransitionReason] = None
+    transition_message: Optional[str] = None
+    cumulative_insights: List[str] = field(default_factory=list)
+    follow_up_count: int = 0
+    max_follow_ups: int = 3
+
+    @traced()
+    def add_exchange(
+        self,
+        question_text: str,
+        is_follow_up: bool = False,
+        follow_up_reason: Optional[FollowUpReason] = None,
+    ) -> RuntimeExchange:
+        """Add a new exchange (question asked, awaiting response)."""
+        exchange = RuntimeExchange(question_text, is_follow_up, follow_up_reason)
+        self.exchanges.append(exchange)
+        if is_follow_up:
+            self.follow_up_count += 1
+        return exchange
+
+    @traced()
+    def record_response(self, response: str, analysis: ResponseAnalysis) -> None:
+        """Record user response and analysis for current exchange."""
+        if self.exchanges:
+            current = self.exchanges[-1]
+            current.user_response = response
+            current.response_timestamp = datetime.now()
+            current.response_analysis = analysis
+            self.cumulative_insights.extend(analysis.insights_extracted)
+            self.objective_status = analysis.objective_progress
+
+    @classmethod
+    def from_model(cls, question: QuestionState) -> "RuntimeQuestion":
+        return cls(
+            id=question.id,
+            order=question.order,
+            base_question_text=question.base_question_text,
+            research_objective=question.research_objective,
+            status=question.status,
+            started_at=question.started_at,
+            completed_at=question.completed_at,
+            objective_status=question.objective_status,
+            exchanges=[RuntimeExchange.from_model(e) for e in question.exchanges],
+            transition_reason=question.transition_reason,
+            transition_message=question.transition_message,
+            cumulative_insights=list(question.cumulative_insights),
+            follow_up_count=question.follow_up_count,
+            max_follow_ups=question.max_follow_ups,
+        )
+
+    def to_model(self) -> QuestionState:
+        return QuestionState.model_construct(
+            id=self.id,
+            order=self.order,
+            base_question_text=self.base_question_text,
+            research_objective=self.research_objective,
+            status=self.status,
+            started_at=self.started_at,
+            completed_at=self.completed_at,
+            objective_status=self.objective_status,
+            exchanges=[e.to_model() for e in self.exchanges],
+            transition_reason=self.transition_reason,
+            transition_message=self.transition_message,
+            cumulative_insights=list(self.cumulative_insights),
+            follow_up_count=self.follow_up_count,
+            max_follow_ups=self.max_follow_ups,
+        )
+
+
+@dataclass(slots=True)
+class RuntimeInsight:
+    """Runtime mirror of Insight."""
+
+    content: str
+    source_question_id: str
+    source_exchange_id: str
+    category: Optional[str] = None
+    importance: str = "medium"
+    related_insight_ids: List[str] = field(default_factory=list)
+    id: str = field(default_factory=new_id)
+    extracted_at: datetime = field(default_factory=datetime.now)
+
+    @classmethod
+    def from_model(cls, insight: Insight) -> "RuntimeInsight":
+        return cls(
+            content=insight.content,
+            source_question_id=insight.source_question_id,
+            source_exchange_id=insight.source_exchange_id,
+            category=insight.category,
+            importance=insight.importance,
+            related_insight_ids=list(insight.related_insight_ids),
+            id=insight.id,
+            extracted_at=insight.extracted_at,
+        )
+
+    def to_model(self) -> Insight:
+        return Insight.model_construct(
+            id=self.id,
+            content=self.content,
+            source_question_id=self.source_question_id,
+            source_exchange_id=self.source_exchange_id,
+            extracted_at=self.extracted_at,
+            category=self.category,
+            importance=self.importance,
+            related_insight_ids=list(self.related_insight_ids),
+        )
+
+
+@dataclass(slots=True)
+class RuntimeInsightBank:
+    """Runtime mirror of InsightBank (same lookup indexes)."""
+
+    insights: List[RuntimeInsight] = field(default_factory=list)
+    by_category: Dict[str, List[str]] = field(default_factory=dict)
+    by_question: Dict[str, List[str]] = field(default_factory=dict)
+    summary: Optional[str] = None
+    last_summary_at: Optional[datetime] = None
+    _index: InsightIndex = field(
+        default_factory=InsightIndex, repr=False, compare=False
+    )
+
+    @traced()
+    def add_insight(
+        self,
+        content: str,
+        source_question_id: str,
+        source_exchange_id: str,
+        category: Optional[str] = None,
+        importance: str = "medium",
+    ) -> RuntimeInsight:
+        """Add a new insight and update indexes."""
+        insight = RuntimeInsight(
+            content, source_question_id, source_exchange_id, category, importance
+        )
+        self.insights.append(insight)
+        self._index.sync(self.insights)
+        if category:
+            self.by_category.setdefault(category, []).append(insight.id)
+        self.by_question.setdefault(source_question_id, []).append(insight.id)
+        return insight
+
+    # Queries only touch `insights` and `_index`: share InsightBank's code
+    reindex = InsightBank.reindex
+    get_high_importance = InsightBank.get_high_importance
+    get_by_id = InsightBank.get_by_id
+    get_by_importance = InsightBank.get_by_importance
+    get_related = InsightBank.get_related
+    top_insights = InsightBank.top_insights
+
+    @classmethod
+    def from_model(cls, bank: InsightBank) -> "RuntimeInsightBank":
+        return cls(
+            insights=[RuntimeInsight.from_model(i) for i in bank.insights],
+            by_category={k: list(v) for k, v in bank.by_category.items()},
+            by_question={k: list(v) for k, v in bank.by_question.items()},
+            summary=bank.summary,
+            last_summary_at=bank.last_summary_at,
+        )
+
+    def to_model(self) -> InsightBank:
+        return InsightBank.model_construct(
+            insights=[i.to_model() for i in self.insights],
+            by_category={k: list(v) for k, v in self.by_category.items()},
+            by_question={k: list(v) for k, v in self.by_question.items()},
+            summary=self.summary,
+            last_summary_at=self.last_summary_at,
+        )
+
+
+@dataclass(slots=True)
+class RuntimeInterviewState:
+    """Runtime mirror of InterviewState."""
+
+    title: str
+    context: str
+    session_id: str = field(default_factory=new_id)
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+    status: InterviewStatus = InterviewStatus.INITIALIZING
+    config: InterviewConfig = field(default_factory=InterviewConfig)
+    questions: List[RuntimeQuestion] = field(default_factory=list)
+    current_question_index: int = 0
+    insight_bank: RuntimeInsightBank = field(default_factory=RuntimeInsightBank)
+    total_questions: int = 0
+    completed_questions: int = 0
+    total_exchanges: int = 0
+    # A list, or a bounded ConversationHistory container (shared, not copied)
+    conversation_history: Any = field(default_factory=list)
+    termination_reason: Optional[str] = None
+    completed_at: Optional[datetime] = None
+
+    def get_current_question(self) -> Optional[RuntimeQuestion]:
+        """Get the current active question."""
+        if 0 <= self.current_question_index < len(self.questions):
+            return self.questions[self.current_question_index]
+        return None
+
+    @traced()
+    def advance_to_next_question(self) -> Optional[RuntimeQuestion]:
+        """Move to the next question. Returns None if interview complete."""
+        self.current_question_index += 1
+        self.completed_questions += 1
+        return self.get_current_question()
+
+    @traced()
+    def record_exchange(self, role: str, content: str) -> None:
+        """Add to conversation history for context."""
+        now = datetime.now()
+        self.conversation_history.append(
+            {"role": role, "content": content, "timestamp": now.isoformat()}
+        )
+        self.total_exchanges += 1
+        self.updated_at = now
+
+    def is_complete(self) -> bool:
+        """Check if interview is finished."""
+        return self.current_question_index >= len(self.questions) or self.status in (
+            InterviewStatus.COMPLETED,
+            InterviewStatus.FAILED,
+        )
+
+    def calculate_progress(self) -> float:
+        """Calculate completion percentage."""
+        if self.total_questions == 0:
+            return 0.0
+        return (self.completed_questions / self.total_questions) * 100
+
+    @traced()
+    def atomic_update(self) -> None:
+        """
+        Mark state as updated (persist with to_model at the boundary).
+
+        Unlike InterviewState.atomic_update() there is no StateJournal to
+        sync: journals track Pydantic states, and SessionManager refuses
+        journal-bound states when hosting runtime models.
+        """
+        self.updated_at = datetime.now()
+
+    @classmethod
+    def from_model(cls, state: InterviewState) -> "RuntimeInterviewState":
+        """
+        Lossless copy of `state`. ResponseAnalysis, InterviewConfig and
+        history entries are shared with the source; lists are copied.
+        """
+        return cls(
+            title=state.title,
+            context=state.context,
+            session_id=state.session_id,
+            created_at=state.created_at,
+            updated_at=state.updated_at,
+            status=state.status,
+            config=state.config,
+            questions=[RuntimeQuestion.from_model(q) for q in state.questions],
+            current_question_index=state.current_question_index,
+            insight_bank=RuntimeInsightBank.from_model(state.insight_bank),
+            total_questions=state.total_questions,
+            completed_questions=state.completed_questions,
+            total_exchanges=state.total_exchanges,
+            conversation_history=_copy_history(state.conversation_history),
+            termination_reason=state.termination_reason,
+            completed_at=state.completed_at,
+        )
+
+    def to_model(self) -> InterviewState:
+        """
+        Lossless InterviewState built with model_construct: runtime objects
+        only ever hold values the schema accepts, so validating again would
+        be wasted work.
+        """
+        return InterviewState.model_construct(
+            session_id=self.session_id,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            title=self.title,
+            context=self.context,
+            status=self.status,
+            config=self.config,
+            questions=[q.to_model() for q in self.questions],
+            current_question_index=self.current_question_index,
+            insight_bank=self.insight_bank.to_model(),
+            total_questions=self.total_questions,
+            completed_questions=self.completed_questions,
+            total_exchanges=self.total_exchanges,
+            conversation_history=_copy_history(self.conversation_history),
+            termination_reason=self.termination_reason,
+            completed_at=self.completed_at,
+        )
+
+
+def _copy_history(history: Any) -> Any:
+    """Copy plain lists; bounded ConversationHistory containers are shared."""
+    return list(history) if isinstance(history, list) else history
+
+
+# =============================================================================
+# CONVERSION
+# =============================================================================
+
+
+def to_runtime(state: InterviewState) -> RuntimeInterviewState:
+    """Convert a Pydantic InterviewState into runtime objects."""
+    return RuntimeInterviewState.from_model(state)
+
+
+def to_model(runtime: RuntimeInterviewState) -> InterviewState:
+    """Convert runtime objects back into a Pydantic InterviewState."""
+    return runtime.to_model()
+
+
+def create_runtime_state(
+    title: str,
+    context: str,
+    questions: List[Dict[str, Any]],
+    config: Optional[InterviewConfig] = None,
+) -> RuntimeInterviewState:
+    """Runtime counterpart of create_interview_state (same arguments)."""
+    max_follow_ups = config.max_follow_ups_per_question if config else 3
+    question_states = [
+        RuntimeQuestion(
+            id=q["id"],
+            order=q["order"],
+            base_question_text=q["base_question_text"],
+            research_objective=q["research_objective"],
+            max_follow_ups=max_follow_ups,
+        )
+        for q in sorted(questions, key=lambda x: x["order"])
+    ]
+    return RuntimeInterviewState(
+        title=title,
+        context=context,
+        questions=question_states,
+        total_questions=len(question_states),
+        config=config or InterviewConfig(),
+    )
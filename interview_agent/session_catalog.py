@@ -0,0 +1,597 @@
+"""
+Session Catalog: SQLite Index over agents/sessions
+
+Finds workflow sessions without globbing and parsing every JSON file:
+- One SQLite database indexes each session's state.json (phases, links),
+  plan.json (checkpoints) and dev-notes.json (note categories)
+- refresh() stats the tracked files and reparses only those whose
+  mtime/size changed and whose content digest differs
+- Queries: sessions by current phase or phase status, children of a
+  session, checkpoints by status, dev notes by category
+
+Sessions are keyed by directory name. The database is a rebuildable cache:
+a schema version change simply reindexes everything.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from agents.interview_agent.state_loader import WORKFLOW_SESSIONS_DIR
+
+try:  # optional faster JSON backend
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+CATALOG_FILENAME = ".session_catalog.sqlite"
+
+# Indexed files per session directory -> kind
+SESSION_FILES = {
+    "state.json": "state",
+    "plan.json": "plan",
+    "dev-notes.json": "dev_notes",
+}
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE files (
+    path TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    error TEXT
+);
+CREATE TABLE sessions (
+    session_id TEXT PRIMARY KEY,
+    topic TEXT,
+    description TEXT,
+    granularity TEXT,
+    current_phase TEXT,
+    parent_session TEXT,
+    prior_session TEXT,
+    build_status TEXT,
+    created_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX sessions_current_phase ON sessions (current_phase);
+CREATE INDEX sessions_parent ON sessions (parent_session);
+CREATE INDEX sessions_prior ON sessions (prior_session);
+CREATE TABLE phases (
+    session_id TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    status TEXT,
+    started_at TEXT,
+    ended_at TEXT,
+    PRIMARY KEY (session_id, phase)
+);
+CREATE INDEX phases_status ON phases (phase, status);
+CREATE TABLE completed_checkpoints (
+    session_id TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    PRIMARY KEY (session_id, checkpoint_id)
+);
+CREATE TABLE checkpoints (
+    session_id TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    title TEXT,
+    status TEXT,
+    prerequisites TEXT NOT NULL,
+    PRIMARY KEY (session_id, checkpoint_id)
+);
+CREATE INDEX checkpoints_status ON checkpoints (status);
+CREATE TABLE dev_notes (
+    session_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    note_id TEXT,
+    category TEXT,
+    scope_type TEXT,
+    scope_ref TEXT,
+    timestamp TEXT,
+    PRIMARY KEY (session_id, position)
+);
+CREATE INDEX dev_notes_category ON dev_notes (category);
+"""
+
+# Tables holding rows derived from each file kind
+_KIND_TABLES = {
+    "state": ("sessions", "phases", "completed_checkpoints"),
+    "plan": ("checkpoints",),
+    "dev_notes": ("dev_notes",),
+}
+
+
+# =============================================================================
+# RECORDS
+# =============================================================================
+
+
+class SessionRecord(BaseModel):
+    """One indexed session (from its state.json)."""
+
+    session_id: str
+    topic: Optional[str] = None
+    description: Optional[str] = None
+    granularity: Optional[str] = None
+    current_phase: Optional[str] = None
+    parent_session: Optional[str] = None
+    prior_session: Optional[str] = None
+    build_status: Optional[str] = None  # plan_state.status
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+
+class CheckpointRecord(BaseModel):
+    """One plan.json checkpoint."""
+
+    session_id: str
+    checkpoint_id: str
+    title: Optional[str] = None
+    status: Optional[str] = None  # as written in plan.json
+    prerequisites: List[str] = []
+    completed: bool = False  # listed in state.json plan_state
+
+
+class DevNoteRecord(BaseModel):
+    """One dev-notes.json entry (metadata only)."""
+
+    session_id: str
+    note_id: Optional[str] = None
+    category: Optional[str] = None
+    scope_type: Optional[str] = None
+    scope_ref: Optional[str] = None
+    timestamp: Optional[str] = None
+
+
+class RefreshStats(BaseModel):
+    """Outcome of one refresh()."""
+
+    files: int = 0  # tracked files found on disk
+    unchanged: int = 0  # same mtime and size
+    touched: int = 0  # mtime/size changed, same content digest
+    reparsed: int = 0
+    removed: int = 0
+    errors: Dict[str, str] = {}  # path -> parse error
+    elapsed_seconds: float = 0.0
+
+
+# =============================================================================
+# SESSION CATALOG
+# =============================================================================
+
+
+class SessionCatalog:
+    """
+    SQLite index of the sessions under one root.
+
+        with SessionCatalog() as catalog:
+            catalog.refresh()
+            building = catalog.sessions(current_phase="build")
+            children = catalog.children("2026-01-12_agent-session-overhaul_k9m2x7")
+
+    Queries read the index as of the last refresh().
+    """
+
+    def __init__(
+        self,
+        root: Path = WORKFLOW_SESSIONS_DIR,
+        db_path: Optional[Path] = None,
+    ):
+        """
+        Args:
+            root: Sessions directory (<root>/<session>/state.json, ...)
+            db_path: SQLite file (default: <root>/.session_catalog.sqlite;
+                ":memory:" for a throwaway index)
+        """
+        self.root = Path(root)
+        self.db_path = db_path if db_path is not None else self.root / CATALOG_FILENAME
+        self._db = sqlite3.connect(str(self.db_path))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        if self._db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._reset_schema()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "SessionCatalog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ==========================================================================
+    # Refresh
+    # ==========================================================================
+
+    def refresh(self) -> RefreshStats:
+        """
+        Bring the index up to date with the files on disk.
+
+        Every tracked file is stat'ed; only files whose mtime or size changed
+        are read, and only those whose content digest changed are reparsed.
+        Runs in one transaction.
+        """
+        start = time.perf_counter()
+        files = unchanged = touched = reparsed = 0
+        errors: Dict[str, str] = {}
+        known = {
+            row[0]: row[1:]
+            for row in self._db.execute(
+                "SELECT path, session_id, kind, mtime_ns, size, digest FROM files"
+            )
+        }
+
+        with self._db:
+            for session_id, kind, path, stat in self._scan():
+                files += 1
+                entry = known.pop(path, None)
+                if entry is not None and (entry[2], entry[3]) == (
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                ):
+                    unchanged += 1
+                    continue
+                try:
+                    with open(path, "rb") as f:
+                        data = f.read()
+                except OSError as exc:
+                    errors[path] = str(exc)
+                    continue
+                digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+                if entry is not None and entry[4] == digest:
+                    touched += 1
+                    self._db.execute(
+                        "UPDATE files SET mtime_ns = ?, size = ? WHERE path = ?",
+                        (stat.st_mtime_ns, stat.st_size, path),
+                    )
+                    continue
+
+                reparsed += 1
+                error = self._index_file(session_id, kind, data)
+                if error is not None:
+                    errors[path] = error
+                self._db.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        path,
+                        session_id,
+                        kind,
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                        digest,
+                        error,
+                    ),
+                )
+
+            # Files that disappeared since the last refresh
+            for path, (session_id, kind, *_) in known.items():
+                self._delete_rows(session_id, kind)
+                self._db.execute("DELETE FROM files WHERE path = ?", (path,))
+
+        return RefreshStats(
+            files=files,
+            unchanged=unchanged,
+            touched=touched,
+            reparsed=reparsed,
+            removed=len(known),
+            errors=errors,
+            elapsed_seconds=time.perf_counter() - start,
+        )
+
+    def _scan(self) -> Iterable[Tuple[str, str, str, os.stat_result]]:
+        """(session_id, kind, path, stat) for every tracked file on disk."""
+        if not self.root.is_dir():
+            return
+        root = str(self.root)
+        with os.scandir(root) as entries:
+            directories = sorted(
+                entry.name
+                for entry in entries
+                if entry.is_dir() and not entry.name.startswith(".")
+            )
+        # Plain string paths: pathlib joins dominate a no-change refresh
+        for session_id in directories:
+            directory = os.path.join(root, session_id)
+            for filename, kind in SESSION_FILES.items():
+                path = os.path.join(directory, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield session_id, kind, path, stat
+
+    def _index_file(self, session_id: str, kind: str, data: bytes) -> Optional[str]:
+        """Replace the rows derived from one file; returns a parse error."""
+        self._delete_rows(session_id, kind)
+        try:
+            document = _json_loads(data)
+            if not isinstance(document, dict):
+                kind_name = type(document).__name__
+                raise ValueError(f"expected a JSON object, got {kind_name}")
+            if kind == "state":
+                self._index_state(session_id, document)
+            elif kind == "plan":
+                self._index_plan(session_id, document)
+            else:
+                self._index_dev_notes(session_id, document)
+        except (ValueError, TypeError, AttributeError) as exc:
+            self._delete_rows(session_id, kind)
+            return f"{type(exc).__name__}: {exc}"
+        return None
+
+    def _index_state(self, session_id: str, state: Dict[str, Any]) -> None:
+        plan_state = state.get("plan_state") or {}
+        self._db.execute(
+            "INSERT INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                session_id,
+                _text(state.get("topic")),
+                _text(state.get("description")),
+                _text(state.get("granularity")),
+                _text(state.get("current_phase")),
+                _text(state.get("parent_session")),
+                _text(state.get("prior_session")),
+                _text(plan_state.get("status")),
+                _text(state.get("created_at")),
+                _text(state.get("updated_at")),
+            ),
+        )
+        phases = state.get("phases") or {}
+        self._db.executemany(
+            "INSERT INTO phases VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    session_id,
+                    phase,
+                    _text(info.get("status")),
+                    _text(info.get("started_at")),
+                    _text(info.get("finalized_at") or info.get("completed_at")),
+                )
+                for phase, info in phases.items()
+                if isinstance(info, dict)
+            ],
+        )
+        self._db.executemany(
+            "INSERT OR IGNORE INTO completed_checkpoints VALUES (?, ?)",
+            [
+                (session_id, str(checkpoint_id))
+                for checkpoint_id in plan_state.get("checkpoints_completed") or ()
+            ],
+        )
+
+    def _index_plan(self, session_id: str, plan: Dict[str, Any]) -> None:
+        self._db.executemany(
+            "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    session_id,
+                    str(checkpoint.get("id", position)),
+                    position,
+                    _text(checkpoint.get("title")),
+                    _text(checkpoint.get("status")),
+                    json.dumps(
+                        [str(p) for p in checkpoint.get("prerequisites") or ()]
+                    ),
+                )
+                for position, checkpoint in enumerate(plan.get("checkpoints") or ())
+            ],
+        )
+
+    def _index_dev_notes(self, session_id: str, notes: Dict[str, Any]) -> None:
+        rows = []
+        for position, note in enumerate(notes.get("notes") or ()):
+            scope = note.get("scope") or {}
+            rows.append(
+                (
+                    session_id,
+                    position,
+                    _text(note.get("id")),
+                    _text(note.get("category")),
+                    _text(scope.get("type")),
+                    _text(scope.get("ref")),
+                    _text(note.get("timestamp")),
+                )
+            )
+        self._db.executemany("INSERT INTO dev_notes VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def _delete_rows(self, session_id: str, kind: str) -> None:
+        for table in _KIND_TABLES[kind]:
+            self._db.execute(f"DELETE FROM {table} WHERE session_id = ?", (session_id,))
+
+    def _reset_schema(self) -> None:
+        with self._db:
+            tables = [
+                row[0]
+                for row in self._db.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                )
+            ]
+            for table in tables:
+                self._db.execute(f"DROP TABLE {table}")
+            self._db.executescript(_SCHEMA)
+            self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    # ==========================================================================
+    # Queries
+    # ==========================================================================
+
+    def get(self, session_id: str) -> Optional[SessionRecord]:
+        """One session by directory name (None if it has no state.json)."""
+        found = self.sessions(session_ids=[session_id])
+        return found[0] if found else None
+
+    def sessions(
+        self,
+        current_phase: Optional[str] = None,
+        phase: Optional[str] = None,
+        phase_status: Optional[str] = None,
+        parent_session: Optional[str] = None,
+        prior_session: Optional[str] = None,
+        session_ids: Optional[List[str]] = None,
+    ) -> List[SessionRecord]:
+        """
+        Sessions matching every given filter, ordered by session id.
+
+        Args:
+            current_phase: state.json current_phase ("spec", "build", ...)
+            phase: With phase_status, a key of state.json phases
+            phase_status: phases.<phase>.status (e.g. "in_progress"); without
+                `phase`, matches any phase
+            parent_session: Sessions whose parent_session is this id
+            prior_session: Sessions whose prior_session is this id
+            session_ids: Restrict to these sessions
+        """
+        clauses = []
+        params: List[Any] = []
+        for column, value in (
+            ("current_phase", current_phase),
+            ("parent_session", parent_session),
+            ("prior_session", prior_session),
+        ):
+            if value is not None:
+                clauses.append(f"s.{column} = ?")
+                params.append(value)
+        if phase is not None or phase_status is not None:
+            condition = "p.session_id = s.session_id"
+            if phase is not None:
+                condition += " AND p.phase = ?"
+                params.append(phase)
+            if phase_status is not None:
+                condition += " AND p.status = ?"
+                params.append(phase_status)
+            clauses.append(f"EXISTS (SELECT 1 FROM phases p WHERE {condition})")
+        if session_ids is not None:
+            clauses.append(f"s.session_id IN ({', '.join('?' * len(session_ids))})")
+            params.extend(session_ids)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._db.execute(
+            f"SELECT * FROM sessions s{where} ORDER BY s.session_id", params
+        )
+        names = [column[0] for column in rows.description]
+        return [SessionRecord(**dict(zip(names, row))) for row in rows]
+
+    def children(
+        self, session_id: str, include_prior: bool = True
+    ) -> List[SessionRecord]:
+        """
+        Sessions descending from `session_id`, ordered by session id.
+
+        Args:
+            session_id: Parent session directory name
+            include_prior: Also count sessions continuing it (prior_session)
+        """
+        found = self.sessions(parent_session=session_id)
+        if include_prior:
+            found += self.sessions(prior_session=session_id)
+            found = sorted(
+                {record.session_id: record for record in found}.values(),
+                key=lambda record: record.session_id,
+            )
+        return found
+
+    def phase_statuses(self, session_id: str) -> Dict[str, Optional[str]]:
+        """phase -> status for one session."""
+        rows = self._db.execute(
+            "SELECT phase, status FROM phases WHERE session_id = ?", (session_id,)
+        )
+        return dict(rows.fetchall())
+
+    def checkpoints(
+        self,
+        session_id: Optional[str] = None,
+        status: Optional[str] = None,
+        completed: Optional[bool] = None,
+    ) -> List[CheckpointRecord]:
+        """
+        Plan checkpoints, in plan order per session.
+
+        Args:
+            session_id: Only this session's plan
+            status: plan.json checkpoint status
+            completed: Filter on state.json plan_state.checkpoints_completed
+        """
+        clauses = []
+        params: List[Any] = []
+        if session_id is not None:
+            clauses.append("c.session_id = ?")
+            params.append(session_id)
+        if status is not None:
+            clauses.append("c.status = ?")
+            params.append(status)
+        if completed is not None:
+            clauses.append(f"d.checkpoint_id IS {'NOT ' if completed else ''}NULL")
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._db.execute(
+            "SELECT c.session_id, c.checkpoint_id, c.title, c.status, "
+            "c.prerequisites, d.checkpoint_id IS NOT NULL "
+            "FROM checkpoints c LEFT JOIN completed_checkpoints d "
+            "ON d.session_id = c.session_id AND d.checkpoint_id = c.checkpoint_id"
+            f"{where} ORDER BY c.session_id, c.position",
+            params,
+        )
+        return [
+            CheckpointRecord(
+                session_id=row[0],
+                checkpoint_id=row[1],
+                title=row[2],
+                status=row[3],
+                prerequisites=json.loads(row[4]),
+                completed=bool(row[5]),
+            )
+            for row in rows
+        ]
+
+    def dev_notes(
+        self, session_id: Optional[str] = None, category: Optional[str] = None
+    ) -> List[DevNoteRecord]:
+        """Dev-note metadata, in file order per session."""
+        clauses = []
+        params: List[Any] = []
+        for column, value in (("session_id", session_id), ("category", category)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._db.execute(
+            "SELECT session_id, note_id, category, scope_type, scope_ref, timestamp "
+            f"FROM dev_notes{where} ORDER BY session_id, position",
+            params,
+        )
+        names = [column[0] for column in rows.description]
+        return [DevNoteRecord(**dict(zip(names, row))) for row in rows]
+
+    def note_categories(self, session_id: Optional[str] = None) -> Dict[str, int]:
+        """Dev-note category -> count (optionally for one session)."""
+        query = "SELECT category, COUNT(*) FROM dev_notes"
+        params: Tuple[Any, ...] = ()
+        if session_id is not None:
+            query += " WHERE session_id = ?"
+            params = (session_id,)
+        rows = self._db.execute(query + " GROUP BY category ORDER BY category", params)
+        return {category: count for category, count in rows if category is not None}
+
+    def errors(self) -> Dict[str, str]:
+        """path -> parse error for files that failed at their last reparse."""
+        rows = self._db.execute("SELECT path, error FROM files WHERE error IS NOT NULL")
+        return dict(rows.fetchall())
+
+
+def _text(value: Any) -> Optional[str]:
+    """Store scalars as text; nested values as compact JSON."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"))
+    return str(value)
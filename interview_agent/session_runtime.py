@@ -0,0 +1,604 @@
+"""
+Multi-Session Interview Runtime
+
+Hosts many InterviewState sessions in one asyncio process:
+- Turns within a session are serialized; sessions run concurrently
+- Pluggable async LLM client (FakeLLMClient for tests and load tests)
+- Per-model concurrency limits for analysis_model / transition_model calls
+- Backpressure: a bounded number of in-flight turns per process
+
+A turn follows the agent workflow: analyze the response, decide, produce
+the next question (follow-up or transition), then update state. State is
+only changed once every model call of the turn has succeeded, so a failed
+turn leaves the session as it was and can be retried.
+"""
+
+import asyncio
+import json
+import re
+import time
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
+
+from pydantic import BaseModel
+
+from agents.interview_agent.runtime_models import (
+    RuntimeInterviewState,
+    to_model,
+    to_runtime,
+)
+from agents.interview_agent.state_schema import (
+    FollowUpReason,
+    InterviewState,
+    InterviewStatus,
+    QuestionStatus,
+    ResearchObjectiveStatus,
+    ResponseAnalysis,
+    TransitionReason,
+)
+from agents.interview_agent.tracing import span
+from agents.interview_agent.user_prompt_formatter import (
+    format_followup_generator_prompt,
+    format_response_analyzer_prompt,
+    format_transition_generator_prompt,
+)
+
+# Sent instead of a transition question once the last question is done
+COMPLETION_MESSAGE = "Thank you for your time - that completes our interview."
+
+
+class SessionNotFoundError(KeyError):
+    """Raised when a turn targets a session the manager does not host."""
+
+
+class SessionStateError(RuntimeError):
+    """Raised when a session cannot take a turn (not started or completed)."""
+
+
+# =============================================================================
+# LLM CLIENTS
+# =============================================================================
+
+
+class LLMClient(Protocol):
+    """Async completion interface used for every model call."""
+
+    async def complete(self, model: str, prompt: str) -> str:
+        """Return the model's completion for `prompt`."""
+        ...
+
+
+class StreamingLLMClient(LLMClient, Protocol):
+    """LLMClient that can also stream a completion as text chunks."""
+
+    def stream(self, model: str, prompt: str) -> AsyncIterator[str]:
+        """Yield the model's completion for `prompt` as it is generated."""
+        ...
+
+
+class FakeLLMClient:
+    """
+    Deterministic offline client.
+
+    Analysis prompts get a ResponseAnalysis JSON that recommends a follow-up
+    until `follow_ups_per_question` follow-ups were asked; generation prompts
+    get a short canned question.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        follow_ups_per_question: int = 1,
+        insights_per_analysis: int = 1,
+        stream_chunk_chars: int = 16,
+    ):
+        """
+        Args:
+            latency: Simulated seconds per call (spread over chunks by stream())
+            follow_ups_per_question: Follow-ups to request before transitioning
+            insights_per_analysis: Insights listed in each analysis reply
+            stream_chunk_chars: Characters per chunk yielded by stream()
+        """
+        self.latency = latency
+        self.follow_ups_per_question = follow_ups_per_question
+        self.insights_per_analysis = insights_per_analysis
+        self.stream_chunk_chars = stream_chunk_chars
+        self.calls: Dict[str, int] = {}
+
+    async def complete(self, model: str, prompt: str) -> str:
+        self.calls[model] = self.calls.get(model, 0) + 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._reply(prompt)
+
+    async def stream(self, model: str, prompt: str) -> AsyncIterator[str]:
+        self.calls[model] = self.calls.get(model, 0) + 1
+        reply = self._reply(prompt)
+        size = self.stream_chunk_chars
+        chunks = [reply[i : i + size] for i in range(0, len(reply), size)]
+        for chunk in chunks:
+            if self.latency:
+                await asyncio.sleep(self.latency / len(chunks))
+            yield chunk
+
+    def _reply(self, prompt: str) -> str:
+        if "Return a ResponseAnalysis JSON object" in prompt:
+            match = re.search(r"<follow_up_count>(\d+)</follow_up_count>", prompt)
+            follow_ups = int(match.group(1)) if match else 0
+            follow_up = follow_ups < self.follow_ups_per_question
+            analysis = {
+                "objective_progress": "partial" if follow_up else "satisfied",
+                "insights_extracted": [
+                    f"Insight {n + 1} after {follow_ups} follow-ups"
+                    for n in range(self.insights_per_analysis)
+                ],
+                "recommendation": "follow_up" if follow_up else "transition",
+                "recommendation_reason": "Fake analysis",
+                "confidence": 0.9,
+            }
+            if "starting with objective_progress and recommendation" in prompt:
+                # Decision fields first, as the streaming prompt asks
+                recommendation = analysis.pop("recommendation")
+                analysis = {
+                    "objective_progress": analysis.pop("objective_progress"),
+                    "recommendation": recommendation,
+                    **analysis,
+                }
+            return json.dumps(analysis)
+        if "<next_question>" in prompt:
+            return "Thanks, that's helpful. Next question coming up."
+        return "Could you tell me more about that?"
+
+
+class ConcurrencyLimitedClient:
+    """Wraps an LLMClient with a semaphore per model name."""
+
+    def __init__(
+        self,
+        client: LLMClient,
+        model_limits: Optional[Dict[str, int]] = None,
+        default_limit: int = 16,
+    ):
+        """
+        Args:
+            client: Underlying client
+            model_limits: Max concurrent calls per model name
+            default_limit: Limit for models not listed in model_limits
+        """
+        self.client = client
+        self.model_limits = model_limits or {}
+        self.default_limit = default_limit
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def complete(self, model: str, prompt: str) -> str:
+        async with self._semaphore(model):
+            with span("model.call", model=model, prompt_chars=len(prompt)):
+                return await self.client.complete(model, prompt)
+
+    async def stream(self, model: str, prompt: str) -> AsyncIterator[str]:
+        """Stream through the wrapped client, holding the model's slot."""
+        async with self._semaphore(model):
+            async for chunk in self.client.stream(model, prompt):
+                yield chunk
+
+    def _semaphore(self, model: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(model)
+        if semaphore is None:
+            limit = self.model_limits.get(model, self.default_limit)
+            semaphore = self._semaphores[model] = asyncio.Semaphore(limit)
+        return semaphore
+
+
+# =============================================================================
+# TURN EXECUTION
+# =============================================================================
+
+
+class TurnResult(BaseModel):
+    """Outcome of one interview turn."""
+
+    session_id: str
+    action: str  # "follow_up", "transition" or "complete"
+    assistant_message: str
+    analysis: Optional[ResponseAnalysis] = None
+    latency_seconds: float = 0.0
+
+
+def start_interview(state: InterviewState) -> str:
+    """
+    Ask the first question (no model call needed).
+
+    Returns:
+        The first question text, or "" for an empty interview
+    """
+    state.status = InterviewStatus.IN_PROGRESS
+    question = state.get_current_question()
+    if not question:
+        return ""
+    question.status = QuestionStatus.ACTIVE
+    question.add_exchange(question.base_question_text)
+    state.record_exchange("assistant", question.base_question_text)
+    state.atomic_update()
+    return question.base_question_text
+
+
+async def analyze_response(
+    state: InterviewState, user_response: str, client: LLMClient
+) -> ResponseAnalysis:
+    """Run the response analyzer call for the current question."""
+    reply = await client.complete(
+        state.config.analysis_model, analyzer_prompt(state, user_response)
+    )
+    return ResponseAnalysis.model_validate_json(reply)
+
+
+def analyzer_prompt(
+    state: InterviewState, user_response: str, decision_fields_first: bool = False
+) -> str:
+    """
+    Build the response analyzer prompt for the current question.
+
+    Args:
+        decision_fields_first: Ask for objective_progress and recommendation
+            first (streaming analysis only)
+    """
+    question = state.get_current_question()
+    return format_response_analyzer_prompt(
+        research_objective=question.research_objective,
+        question_asked=question.exchanges[-1].question_text,
+        user_response=user_response,
+        exchange_history=question.exchanges,
+        follow_up_count=question.follow_up_count,
+        max_follow_ups=question.max_follow_ups,
+        decision_fields_first=decision_fields_first,
+    )
+
+
+def wants_follow_up(state: InterviewState, analysis: ResponseAnalysis) -> bool:
+    """
+    Decide the next action from the analysis (does not change state).
+
+    Returns:
+        True if the next action is a follow-up, False to transition
+    """
+    question = state.get_current_question()
+    return (
+        analysis.recommendation == "follow_up"
+        and question.follow_up_count < question.max_follow_ups
+    )
+
+
+def apply_analysis(
+    state: InterviewState, user_response: str, analysis: ResponseAnalysis
+) -> bool:
+    """
+    Record the response and analysis, then decide the next action.
+
+    Turn runners call this only after the next message has been generated,
+    so a failed model call never leaves a half-applied turn behind.
+
+    Returns:
+        wants_follow_up(state, analysis)
+    """
+    question = state.get_current_question()
+    exchange = question.exchanges[-1]
+    question.record_response(user_response, analysis)
+    state.record_exchange("user", user_response)
+    for content in analysis.insights_extracted:
+        state.insight_bank.add_insight(content, question.id, exchange.id)
+
+    return wants_follow_up(state, analysis)
+
+
+def followup_prompt(state: InterviewState, user_response: str) -> str:
+    """Build the follow-up generator prompt for the current question."""
+    question = state.get_current_question()
+    return format_followup_generator_prompt(
+        research_objective=question.research_objective,
+        user_response=user_response,
+        follow_up_reason=FollowUpReason.OBJECTIVE_NOT_SATISFIED.value,
+        previous_follow_ups=[e.question_text for e in question.exchanges if e.is_follow_up],
+    )
+
+
+def transition_prompt(
+    state: InterviewState,
+    user_response: str,
+    transition_reason: TransitionReason,
+    key_insight: Optional[str] = None,
+) -> Optional[str]:
+    """Build the transition prompt towards the next question (None if last)."""
+    next_index = state.current_question_index + 1
+    if next_index >= len(state.questions):
+        return None
+    return format_transition_generator_prompt(
+        user_response=user_response,
+        transition_reason=transition_reason.value,
+        next_question=state.questions[next_index].base_question_text,
+        key_insight=key_insight,
+    )
+
+
+def apply_follow_up(state: InterviewState, follow_up_text: str) -> None:
+    """Ask a generated follow-up on the current question."""
+    question = state.get_current_question()
+    question.status = QuestionStatus.FOLLOW_UP
+    question.add_exchange(
+        follow_up_text,
+        is_follow_up=True,
+        follow_up_reason=FollowUpReason.OBJECTIVE_NOT_SATISFIED,
+    )
+    state.record_exchange("assistant", follow_up_text)
+    state.atomic_update()
+
+
+def apply_transition(
+    state: InterviewState,
+    analysis: ResponseAnalysis,
+    transition_text: Optional[str],
+) -> str:
+    """
+    Close the current question and ask the next one (or complete).
+
+    Returns:
+        "transition" or "complete"
+    """
+    question = state.get_current_question()
+    question.transition_reason = transition_reason_for(analysis)
+    question.transition_message = transition_text
+    question.status = QuestionStatus.SATISFIED
+    question.completed_at = question.exchanges[-1].response_timestamp
+
+    if transition_text:
+        state.record_exchange("assistant", transition_text)
+
+    next_question = state.advance_to_next_question()
+    if next_question is None:
+        state.status = InterviewStatus.COMPLETED
+        state.completed_at = question.completed_at
+        state.atomic_update()
+        return "complete"
+
+    next_question.status = QuestionStatus.ACTIVE
+    next_question.add_exchange(next_question.base_question_text)
+    state.atomic_update()
+    return "transition"
+
+
+def transition_reason_for(analysis: ResponseAnalysis) -> TransitionReason:
+    """Map an analysis to the reason we are leaving the question."""
+    if analysis.objective_progress in (
+        ResearchObjectiveStatus.SATISFIED,
+        ResearchObjectiveStatus.EXCEEDED,
+    ):
+        return TransitionReason.OBJECTIVE_SATISFIED
+    if analysis.recommendation == "follow_up":
+        return TransitionReason.MAX_FOLLOW_UPS
+    return TransitionReason.OBJECTIVE_SATISFIED
+
+
+def check_awaiting_response(state: InterviewState) -> None:
+    """
+    Check that the session has asked a question the user can answer.
+
+    Raises:
+        SessionStateError: If the interview is completed or not started
+    """
+    question = state.get_current_question()
+    if question is None:
+        raise SessionStateError(
+            f"session {state.session_id} has no current question "
+            f"(status: {state.status.value})"
+        )
+    if not question.exchanges:
+        raise SessionStateError(
+            f"session {state.session_id} has not asked question {question.id}; "
+            "call start_session() first"
+        )
+
+
+def _pending_exchange_id(state: InterviewState) -> Optional[str]:
+    """Id of the exchange the user is answering (the turn's trace key)."""
+    question = state.get_current_question()
+    if question and question.exchanges:
+        return question.exchanges[-1].id
+    return None
+
+
+async def run_turn(
+    state: InterviewState, user_response: str, client: LLMClient
+) -> TurnResult:
+    """
+    Process one user response sequentially: analyze, then generate.
+
+    Nothing is applied to `state` until the next message has been generated;
+    if a model call raises, the session is unchanged and the turn can be
+    retried.
+
+    Args:
+        state: Session state (mutated in place)
+        user_response: The participant's answer to the pending exchange
+        client: LLM client
+
+    Returns:
+        TurnResult with the next assistant message
+    """
+    analysis = await analyze_response(state, user_response, client)
+
+    if wants_follow_up(state, analysis):
+        text = await client.complete(
+            state.config.transition_model, followup_prompt(state, user_response)
+        )
+        apply_analysis(state, user_response, analysis)
+        apply_follow_up(state, text)
+        action = "follow_up"
+    else:
+        key_insight = analysis.insights_extracted[0] if analysis.insights_extracted else None
+        prompt = transition_prompt(
+            state, user_response, transition_reason_for(analysis), key_insight
+        )
+        text = (
+            await client.complete(state.config.transition_model, prompt)
+            if prompt
+            else COMPLETION_MESSAGE
+        )
+        apply_analysis(state, user_response, analysis)
+        action = apply_transition(state, analysis, text)
+
+    return TurnResult(
+        session_id=state.session_id,
+        action=action,
+        assistant_message=text,
+        analysis=analysis,
+    )
+
+
+TurnRunner = Callable[[InterviewState, str, LLMClient], Awaitable[TurnResult]]
+
+
+# =============================================================================
+# SESSION MANAGER
+# =============================================================================
+
+
+class SessionManager:
+    """
+    Owns many InterviewState sessions and runs their turns concurrently.
+
+    Each session has its own lock, so turns for one session are applied in
+    submission order while different sessions interleave freely. A global
+    semaphore bounds in-flight turns: once `max_pending_turns` are queued or
+    running, submit_turn() waits (backpressure on the caller).
+    """
+
+    def __init__(
+        self,
+        client: LLMClient,
+        model_limits: Optional[Dict[str, int]] = None,
+        max_pending_turns: int = 256,
+        turn_runner: TurnRunner = run_turn,
+        after_turn: Optional[Callable[[InterviewState], Awaitable[None]]] = None,
+        runtime_models: bool = False,
+    ):
+        """
+        Args:
+            client: LLM client shared by all sessions
+            model_limits: Max concurrent calls per model name
+            max_pending_turns: In-flight turn limit before callers wait
+            turn_runner: Turn implementation (run_turn by default)
+            after_turn: Optional async hook, e.g. to persist the state
+            runtime_models: Host sessions as slotted runtime objects
+                (runtime_models.py). get_session() and after_turn then see
+                a RuntimeInterviewState; use export_session() for a model.
+                Not combinable with StateJournal (persist via after_turn)
+        """
+        self.client = ConcurrencyLimitedClient(client, model_limits)
+        self.turn_runner = turn_runner
+        self.after_turn = after_turn
+        self.runtime_models = runtime_models
+        self._pending = asyncio.Semaphore(max_pending_turns)
+        self._sessions: Dict[str, InterviewState] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def add_session(self, state: InterviewState) -> str:
+        """
+        Host a session; returns its session_id.
+
+        Raises:
+            ValueError: With runtime_models, if `state` is bound to a
+                StateJournal (runtime objects are not journaled)
+        """
+        if self.runtime_models and isinstance(state, InterviewState):
+            if state._journal is not None and state._journal.state is state:
+                raise ValueError(
+                    f"session {state.session_id} is bound to a StateJournal, "
+                    "which runtime_models sessions would not update; host it "
+                    "with runtime_models=False or close the journal first"
+                )
+            state = to_runtime(state)
+        self._sessions[state.session_id] = state
+        self._locks[state.session_id] = asyncio.Lock()
+        return state.session_id
+
+    def remove_session(self, session_id: str) -> InterviewState:
+        """
+        Stop hosting a session and return its final state.
+
+        Turns already waiting for the session raise SessionNotFoundError.
+        """
+        state = self.get_session(session_id)
+        del self._sessions[session_id]
+        del self._locks[session_id]
+        return to_model(state) if isinstance(state, RuntimeInterviewState) else state
+
+    def export_session(self, session_id: str) -> InterviewState:
+        """A hosted session as an InterviewState (for persistence and APIs)."""
+        state = self.get_session(session_id)
+        return to_model(state) if isinstance(state, RuntimeInterviewState) else state
+
+    def get_session(self, session_id: str) -> InterviewState:
+        """Look up a hosted session."""
+        try:
+            return self._sessions[session_id]
+        except KeyError:
+            raise SessionNotFoundError(session_id) from None
+
+    def _hosted(self, session_id: str) -> Tuple[InterviewState, asyncio.Lock]:
+        """A hosted session and its turn lock, looked up together."""
+        try:
+            return self._sessions[session_id], self._locks[session_id]
+        except KeyError:
+            raise SessionNotFoundError(session_id) from None
+
+    def _check_still_hosted(self, session_id: str, state: InterviewState) -> None:
+        """Raise if the session was removed while a caller waited for it."""
+        if self._sessions.get(session_id) is not state:
+            raise SessionNotFoundError(session_id)
+
+    @property
+    def session_ids(self) -> List[str]:
+        return list(self._sessions)
+
+    async def start_session(self, session_id: str) -> str:
+        """Ask the first question of a hosted session."""
+        state, lock = self._hosted(session_id)
+        async with lock:
+            self._check_still_hosted(session_id, state)
+            return start_interview(state)
+
+    async def submit_turn(self, session_id: str, user_response: str) -> TurnResult:
+        """
+        Process a user response for one session.
+
+        Waits if too many turns are in flight (backpressure), then waits for
+        earlier turns of the same session to finish.
+
+        Raises:
+            SessionNotFoundError: If the session is not (or no longer) hosted
+            SessionStateError: If the session was not started or is completed
+        """
+        state, lock = self._hosted(session_id)
+        start = time.perf_counter()
+        async with self._pending:
+            async with lock:
+                self._check_still_hosted(session_id, state)
+                check_awaiting_response(state)
+                with span(
+                    "turn",
+                    session_id=session_id,
+                    exchange_id=_pending_exchange_id(state),
+                ):
+                    result = await self.turn_runner(state, user_response, self.client)
+                    if self.after_turn:
+                        with span("persist"):
+                            await self.after_turn(state)
+        result.latency_seconds = time.perf_counter() - start
+        return result
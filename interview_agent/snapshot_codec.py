@@ -0,0 +1,395 @@
+"""
+Binary Snapshot Codec for InterviewState
+
+Compact alternative to model_dump_json(indent=2) for state snapshots:
+- Every string (ids, enum values, text, dict keys) is stored once in a string
+  table and referenced by index
+- Timestamps are integer microseconds (plus the UTC offset when tz-aware)
+- Integers and floats are packed into typed arrays
+- Optional zlib / lzma compression of the whole payload
+- decode_snapshot(encode_snapshot(state)) dumps to the same JSON as state
+
+The layout is derived from the models' field annotations, so new fields are
+carried automatically; an unsupported annotation fails at import time.
+
+File layout:
+    b"IVSN" | version u8 | compression u8 | payload (optionally compressed)
+
+    payload = "<cIII" header (int typecode, #ints, #floats, #strings)
+              | string lengths (u32) | ints | floats | UTF-8 string blob
+"""
+
+import lzma
+import struct
+import sys
+import zlib
+from array import array
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+from agents.interview_agent.state_journal import atomic_write_bytes
+from agents.interview_agent.state_schema import InterviewState
+
+MAGIC = b"IVSN"
+VERSION = 1
+
+SNAPSHOT_BINARY_FILENAME = "state.bin"
+
+COMPRESSION_CODES = {None: 0, "zlib": 1, "lzma": 2}
+
+_HEADER = struct.Struct("<cIII")
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_INT32_RANGE = (-(2**31), 2**31 - 1)
+
+
+class SnapshotCodecError(ValueError):
+    """Raised when a binary snapshot cannot be encoded or decoded."""
+
+
+# =============================================================================
+# STREAMS
+# =============================================================================
+
+
+class _Writer:
+    """Accumulates the string table and the int / float streams."""
+
+    __slots__ = ("strings", "ints", "floats")
+
+    def __init__(self) -> None:
+        # Index 0 is reserved for None
+        self.strings: Dict[str, int] = {}
+        self.ints: List[int] = []
+        self.floats: List[float] = []
+
+    def ref(self, value: Optional[str]) -> None:
+        if value is None:
+            self.ints.append(0)
+            return
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings) + 1
+        self.ints.append(index)
+
+
+class _Reader:
+    """Sequential access to the decoded streams."""
+
+    __slots__ = ("strings", "int", "float")
+
+    def __init__(self, strings: List[Optional[str]], ints: array, floats: array):
+        self.strings = strings
+        self.int = iter(ints).__next__
+        self.float = iter(floats).__next__
+
+    def ref(self) -> Optional[str]:
+        return self.strings[self.int()]
+
+
+# =============================================================================
+# FIELD CODECS (compiled from annotations)
+# =============================================================================
+
+Encoder = Callable[[_Writer, Any], None]
+Decoder = Callable[[_Reader], Any]
+
+_model_codecs: Dict[type, Tuple[Encoder, Decoder]] = {}
+
+
+def _compile(annotation: Any) -> Tuple[Encoder, Decoder]:
+    """Build (encoder, decoder) for one field annotation."""
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is Union and type(None) in args and len(args) == 2:
+        inner = args[0] if args[1] is type(None) else args[1]
+        if _is_string(inner):
+            # String refs already use 0 for None
+            return _compile(inner)
+        inner_encode, inner_decode = _compile(inner)
+
+        def encode_optional(w: _Writer, value: Any) -> None:
+            if value is None:
+                w.ints.append(0)
+            else:
+                w.ints.append(1)
+                inner_encode(w, value)
+
+        def decode_optional(r: _Reader) -> Any:
+            return inner_decode(r) if r.int() else None
+
+        return encode_optional, decode_optional
+
+    if origin is list:
+        item_encode, item_decode = _compile(args[0])
+
+        def encode_list(w: _Writer, value: Any) -> None:
+            items = value if isinstance(value, list) else list(value)
+            w.ints.append(len(items))
+            for item in items:
+                item_encode(w, item)
+
+        def decode_list(r: _Reader) -> List[Any]:
+            return [item_decode(r) for _ in range(r.int())]
+
+        return encode_list, decode_list
+
+    if origin is dict and args[0] is str:
+        value_encode, value_decode = _compile(args[1])
+
+        def encode_dict(w: _Writer, value: Dict[str, Any]) -> None:
+            w.ints.append(len(value))
+            for key, item in value.items():
+                w.ref(key)
+                value_encode(w, item)
+
+        def decode_dict(r: _Reader) -> Dict[str, Any]:
+            return {r.ref(): value_decode(r) for _ in range(r.int())}
+
+        return encode_dict, decode_dict
+
+    if _is_string(annotation):
+        if issubclass(annotation, Enum):
+            return _encode_enum, _Reader.ref
+        return _Writer.ref, _Reader.ref
+    if annotation is bool:
+        return _encode_int, _decode_bool
+    if annotation is int:
+        return _encode_int, _decode_int
+    if annotation is float:
+        return _encode_float, _decode_float
+    if annotation is datetime:
+        return _encode_datetime, _decode_datetime
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _model_codec(annotation)
+
+    raise TypeError(f"snapshot_codec cannot encode fields of type {annotation!r}")
+
+
+def _model_codec(model: type) -> Tuple[Encoder, Decoder]:
+    """(encoder, decoder) for a model: its fields in declaration order."""
+    if model in _model_codecs:
+        return _model_codecs[model]
+
+    names = tuple(model.model_fields)
+    encoders: List[Encoder] = []
+    decoders: List[Decoder] = []
+
+    def encode_model(w: _Writer, value: BaseModel) -> None:
+        fields = value.__dict__
+        for name, encode in zip(names, encoders):
+            encode(w, fields[name])
+
+    def decode_model(r: _Reader) -> Dict[str, Any]:
+        return dict(zip(names, [decode(r) for decode in decoders]))
+
+    _model_codecs[model] = (encode_model, decode_model)
+    for field in model.model_fields.values():
+        encode, decode = _compile(field.annotation)
+        encoders.append(encode)
+        decoders.append(decode)
+    return encode_model, decode_model
+
+
+def _is_string(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, str)
+
+
+def _encode_enum(w: _Writer, value: Any) -> None:
+    w.ref(value.value if isinstance(value, Enum) else value)
+
+
+def _encode_int(w: _Writer, value: int) -> None:
+    w.ints.append(int(value))
+
+
+def _decode_int(r: _Reader) -> int:
+    return r.int()
+
+
+def _decode_bool(r: _Reader) -> bool:
+    return bool(r.int())
+
+
+def _encode_float(w: _Writer, value: float) -> None:
+    w.floats.append(value)
+
+
+def _decode_float(r: _Reader) -> float:
+    return r.float()
+
+
+def _encode_datetime(w: _Writer, value: datetime) -> None:
+    """Wall-clock microseconds, then 0 (naive) or 1 + UTC offset in us."""
+    w.ints.append((value.replace(tzinfo=None) - _EPOCH) // _MICROSECOND)
+    offset = value.utcoffset()
+    if offset is None:
+        w.ints.append(0)
+    else:
+        w.ints.append(1)
+        w.ints.append(offset // _MICROSECOND)
+
+
+def _decode_datetime(r: _Reader) -> datetime:
+    value = _EPOCH + timedelta(microseconds=r.int())
+    if r.int():
+        value = value.replace(tzinfo=timezone(timedelta(microseconds=r.int())))
+    return value
+
+
+_encode_state, _decode_state = _model_codec(InterviewState)
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+
+def encode_snapshot(
+    state: InterviewState, compression: Optional[str] = None, level: int = 6
+) -> bytes:
+    """
+    Encode an InterviewState as a binary snapshot.
+
+    Args:
+        state: State to encode
+        compression: None, "zlib" or "lzma"
+        level: Compression level (zlib 0-9, lzma preset 0-9)
+
+    Returns:
+        Snapshot bytes
+    """
+    if compression not in COMPRESSION_CODES:
+        raise SnapshotCodecError(f"Unknown compression: {compression!r}")
+
+    w = _Writer()
+    _encode_state(w, state)
+
+    low, high = (min(w.ints), max(w.ints)) if w.ints else (0, 0)
+    typecode = "i" if _INT32_RANGE[0] <= low and high <= _INT32_RANGE[1] else "q"
+    try:
+        ints = array(typecode, w.ints)
+    except OverflowError as e:
+        raise SnapshotCodecError("Integer field out of 64-bit range") from e
+    floats = array("d", w.floats)
+    lengths = array("I", [len(s) for s in w.strings])
+    blob = "".join(w.strings).encode("utf-8", "surrogatepass")
+
+    if sys.byteorder == "big":
+        for packed in (ints, floats, lengths):
+            packed.byteswap()
+
+    payload = b"".join(
+        (
+            _HEADER.pack(typecode.encode(), len(ints), len(floats), len(lengths)),
+            lengths.tobytes(),
+            ints.tobytes(),
+            floats.tobytes(),
+            blob,
+        )
+    )
+    if compression == "zlib":
+        payload = zlib.compress(payload, level)
+    elif compression == "lzma":
+        payload = lzma.compress(payload, preset=level)
+
+    return MAGIC + bytes((VERSION, COMPRESSION_CODES[compression])) + payload
+
+
+def decode_snapshot(data: bytes) -> InterviewState:
+    """
+    Decode a binary snapshot (validated through InterviewState).
+
+    Raises:
+        SnapshotCodecError: Not a snapshot, unsupported version, or corrupt
+    """
+    if data[:4] != MAGIC or len(data) < 6:
+        raise SnapshotCodecError("Not an InterviewState binary snapshot")
+    version, compression = data[4], data[5]
+    if version != VERSION:
+        raise SnapshotCodecError(f"Unsupported snapshot version: {version}")
+
+    try:
+        payload = memoryview(data)[6:]
+        if compression == COMPRESSION_CODES["zlib"]:
+            payload = memoryview(zlib.decompress(payload))
+        elif compression == COMPRESSION_CODES["lzma"]:
+            payload = memoryview(lzma.decompress(payload))
+        elif compression != COMPRESSION_CODES[None]:
+            raise SnapshotCodecError(f"Unknown compression code: {compression}")
+
+        typecode, n_ints, n_floats, n_strings = _HEADER.unpack_from(payload)
+        offset = _HEADER.size
+        lengths = array("I")
+        ints = array(typecode.decode())
+        floats = array("d")
+        for packed, count in ((lengths, n_strings), (ints, n_ints), (floats, n_floats)):
+            end = offset + count * packed.itemsize
+            packed.frombytes(payload[offset:end])
+            if len(packed) != count:
+                raise SnapshotCodecError("Corrupt snapshot: truncated arrays")
+            offset = end
+        if sys.byteorder == "big":
+            for packed in (ints, floats, lengths):
+                packed.byteswap()
+
+        text = bytes(payload[offset:]).decode("utf-8", "surrogatepass")
+        strings: List[Optional[str]] = [None]
+        position = 0
+        for length in lengths:
+            strings.append(text[position : position + length])
+            position += length
+        if position != len(text):
+            raise SnapshotCodecError("Corrupt snapshot: string table size mismatch")
+
+        data_dict = _decode_state(_Reader(strings, ints, floats))
+    except SnapshotCodecError:
+        raise
+    except (
+        IndexError,
+        StopIteration,
+        ValueError,
+        struct.error,
+        zlib.error,
+        lzma.LZMAError,
+    ) as e:
+        raise SnapshotCodecError(f"Corrupt snapshot: {e}") from e
+
+    return InterviewState.model_validate(data_dict)
+
+
+def save_snapshot(
+    state: InterviewState,
+    path: Path,
+    compression: Optional[str] = "zlib",
+    fsync: bool = True,
+) -> int:
+    """
+    Atomically write a binary snapshot.
+
+    Returns:
+        Bytes written
+    """
+    data = encode_snapshot(state, compression)
+    atomic_write_bytes(Path(path), data, fsync)
+    return len(data)
+
+
+def load_snapshot(path: Path) -> InterviewState:
+    """Read a binary snapshot written by save_snapshot."""
+    return decode_snapshot(Path(path).read_bytes())
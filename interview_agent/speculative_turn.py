@@ -0,0 +1,216 @@
+"""
+Speculative Turn Pipeline for Interview Agent
+
+Alternative TurnRunner for SessionManager that overlaps the model calls of
+a turn instead of running them back to back:
+- Response analysis, follow-up generation and transition generation start
+  concurrently
+- Once the analysis decides, the matching branch is committed and the other
+  is cancelled; the turn is applied to the state only after the committed
+  branch returns, so a failed call leaves the session unchanged
+- At max_follow_ups the turn can only transition, so nothing is speculated:
+  the transition is generated once, after the analysis, as run_turn does
+- Discarded branches are cancelled and their outcome (result, error or
+  cancellation) is always retrieved, so failures are never left unobserved
+- Metrics track wasted calls against latency saved
+
+Trade-off: the speculative transition prompt is built before the analysis
+exists, so it predicts TransitionReason.OBJECTIVE_SATISFIED and carries no
+key_insight. If the analysis yields a different reason, the transition is
+regenerated sequentially (counted as a reissue).
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+from pydantic import BaseModel
+
+from agents.interview_agent.session_runtime import (
+    COMPLETION_MESSAGE,
+    LLMClient,
+    TurnResult,
+    analyze_response,
+    apply_analysis,
+    apply_follow_up,
+    apply_transition,
+    followup_prompt,
+    transition_prompt,
+    transition_reason_for,
+    wants_follow_up,
+)
+from agents.interview_agent.state_schema import InterviewState, TransitionReason
+
+PREDICTED_TRANSITION_REASON = TransitionReason.OBJECTIVE_SATISFIED
+
+
+# =============================================================================
+# METRICS
+# =============================================================================
+
+
+class SpeculationMetrics(BaseModel):
+    """Counters for the speculative pipeline."""
+
+    turns: int = 0
+    branches_launched: int = 0
+    branches_committed: int = 0
+
+    # Wasted calls: branch cancelled after the analysis picked the other one
+    branches_cancelled: int = 0
+    # Subset of cancelled branches whose call had already completed (fully paid)
+    branches_wasted_completed: int = 0
+
+    follow_ups_skipped_at_limit: int = 0
+    transitions_reissued: int = 0
+
+    # Sum over turns of (analysis + committed branch time) - actual turn time
+    latency_saved_seconds: float = 0.0
+
+    @property
+    def wasted_call_ratio(self) -> float:
+        """Cancelled branches per launched branch."""
+        if not self.branches_launched:
+            return 0.0
+        return self.branches_cancelled / self.branches_launched
+
+    @property
+    def mean_latency_saved_seconds(self) -> float:
+        """Average latency saved per turn."""
+        return self.latency_saved_seconds / self.turns if self.turns else 0.0
+
+
+# =============================================================================
+# TURN RUNNER
+# =============================================================================
+
+
+class SpeculativeTurnRunner:
+    """
+    TurnRunner that speculates on both branches of a turn.
+
+    Usage:
+        runner = SpeculativeTurnRunner()
+        manager = SessionManager(client, turn_runner=runner)
+        ...
+        runner.metrics.wasted_call_ratio
+    """
+
+    def __init__(self, metrics: Optional[SpeculationMetrics] = None):
+        self.metrics = metrics or SpeculationMetrics()
+
+    async def __call__(
+        self, state: InterviewState, user_response: str, client: LLMClient
+    ) -> TurnResult:
+        metrics = self.metrics
+        metrics.turns += 1
+        turn_start = time.perf_counter()
+        question = state.get_current_question()
+        model = state.config.transition_model
+
+        analysis_task = asyncio.create_task(
+            _timed(analyze_response(state, user_response, client))
+        )
+
+        follow_up_task = transition_task = None
+        if question.follow_up_count >= question.max_follow_ups:
+            # The turn can only transition; speculating would only add calls
+            metrics.follow_ups_skipped_at_limit += 1
+        else:
+            follow_up_task = asyncio.create_task(
+                _timed(client.complete(model, followup_prompt(state, user_response)))
+            )
+            metrics.branches_launched += 1
+
+            # Transition branch: only if there is a next question to move to
+            speculative_prompt = transition_prompt(
+                state, user_response, PREDICTED_TRANSITION_REASON
+            )
+            if speculative_prompt:
+                transition_task = asyncio.create_task(
+                    _timed(client.complete(model, speculative_prompt))
+                )
+                metrics.branches_launched += 1
+
+        try:
+            analysis, analysis_seconds = await analysis_task
+        except BaseException:
+            for task in (follow_up_task, transition_task):
+                if task:
+                    _discard(task)
+            raise
+
+        # State changes wait until the committed branch has produced its text
+        follow_up = wants_follow_up(state, analysis)
+        committed, discarded = (
+            (follow_up_task, transition_task)
+            if follow_up
+            else (transition_task, follow_up_task)
+        )
+
+        if discarded is not None:
+            metrics.branches_cancelled += 1
+            if discarded.done():
+                metrics.branches_wasted_completed += 1
+            _discard(discarded)
+
+        if follow_up:
+            text, branch_seconds = await committed
+            metrics.branches_committed += 1
+            apply_analysis(state, user_response, analysis)
+            apply_follow_up(state, text)
+            action = "follow_up"
+        else:
+            reason = transition_reason_for(analysis)
+            if committed is not None and reason == PREDICTED_TRANSITION_REASON:
+                text, branch_seconds = await committed
+                metrics.branches_committed += 1
+            else:
+                if committed is not None:
+                    # Misprediction: discard and regenerate with the real reason
+                    _discard(committed)
+                    metrics.branches_cancelled += 1
+                    metrics.transitions_reissued += 1
+                key_insight = (
+                    analysis.insights_extracted[0]
+                    if analysis.insights_extracted
+                    else None
+                )
+                prompt = transition_prompt(state, user_response, reason, key_insight)
+                if prompt:
+                    text, branch_seconds = await _timed(client.complete(model, prompt))
+                else:
+                    text, branch_seconds = COMPLETION_MESSAGE, 0.0
+            apply_analysis(state, user_response, analysis)
+            action = apply_transition(state, analysis, text)
+
+        elapsed = time.perf_counter() - turn_start
+        metrics.latency_saved_seconds += max(
+            0.0, analysis_seconds + branch_seconds - elapsed
+        )
+
+        return TurnResult(
+            session_id=state.session_id,
+            action=action,
+            assistant_message=text,
+            analysis=analysis,
+        )
+
+
+def _discard(task: asyncio.Task) -> None:
+    """Cancel a branch and retrieve its outcome once it settles."""
+    task.cancel()
+    task.add_done_callback(_retrieve_outcome)
+
+
+def _retrieve_outcome(task: asyncio.Task) -> None:
+    # Marks a failed branch's exception as retrieved (no "never retrieved" log)
+    if not task.cancelled():
+        task.exception()
+
+
+async def _timed(awaitable):
+    """Await and return (result, seconds taken)."""
+    start = time.perf_counter()
+    result = await awaitable
+    return result, time.perf_counter() - start
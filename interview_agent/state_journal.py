@@ -0,0 +1,540 @@
+"""
+Append-Only Journal Persistence for InterviewState
+
+Storage layer behind InterviewState.atomic_update():
+- state.json is a periodic snapshot, written via temp file + rename
+- journal.jsonl holds compact delta records for the changes since the snapshot
+- A bound state's atomic_update() journals what changed since its previous
+  call and commits it (config.auto_save_after_each_exchange)
+- Each record is checksummed; a torn tail from a crash is dropped on load
+- Loading = read snapshot, replay journal, so each save is O(1) per turn
+
+Record line format: "<crc32 hex> <compact json>\\n"
+"""
+
+import json
+import os
+import zlib
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, TypeAdapter
+
+from agents.interview_agent.state_schema import (
+    Exchange,
+    Insight,
+    InsightBank,
+    InterviewState,
+    QuestionState,
+    ResponseAnalysis,
+)
+from agents.interview_agent.tracing import traced
+
+SNAPSHOT_FILENAME = "state.json"
+JOURNAL_FILENAME = "journal.jsonl"
+
+# Extra key stored in the snapshot; InterviewState ignores unknown keys on load
+SNAPSHOT_SEQ_KEY = "_journal_seq"
+
+# Response fields of an exchange, journaled by "response" records
+RESPONSE_FIELDS = {"user_response", "response_timestamp", "response_analysis"}
+
+# Scalar fields carried by "question" and "state" patch records
+QUESTION_PATCH_FIELDS = (
+    "status",
+    "started_at",
+    "completed_at",
+    "objective_status",
+    "transition_reason",
+    "transition_message",
+    "follow_up_count",
+)
+STATE_PATCH_FIELDS = (
+    "status",
+    "updated_at",
+    "current_question_index",
+    "completed_questions",
+    "termination_reason",
+    "completed_at",
+)
+
+
+class JournalError(Exception):
+    """Raised when a journal cannot be replayed onto its snapshot."""
+
+
+# =============================================================================
+# STATE JOURNAL
+# =============================================================================
+
+
+class StateJournal:
+    """
+    Snapshot + append-only delta log for one interview session directory.
+
+    create() or load() binds the state; from then on its atomic_update()
+    calls sync(), so the existing save point persists each exchange:
+
+        journal = StateJournal(session_dir)
+        journal.create(state)  # or: state = journal.load()
+        ...
+        question.add_exchange(text)
+        state.record_exchange("assistant", text)
+        state.atomic_update()  # journals the exchange and history entry
+
+    sync() compares the state with what it last journaled: new exchanges,
+    responses, insights and history entries, and the status fields of each
+    question and of the state. Other edits to existing records (e.g. an
+    insight's importance) are only persisted by the next snapshot. The
+    question list itself is fixed by the snapshot.
+
+    sync() buffers its records and commits them with one open, write and
+    fsync of journal.jsonl; no file stays open between commits, so idle
+    sessions hold no descriptors. The journal compacts itself into a fresh
+    snapshot once `snapshot_every` records accumulate.
+    """
+
+    def __init__(
+        self,
+        session_dir: Path,
+        snapshot_every: int = 100,
+        fsync: bool = True,
+    ):
+        """
+        Args:
+            session_dir: Directory holding state.json and journal.jsonl
+            snapshot_every: Records to accumulate before compacting
+            fsync: Whether commits and snapshots fsync (durable on power loss)
+        """
+        self.session_dir = Path(session_dir)
+        self.snapshot_path = self.session_dir / SNAPSHOT_FILENAME
+        self.journal_path = self.session_dir / JOURNAL_FILENAME
+        self.snapshot_every = snapshot_every
+        self.fsync = fsync
+
+        self.state: Optional[InterviewState] = None
+        self._seq = 0
+        self._records_since_snapshot = 0
+        # Encoded records appended since the last commit()
+        self._pending: List[bytes] = []
+
+        # What has been journaled so far (sync() appends the difference)
+        self._exchanges: Dict[str, Tuple[int, bool]] = {}
+        self._question_fields: Dict[str, Tuple[Any, ...]] = {}
+        self._state_fields: Tuple[Any, ...] = ()
+        self._insights = 0
+        self._history = 0
+
+    # ==========================================================================
+    # Lifecycle
+    # ==========================================================================
+
+    def create(self, state: InterviewState) -> None:
+        """Start a new journal with `state` as the initial snapshot and bind it."""
+        self.session_dir.mkdir(parents=True, exist_ok=True)
+        self._seq = 0
+        self._bind(state)
+        self.snapshot()
+
+    @traced()
+    def load(self) -> InterviewState:
+        """
+        Load the snapshot, replay the journal on top of it and bind the result.
+
+        A torn or corrupt tail (crash mid-append) is truncated away; records
+        already folded into the snapshot are skipped.
+
+        Returns:
+            The recovered InterviewState
+        """
+        with open(self.snapshot_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        snapshot_seq = data.pop(SNAPSHOT_SEQ_KEY, 0)
+        state = InterviewState.model_validate(data)
+
+        records, good_bytes = self._read_records()
+        if self.journal_path.exists() and good_bytes < self.journal_path.stat().st_size:
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(good_bytes)
+
+        questions = {q.id: q for q in state.questions}
+        seq = snapshot_seq
+        replayed = 0
+        for record in records:
+            if record["seq"] <= snapshot_seq:
+                continue
+            apply_record(state, record, questions)
+            seq = record["seq"]
+            replayed += 1
+
+        self._seq = seq
+        self._records_since_snapshot = replayed
+        self._bind(state)
+        return state
+
+    @traced()
+    def commit(self) -> None:
+        """Write the appended records and make them durable (one fsync)."""
+        if not self._pending:
+            return
+        with open(self.journal_path, "ab") as f:
+            f.write(b"".join(self._pending))
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Commit pending records and unbind the state (it stops auto-saving)."""
+        self.commit()
+        if self.state is not None and self.state._journal is self:
+            self.state._journal = None
+
+    def __enter__(self) -> "StateJournal":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "StateJournal":
+        # Deep-copied states keep the reference; sync only runs for self.state
+        return self
+
+    # ==========================================================================
+    # Delta Records
+    # ==========================================================================
+
+    @traced("StateJournal.sync")
+    def sync(self) -> int:
+        """
+        Journal every change to the bound state since the last sync and commit.
+
+        Returns:
+            Number of records appended
+
+        Raises:
+            JournalError: If no state is bound
+        """
+        state = self._bound()
+        start_seq = self._seq
+
+        for question in state.questions:
+            self._sync_question(question)
+
+        insights = state.insight_bank.insights
+        for insight in insights[self._insights :]:
+            self._append(
+                {
+                    "op": "insight",
+                    "insight": insight.model_dump(mode="json", exclude_none=True),
+                }
+            )
+        self._insights = len(insights)
+
+        history = state.conversation_history
+        if len(history) > self._history:
+            for entry in history[self._history :]:
+                self._append({"op": "history", "entry": entry})
+            self._history = len(history)
+
+        # Last, so replay ends with the state's own updated_at
+        fields = _values(state, STATE_PATCH_FIELDS)
+        if fields != self._state_fields:
+            self._append({"op": "state", "fields": _patch(state, STATE_PATCH_FIELDS)})
+            self._state_fields = fields
+
+        appended = self._seq - start_seq
+        if appended:
+            self.commit()
+            if (
+                self.snapshot_every
+                and self._records_since_snapshot >= self.snapshot_every
+            ):
+                self.snapshot()
+        return appended
+
+    def _sync_question(self, question: QuestionState) -> None:
+        """Append exchange, response and status records for one question."""
+        exchanges = question.exchanges
+        count, responded = self._exchanges.get(question.id, (0, True))
+        if not responded and exchanges[count - 1].user_response is not None:
+            self._append_response(question, exchanges[count - 1])
+        for exchange in exchanges[count:]:
+            self._append(
+                {
+                    "op": "exchange",
+                    "q": question.id,
+                    "exchange": exchange.model_dump(
+                        mode="json", exclude_none=True, exclude=RESPONSE_FIELDS
+                    ),
+                }
+            )
+            if exchange.user_response is not None:
+                self._append_response(question, exchange)
+        self._exchanges[question.id] = (
+            len(exchanges),
+            not exchanges or exchanges[-1].user_response is not None,
+        )
+
+        fields = _values(question, QUESTION_PATCH_FIELDS)
+        if fields != self._question_fields.get(question.id):
+            self._append(
+                {
+                    "op": "question",
+                    "q": question.id,
+                    "fields": _patch(question, QUESTION_PATCH_FIELDS),
+                }
+            )
+            self._question_fields[question.id] = fields
+
+    def _append_response(self, question: QuestionState, exchange: Exchange) -> None:
+        """Record the response + analysis on an exchange (record_response)."""
+        self._append(
+            {
+                "op": "response",
+                "q": question.id,
+                "x": exchange.id,
+                "response": exchange.user_response,
+                "at": _dump_datetime(exchange.response_timestamp),
+                "analysis": (
+                    exchange.response_analysis.model_dump(mode="json")
+                    if exchange.response_analysis
+                    else None
+                ),
+            }
+        )
+
+    # ==========================================================================
+    # Snapshot / Compaction
+    # ==========================================================================
+
+    @traced()
+    def snapshot(self) -> None:
+        """
+        Write a full snapshot and reset the journal.
+
+        The snapshot records the last folded sequence number, so a crash
+        between the rename and the journal truncation cannot double-apply.
+        """
+        data = self._bound().model_dump(mode="json")
+        data[SNAPSHOT_SEQ_KEY] = self._seq
+        atomic_write_text(self.snapshot_path, json.dumps(data, indent=2), self.fsync)
+
+        # Uncommitted records are folded into the snapshot
+        self._pending.clear()
+        with open(self.journal_path, "wb") as f:
+            if self.fsync:
+                os.fsync(f.fileno())
+        self._records_since_snapshot = 0
+
+    # ==========================================================================
+    # Internals
+    # ==========================================================================
+
+    def _bind(self, state: InterviewState) -> None:
+        """Bind `state` and mark everything in it as journaled."""
+        if self.state is not None and self.state is not state:
+            self.close()
+        self.state = state
+        state._journal = self
+        self._exchanges = {
+            q.id: (
+                len(q.exchanges),
+                not q.exchanges or q.exchanges[-1].user_response is not None,
+            )
+            for q in state.questions
+        }
+        self._question_fields = {
+            q.id: _values(q, QUESTION_PATCH_FIELDS) for q in state.questions
+        }
+        self._state_fields = _values(state, STATE_PATCH_FIELDS)
+        self._insights = len(state.insight_bank.insights)
+        self._history = len(state.conversation_history)
+
+    def _bound(self) -> InterviewState:
+        if self.state is None:
+            raise JournalError("No state bound; call create() or load() first")
+        return self.state
+
+    @traced("StateJournal.append")
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Serialize and checksum one record; commit() writes it."""
+        self._seq += 1
+        record["seq"] = self._seq
+        payload = json.dumps(record, separators=(",", ":")).encode("utf-8")
+        self._pending.append(b"%08x %s\n" % (zlib.crc32(payload), payload))
+        self._records_since_snapshot += 1
+
+    def _read_records(self) -> Tuple[List[Dict[str, Any]], int]:
+        """Read valid records; returns them plus the byte length they span."""
+        if not self.journal_path.exists():
+            return [], 0
+
+        records = []
+        good_bytes = 0
+        with open(self.journal_path, "rb") as f:
+            for line in f:
+                record = _decode_line(line)
+                if record is None:
+                    break
+                records.append(record)
+                good_bytes += len(line)
+        return records, good_bytes
+
+
+# =============================================================================
+# REPLAY
+# =============================================================================
+
+
+def apply_record(
+    state: InterviewState,
+    record: Dict[str, Any],
+    questions: Optional[Dict[str, QuestionState]] = None,
+) -> None:
+    """
+    Apply one journal record to `state`, mirroring the original mutation.
+
+    Args:
+        state: State to mutate
+        record: Decoded journal record
+        questions: Optional question id -> QuestionState index
+    """
+    if questions is None:
+        questions = {q.id: q for q in state.questions}
+    op = record["op"]
+
+    if op == "exchange":
+        question = _question(questions, record["q"])
+        exchange = Exchange.model_validate(record["exchange"])
+        question.exchanges.append(exchange)
+        if exchange.is_follow_up:
+            question.follow_up_count += 1
+
+    elif op == "response":
+        question = _question(questions, record["q"])
+        if not question.exchanges or question.exchanges[-1].id != record["x"]:
+            raise JournalError(f"Response for unknown exchange {record['x']}")
+        exchange = question.exchanges[-1]
+        exchange.user_response = record["response"]
+        exchange.response_timestamp = _load_datetime(record["at"])
+        if record["analysis"] is not None:
+            analysis = ResponseAnalysis.model_validate(record["analysis"])
+            exchange.response_analysis = analysis
+            question.cumulative_insights.extend(analysis.insights_extracted)
+            question.objective_status = analysis.objective_progress
+
+    elif op == "insight":
+        _index_insight(state.insight_bank, Insight.model_validate(record["insight"]))
+
+    elif op == "history":
+        entry = record["entry"]
+        state.conversation_history.append(entry)
+        state.total_exchanges += 1
+
+    elif op == "question":
+        _apply_patch(_question(questions, record["q"]), record["fields"])
+
+    elif op == "state":
+        _apply_patch(state, record["fields"])
+
+    else:
+        raise JournalError(f"Unknown journal op: {op}")
+
+
+# =============================================================================
+# UTILITY FUNCTIONS
+# =============================================================================
+
+
+def atomic_write_text(path: Path, text: str, fsync: bool = True) -> None:
+    """Write `text` to `path` via a temp file + rename in the same directory."""
+    atomic_write_bytes(path, text.encode("utf-8"), fsync)
+
+
+def atomic_write_bytes(path: Path, data: bytes, fsync: bool = True) -> None:
+    """Write `data` to `path` via a temp file + rename in the same directory."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        if fsync:
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    if fsync:
+        _fsync_dir(path.parent)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """fsync a directory so a rename inside it is durable (POSIX only)."""
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _decode_line(line: bytes) -> Optional[Dict[str, Any]]:
+    """Decode a journal line; None if torn, corrupt or missing its newline."""
+    if not line.endswith(b"\n") or len(line) < 10 or line[8:9] != b" ":
+        return None
+    payload = line[9:-1]
+    try:
+        if int(line[:8], 16) != zlib.crc32(payload):
+            return None
+        return json.loads(payload)
+    except ValueError:
+        return None
+
+
+def _question(questions: Dict[str, QuestionState], question_id: str) -> QuestionState:
+    """Look up a question by id or fail replay."""
+    question = questions.get(question_id)
+    if question is None:
+        raise JournalError(f"Journal references unknown question {question_id}")
+    return question
+
+
+def _index_insight(bank: InsightBank, insight: Insight) -> None:
+    """Append an existing insight and update indexes like add_insight."""
+    bank.insights.append(insight)
+    if insight.category:
+        bank.by_category.setdefault(insight.category, []).append(insight.id)
+    bank.by_question.setdefault(insight.source_question_id, []).append(insight.id)
+
+
+def _values(model: Any, fields: Tuple[str, ...]) -> Tuple[Any, ...]:
+    """Current values of scalar fields (cheap change detection for sync)."""
+    return tuple(getattr(model, name) for name in fields)
+
+
+def _patch(model: BaseModel, fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """Dump a subset of scalar fields in JSON mode."""
+    return model.model_dump(mode="json", include=set(fields))
+
+
+def _apply_patch(model: BaseModel, fields: Dict[str, Any]) -> None:
+    """Validate and set scalar fields from a patch."""
+    for name, value in fields.items():
+        adapter = _field_adapter(type(model), name)
+        setattr(model, name, adapter.validate_python(value))
+
+
+@lru_cache(maxsize=None)
+def _field_adapter(model_type: type, name: str) -> TypeAdapter:
+    """Cached TypeAdapter for one model field's annotation."""
+    return TypeAdapter(model_type.model_fields[name].annotation)
+
+
+def _dump_datetime(value: Optional[datetime]) -> Optional[str]:
+    """Serialize a datetime for a journal record."""
+    return value.isoformat() if value else None
+
+
+def _load_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Parse a datetime from a journal record."""
+    return datetime.fromisoformat(value) if value else None
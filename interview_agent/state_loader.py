@@ -0,0 +1,226 @@
+"""
+Bulk State Loader for Interview Agent
+
+Rehydrates many sessions at once on restart:
+- Discovers <root>/<session>/state.json files
+- Reads them with a thread pool (bulk I/O)
+- Validates straight from bytes with model_validate_json, in a process pool
+  when several CPUs are available
+- Per-file error reporting instead of failing the whole load
+
+Session directories holding a journal (state_journal) are loaded through
+StateJournal so their deltas are replayed on top of the snapshot.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+
+from agents.interview_agent.state_journal import (
+    JOURNAL_FILENAME,
+    SNAPSHOT_FILENAME,
+    StateJournal,
+)
+from agents.interview_agent.state_schema import InterviewState
+
+try:  # optional faster JSON backend for untyped (model=None) loads
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Session roots, relative to the repository root
+INTERVIEW_SESSIONS_DIR = Path("agents/interview_sessions")
+WORKFLOW_SESSIONS_DIR = Path("agents/sessions")
+
+# Below this many files a process pool costs more than it saves
+MIN_FILES_FOR_POOL = 64
+
+
+class StateLoadError(BaseModel):
+    """A state file that could not be loaded."""
+
+    path: str
+    error_type: str
+    message: str
+
+
+class BulkLoadResult(BaseModel):
+    """Outcome of a bulk load."""
+
+    # path -> loaded model (or dict when no model was given)
+    states: Dict[str, Any] = {}
+    errors: List[StateLoadError] = []
+
+    validated: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+# =============================================================================
+# DISCOVERY & I/O
+# =============================================================================
+
+
+def discover_state_files(
+    roots: Iterable[Path], filename: str = SNAPSHOT_FILENAME
+) -> List[Path]:
+    """
+    Find <root>/<session>/<filename> under each root.
+
+    Missing roots are skipped. Results are sorted for stable ordering.
+    """
+    paths: List[Path] = []
+    for root in roots:
+        root = Path(root)
+        if root.is_dir():
+            paths.extend(root.glob(f"*/{filename}"))
+    return sorted(paths)
+
+
+def read_files(
+    paths: Sequence[Path], io_workers: int = 16
+) -> List[Tuple[Path, Optional[bytes], Optional[OSError]]]:
+    """
+    Read many files concurrently.
+
+    Returns:
+        (path, bytes or None, OSError or None) per input path, in order
+    """
+
+    def read(path: Path) -> Tuple[Path, Optional[bytes], Optional[OSError]]:
+        try:
+            return path, path.read_bytes(), None
+        except OSError as exc:
+            return path, None, exc
+
+    if len(paths) <= 1:
+        return [read(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(io_workers, len(paths))) as pool:
+        return list(pool.map(read, paths))
+
+
+# =============================================================================
+# BULK LOAD
+# =============================================================================
+
+
+def load_states(
+    paths: Sequence[Path],
+    model: Optional[Type[BaseModel]] = InterviewState,
+    workers: Optional[int] = None,
+    chunk_size: int = 32,
+) -> BulkLoadResult:
+    """
+    Load and validate many state files.
+
+    Args:
+        paths: State files to load
+        model: Pydantic model to validate into (None: plain parsed JSON)
+        workers: Validation processes (default: CPU count; 1 = in-process)
+        chunk_size: Files per process-pool task
+
+    Returns:
+        BulkLoadResult with loaded states and per-file errors
+    """
+    start = time.perf_counter()
+    result = BulkLoadResult()
+    pending: List[Tuple[str, bytes]] = []
+
+    for path, data, error in read_files(list(paths)):
+        if error is not None:
+            result.errors.append(_error(str(path), error))
+            continue
+        pending.append((str(path), data))
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(pending) >= MIN_FILES_FOR_POOL:
+        chunks = [
+            pending[i : i + chunk_size] for i in range(0, len(pending), chunk_size)
+        ]
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            loaded = [
+                item
+                for chunk in pool.map(_load_chunk, [model] * len(chunks), chunks)
+                for item in chunk
+            ]
+    else:
+        loaded = _load_chunk(model, pending)
+
+    for path, state, error in loaded:
+        if error is not None:
+            result.errors.append(error)
+            continue
+        result.states[path] = state
+        result.validated += 1
+
+    result.elapsed_seconds = time.perf_counter() - start
+    return result
+
+
+def load_session_states(
+    base_dir: Path = Path("."),
+    workers: Optional[int] = None,
+) -> Dict[str, BulkLoadResult]:
+    """
+    Rehydrate every session under a repository checkout.
+
+    Interview sessions validate into InterviewState; workflow sessions
+    (agents/sessions) have no Pydantic model and load as parsed JSON.
+
+    Args:
+        base_dir: Repository root
+        workers: Validation processes
+
+    Returns:
+        {"interview": BulkLoadResult, "workflow": BulkLoadResult}
+    """
+    results = {}
+    for name, root, model in (
+        ("interview", INTERVIEW_SESSIONS_DIR, InterviewState),
+        ("workflow", WORKFLOW_SESSIONS_DIR, None),
+    ):
+        results[name] = load_states(
+            discover_state_files([Path(base_dir) / root]), model, workers
+        )
+    return results
+
+
+def _load_chunk(
+    model: Optional[Type[BaseModel]], items: List[Tuple[str, bytes]]
+) -> List[Tuple[str, Any, Optional[StateLoadError]]]:
+    """Validate a batch of files (runs in a worker process)."""
+    return [(path, *_load_one(model, path, data)) for path, data in items]
+
+
+def _load_one(
+    model: Optional[Type[BaseModel]], path: str, data: bytes
+) -> Tuple[Any, Optional[StateLoadError]]:
+    """Validate one file; returns (state, None) or (None, error)."""
+    try:
+        if model is InterviewState and _has_journal(Path(path)):
+            journal = StateJournal(Path(path).parent, fsync=False)
+            try:
+                return journal.load(), None
+            finally:
+                journal.close()
+        if model is None:
+            return _json_loads(data), None
+        return model.model_validate_json(data), None
+    except Exception as exc:  # reported per file
+        return None, _error(path, exc)
+
+
+def _has_journal(path: Path) -> bool:
+    return (path.parent / JOURNAL_FILENAME).exists()
+
+
+def _error(path: str, exc: Exception) -> StateLoadError:
+    return StateLoadError(path=path, error_type=type(exc).__name__, message=str(exc))
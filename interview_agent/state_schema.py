@@ -13,7 +13,10 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, field_serializer
+
+from agents.interview_agent.importance import HIGH_IMPORTANCE
+from agents.interview_agent.tracing import traced
 
 # =============================================================================
 # ENUMS - Status and Reason Tracking
@@ -157,6 +160,7 @@ class QuestionState(BaseModel):
     follow_up_count: int = 0
     max_follow_ups: int = 3  # Configurable limit
 
+    @traced()
     def add_exchange(
         self,
         question_text: str,
@@ -174,6 +178,7 @@ class QuestionState(BaseModel):
             self.follow_up_count += 1
         return exchange
 
+    @traced()
     def record_response(self, response: str, analysis: ResponseAnalysis) -> None:
         """Record user response and analysis for current exchange."""
         if self.exchanges:
@@ -194,6 +199,10 @@ class QuestionState(BaseModel):
 # =============================================================================
 
 
+# Size of the bounded top-k views kept by InsightBank
+INSIGHT_TOP_K = 32
+
+
 class Insight(BaseModel):
     """
     A single insight extracted from the interview.
@@ -220,6 +229,11 @@ class InsightBank(BaseModel):
     """
     Collection of all insights from the interview.
     Replaces/enhances the memory bank concept.
+
+    Lookups (get_by_id, get_high_importance, top_insights, ...) use indexes
+    that follow appends to `insights` and replacement of the list. Editing
+    an insight in place (e.g. its importance) or removing one does not
+    update them: call reindex() afterwards.
     """
 
     insights: List[Insight] = Field(default_factory=list)
@@ -236,6 +250,10 @@ class InsightBank(BaseModel):
     summary: Optional[str] = None
     last_summary_at: Optional[datetime] = None
 
+    # Derived lookup indexes (not serialized; caught up lazily from `insights`)
+    _index: "InsightIndex" = PrivateAttr(default_factory=lambda: InsightIndex())
+
+    @traced()
     def add_insight(
         self,
         content: str,
@@ -255,6 +273,7 @@ class InsightBank(BaseModel):
         self.insights.append(insight)
 
         # Update indexes
+        self._index.sync(self.insights)
         if category:
             if category not in self.by_category:
                 self.by_category[category] = []
@@ -266,9 +285,101 @@ class InsightBank(BaseModel):
 
         return insight
 
+    def reindex(self) -> None:
+        """Rebuild the lookup indexes after editing or removing insights."""
+        self._index.reset(self.insights)
+
     def get_high_importance(self) -> List[Insight]:
         """Get all high/critical importance insights."""
-        return [i for i in self.insights if i.importance in ("high", "critical")]
+        return list(self._index.sync(self.insights).high_priority)
+
+    def get_by_id(self, insight_id: str) -> Optional[Insight]:
+        """Look up an insight by id."""
+        return self._index.sync(self.insights).by_id.get(insight_id)
+
+    def get_by_importance(self, importance: str) -> List[Insight]:
+        """Get insights with an exact importance value, in insertion order."""
+        index = self._index.sync(self.insights)
+        return list(index.by_importance.get(importance, ()))
+
+    def get_related(self, insight: Insight) -> List[Insight]:
+        """Resolve an insight's related_insight_ids (unknown ids are skipped)."""
+        by_id = self._index.sync(self.insights).by_id
+        return [
+            by_id[related_id]
+            for related_id in insight.related_insight_ids
+            if related_id in by_id
+        ]
+
+    def top_insights(self, limit: int) -> List[Insight]:
+        """
+        First `limit` insights with high/critical ones first, in insertion order.
+
+        Same selection as (high + other)[:limit] over the whole bank, served
+        from bounded views when limit <= INSIGHT_TOP_K.
+        """
+        index = self._index.sync(self.insights)
+        if limit > INSIGHT_TOP_K:
+            other = [i for i in self.insights if i.importance not in HIGH_IMPORTANCE]
+            return (index.high_priority + other)[:limit]
+        selected = index.top_high[:limit]
+        return selected + index.top_other[: limit - len(selected)]
+
+
+class InsightIndex:
+    """
+    Lookup indexes over an insights list.
+
+    Shared by InsightBank and runtime_models.RuntimeInsightBank, which each
+    keep one in a private `_index` attribute. Kept as one plain object so
+    each query pays a single attribute lookup on the bank.
+    """
+
+    __slots__ = (
+        "by_id",
+        "by_importance",
+        "high_priority",
+        "top_high",
+        "top_other",
+        "indexed",
+        "count",
+    )
+
+    def __init__(self) -> None:
+        self.reset(None)
+
+    def reset(self, insights: Optional[List[Insight]]) -> None:
+        self.by_id: Dict[str, Insight] = {}
+        self.by_importance: Dict[str, List[Insight]] = {}
+        self.high_priority: List[Insight] = []
+        self.top_high: List[Insight] = []
+        self.top_other: List[Insight] = []
+        self.indexed = insights
+        self.count = 0
+
+    def sync(self, insights: List[Insight]) -> "InsightIndex":
+        """
+        Index insights appended since the last call (rebuild if replaced).
+
+        Only the list's identity and length are checked; in-place edits need
+        reset() (InsightBank.reindex()).
+        """
+        if self.indexed is not insights or self.count > len(insights):
+            self.reset(insights)
+        elif self.count == len(insights):
+            return self
+
+        for insight in insights[self.count :]:
+            self.by_id[insight.id] = insight
+            self.by_importance.setdefault(insight.importance, []).append(insight)
+            if insight.importance in HIGH_IMPORTANCE:
+                self.high_priority.append(insight)
+                if len(self.top_high) < INSIGHT_TOP_K:
+                    self.top_high.append(insight)
+            elif len(self.top_other) < INSIGHT_TOP_K:
+                self.top_other.append(insight)
+        self.count = len(insights)
+        return self
 
 
 # =============================================================================
@@ -334,6 +445,9 @@ class InterviewState(BaseModel):
     termination_reason: Optional[str] = None
     completed_at: Optional[datetime] = None
 
+    # Storage bound by StateJournal.create() / load() (not serialized)
+    _journal: Any = PrivateAttr(default=None)
+
     # ==========================================================================
     # State Machine Methods
     # ==========================================================================
@@ -344,6 +458,7 @@ class InterviewState(BaseModel):
             return self.questions[self.current_question_index]
         return None
 
+    @traced()
     def advance_to_next_question(self) -> Optional[QuestionState]:
         """Move to the next question. Returns None if interview complete."""
         self.current_question_index += 1
@@ -353,6 +468,7 @@ class InterviewState(BaseModel):
             return None
         return self.get_current_question()
 
+    @traced()
     def record_exchange(self, role: str, content: str) -> None:
         """Add to conversation history for context."""
         self.conversation_history.append(
@@ -374,16 +490,37 @@ class InterviewState(BaseModel):
             return 0.0
         return (self.completed_questions / self.total_questions) * 100
 
+    # ==========================================================================
+    # Serialization
+    # ==========================================================================
+
+    @field_serializer("conversation_history")
+    def _serialize_conversation_history(
+        self, history: List[Dict[str, str]]
+    ) -> List[Dict[str, str]]:
+        """Serialize bounded history containers back to the plain list shape."""
+        return history if isinstance(history, list) else list(history)
+
     # ==========================================================================
     # Atomic Update Method
     # ==========================================================================
 
+    @traced()
     def atomic_update(self) -> None:
         """
         Mark state as updated. Call this after EVERY exchange.
-        The actual file write happens in the storage layer.
+        The actual file write happens in the storage layer (state_journal):
+        with config.auto_save_after_each_exchange, a state bound to a
+        StateJournal journals and commits its changes here.
         """
         self.updated_at = datetime.now()
+        journal = self._journal
+        if (
+            journal is not None
+            and journal.state is self
+            and self.config.auto_save_after_each_exchange
+        ):
+            journal.sync()
 
 
 # =============================================================================
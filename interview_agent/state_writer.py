@@ -0,0 +1,289 @@
+"""
+Group-Commit Persistence for Many Sessions' state.json
+
+Write path for hosts running hundreds of concurrent sessions:
+- save(state) marks a session dirty; saves of the same session within the
+  batch window coalesce into one write of its latest state
+- A batch writes every dirty session's temp file, then renames them all
+  into place (each file is replaced atomically)
+- One filesystem barrier per batch instead of an fsync per file (syncfs on
+  Linux, sync() elsewhere on POSIX, per-file fsync as a last resort)
+- Configurable Durability: none / batch / full
+- File operations go through a FileSystem object, so tests can inject faults
+
+Layout: <root>/<session_id>/state.json, the same files state_loader reads.
+"""
+
+import asyncio
+import ctypes
+import os
+import sys
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from agents.interview_agent.runtime_models import RuntimeInterviewState, to_model
+from agents.interview_agent.state_journal import SNAPSHOT_FILENAME
+from agents.interview_agent.state_loader import INTERVIEW_SESSIONS_DIR
+from agents.interview_agent.state_schema import InterviewState
+from agents.interview_agent.tracing import span
+
+
+class Durability(str, Enum):
+    """What a completed save() guarantees."""
+
+    # Atomic renames only: survives a process crash; after a power loss
+    # files may be stale or empty
+    NONE = "none"
+    # Barrier between temp writes and renames: state.json is always a
+    # complete version; a power loss may roll back to the previous batch
+    BATCH = "batch"
+    # Second barrier after the renames: completed saves survive power loss
+    FULL = "full"
+
+
+@dataclass(slots=True)
+class GroupCommitStats:
+    """Counters for one GroupCommitWriter."""
+
+    saves: int = 0  # save() calls
+    writes: int = 0  # state.json files written (after coalescing)
+    batches: int = 0
+    barriers: int = 0
+
+
+# =============================================================================
+# FILESYSTEM
+# =============================================================================
+
+
+def _load_syncfs() -> Any:
+    """libc syncfs(2) on Linux, else None."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return ctypes.CDLL(None, use_errno=True).syncfs
+    except (OSError, AttributeError):
+        return None
+
+
+_syncfs = _load_syncfs()
+
+
+class FileSystem:
+    """
+    File operations used by GroupCommitWriter.
+
+    Subclass to inject faults (crashes, torn writes, lost renames).
+    """
+
+    def makedirs(self, path: Path) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+
+    def write(self, path: Path, data: bytes) -> None:
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def replace(self, src: Path, dst: Path) -> None:
+        os.replace(src, dst)
+
+    def barrier(self, root: Path, paths: List[Path]) -> None:
+        """
+        Make every write and rename so far durable.
+
+        Args:
+            root: Directory on the filesystem to flush
+            paths: Files touched since the last barrier (per-file fallback)
+        """
+        if _syncfs is not None:
+            fd = os.open(root, os.O_RDONLY)
+            try:
+                if _syncfs(fd) != 0:
+                    errno = ctypes.get_errno()
+                    raise OSError(errno, os.strerror(errno), str(root))
+            finally:
+                os.close(fd)
+        elif hasattr(os, "sync"):
+            os.sync()
+        else:
+            for path in paths:
+                with open(path, "rb+") as f:
+                    os.fsync(f.fileno())
+
+
+# =============================================================================
+# GROUP-COMMIT WRITER
+# =============================================================================
+
+
+class GroupCommitWriter:
+    """
+    Batches state.json writes for many sessions.
+
+    Use from the event loop that runs the sessions, e.g. as the
+    SessionManager persistence hook:
+
+        writer = GroupCommitWriter(root, durability=Durability.BATCH)
+        manager = SessionManager(client, after_turn=writer.save)
+        ...
+        await writer.close()
+
+    Each batch serializes the latest state of every dirty session on the
+    loop, then does the file I/O in a worker thread. A session saved again
+    while its batch is in flight is written by the next batch.
+    """
+
+    def __init__(
+        self,
+        root: Path = INTERVIEW_SESSIONS_DIR,
+        durability: Durability = Durability.BATCH,
+        window: float = 0.005,
+        max_batch: int = 256,
+        fs: Optional[FileSystem] = None,
+    ):
+        """
+        Args:
+            root: Sessions directory (<root>/<session_id>/state.json)
+            durability: Guarantee a completed save() gives
+            window: Seconds to collect saves after the first dirty session
+            max_batch: Sessions per batch; a full batch starts immediately
+            fs: File operations (a fault-injecting shim in tests)
+        """
+        self.root = Path(root)
+        self.durability = Durability(durability)
+        self.window = window
+        self.max_batch = max_batch
+        self.fs = fs or FileSystem()
+        self.stats = GroupCommitStats()
+
+        self._dirty: Dict[str, Any] = {}
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        self._known_dirs: set = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    # ==========================================================================
+    # Public API
+    # ==========================================================================
+
+    async def save(self, state: InterviewState, wait: bool = True) -> None:
+        """
+        Queue `state` for the next batch.
+
+        Args:
+            state: InterviewState or RuntimeInterviewState to persist
+            wait: Return only once a batch has written it (per durability);
+                write errors are raised here
+
+        Raises:
+            RuntimeError: If the writer is closed
+        """
+        if self._closed:
+            raise RuntimeError("GroupCommitWriter is closed")
+        self._start()
+        self.stats.saves += 1
+        self._dirty[state.session_id] = state
+        self._idle.clear()
+        self._wakeup.set()
+        if not wait:
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(state.session_id, []).append(future)
+        await future
+
+    async def flush(self) -> None:
+        """Wait until every queued save has been written."""
+        if self._idle is not None:
+            await self._idle.wait()
+
+    async def close(self) -> None:
+        """Flush pending saves and stop the batch task."""
+        self._closed = True
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    # ==========================================================================
+    # Batching
+    # ==========================================================================
+
+    def _start(self) -> None:
+        """Start the batch task on first use (inside the running loop)."""
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._idle = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            if self.window and len(self._dirty) < self.max_batch:
+                await asyncio.sleep(self.window)
+            self._wakeup.clear()
+
+            session_ids = list(self._dirty)[: self.max_batch]
+            states = [self._dirty.pop(session_id) for session_id in session_ids]
+            waiters = [
+                future
+                for session_id in session_ids
+                for future in self._waiters.pop(session_id, ())
+            ]
+            try:
+                with span("persist.batch", sessions=len(states)):
+                    payloads = [
+                        (state.session_id, _serialize(state)) for state in states
+                    ]
+                    await asyncio.to_thread(self._commit, payloads)
+            except Exception as exc:
+                for future in waiters:
+                    if not future.done():
+                        future.set_exception(exc)
+            else:
+                for future in waiters:
+                    if not future.done():
+                        future.set_result(None)
+
+            if self._dirty:
+                self._wakeup.set()
+            else:
+                self._idle.set()
+
+    def _commit(self, payloads: List[Tuple[str, bytes]]) -> None:
+        """Write one batch: temp files, barrier, renames (, barrier)."""
+        moves = []
+        for session_id, data in payloads:
+            directory = self.root / session_id
+            if directory not in self._known_dirs:
+                self.fs.makedirs(directory)
+                self._known_dirs.add(directory)
+            path = directory / SNAPSHOT_FILENAME
+            tmp_path = path.with_name(f".{path.name}.tmp")
+            self.fs.write(tmp_path, data)
+            moves.append((tmp_path, path))
+
+        if self.durability != Durability.NONE:
+            self.fs.barrier(self.root, [tmp_path for tmp_path, _ in moves])
+            self.stats.barriers += 1
+        for tmp_path, path in moves:
+            self.fs.replace(tmp_path, path)
+        if self.durability == Durability.FULL:
+            self.fs.barrier(self.root, [path for _, path in moves])
+            self.stats.barriers += 1
+
+        self.stats.writes += len(moves)
+        self.stats.batches += 1
+
+
+def _serialize(state: Any) -> bytes:
+    """state.json bytes for either state representation."""
+    if isinstance(state, RuntimeInterviewState):
+        state = to_model(state)
+    return state.model_dump_json(indent=2).encode("utf-8")
@@ -0,0 +1,397 @@
+"""
+Lightweight Tracing for Interview Agent
+
+Timing spans around prompt formatting, model calls, state mutation and
+persistence:
+- span(name, **attributes): context manager
+- traced(name): decorator for functions and methods
+- Disabled by default: span() returns a shared no-op object and traced
+  functions do one global check before calling through
+- enable_tracing(*sinks) installs a Tracer; sinks receive finished spans
+- disable_tracing() removes it and closes its exporters
+- HistogramAggregator: per-span-name latency histograms
+- JsonlExporter: one JSON line per finished span (attributes nested under
+  "attributes", so they cannot shadow the span's own keys)
+
+Spans nest through contextvars, so asyncio tasks started inside a span
+(e.g. speculative branches) are parented correctly. The attributes in
+INHERITED_ATTRIBUTES (session_id, exchange_id) propagate to child spans;
+run_turn opens its "turn" span with the pending Exchange.id, so every span
+of a slow turn can be found by exchange id.
+
+This module must not import the state schema (the schema is instrumented).
+"""
+
+from __future__ import annotations
+
+import inspect
+import itertools
+import math
+import os
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Protocol, TypeVar
+
+# json / orjson / pathlib are imported by the exporter on first use: this
+# module is imported by every formatter and must stay cheap on cold start
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Attributes copied from a parent span to its children
+INHERITED_ATTRIBUTES = ("session_id", "exchange_id")
+
+# Histogram buckets: upper bounds in microseconds, doubling from 1us (~1.2h)
+HISTOGRAM_BUCKETS = 32
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Span:
+    """A timed operation; finished spans are handed to the tracer's sinks."""
+
+    __slots__ = (
+        "name",
+        "span_id",
+        "parent_id",
+        "trace_id",
+        "attributes",
+        "start_ns",
+        "duration_ns",
+        "error",
+        "_tracer",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        parent: Optional["Span"],
+        attributes: Dict[str, Any],
+    ):
+        self.name = name
+        self.span_id = next(tracer.span_ids)
+        if parent is None:
+            self.parent_id = None
+            self.trace_id = self.span_id
+        else:
+            self.parent_id = parent.span_id
+            self.trace_id = parent.trace_id
+            for key in INHERITED_ATTRIBUTES:
+                if key not in attributes and key in parent.attributes:
+                    attributes[key] = parent.attributes[key]
+        self.attributes = attributes
+        self.start_ns = 0
+        self.duration_ns = 0
+        self.error: Optional[str] = None
+        self._tracer = tracer
+        self._token = None
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.duration_ns / 1e9
+
+    def set(self, **attributes: Any) -> None:
+        """Add attributes to the span."""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Exported form; ids are prefixed with the process id (see Tracer)."""
+        prefix = self._tracer.id_prefix
+        return {
+            "name": self.name,
+            "span_id": f"{prefix}{self.span_id:x}",
+            "parent_id": (
+                f"{prefix}{self.parent_id:x}" if self.parent_id is not None else None
+            ),
+            "trace_id": f"{prefix}{self.trace_id:x}",
+            "start_ns": self.start_ns,
+            "duration_us": self.duration_ns / 1000,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.duration_ns = time.perf_counter_ns() - self.start_ns
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.error = exc_type.__name__
+        self._tracer.finish(self)
+
+
+class _NoopSpan:
+    """Returned by span() while tracing is disabled."""
+
+    __slots__ = ()
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+# =============================================================================
+# TRACER
+# =============================================================================
+
+
+class SpanSink(Protocol):
+    """Receives every finished span."""
+
+    def on_end(self, span: Span) -> None:
+        ...
+
+
+class Tracer:
+    """Creates spans and fans finished ones out to sinks."""
+
+    def __init__(self, sinks: Optional[List[SpanSink]] = None):
+        self.sinks: List[SpanSink] = list(sinks or ())
+        # next() on a count is atomic under the GIL, unlike `+= 1`
+        self.span_ids = itertools.count(1)
+        # Process id prefix keeps exported ids unique across worker processes
+        self.id_prefix = f"{os.getpid():x}-"
+
+    def start(self, name: str, attributes: Dict[str, Any]) -> Span:
+        return Span(self, name, _current_span.get(), attributes)
+
+    def finish(self, span: Span) -> None:
+        for sink in self.sinks:
+            sink.on_end(span)
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("interview_span", default=None)
+_tracer: Optional[Tracer] = None
+
+
+def enable_tracing(*sinks: SpanSink) -> Tracer:
+    """Install a Tracer feeding `sinks` and return it."""
+    global _tracer
+    _tracer = Tracer(list(sinks))
+    return _tracer
+
+
+def disable_tracing() -> None:
+    """
+    Back to the no-op default.
+
+    Sinks of the removed tracer that have a close() (JsonlExporter) are
+    closed, so spans still buffered in memory are written out.
+    """
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is None:
+        return
+    for sink in tracer.sinks:
+        close = getattr(sink, "close", None)
+        if close is not None:
+            close()
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+def current_span() -> Optional[Span]:
+    """The innermost open span in this context (None when disabled)."""
+    return _current_span.get() if _tracer is not None else None
+
+
+def span(name: str, **attributes: Any):
+    """
+    Time a block.
+
+    Usage:
+        with span("persist", session_id=state.session_id):
+            journal.commit()
+    """
+    if _tracer is None:
+        return NOOP_SPAN
+    return _tracer.start(name, attributes)
+
+
+def traced(name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorator timing every call of a function or method (sync or async).
+
+    Args:
+        name: Span name (default: the function's __qualname__)
+    """
+
+    def decorate(fn: F) -> F:
+        span_name = name or fn.__qualname__
+
+        # unwrap() so functions already wrapped by @wraps decorators count
+        if inspect.iscoroutinefunction(fn) or inspect.iscoroutinefunction(
+            inspect.unwrap(fn)
+        ):
+
+            @wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if _tracer is None:
+                    return await fn(*args, **kwargs)
+                with _tracer.start(span_name, {}):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return fn(*args, **kwargs)
+            with _tracer.start(span_name, {}):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+# =============================================================================
+# SINKS
+# =============================================================================
+
+
+class LatencyHistogram:
+    """Log2-bucketed latency histogram (microsecond resolution)."""
+
+    __slots__ = ("counts", "count", "total_ns", "min_ns", "max_ns")
+
+    def __init__(self) -> None:
+        self.counts = [0] * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record(self, duration_ns: int) -> None:
+        micros = duration_ns // 1000
+        bucket = min(micros.bit_length(), HISTOGRAM_BUCKETS - 1)
+        self.counts[bucket] += 1
+        if not self.count or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.count += 1
+        self.total_ns += duration_ns
+
+    @property
+    def mean_us(self) -> float:
+        return self.total_ns / self.count / 1000 if self.count else 0.0
+
+    def percentile_us(self, pct: float) -> float:
+        """Upper bound of the bucket holding the pct-th percentile."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100 * self.count))
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(float(1 << bucket), self.max_ns / 1000)
+        return self.max_ns / 1000
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_us": self.mean_us,
+            "p50_us": self.percentile_us(50),
+            "p99_us": self.percentile_us(99),
+            "max_us": self.max_ns / 1000,
+        }
+
+
+class HistogramAggregator:
+    """Sink keeping one LatencyHistogram per span name."""
+
+    def __init__(self) -> None:
+        self.histograms: Dict[str, LatencyHistogram] = {}
+
+    def on_end(self, span: Span) -> None:
+        histogram = self.histograms.get(span.name)
+        if histogram is None:
+            histogram = self.histograms[span.name] = LatencyHistogram()
+        histogram.record(span.duration_ns)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """{span name: count / mean / p50 / p99 / max}, slowest total first."""
+        ordered = sorted(
+            self.histograms.items(), key=lambda item: item[1].total_ns, reverse=True
+        )
+        return {name: histogram.summary() for name, histogram in ordered}
+
+
+class JsonlExporter:
+    """Sink appending each finished span to a JSON-lines file."""
+
+    def __init__(self, path: Path, buffer_spans: int = 256):
+        """
+        Args:
+            path: Output file (appended to)
+            buffer_spans: Spans held in memory between writes
+        """
+        from pathlib import Path
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.buffer_spans = buffer_spans
+        self._dumps = _json_dumps()
+        self._buffer: List[str] = []
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def on_end(self, span: Span) -> None:
+        self._buffer.append(self._dumps(span.to_dict()))
+        if len(self._buffer) >= self.buffer_spans:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._file.write("\n".join(self._buffer) + "\n")
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write buffered spans and close the file (safe to call twice)."""
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+
+def _json_dumps() -> Callable[[Dict[str, Any]], str]:
+    """Span serializer: orjson when installed, else json."""
+    try:
+        from orjson import dumps
+    except ImportError:
+        import json
+
+        return lambda record: json.dumps(record, default=str)
+    return lambda record: dumps(record, default=str).decode()
+
+
+def read_spans(path: Path) -> List[Dict[str, Any]]:
+    """Load spans written by JsonlExporter."""
+    import json
+
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def spans_for_exchange(
+    spans: List[Dict[str, Any]], exchange_id: str
+) -> List[Dict[str, Any]]:
+    """Spans recorded while answering the given Exchange.id."""
+    return [s for s in spans if s["attributes"].get("exchange_id") == exchange_id]
@@ -0,0 +1,784 @@
+"""
+Incremental transcript.md Writer and Recovery Parser
+
+transcript.md is the human-readable, append-only log of a session (see
+agent.md). This module keeps it machine-recoverable:
+- TranscriptWriter.sync() renders only what changed since the last call
+  (new questions, exchanges, responses, insights, transitions) and appends
+  it with one buffered write per turn
+- Every block is preceded by an HTML comment carrying its ids, timestamps
+  and analysis fields as compact JSON; Markdown viewers hide it
+- parse_transcript() rebuilds the state.json dict in one linear pass, so a
+  corrupted state.json can be recovered from the transcript alone
+
+Block format (the comment's "n" counts the body lines that follow):
+
+    <!-- exchange {"id":"...","at":"...","h":"...","n":1} -->
+    **Interviewer**: What made you try the product?
+
+Lines without a block comment are decoration and are skipped by the parser.
+A torn tail (crash mid-append) is dropped on parse and truncated on resume.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from agents.interview_agent.state_schema import (
+    InterviewState,
+    InterviewStatus,
+    QuestionStatus,
+)
+from agents.interview_agent.tracing import traced
+
+try:  # optional faster JSON backend for block metadata
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+TRANSCRIPT_FILENAME = "transcript.md"
+
+# Block kinds, in the order a session produces them
+BLOCK_KINDS = (
+    "interview",
+    "question",
+    "exchange",
+    "response",
+    "insight",
+    "transition",
+    "message",
+    "state",
+    "summary",
+)
+
+# Statuses after which the summary section is appended
+FINAL_STATUSES = (InterviewStatus.COMPLETED, InterviewStatus.FAILED)
+
+_ROLE_LABELS = {"assistant": "**Interviewer**", "user": "**Participant**"}
+
+
+class TranscriptError(Exception):
+    """Raised when a transcript cannot be parsed or does not match a session."""
+
+
+# =============================================================================
+# TRANSCRIPT WRITER
+# =============================================================================
+
+
+class TranscriptWriter:
+    """
+    Appends transcript.md for one session directory.
+
+    Call sync() after each turn (where atomic_update() is called, or from a
+    SessionManager after_turn hook); it works on InterviewState and
+    RuntimeInterviewState alike:
+
+        writer = TranscriptWriter(session_dir)
+        writer.open(state)
+        ...
+        writer.sync(state)
+
+    open() on an existing transcript parses it to find where it left off,
+    so a resumed session continues the same file without duplicates.
+    """
+
+    def __init__(self, session_dir: Path, fsync: bool = False):
+        """
+        Args:
+            session_dir: Directory holding transcript.md
+            fsync: Whether sync() fsyncs (the transcript is a secondary log,
+                so by default it is only flushed to the OS)
+        """
+        self.session_dir = Path(session_dir)
+        self.path = self.session_dir / TRANSCRIPT_FILENAME
+        self.fsync = fsync
+
+        self._cursor: Optional[_Cursor] = None
+        self._file = None
+
+    # ==========================================================================
+    # Lifecycle
+    # ==========================================================================
+
+    def open(self, state: InterviewState) -> None:
+        """
+        Start or resume the transcript for `state` and bring it up to date.
+
+        Raises:
+            TranscriptError: If the existing transcript is another session's
+        """
+        self.session_dir.mkdir(parents=True, exist_ok=True)
+        if self.path.exists() and self.path.stat().st_size:
+            data, good_bytes = parse_transcript(self.path)
+            if data["session_id"] != state.session_id:
+                raise TranscriptError(
+                    f"{self.path} belongs to session {data['session_id']}"
+                )
+            if good_bytes < self.path.stat().st_size:
+                with open(self.path, "r+b") as f:
+                    f.truncate(good_bytes)
+            self._cursor = _Cursor.from_state(InterviewState.model_validate(data))
+            self._file = open(self.path, "ab")
+        else:
+            self._cursor = _Cursor()
+            self._file = open(self.path, "ab")
+            self._write(_render_header(state))
+        self.sync(state)
+
+    def close(self) -> None:
+        """Close the transcript file handle."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "TranscriptWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ==========================================================================
+    # Incremental Rendering
+    # ==========================================================================
+
+    @traced("TranscriptWriter.sync")
+    def sync(self, state: InterviewState) -> int:
+        """
+        Append everything that happened since the last sync.
+
+        Returns:
+            Number of bytes appended
+        """
+        if self._cursor is None:
+            raise TranscriptError("Transcript not open; call open() first")
+        cursor = self._cursor
+        history = _HistoryMatcher(state.conversation_history[cursor.history :])
+        new_insights = state.insight_bank.insights[cursor.insights :]
+        insights_by_exchange: Dict[str, List[Any]] = {}
+        for insight in new_insights:
+            insights_by_exchange.setdefault(insight.source_exchange_id, []).append(
+                insight
+            )
+        parts: List[str] = []
+
+        while cursor.question < len(state.questions):
+            question = state.questions[cursor.question]
+            if not cursor.started:
+                if (
+                    question.status == QuestionStatus.PENDING
+                    and not question.exchanges
+                    and cursor.question >= state.current_question_index
+                ):
+                    break
+                parts.append(_render_question(question))
+                cursor.started = True
+
+            exchanges = question.exchanges
+            while True:
+                if not cursor.responded:
+                    exchange = exchanges[cursor.exchanges - 1]
+                    if exchange.user_response is not None:
+                        insights = insights_by_exchange.pop(exchange.id, [])
+                        parts.append(_render_response(exchange, insights, history))
+                    elif cursor.exchanges == len(exchanges):
+                        break
+                    cursor.responded = True
+                elif cursor.exchanges < len(exchanges):
+                    exchange = exchanges[cursor.exchanges]
+                    parts.append(_render_exchange(exchange, history))
+                    cursor.exchanges += 1
+                    cursor.responded = False
+                else:
+                    break
+
+            if cursor.question >= state.current_question_index:
+                break
+            parts.append(_render_transition(question, history))
+            cursor.next_question()
+
+        # Insights and history entries not tied to a rendered block
+        for insights in insights_by_exchange.values():
+            parts.extend(_render_insight(i) for i in insights)
+        parts.extend(_render_message(entry) for entry in history.unmatched())
+        cursor.history += history.consumed
+        cursor.insights += len(new_insights)
+
+        fields = _state_fields(state, cursor.current_question(state))
+        if parts or fields != cursor.fields:
+            parts.append(_block("state", fields))
+            cursor.fields = fields
+        if state.status in FINAL_STATUSES and not cursor.summary:
+            parts.append(_render_summary(state))
+            cursor.summary = True
+        if not parts:
+            return 0
+        return self._write("".join(parts))
+
+    # ==========================================================================
+    # Internals
+    # ==========================================================================
+
+    def _write(self, text: str) -> int:
+        """Append rendered blocks with a single write."""
+        data = text.encode("utf-8")
+        self._file.write(data)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        return len(data)
+
+
+class _Cursor:
+    """How far into a session the transcript has been rendered."""
+
+    __slots__ = (
+        "question",
+        "started",
+        "exchanges",
+        "responded",
+        "history",
+        "insights",
+        "fields",
+        "summary",
+    )
+
+    def __init__(self) -> None:
+        self.question = 0  # index of the question being rendered
+        self.started = False  # its heading is written
+        self.exchanges = 0  # its exchanges written
+        self.responded = True  # response of its last written exchange handled
+        self.history = 0  # conversation_history entries consumed
+        self.insights = 0  # insight_bank.insights consumed
+        self.fields: Optional[Dict[str, Any]] = None  # last "state" block
+        self.summary = False
+
+    @classmethod
+    def from_state(cls, state: InterviewState) -> "_Cursor":
+        """Cursor positioned after everything `state` contains."""
+        cursor = cls()
+        cursor.question = min(state.current_question_index, len(state.questions))
+        question = (
+            state.questions[cursor.question]
+            if cursor.question < len(state.questions)
+            else None
+        )
+        if question is not None and (
+            question.exchanges or question.status != QuestionStatus.PENDING
+        ):
+            cursor.started = True
+            cursor.exchanges = len(question.exchanges)
+            cursor.responded = (
+                not question.exchanges
+                or question.exchanges[-1].user_response is not None
+            )
+        cursor.history = len(state.conversation_history)
+        cursor.insights = len(state.insight_bank.insights)
+        cursor.fields = _state_fields(state, cursor.current_question(state))
+        cursor.summary = state.status in FINAL_STATUSES
+        return cursor
+
+    def current_question(self, state: InterviewState) -> Any:
+        """The question being rendered, once its heading is written."""
+        if self.started and self.question < len(state.questions):
+            return state.questions[self.question]
+        return None
+
+    def next_question(self) -> None:
+        self.question += 1
+        self.started = False
+        self.exchanges = 0
+        self.responded = True
+
+
+class _HistoryMatcher:
+    """
+    Pairs new conversation_history entries with the blocks that show them.
+
+    An interviewer or participant block records the timestamp ("h") of the
+    history entry with the same role and text, so history is rebuilt without
+    writing each message twice. Entries that match no block are rendered as
+    standalone "message" blocks.
+    """
+
+    __slots__ = ("entries", "consumed")
+
+    def __init__(self, entries: List[Dict[str, Any]]):
+        self.entries = entries
+        self.consumed = 0
+
+    def take(self, role: str, content: Optional[str]) -> Optional[str]:
+        """Timestamp of the next entry if it is this message, else None."""
+        if self.consumed >= len(self.entries):
+            return None
+        entry = self.entries[self.consumed]
+        if (
+            entry.get("role") == role
+            and entry.get("content") == content
+            and len(entry) == 3
+            and isinstance(entry.get("timestamp"), str)
+        ):
+            self.consumed += 1
+            return entry["timestamp"]
+        return None
+
+    def unmatched(self) -> List[Dict[str, Any]]:
+        """Consume and return the entries no block claimed."""
+        rest = self.entries[self.consumed :]
+        self.consumed = len(self.entries)
+        return rest
+
+
+# =============================================================================
+# RENDERING
+# =============================================================================
+
+
+def _render_header(state: InterviewState) -> str:
+    plan = [
+        {
+            "id": q.id,
+            "order": q.order,
+            "base_question_text": q.base_question_text,
+            "research_objective": q.research_objective,
+            "max_follow_ups": q.max_follow_ups,
+        }
+        for q in state.questions
+    ]
+    meta = {
+        "session_id": state.session_id,
+        "created_at": _dump_datetime(state.created_at),
+        "context": state.context,
+        "config": state.config.model_dump(mode="json"),
+        "total_questions": state.total_questions,
+        "questions": plan,
+    }
+    return (
+        _block("interview", meta, f"# Interview: {state.title}")
+        + f"Session: {state.session_id}\n"
+        + f"Started: {_dump_datetime(state.created_at)}\n\n---\n\n"
+    )
+
+
+def _render_question(question: Any) -> str:
+    meta = {"id": question.id, "at": _dump_datetime(question.started_at)}
+    heading = f"## Question {question.order}: {question.base_question_text}"
+    return (
+        _block("question", meta, heading)
+        + f"**Research Objective**: {question.research_objective}\n\n"
+    )
+
+
+def _render_exchange(exchange: Any, history: _HistoryMatcher) -> str:
+    meta = {
+        "id": exchange.id,
+        "at": _dump_datetime(exchange.timestamp),
+        "h": history.take("assistant", exchange.question_text),
+    }
+    label = "**Interviewer**"
+    if exchange.is_follow_up:
+        meta["follow_up"] = True
+        meta["reason"] = _value(exchange.follow_up_reason)
+        label += " (follow-up)"
+    return _block("exchange", meta, f"{label}: {exchange.question_text}") + "\n"
+
+
+def _render_response(
+    exchange: Any, insights: List[Any], history: _HistoryMatcher
+) -> str:
+    meta = {
+        "x": exchange.id,
+        "at": _dump_datetime(exchange.response_timestamp),
+        "h": history.take("user", exchange.user_response),
+    }
+    analysis = exchange.response_analysis
+    if analysis is not None:
+        meta["progress"] = _value(analysis.objective_progress)
+        meta["rec"] = analysis.recommendation
+        meta["why"] = analysis.recommendation_reason
+        meta["conf"] = analysis.confidence
+        # Normally the analysis insights are exactly the bank insights that
+        # follow; spell them out only when they differ
+        if analysis.insights_extracted != [i.content for i in insights]:
+            meta["insights"] = list(analysis.insights_extracted)
+    text = _block("response", meta, f"**Participant**: {exchange.user_response}")
+    if not insights:
+        return text + "\n"
+    return text + "> Insights:\n" + "".join(map(_render_insight, insights)) + "\n"
+
+
+def _render_insight(insight: Any) -> str:
+    meta = {
+        "id": insight.id,
+        "at": _dump_datetime(insight.extracted_at),
+        "q": insight.source_question_id,
+        "x": insight.source_exchange_id,
+        "importance": insight.importance,
+        "category": insight.category,
+    }
+    if insight.related_insight_ids:
+        meta["related"] = list(insight.related_insight_ids)
+    return _block("insight", meta, f"> - {insight.content}")
+
+
+def _render_transition(question: Any, history: _HistoryMatcher) -> str:
+    meta = {
+        "q": question.id,
+        "status": _value(question.status),
+        "objective": _value(question.objective_status),
+        "reason": _value(question.transition_reason),
+        "at": _dump_datetime(question.completed_at),
+    }
+    message = question.transition_message
+    if message is None:
+        return _block("transition", meta)
+    meta["h"] = history.take("assistant", message)
+    body = f"**Interviewer** (transition): {message}"
+    return _block("transition", meta, body) + "\n"
+
+
+def _render_message(entry: Dict[str, Any]) -> str:
+    meta = {key: value for key, value in entry.items() if key != "content"}
+    label = _ROLE_LABELS.get(entry.get("role"), f"**{entry.get('role')}**")
+    return _block("message", {"entry": meta}, f"{label}: {entry.get('content')}")
+
+
+def _render_summary(state: InterviewState) -> str:
+    lines = ["", "---", ""]
+    high = state.insight_bank.get_high_importance()
+    if high:
+        lines.append("**Key Insights**:")
+        lines.extend(f"- {insight.content}" for insight in high)
+        lines.append("")
+    exchanges = sum(len(q.exchanges) for q in state.questions)
+    end = state.completed_at or state.updated_at
+    minutes = int((end - state.created_at).total_seconds() // 60)
+    lines.append(
+        f"**Questions**: {state.completed_questions}/{state.total_questions} | "
+        f"**Exchanges**: {exchanges} | **Duration**: {minutes} min"
+    )
+    return _block("summary", {}, "## Summary") + "\n".join(lines) + "\n"
+
+
+def _state_fields(state: InterviewState, question: Any) -> Dict[str, Any]:
+    """Scalars that change without an event of their own ("state" block)."""
+    fields = {
+        "status": _value(state.status),
+        "updated_at": _dump_datetime(state.updated_at),
+        "total_exchanges": state.total_exchanges,
+        "termination_reason": state.termination_reason,
+        "completed_at": _dump_datetime(state.completed_at),
+        "summary": state.insight_bank.summary,
+        "summary_at": _dump_datetime(state.insight_bank.last_summary_at),
+    }
+    if question is not None:
+        fields["question"] = {
+            "id": question.id,
+            "status": _value(question.status),
+            "objective": _value(question.objective_status),
+            "follow_ups": question.follow_up_count,
+        }
+    return fields
+
+
+def _block(kind: str, meta: Dict[str, Any], body: Optional[str] = None) -> str:
+    """One block: comment line with compact JSON meta, then the body lines."""
+    meta = {key: value for key, value in meta.items() if value is not None}
+    if body is None:
+        meta["n"] = 0
+        body = ""
+    else:
+        meta["n"] = body.count("\n") + 1
+        body += "\n"
+    payload = json.dumps(meta, separators=(",", ":"), ensure_ascii=False)
+    # ">" only occurs inside JSON strings; escaping it keeps "-->" out
+    payload = payload.replace(">", "\\u003e")
+    return f"<!-- {kind} {payload} -->\n{body}"
+
+
+# =============================================================================
+# PARSING / RECOVERY
+# =============================================================================
+
+
+@traced()
+def parse_transcript(path: Path) -> Tuple[Dict[str, Any], int]:
+    """
+    Rebuild the state.json dict from a transcript in one linear pass.
+
+    A torn tail (incomplete last line or block) is ignored.
+
+    Args:
+        path: transcript.md to read
+
+    Returns:
+        (state dict ready for InterviewState.model_validate, byte length of
+        the complete blocks read)
+
+    Raises:
+        TranscriptError: If the transcript has no header or is inconsistent
+    """
+    with open(path, "rb") as f:
+        lines = f.read().split(b"\n")
+    lines.pop()  # text after the last newline: b"" or a torn line
+
+    recovery = _Recovery()
+    good_bytes = 0
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        header = _decode_header(line) if line.startswith(b"<!-- ") else None
+        if header is None:
+            good_bytes += len(line) + 1
+            index += 1
+            continue
+
+        kind, meta = header
+        end = index + 1 + meta.pop("n")
+        if end > len(lines):
+            break  # torn block
+        body = None
+        if end > index + 1:
+            body = b"\n".join(lines[index + 1 : end]).decode("utf-8")
+        recovery.apply(kind, meta, body)
+        good_bytes += sum(len(line) + 1 for line in lines[index:end])
+        index = end
+
+    if recovery.state is None:
+        raise TranscriptError(f"{path} has no interview header")
+    return recovery.state, good_bytes
+
+
+def recover_state(session_dir: Path) -> InterviewState:
+    """
+    Rebuild a session's InterviewState from its transcript.md.
+
+    Use when state.json is missing or corrupt (agent.md error handling).
+    """
+    data, _ = parse_transcript(Path(session_dir) / TRANSCRIPT_FILENAME)
+    return InterviewState.model_validate(data)
+
+
+class _Recovery:
+    """Folds transcript blocks into a state.json-shaped dict."""
+
+    def __init__(self) -> None:
+        self.state: Optional[Dict[str, Any]] = None
+        self.questions: Dict[str, Dict[str, Any]] = {}
+        self.question: Optional[Dict[str, Any]] = None
+        # Analysis whose insights come from the insight blocks that follow
+        self.open_analysis: Optional[Tuple[str, Dict[str, Any]]] = None
+
+    def apply(self, kind: str, meta: Dict[str, Any], body: Optional[str]) -> None:
+        if kind == "interview":
+            self._start(meta, _body_text(body))
+            return
+        if self.state is None:
+            raise TranscriptError(f"'{kind}' block before the interview header")
+        if kind != "insight":
+            self.open_analysis = None
+
+        if kind == "question":
+            self._question(meta)
+        elif kind == "exchange":
+            self._exchange(meta, body)
+        elif kind == "response":
+            self._response(meta, body)
+        elif kind == "insight":
+            self._insight(meta, body)
+        elif kind == "transition":
+            self._transition(meta, body)
+        elif kind == "message":
+            self._message(meta, body)
+        elif kind == "state":
+            self._state(meta)
+        # "summary" is derived from the insights; nothing to recover
+
+    # ==========================================================================
+    # Block Handlers
+    # ==========================================================================
+
+    def _start(self, meta: Dict[str, Any], title: str) -> None:
+        questions = [
+            dict(q, exchanges=[], cumulative_insights=[]) for q in meta["questions"]
+        ]
+        self.questions = {q["id"]: q for q in questions}
+        self.state = {
+            "session_id": meta["session_id"],
+            "created_at": meta["created_at"],
+            "updated_at": meta["created_at"],
+            "title": title,
+            "context": meta["context"],
+            "config": meta["config"],
+            "questions": questions,
+            "total_questions": meta["total_questions"],
+            "current_question_index": 0,
+            "completed_questions": 0,
+            "insight_bank": {"insights": [], "by_category": {}, "by_question": {}},
+            "conversation_history": [],
+        }
+
+    def _question(self, meta: Dict[str, Any]) -> None:
+        question = self._lookup(meta["id"])
+        question["status"] = QuestionStatus.ACTIVE.value
+        question["started_at"] = meta.get("at")
+        self.question = question
+
+    def _exchange(self, meta: Dict[str, Any], body: Optional[str]) -> None:
+        question = self._current()
+        text = _body_text(body)
+        question["exchanges"].append(
+            {
+                "id": meta["id"],
+                "timestamp": meta["at"],
+                "question_text": text,
+                "is_follow_up": meta.get("follow_up", False),
+                "follow_up_reason": meta.get("reason"),
+            }
+        )
+        if meta.get("follow_up"):
+            question["follow_up_count"] = question.get("follow_up_count", 0) + 1
+        self._history(meta, "assistant", text)
+
+    def _response(self, meta: Dict[str, Any], body: Optional[str]) -> None:
+        question = self._current()
+        exchanges = question["exchanges"]
+        if not exchanges or exchanges[-1]["id"] != meta["x"]:
+            raise TranscriptError(f"Response for unknown exchange {meta['x']}")
+        exchange = exchanges[-1]
+        exchange["user_response"] = text = _body_text(body)
+        exchange["response_timestamp"] = meta.get("at")
+        if "progress" in meta:
+            analysis = {
+                "objective_progress": meta["progress"],
+                "insights_extracted": meta.get("insights", []),
+                "recommendation": meta["rec"],
+                "recommendation_reason": meta["why"],
+                "confidence": meta["conf"],
+            }
+            exchange["response_analysis"] = analysis
+            question["cumulative_insights"].extend(analysis["insights_extracted"])
+            question["objective_status"] = meta["progress"]
+            if "insights" not in meta:
+                self.open_analysis = (meta["x"], analysis)
+        self._history(meta, "user", text)
+
+    def _insight(self, meta: Dict[str, Any], body: Optional[str]) -> None:
+        content = _body_text(body, "> - ")
+        insight = {
+            "id": meta["id"],
+            "content": content,
+            "source_question_id": meta["q"],
+            "source_exchange_id": meta["x"],
+            "extracted_at": meta["at"],
+            "category": meta.get("category"),
+            "importance": meta["importance"],
+            "related_insight_ids": meta.get("related", []),
+        }
+        bank = self.state["insight_bank"]
+        bank["insights"].append(insight)
+        if insight["category"]:
+            bank["by_category"].setdefault(insight["category"], []).append(meta["id"])
+        bank["by_question"].setdefault(meta["q"], []).append(meta["id"])
+
+        if self.open_analysis is not None and self.open_analysis[0] == meta["x"]:
+            self.open_analysis[1]["insights_extracted"].append(content)
+            self._lookup(meta["q"])["cumulative_insights"].append(content)
+
+    def _transition(self, meta: Dict[str, Any], body: Optional[str]) -> None:
+        question = self._lookup(meta["q"])
+        question["status"] = meta["status"]
+        question["objective_status"] = meta["objective"]
+        question["transition_reason"] = meta.get("reason")
+        question["completed_at"] = meta.get("at")
+        if body is not None:
+            question["transition_message"] = _body_text(body)
+            self._history(meta, "assistant", question["transition_message"])
+        self.state["current_question_index"] += 1
+        self.state["completed_questions"] += 1
+        self.question = None
+
+    def _message(self, meta: Dict[str, Any], body: Optional[str]) -> None:
+        entry = dict(meta["entry"])
+        entry["content"] = _body_text(body)
+        self.state["conversation_history"].append(entry)
+
+    def _state(self, meta: Dict[str, Any]) -> None:
+        state = self.state
+        state["status"] = meta["status"]
+        state["updated_at"] = meta["updated_at"]
+        state["total_exchanges"] = meta["total_exchanges"]
+        state["termination_reason"] = meta.get("termination_reason")
+        state["completed_at"] = meta.get("completed_at")
+        state["insight_bank"]["summary"] = meta.get("summary")
+        state["insight_bank"]["last_summary_at"] = meta.get("summary_at")
+        if "question" in meta:
+            fields = meta["question"]
+            question = self._lookup(fields["id"])
+            question["status"] = fields["status"]
+            question["objective_status"] = fields["objective"]
+            question["follow_up_count"] = fields["follow_ups"]
+
+    # ==========================================================================
+    # Helpers
+    # ==========================================================================
+
+    def _lookup(self, question_id: str) -> Dict[str, Any]:
+        question = self.questions.get(question_id)
+        if question is None:
+            raise TranscriptError(f"Unknown question {question_id} in transcript")
+        return question
+
+    def _current(self) -> Dict[str, Any]:
+        if self.question is None:
+            raise TranscriptError("Exchange outside of a started question")
+        return self.question
+
+    def _history(self, meta: Dict[str, Any], role: str, content: str) -> None:
+        if "h" in meta:
+            self.state["conversation_history"].append(
+                {"role": role, "content": content, "timestamp": meta["h"]}
+            )
+
+
+# =============================================================================
+# UTILITY FUNCTIONS
+# =============================================================================
+
+
+def _decode_header(line: bytes) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Decode a block comment line; None if it is not one."""
+    if not line.endswith(b" -->"):
+        return None
+    kind, _, payload = line[5:-4].partition(b" ")
+    kind = kind.decode("ascii", "replace")
+    if kind not in BLOCK_KINDS:
+        return None
+    try:
+        meta = _json_loads(payload)
+    except ValueError:
+        return None
+    if not isinstance(meta, dict) or not isinstance(meta.get("n"), int):
+        return None
+    return kind, meta
+
+
+def _body_text(body: Optional[str], prefix: Optional[str] = None) -> str:
+    """Strip the rendered label ("**Participant**: ", "> - ", ...) from a body."""
+    if body is None:
+        return ""
+    if prefix is not None:
+        return body[len(prefix) :] if body.startswith(prefix) else body
+    return body.partition(": ")[2]
+
+
+def _value(value: Any) -> Any:
+    """Enum value (or None)."""
+    return value.value if value is not None else None
+
+
+def _dump_datetime(value: Optional[datetime]) -> Optional[str]:
+    """Serialize a datetime for block metadata."""
+    return value.isoformat() if value else None
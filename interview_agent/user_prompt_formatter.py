@@ -7,27 +7,48 @@ Follows the modular formatter pattern from the prompt-writing framework:
 - Build strings line-by-line with explicit tabs
 - XML semantic tags for clear boundaries
 - Conditional inclusion based on available data
+- Imports without Pydantic: schema types are annotation-only, so string-only
+  callers (format_minimal_context, _escape_xml) skip the model import
 """
 
-from typing import Any, Dict, List, Optional
+from __future__ import annotations
 
-# Import state schema (adjust path as needed)
-from agents.interview_agent.state_schema import (
-    Exchange,
-    InsightBank,
-    InterviewState,
-)
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from agents.interview_agent.importance import HIGH_IMPORTANCE
+from agents.interview_agent.tracing import traced
+
+# The schema is only needed for annotations here. Importing it at runtime
+# would load Pydantic for callers that just format strings (cold starts).
+if TYPE_CHECKING:
+    from agents.interview_agent.state_schema import (
+        Exchange,
+        Insight,
+        InsightBank,
+        InterviewState,
+        QuestionState,
+    )
+
+# Prompt layouts for format_interviewer_prompt
+LAYOUT_DEFAULT = "default"
+LAYOUT_STABLE_PREFIX = "stable_prefix"
+
+# Separates the cacheable prefix from the per-turn suffix (stable_prefix layout)
+CACHE_BREAKPOINT = "<!-- cache_breakpoint -->\n\n"
 
 # =============================================================================
 # MAIN FORMATTER - Orchestrator Prompt
 # =============================================================================
 
 
+@traced()
 def format_interviewer_prompt(
     state: InterviewState,
     user_message: Optional[str] = None,
     max_history: int = 10,
     include_all_questions: bool = False,
+    layout: str = LAYOUT_DEFAULT,
 ) -> str:
     """
     Main formatter for the interviewer system prompt.
@@ -39,10 +60,17 @@ def format_interviewer_prompt(
         user_message: The user's latest response (None on first turn)
         max_history: Maximum conversation history entries to include
         include_all_questions: Whether to show all questions or just current
+        layout: LAYOUT_DEFAULT, or LAYOUT_STABLE_PREFIX to order sections
+            for provider-side prefix caching (see format_stable_prefix_prompt)
 
     Returns:
         Formatted XML string for the user prompt
     """
+    if layout == LAYOUT_STABLE_PREFIX:
+        return format_stable_prefix_prompt(state, user_message, max_history)
+    if layout != LAYOUT_DEFAULT:
+        raise ValueError(f"Unknown prompt layout: {layout!r}")
+
     prompt = ""
 
     # Interview context and metadata
@@ -75,27 +103,89 @@ def format_interviewer_prompt(
     return prompt
 
 
+def format_stable_prefix_prompt(
+    state: InterviewState,
+    user_message: Optional[str] = None,
+    max_history: int = 10,
+) -> str:
+    """
+    Interviewer prompt with sections ordered from most to least stable.
+
+    Same content as the default layout, regrouped so consecutive turns share
+    a long identical prefix that provider prompt caching can reuse:
+    - Session-stable: interview metadata and context (without status)
+    - Question-stable: current question text, objective and limits
+    - CACHE_BREAKPOINT
+    - Per-turn: exchanges, insights, history, latest message, statuses,
+      progress and task
+
+    Use stable_prefix_length() / split_cache_breakpoint() to measure or send
+    the cacheable part separately.
+    """
+    prompt = ""
+
+    # Stable for the whole session
+    prompt += format_interview_context(state, include_status=False)
+
+    # Stable until the next transition
+    prompt += format_current_question(state, include_status=False)
+
+    prompt += CACHE_BREAKPOINT
+
+    # Changes every turn
+    prompt += format_question_exchanges(state)
+    prompt += format_insight_summary(state.insight_bank)
+    prompt += format_conversation_history(
+        state.conversation_history, max_entries=max_history
+    )
+    if user_message:
+        prompt += format_user_message(user_message)
+    prompt += format_status(state)
+    prompt += format_progress(state)
+    prompt += format_task_instruction(state, user_message)
+
+    return prompt
+
+
+def stable_prefix_length(prompt: str) -> int:
+    """Characters before the cache breakpoint (0 if the prompt has none)."""
+    index = prompt.find(CACHE_BREAKPOINT)
+    return max(index, 0)
+
+
+def split_cache_breakpoint(prompt: str) -> Tuple[str, str]:
+    """
+    Split a prompt at its cache breakpoint, dropping the marker.
+
+    Returns:
+        (cacheable prefix, per-turn suffix); ("", prompt) without a marker
+    """
+    prefix, marker, suffix = prompt.partition(CACHE_BREAKPOINT)
+    return (prefix, suffix) if marker else ("", prompt)
+
+
 # =============================================================================
 # SECTION FORMATTERS
 # =============================================================================
 
 
-def format_interview_context(state: InterviewState) -> str:
+def format_interview_context(state: InterviewState, include_status: bool = True) -> str:
     """Format interview metadata and context."""
     fields = []
     fields.append(f"\t<session_id>{state.session_id}</session_id>")
     fields.append(f"\t<title>{state.title}</title>")
-    fields.append(f"\t<status>{state.status.value}</status>")
+    if include_status:
+        fields.append(f"\t<status>{state.status.value}</status>")
 
     if state.context:
         # Escape any XML-like content in context
-        escaped_context = _escape_xml(state.context)
+        escaped_context = _escape_xml_cached(state.context)
         fields.append(f"\t<context>{escaped_context}</context>")
 
     return f"<interview>\n{_join_lines(fields)}\n</interview>\n\n"
 
 
-def format_current_question(state: InterviewState) -> str:
+def format_current_question(state: InterviewState, include_status: bool = True) -> str:
     """Format the current question with its research objective."""
     question = state.get_current_question()
 
@@ -106,21 +196,27 @@ def format_current_question(state: InterviewState) -> str:
     fields.append(f"\t<id>{question.id}</id>")
     fields.append(f"\t<order>{question.order} of {state.total_questions}</order>")
     fields.append(
-        f"\t<question_text>{_escape_xml(question.base_question_text)}</question_text>"
+        f"\t<question_text>{_escape_xml_cached(question.base_question_text)}</question_text>"
     )
     fields.append(
-        f"\t<research_objective>{_escape_xml(question.research_objective)}</research_objective>"
+        f"\t<research_objective>{_escape_xml_cached(question.research_objective)}</research_objective>"
     )
-    fields.append(f"\t<status>{question.status.value}</status>")
-    fields.append(
-        f"\t<objective_status>{question.objective_status.value}</objective_status>"
-    )
-    fields.append(f"\t<follow_up_count>{question.follow_up_count}</follow_up_count>")
+    if include_status:
+        fields.extend(_question_status_fields(question))
     fields.append(f"\t<max_follow_ups>{question.max_follow_ups}</max_follow_ups>")
 
     return f"<current_question>\n{_join_lines(fields)}\n</current_question>\n\n"
 
 
+def format_status(state: InterviewState) -> str:
+    """Format interview and current question status (stable_prefix layout)."""
+    fields = [f"\t<interview_status>{state.status.value}</interview_status>"]
+    question = state.get_current_question()
+    if question:
+        fields.extend(_question_status_fields(question))
+    return f"<status>\n{_join_lines(fields)}\n</status>\n\n"
+
+
 def format_question_exchanges(state: InterviewState) -> str:
     """Format the exchange history for the current question."""
     question = state.get_current_question()
@@ -128,53 +224,10 @@ def format_question_exchanges(state: InterviewState) -> str:
     if not question or not question.exchanges:
         return ""
 
-    exchanges = []
-    for i, exchange in enumerate(question.exchanges):
-        exchange_fields = []
-        exchange_fields.append(
-            f"\t\t<asked>{_escape_xml(exchange.question_text)}</asked>"
-        )
-
-        if exchange.is_follow_up:
-            exchange_fields.append("\t\t<type>follow_up</type>")
-            if exchange.follow_up_reason:
-                exchange_fields.append(
-                    f"\t\t<follow_up_reason>{exchange.follow_up_reason.value}</follow_up_reason>"
-                )
-        else:
-            exchange_fields.append("\t\t<type>initial</type>")
-
-        if exchange.user_response:
-            exchange_fields.append(
-                f"\t\t<response>{_escape_xml(exchange.user_response)}</response>"
-            )
-
-            if exchange.response_analysis:
-                analysis = exchange.response_analysis
-                analysis_fields = []
-                analysis_fields.append(
-                    f"\t\t\t<objective_progress>{analysis.objective_progress.value}</objective_progress>"
-                )
-                analysis_fields.append(
-                    f"\t\t\t<recommendation>{analysis.recommendation}</recommendation>"
-                )
-                if analysis.insights_extracted:
-                    insights = [
-                        f"\t\t\t\t<insight>{_escape_xml(ins)}</insight>"
-                        for ins in analysis.insights_extracted
-                    ]
-                    analysis_fields.append(
-                        f"\t\t\t<insights>\n{_join_lines(insights)}\n\t\t\t</insights>"
-                    )
-                exchange_fields.append(
-                    f"\t\t<analysis>\n{_join_lines(analysis_fields)}\n\t\t</analysis>"
-                )
-        else:
-            exchange_fields.append("\t\t<response>AWAITING</response>")
-
-        exchanges.append(
-            f'\t<exchange num="{i + 1}">\n{_join_lines(exchange_fields)}\n\t</exchange>'
-        )
+    exchanges = [
+        _format_exchange(i + 1, exchange)
+        for i, exchange in enumerate(question.exchanges)
+    ]
 
     return f"<question_exchanges>\n{_join_lines(exchanges)}\n</question_exchanges>\n\n"
 
@@ -184,33 +237,15 @@ def format_insight_summary(insight_bank: InsightBank, max_insights: int = 10) ->
     if not insight_bank.insights:
         return ""
 
-    # Get most recent insights, prioritizing high importance
-    high_priority = [
-        i for i in insight_bank.insights if i.importance in ("high", "critical")
-    ]
-    other = [
-        i for i in insight_bank.insights if i.importance not in ("high", "critical")
-    ]
-
-    # Combine with high priority first, limit total
-    selected = (high_priority + other)[:max_insights]
+    selected = _select_insights(insight_bank, max_insights)
 
     if not selected:
         return ""
 
-    insight_lines = []
-    for insight in selected:
-        importance_marker = "*" if insight.importance in ("high", "critical") else ""
-        category = f" [{insight.category}]" if insight.category else ""
-        insight_lines.append(
-            f'\t<insight importance="{insight.importance}"{' category="' + insight.category + '"' if insight.category else ""}>{importance_marker}{_escape_xml(insight.content)}</insight>'
-        )
-
-    header = f"\t<total_insights>{len(insight_bank.insights)}</total_insights>"
-    if len(insight_bank.insights) > max_insights:
-        header += f"\n\t<showing>Most recent {max_insights} (prioritizing high importance)</showing>"
-
-    return f"<accumulated_insights>\n{header}\n{_join_lines(insight_lines)}\n</accumulated_insights>\n\n"
+    insight_lines = [_format_insight(insight) for insight in selected]
+    return _insight_summary_section(
+        insight_lines, len(insight_bank.insights), max_insights
+    )
 
 
 def format_conversation_history(
@@ -221,21 +256,11 @@ def format_conversation_history(
         return ""
 
     # Apply sliding window
-    recent = history[-max_entries:] if len(history) > max_entries else history
-
-    messages = []
-    for msg in recent:
-        role = msg.get("role", "user")
-        content = _escape_xml(msg.get("content", ""))
-        messages.append(f'\t<message role="{role}">{content}</message>')
-
-    window_note = ""
-    if len(history) > max_entries:
-        window_note = (
-            f"\t<!-- Showing last {max_entries} of {len(history)} messages -->\n"
-        )
-
-    return f"<conversation_history>\n{window_note}{_join_lines(messages)}\n</conversation_history>\n\n"
+    messages = [
+        _format_history_message(history[index])
+        for index in _history_window(len(history), max_entries)
+    ]
+    return _conversation_history_section(messages, len(history), max_entries)
 
 
 def format_user_message(message: str) -> str:
@@ -284,6 +309,7 @@ def format_task_instruction(state: InterviewState, user_message: Optional[str])
 # =============================================================================
 
 
+@traced()
 def format_response_analyzer_prompt(
     research_objective: str,
     question_asked: str,
@@ -291,16 +317,19 @@ def format_response_analyzer_prompt(
     exchange_history: Optional[List[Exchange]] = None,
     follow_up_count: int = 0,
     max_follow_ups: int = 3,
+    decision_fields_first: bool = False,
 ) -> str:
     """
     Format context for the response analyzer sub-prompt.
 
     Used when running response analysis as a separate LLM call.
+    decision_fields_first asks for objective_progress and recommendation
+    before the other fields (for parsing the reply while it streams).
     """
     prompt = ""
 
     # Research objective (critical context)
-    prompt += f"<research_objective>\n\t{_escape_xml(research_objective)}\n</research_objective>\n\n"
+    prompt += f"<research_objective>\n\t{_escape_xml_cached(research_objective)}\n</research_objective>\n\n"
 
     # The question that was asked
     prompt += (
@@ -330,11 +359,15 @@ def format_response_analyzer_prompt(
     prompt += f"<constraints>\n\t<follow_up_count>{follow_up_count}</follow_up_count>\n\t<max_follow_ups>{max_follow_ups}</max_follow_ups>\n</constraints>\n\n"
 
     # Task
-    prompt += "<task>Analyze this response against the research objective. Return a ResponseAnalysis JSON object.</task>\n"
+    task = "Analyze this response against the research objective. Return a ResponseAnalysis JSON object"
+    if decision_fields_first:
+        task += ", starting with objective_progress and recommendation"
+    prompt += f"<task>{task}.</task>\n"
 
     return prompt
 
 
+@traced()
 def format_transition_generator_prompt(
     user_response: str,
     transition_reason: str,
@@ -367,6 +400,7 @@ def format_transition_generator_prompt(
     return prompt
 
 
+@traced()
 def format_followup_generator_prompt(
     research_objective: str,
     user_response: str,
@@ -382,7 +416,7 @@ def format_followup_generator_prompt(
     prompt = ""
 
     # Research objective
-    prompt += f"<research_objective>\n\t{_escape_xml(research_objective)}\n</research_objective>\n\n"
+    prompt += f"<research_objective>\n\t{_escape_xml_cached(research_objective)}\n</research_objective>\n\n"
 
     # User's response to follow up on
     prompt += f"<user_response>\n\t{_escape_xml(user_response)}\n</user_response>\n\n"
@@ -408,22 +442,152 @@ def format_followup_generator_prompt(
     return prompt
 
 
+# =============================================================================
+# ITEM FORMATTERS - Single entries within a section
+# =============================================================================
+
+
+def _format_exchange(num: int, exchange: Exchange) -> str:
+    """Format a single exchange block for the question_exchanges section."""
+    exchange_fields = []
+    exchange_fields.append(f"\t\t<asked>{_escape_xml(exchange.question_text)}</asked>")
+
+    if exchange.is_follow_up:
+        exchange_fields.append("\t\t<type>follow_up</type>")
+        if exchange.follow_up_reason:
+            exchange_fields.append(
+                f"\t\t<follow_up_reason>{exchange.follow_up_reason.value}</follow_up_reason>"
+            )
+    else:
+        exchange_fields.append("\t\t<type>initial</type>")
+
+    if exchange.user_response:
+        exchange_fields.append(
+            f"\t\t<response>{_escape_xml(exchange.user_response)}</response>"
+        )
+
+        if exchange.response_analysis:
+            analysis = exchange.response_analysis
+            analysis_fields = []
+            analysis_fields.append(
+                f"\t\t\t<objective_progress>{analysis.objective_progress.value}</objective_progress>"
+            )
+            analysis_fields.append(
+                f"\t\t\t<recommendation>{analysis.recommendation}</recommendation>"
+            )
+            if analysis.insights_extracted:
+                insights = [
+                    f"\t\t\t\t<insight>{_escape_xml(ins)}</insight>"
+                    for ins in analysis.insights_extracted
+                ]
+                analysis_fields.append(
+                    f"\t\t\t<insights>\n{_join_lines(insights)}\n\t\t\t</insights>"
+                )
+            exchange_fields.append(
+                f"\t\t<analysis>\n{_join_lines(analysis_fields)}\n\t\t</analysis>"
+            )
+    else:
+        exchange_fields.append("\t\t<response>AWAITING</response>")
+
+    return f'\t<exchange num="{num}">\n{_join_lines(exchange_fields)}\n\t</exchange>'
+
+
+def _question_status_fields(question: QuestionState) -> List[str]:
+    """Per-turn fields of the current question."""
+    return [
+        f"\t<status>{question.status.value}</status>",
+        f"\t<objective_status>{question.objective_status.value}</objective_status>",
+        f"\t<follow_up_count>{question.follow_up_count}</follow_up_count>",
+    ]
+
+
+def _select_insights(insight_bank: InsightBank, max_insights: int) -> List[Insight]:
+    """Select insights for the summary, high/critical importance first."""
+    return insight_bank.top_insights(max_insights)
+
+
+def _format_insight(insight: Insight) -> str:
+    """Format a single insight line for the accumulated_insights section."""
+    importance_marker = "*" if insight.importance in HIGH_IMPORTANCE else ""
+    category_attr = f' category="{insight.category}"' if insight.category else ""
+    return f'\t<insight importance="{insight.importance}"{category_attr}>{importance_marker}{_escape_xml(insight.content)}</insight>'
+
+
+def _format_history_message(msg: Dict[str, str]) -> str:
+    """Format a single conversation history message."""
+    role = msg.get("role", "user")
+    content = _escape_xml(msg.get("content", ""))
+    return f'\t<message role="{role}">{content}</message>'
+
+
+# Section wrappers shared with InterviewPromptBuilder, which renders the same
+# sections from cached lines
+
+
+def _insight_summary_section(
+    insight_lines: List[str], total: int, max_insights: int
+) -> str:
+    """Wrap formatted insight lines in <accumulated_insights> with its header."""
+    header = f"\t<total_insights>{total}</total_insights>"
+    if total > max_insights:
+        header += f"\n\t<showing>Most recent {max_insights} (prioritizing high importance)</showing>"
+
+    return f"<accumulated_insights>\n{header}\n{_join_lines(insight_lines)}\n</accumulated_insights>\n\n"
+
+
+def _history_window(total: int, max_entries: int) -> range:
+    """
+    Indexes of the history entries shown: those of history[-max_entries:]
+    once over the limit (so max_entries=0 shows every entry, like the slice).
+    """
+    return range(total)[-max_entries:] if total > max_entries else range(total)
+
+
+def _conversation_history_section(
+    messages: List[str], total: int, max_entries: int
+) -> str:
+    """Wrap formatted messages in <conversation_history> with the window note."""
+    window_note = ""
+    if total > max_entries:
+        window_note = f"\t<!-- Showing last {max_entries} of {total} messages -->\n"
+
+    return f"<conversation_history>\n{window_note}{_join_lines(messages)}\n</conversation_history>\n\n"
+
+
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
 
+# Ordered: "&" must be escaped before the entities that contain it
+_XML_ESCAPES = (
+    ("&", "&amp;"),
+    ("<", "&lt;"),
+    (">", "&gt;"),
+    ('"', "&quot;"),
+    ("'", "&apos;"),
+)
+
+
 def _escape_xml(text: str) -> str:
-    """Escape XML special characters in text."""
+    """
+    Escape XML special characters in text.
+
+    Clean strings (the common case) are returned as-is with no copy; only
+    the characters actually present are replaced.
+    """
     if not text:
         return ""
-    return (
-        text.replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&apos;")
-    )
+    for char, entity in _XML_ESCAPES:
+        if char in text:
+            text = text.replace(char, entity)
+    return text
+
+
+@lru_cache(maxsize=4096)
+def _escape_xml_cached(text: str) -> str:
+    """Memoized _escape_xml for strings repeated every turn (question text, objectives, context)."""
+    return _escape_xml(text)
 
 
 def _join_lines(lines: List[str]) -> str:
@@ -444,10 +608,13 @@ def format_from_dict(
 
     Convenience function for when you have raw dict instead of Pydantic model.
     """
+    from agents.interview_agent.state_schema import InterviewState
+
     state = InterviewState(**state_dict)
     return format_interviewer_prompt(state, user_message)
 
 
+@traced()
 def format_minimal_context(
     question_text: str,
     research_objective: str,
@@ -459,7 +626,7 @@ def format_minimal_context(
     Use when you don't need full state tracking.
     """
     prompt = f"<question>\n\t{_escape_xml(question_text)}\n</question>\n\n"
-    prompt += f"<research_objective>\n\t{_escape_xml(research_objective)}\n</research_objective>\n\n"
+    prompt += f"<research_objective>\n\t{_escape_xml_cached(research_objective)}\n</research_objective>\n\n"
 
     if user_response:
         prompt += (